@@ -0,0 +1,330 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Persistent local archive of quantum task results.
+
+Every terminal result the server fetches is archived in the workspace directory, so later
+analysis runs locally instead of going back to AWS. An SQLite index holds one row per task:
+device, status, shots, creation and end times, and the hash of the submitted circuit. The
+counts and the fetched per-shot measurements of each task are stored bit-packed in a
+compressed `.npz` file next to it; large measurements are only indexed here, since the
+memory-mapped measurement store keeps them. Results can be searched by task ID, device, time
+range, status and circuit, and loaded without API calls.
+"""
+
+import hashlib
+import numpy as np
+import os
+import sqlite3
+import threading
+import time
+from awslabs.amazon_braket_mcp_server.composite import TERMINAL_STATUSES
+from awslabs.amazon_braket_mcp_server.measurements import encode_rows, packed_rows
+from awslabs.amazon_braket_mcp_server.models import (
+    ArchivedResult,
+    PackedMeasurements,
+    TaskResult,
+    TaskStatus,
+)
+from datetime import datetime, timezone
+from loguru import logger
+from pathlib import Path
+from typing import Any, List, Optional, Union
+
+
+# File name of the SQLite index in the archive directory
+INDEX_FILENAME = 'index.sqlite3'
+
+# Default maximum number of entries returned by a search
+DEFAULT_SEARCH_LIMIT = 100
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    task_id TEXT PRIMARY KEY,
+    device_arn TEXT NOT NULL,
+    status TEXT NOT NULL,
+    shots INTEGER NOT NULL,
+    circuit_hash TEXT,
+    created_at REAL,
+    ended_at REAL,
+    archived_at REAL NOT NULL,
+    num_qubits INTEGER,
+    has_measurements INTEGER NOT NULL DEFAULT 0,
+    result TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_device ON results (device_arn, created_at);
+CREATE INDEX IF NOT EXISTS results_circuit ON results (circuit_hash, created_at);
+CREATE INDEX IF NOT EXISTS results_created ON results (created_at);
+CREATE TABLE IF NOT EXISTS circuits (
+    task_id TEXT PRIMARY KEY,
+    circuit_hash TEXT NOT NULL
+);
+"""
+
+_COLUMNS = (
+    'task_id, device_arn, status, shots, circuit_hash, created_at, ended_at, archived_at, '
+    'num_qubits, has_measurements'
+)
+
+
+def _timestamp(value: Any) -> Optional[float]:
+    """Convert a metadata time (datetime, ISO string or Unix timestamp) to a Unix timestamp."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    return None
+
+
+class ResultArchive:
+    """SQLite-indexed archive of task results with compressed `.npz` data files.
+
+    Attributes:
+        directory: Directory of the index and data files
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        """Initialize the archive; the index is opened on first use.
+
+        Args:
+            directory: Directory of the index and data files
+        """
+        self.directory = Path(directory)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open (or create) the index; must be called with the lock held."""
+        if self._conn is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.directory / INDEX_FILENAME), check_same_thread=False)
+            with conn:
+                conn.execute('PRAGMA journal_mode=WAL')
+                conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the index."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _data_path(self, task_id: str) -> Path:
+        """Get the data file of a task; task ARNs are hashed to portable file names."""
+        return self.directory / (hashlib.sha256(task_id.encode('utf-8')).hexdigest() + '.npz')
+
+    @staticmethod
+    def _to_entry(row) -> ArchivedResult:
+        return ArchivedResult(
+            task_id=row[0],
+            device_arn=row[1],
+            status=TaskStatus(row[2]),
+            shots=row[3],
+            circuit_hash=row[4],
+            created_at=row[5],
+            ended_at=row[6],
+            archived_at=row[7],
+            num_qubits=row[8],
+            has_measurements=bool(row[9]),
+        )
+
+    def record_circuit(self, task_id: str, circuit_hash: str) -> None:
+        """Record the circuit a task was submitted with, before or after its result arrives.
+
+        Args:
+            task_id: ID of the quantum task
+            circuit_hash: Hash of the circuit definition
+        """
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO circuits (task_id, circuit_hash) VALUES (?, ?)',
+                    (task_id, circuit_hash),
+                )
+                conn.execute(
+                    'UPDATE results SET circuit_hash = ? WHERE task_id = ?',
+                    (circuit_hash, task_id),
+                )
+
+    def put(
+        self,
+        result: TaskResult,
+        measurements: Optional[PackedMeasurements] = None,
+        store_rows: bool = True,
+    ) -> Optional[ArchivedResult]:
+        """Archive the result of a task in a terminal state.
+
+        The data file is moved into place before the index row is written, so every indexed
+        file is complete.
+
+        Args:
+            result: Result of the quantum task
+            measurements: Bit-packed per-shot measurements of the task (optional)
+            store_rows: Whether the measurement rows are written to the data file; without it
+                they are only indexed, e.g. when the measurement store keeps them
+
+        Returns:
+            Optional[ArchivedResult]: The index entry, or None if the task is not terminal
+        """
+        if result.status not in TERMINAL_STATUSES:
+            return None
+        measurements = measurements or result.packed_measurements
+        counts = result.counts or {}
+        arrays = {
+            'bitstrings': np.array(list(counts), dtype=str),
+            'counts': np.array(list(counts.values()), dtype=np.int64),
+        }
+        if measurements is not None and store_rows:
+            arrays.update(
+                measurements=packed_rows(measurements),
+                num_qubits=np.int64(measurements.shape[1]),
+                bit_order=np.array(measurements.bit_order),
+            )
+        summary = result.model_copy(
+            update={'counts': None, 'measurements': None, 'packed_measurements': None}
+        )
+        metadata = result.metadata or {}
+        entry = ArchivedResult(
+            task_id=result.task_id,
+            device_arn=result.device,
+            status=result.status,
+            shots=result.shots,
+            created_at=_timestamp(metadata.get('createdAt')),
+            ended_at=_timestamp(metadata.get('endedAt')),
+            archived_at=time.time(),
+            num_qubits=measurements.shape[1] if measurements is not None else None,
+            has_measurements=measurements is not None,
+        )
+
+        path = self._data_path(result.task_id)
+        with self._lock:
+            conn = self._connection()
+            partial = path.with_suffix(f'.{threading.get_ident()}.tmp.npz')
+            np.savez_compressed(partial, **arrays)
+            os.replace(partial, path)
+            with conn:
+                row = conn.execute(
+                    'SELECT circuit_hash FROM circuits WHERE task_id = ?', (result.task_id,)
+                ).fetchone()
+                entry.circuit_hash = row[0] if row else None
+                conn.execute(
+                    f'INSERT OR REPLACE INTO results ({_COLUMNS}, result) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    (
+                        entry.task_id,
+                        entry.device_arn,
+                        entry.status.value,
+                        entry.shots,
+                        entry.circuit_hash,
+                        entry.created_at,
+                        entry.ended_at,
+                        entry.archived_at,
+                        entry.num_qubits,
+                        int(entry.has_measurements),
+                        summary.model_dump_json(),
+                    ),
+                )
+        return entry
+
+    def search(
+        self,
+        task_id: Optional[str] = None,
+        device_arn: Optional[str] = None,
+        circuit_hash: Optional[str] = None,
+        created_after: Optional[float] = None,
+        created_before: Optional[float] = None,
+        status: Optional[TaskStatus] = None,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+    ) -> List[ArchivedResult]:
+        """Search the archived results, most recently created first.
+
+        Tasks without a known creation time are matched on the time they were archived.
+
+        Args:
+            task_id: Only the result of this task
+            device_arn: Only results of this device
+            circuit_hash: Only results of this circuit
+            created_after: Only tasks created at or after this time (Unix timestamp)
+            created_before: Only tasks created before this time (Unix timestamp)
+            status: Only results in this status
+            limit: Maximum number of entries to return
+
+        Returns:
+            List[ArchivedResult]: Index entries of the matching results
+        """
+        conditions = []
+        params: tuple = ()
+        for column, value in (
+            ('task_id', task_id),
+            ('device_arn', device_arn),
+            ('circuit_hash', circuit_hash),
+            ('status', status.value if status is not None else None),
+        ):
+            if value is not None:
+                conditions.append(f'{column} = ?')
+                params += (value,)
+        if created_after is not None:
+            conditions.append('COALESCE(created_at, archived_at) >= ?')
+            params += (created_after,)
+        if created_before is not None:
+            conditions.append('COALESCE(created_at, archived_at) < ?')
+            params += (created_before,)
+        query = f'SELECT {_COLUMNS} FROM results'
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        query += ' ORDER BY COALESCE(created_at, archived_at) DESC LIMIT ?'
+        with self._lock:
+            rows = self._connection().execute(query, (*params, limit)).fetchall()
+        return [self._to_entry(row) for row in rows]
+
+    def get(self, task_id: str) -> Optional[TaskResult]:
+        """Load an archived result with its counts and bit-packed measurements.
+
+        Args:
+            task_id: ID of the quantum task
+
+        Returns:
+            Optional[TaskResult]: The result, or None if the task is not archived
+        """
+        with self._lock:
+            row = (
+                self._connection()
+                .execute('SELECT result FROM results WHERE task_id = ?', (task_id,))
+                .fetchone()
+            )
+        if row is None:
+            return None
+        result = TaskResult.model_validate_json(row[0])
+        try:
+            with np.load(self._data_path(task_id)) as data:
+                counts = {
+                    str(bitstring): int(count)
+                    for bitstring, count in zip(data['bitstrings'], data['counts'])
+                }
+                packed = None
+                if 'measurements' in data:
+                    packed = encode_rows(
+                        data['measurements'], int(data['num_qubits']), str(data['bit_order'])
+                    )
+        except Exception as e:
+            logger.warning(f'Ignoring unreadable archived data of {task_id}: {str(e)}')
+            return result
+        return result.model_copy(update={'counts': counts or None, 'packed_measurements': packed})
@@ -0,0 +1,113 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Direct conversion of circuit definitions to Braket circuits.
+
+Unlike the Qiskit route, the direct conversion keeps symbolic gate parameters (given as
+parameter names instead of numbers) as Braket free parameters, so a parameterized circuit is
+built and serialized once and each parameter point is sent as task inputs. It also supports
+device-native gates and verbatim boxes for circuits that are already compiled.
+"""
+
+from awslabs.amazon_braket_mcp_server.exceptions import CircuitCreationError
+from awslabs.amazon_braket_mcp_server.models import QuantumCircuit
+from braket.circuits import Circuit as BraketCircuit
+from braket.circuits import FreeParameter
+from typing import List, Mapping
+
+
+# Braket circuit methods for circuit definition gate names
+BRAKET_GATES: Mapping[str, str] = {
+    'h': 'h',
+    'x': 'x',
+    'y': 'y',
+    'z': 'z',
+    's': 's',
+    't': 't',
+    'rx': 'rx',
+    'ry': 'ry',
+    'rz': 'rz',
+    'cx': 'cnot',
+    'cnot': 'cnot',
+    'cy': 'cy',
+    'cz': 'cz',
+    'swap': 'swap',
+    'ccx': 'ccnot',
+    'toffoli': 'ccnot',
+    # Native gates of QPUs, for pre-compiled (verbatim) circuits
+    'prx': 'prx',
+    'iswap': 'iswap',
+    'gpi': 'gpi',
+    'gpi2': 'gpi2',
+    'ms': 'ms',
+}
+
+
+def circuit_parameters(circuit_def: QuantumCircuit) -> List[str]:
+    """List the symbolic parameter names of a circuit definition.
+
+    Args:
+        circuit_def: Circuit definition
+
+    Returns:
+        List[str]: Sorted names of the parameters given as strings
+    """
+    return sorted(
+        {
+            param
+            for gate in circuit_def.gates
+            for param in gate.params or []
+            if isinstance(param, str)
+        }
+    )
+
+
+def build_braket_circuit(circuit_def: QuantumCircuit, verbatim: bool = False) -> BraketCircuit:
+    """Build a Braket circuit from a circuit definition.
+
+    String gate parameters become free parameters. Explicit measurements (including
+    `measure_all`) measure exactly the requested qubits, even idle ones; without measurements,
+    every qubit the circuit acts on is measured, which is the Braket default.
+
+    Args:
+        circuit_def: Circuit definition
+        verbatim: Whether to wrap the gates in a verbatim box, so the device compiler runs
+            them unchanged on the given physical qubits
+
+    Returns:
+        BraketCircuit: The Braket circuit
+
+    Raises:
+        CircuitCreationError: If the circuit uses an unsupported gate
+    """
+    circuit = BraketCircuit()
+    measured: List[int] = []
+    for gate in circuit_def.gates:
+        if gate.name == 'measure_all' or (gate.name == 'measure' and not gate.qubits):
+            measured = list(range(circuit_def.num_qubits))
+            continue
+        if gate.name == 'measure':
+            measured.extend(q for q in gate.qubits if q not in measured)
+            continue
+        method = BRAKET_GATES.get(gate.name)
+        if method is None:
+            raise CircuitCreationError(f'Unsupported gate: {gate.name}')
+        params = [
+            FreeParameter(param) if isinstance(param, str) else param
+            for param in gate.params or []
+        ]
+        getattr(circuit, method)(*gate.qubits, *params)
+
+    if verbatim and circuit.instructions:
+        circuit = BraketCircuit().add_verbatim_box(circuit)
+    if measured and sorted(measured) != sorted(int(qubit) for qubit in circuit.qubits):
+        circuit.measure(sorted(measured))
+    return circuit
@@ -20,15 +20,26 @@ using both Qiskit and Amazon Braket SDK.
 """
 
 import io
+import os
 import json
 import base64
+import threading
+import tempfile
+import time
 import boto3
 import numpy as np
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Union, Any, Tuple
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_for_futures
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Union, Any, Tuple
 
-from braket.aws import AwsDevice, AwsQuantumTask
+from botocore.config import Config
+from braket.aws import AwsDevice, AwsQuantumTask, AwsSession
 from braket.circuits import Circuit as BraketCircuit
+from braket.circuits.serialization import IRType
+from braket.ir.openqasm import Program as OpenQASMProgram
 from braket.tasks import QuantumTask
 from braket.devices import LocalSimulator
 
@@ -39,22 +50,138 @@ from qiskit_braket_provider import BraketProvider
 from loguru import logger
 
 from awslabs.amazon_braket_mcp_server.models import (
+    ArchivedResult,
     QuantumCircuit,
     Gate,
     TaskResult,
     TaskStatus,
     DeviceInfo,
     DeviceType,
+    ExecutionWindow,
+    ResultTypeSpec,
+    SubmissionEntry,
+    SubmissionState,
+    TaskEstimate,
 )
 from awslabs.amazon_braket_mcp_server.exceptions import (
     CircuitCreationError,
+    CircuitValidationError,
     TaskExecutionError,
     TaskResultError,
     DeviceError,
+    ThrottlingError,
 )
+from awslabs.amazon_braket_mcp_server.archive import DEFAULT_SEARCH_LIMIT, ResultArchive
+from awslabs.amazon_braket_mcp_server.braket_circuits import (
+    build_braket_circuit,
+    circuit_parameters,
+)
+from awslabs.amazon_braket_mcp_server.composite import (
+    TERMINAL_STATUSES,
+    CompositeTask,
+    is_composite_task_id,
+    split_shots,
+)
+from awslabs.amazon_braket_mcp_server.deduplication import (
+    SubmissionDeduplicator,
+    circuit_hash,
+    sub_task_token,
+    submission_key,
+)
+from awslabs.amazon_braket_mcp_server.estimator import estimate_task, load_price_table
+from awslabs.amazon_braket_mcp_server.journal import (
+    JOURNAL_TAG,
+    SubmissionJournal,
+    SubmissionWorker,
+)
+from awslabs.amazon_braket_mcp_server.measurement_store import (
+    DEFAULT_PAGE_SIZE,
+    LARGE_RESULT_BYTES,
+    MeasurementStore,
+    StoredMeasurements,
+    packed_size,
+)
+from awslabs.amazon_braket_mcp_server.measurements import (
+    concatenate_packed,
+    pack_measurements,
+    packed_counts,
+    unpack_measurements,
+)
+from awslabs.amazon_braket_mcp_server.multiplexing import (
+    MultiplexedTask,
+    allocate_qubits,
+    pack_circuits,
+)
+from awslabs.amazon_braket_mcp_server.openqasm import (
+    device_parameters,
+    emit_openqasm,
+    program_action,
+)
+from awslabs.amazon_braket_mcp_server.preflight import (
+    find_parameter_errors,
+    find_preflight_errors,
+    validate_circuit_for_device,
+)
+from awslabs.amazon_braket_mcp_server.prefetcher import ResultPrefetcher
+from awslabs.amazon_braket_mcp_server.preview import PREVIEW_MAX_QUBITS, LocalPreviews
+from awslabs.amazon_braket_mcp_server.result_cache import DEFAULT_RESULT_CACHE_SIZE, ResultCache
+from awslabs.amazon_braket_mcp_server.result_types import (
+    build_result_type_circuit,
+    result_types_hash,
+    serialize_result_types,
+    validate_result_types,
+)
+from awslabs.amazon_braket_mcp_server.s3_results import load_result
+from awslabs.amazon_braket_mcp_server.scheduler import (
+    DEFAULT_DEVICE_CONCURRENCY,
+    SubmissionScheduler,
+)
+from awslabs.amazon_braket_mcp_server.sweep import ParameterSweep
+from awslabs.amazon_braket_mcp_server.throttling import RateLimiter
 from awslabs.amazon_braket_mcp_server.visualization import VisualizationUtils
 
 
+def make_client_config(
+    max_pool_connections: int = 50,
+    retry_mode: str = 'standard',
+    max_attempts: int = 2,
+    connect_timeout: float = 10.0,
+    read_timeout: float = 60.0,
+    tcp_keepalive: bool = True,
+) -> Config:
+    """Build the botocore configuration shared by all Braket API calls.
+
+    The connection pool is sized for the concurrent sub-task submissions, result fetches
+    and queued submissions issued from one service.
+
+    Throttling is handled by the service's RateLimiter, which wraps every call and makes up
+    to max_retries + 1 calls. Botocore retries inside each of those calls, so a throttled
+    request is sent up to (max_retries + 1) * max_attempts times. Botocore's retries are
+    therefore kept to one in 'standard' mode by default, for transient network and server
+    errors; the 'adaptive' mode would add a second client-side token bucket on top of the
+    RateLimiter's. Retries made by botocore are reported as sdk_retries in the throttling
+    metrics.
+
+    Args:
+        max_pool_connections: Maximum number of pooled HTTP connections
+        retry_mode: Botocore retry mode ('legacy', 'standard' or 'adaptive')
+        max_attempts: Maximum number of botocore attempts per call, including the first
+        connect_timeout: Seconds to wait for a connection
+        read_timeout: Seconds to wait for a response
+        tcp_keepalive: Whether to enable TCP keepalive on pooled connections
+
+    Returns:
+        Config: The botocore client configuration
+    """
+    return Config(
+        max_pool_connections=max_pool_connections,
+        retries={'mode': retry_mode, 'total_max_attempts': max_attempts},
+        connect_timeout=connect_timeout,
+        read_timeout=read_timeout,
+        tcp_keepalive=tcp_keepalive,
+    )
+
+
 class BraketService:
     """A unified interface for interacting with Amazon Braket service.
 
@@ -64,6 +191,8 @@ class BraketService:
     Attributes:
         braket_client: Boto3 client for Amazon Braket service
         provider: Qiskit Braket provider for converting Qiskit circuits to Braket circuits
+        rate_limiter: Client-side rate limiter applied to every Braket API call
+        deduplicator: Remembers recent submissions so identical retries reuse the existing task
     """
 
     # Regions where Amazon Braket is available
@@ -75,12 +204,73 @@ class BraketService:
         'eu-north-1'
     }
 
-    def __init__(self, region_name: Optional[str] = None, workspace_dir: Optional[str] = None):
+    # Maximum number of concurrent API requests issued for a single tool call
+    MAX_CONCURRENT_REQUESTS = 8
+
+    # File name of the submission journal in the workspace directory
+    JOURNAL_FILENAME = 'braket_submissions.sqlite3'
+
+    # Directory of memory-mapped task measurements in the workspace directory
+    MEASUREMENT_STORE_DIRNAME = 'braket_measurements'
+
+    # Directory of the persistent result archive in the workspace directory
+    ARCHIVE_DIRNAME = 'braket_archive'
+
+    # Allowed clock difference when searching for tasks of interrupted submissions
+    RECONCILE_CLOCK_SKEW_SECONDS = 300
+
+    def __init__(
+        self,
+        region_name: Optional[str] = None,
+        workspace_dir: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        dedup_window_seconds: float = 300.0,
+        device_cache_ttl_seconds: float = 60.0,
+        submission_concurrency: int = 4,
+        device_concurrency: int = DEFAULT_DEVICE_CONCURRENCY,
+        price_table_path: Optional[str] = None,
+        client_config: Optional[Config] = None,
+        submission_worker: Optional[SubmissionWorker] = None,
+        preview_max_qubits: int = PREVIEW_MAX_QUBITS,
+        direct_submission: bool = True,
+        result_cache_size: int = DEFAULT_RESULT_CACHE_SIZE,
+        prefetch_results: bool = False,
+        direct_results: bool = True,
+        memmap_threshold_bytes: int = LARGE_RESULT_BYTES,
+    ):
         """Initialize a connection to Amazon Braket service.
 
         Args:
             region_name: AWS region name. If not provided, uses the default region from AWS configuration.
             workspace_dir: Directory to save visualization files. If None, uses temp directory.
+                If set, fetched terminal results are also archived there and served from the
+                archive after a restart.
+            rate_limiter: Rate limiter for Braket API calls. If None, a new one is created.
+            dedup_window_seconds: How long identical submissions return the existing task ID.
+                Zero disables submission deduplication.
+            device_cache_ttl_seconds: How long device information is cached for pre-flight
+                checks and shot limits.
+            submission_concurrency: Maximum number of queued submissions the background
+                worker submits at once.
+            device_concurrency: Maximum number of queued submissions to one device the
+                background worker submits at once.
+            price_table_path: JSON file overriding entries of the default price table used
+                for cost estimates.
+            client_config: Botocore configuration of the shared Braket client. If None,
+                make_client_config() defaults are used.
+            submission_worker: Submission worker shared with services of other regions. If
+                None, a worker for the journal in workspace_dir is created on first use.
+            preview_max_qubits: Largest circuit simulated locally as a preview of a task.
+            direct_submission: Whether circuit definitions are rendered straight to OpenQASM
+                and submitted with CreateQuantumTask instead of through SDK circuit objects.
+            result_cache_size: Number of terminal task results cached in memory. Results are
+                also read from the archive if workspace_dir is set.
+            prefetch_results: Whether created tasks are watched in the background and their
+                results fetched into the result cache as soon as they finish.
+            direct_results: Whether gate model results are downloaded from their S3 output
+                location in concurrent ranged GETs instead of through the Braket SDK.
+            memmap_threshold_bytes: Bit-packed size from which fetched measurements are kept
+                in the memory-mapped measurement store instead of in the result cache.
             
         Raises:
             ValueError: If the specified region doesn't support Amazon Braket
@@ -92,13 +282,54 @@ class BraketService:
             region_name = session.region_name
             
         self.region_name = region_name
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.deduplicator = SubmissionDeduplicator(dedup_window_seconds)
+        self._submission_context = threading.local()
+        self._composite_tasks: Dict[str, CompositeTask] = {}
+        self._sweeps: Dict[str, ParameterSweep] = {}
+        self._multiplexed_tasks: Dict[str, MultiplexedTask] = {}
+        self.device_cache_ttl_seconds = device_cache_ttl_seconds
+        self._device_cache: Dict[str, Tuple[DeviceInfo, float]] = {}
+        self.workspace_dir = workspace_dir or tempfile.gettempdir()
+        self.submission_concurrency = submission_concurrency
+        self.device_concurrency = device_concurrency
+        self._submission_worker: Optional[SubmissionWorker] = submission_worker
+        self._submission_worker_lock = threading.Lock()
+        self.price_table = load_price_table(price_table_path)
+        self.previews = LocalPreviews(preview_max_qubits)
+        self.direct_submission = direct_submission
+        self.measurement_store = MeasurementStore(
+            Path(self.workspace_dir) / self.MEASUREMENT_STORE_DIRNAME
+        )
+        self.archive = (
+            ResultArchive(Path(workspace_dir) / self.ARCHIVE_DIRNAME) if workspace_dir else None
+        )
+        self.result_cache = ResultCache(self.archive, result_cache_size)
+        self.prefetch_results = prefetch_results
+        self.direct_results = direct_results
+        self.memmap_threshold_bytes = memmap_threshold_bytes
+        self._s3_client = None
+        self._s3_client_lock = threading.Lock()
+        self._prefetcher: Optional[ResultPrefetcher] = None
+        self._prefetcher_lock = threading.Lock()
         
         # Validate region support
         if region_name and region_name not in self.SUPPORTED_REGIONS:
             logger.warning(f'Region {region_name} may not support Amazon Braket. Supported regions: {sorted(self.SUPPORTED_REGIONS)}')
             
         try:
-            self.braket_client = boto3.client('braket', region_name=region_name)
+            self.client_config = client_config or make_client_config()
+            self.braket_client = boto3.client(
+                'braket', region_name=region_name, config=self.client_config
+            )
+            self.braket_client.meta.events.register(
+                'before-parameter-build.braket.CreateQuantumTask', self._inject_client_token
+            )
+            # Route every Braket SDK call (devices, tasks and S3 results) through one session
+            # on the tuned client, so they share its connection pool and hooks
+            self.aws_session = AwsSession(
+                braket_client=self.braket_client, config=self.client_config
+            )
             self.provider = BraketProvider()
             
             # Initialize visualization utilities
@@ -124,7 +355,7 @@ class BraketService:
         try:
             # Try to list devices as a basic connectivity test
             # This requires minimal permissions and validates both connectivity and auth
-            response = self.braket_client.search_devices(maxResults=1)
+            response = self._call('SearchDevices', self.braket_client.search_devices, maxResults=1)
             logger.debug("Successfully validated Amazon Braket service access")
         except Exception as e:
             error_msg = f"Failed to validate Amazon Braket service access: {str(e)}"
@@ -132,6 +363,51 @@ class BraketService:
             # Don't raise here - allow the service to initialize but log the warning
             # The actual operations will fail with more specific errors if needed
 
+    def _call(self, operation: str, func, *args, **kwargs) -> Any:
+        """Call the Braket API through the client-side rate limiter.
+
+        Args:
+            operation: Braket API operation performed by the call (e.g. 'GetQuantumTask')
+            func: Function performing the call (boto3 client method or Braket SDK method)
+            *args: Positional arguments for the function
+            **kwargs: Keyword arguments for the function
+
+        Returns:
+            Any: The return value of the function
+
+        Raises:
+            ThrottlingError: If the call is still throttled after all retries
+        """
+        return self.rate_limiter.call(operation, self.region_name, func, *args, **kwargs)
+
+    def _inject_client_token(self, params: Dict[str, Any], **kwargs) -> None:
+        """Botocore hook setting the idempotency token of the current submission.
+
+        The Braket SDK generates its own `clientToken` for every CreateQuantumTask request,
+        so the token of the submission in progress on this thread is injected here instead.
+        """
+        client_token = getattr(self._submission_context, 'client_token', None)
+        if client_token:
+            params['clientToken'] = client_token
+
+    @contextmanager
+    def _client_token(self, client_token: Optional[str]):
+        """Set the idempotency token used by CreateQuantumTask requests on this thread."""
+        self._submission_context.client_token = client_token
+        try:
+            yield
+        finally:
+            self._submission_context.client_token = None
+
+    def get_throttling_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Get client-side rate limiting metrics.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Calls, throttled responses and time spent waiting,
+                keyed by region and API operation
+        """
+        return self.rate_limiter.get_metrics()
+
     def create_qiskit_circuit(self, circuit_def: QuantumCircuit) -> QiskitCircuit:
         """Create a Qiskit quantum circuit from the circuit definition.
 
@@ -254,111 +530,816 @@ class BraketService:
         shots: int = 1000,
         s3_bucket: Optional[str] = None,
         s3_prefix: Optional[str] = None,
+        client_token: Optional[str] = None,
+        tags: Optional[Dict[str, str]] = None,
+        result_types: Optional[List[ResultTypeSpec]] = None,
+        verbatim: bool = False,
+        preview: bool = False,
     ) -> str:
         """Run a quantum task on an Amazon Braket device.
 
+        Identical submissions of a circuit definition (same circuit, device, shots and client
+        token) within the deduplication window return the existing task ID instead of
+        creating a new task. Requests for more shots than the device accepts are split into
+        concurrently submitted sub-tasks, returned as a single composite task ID.
+
+        Circuit definitions are checked against cached device information (qubit count,
+        supported gates, shots, status and paradigm) before they are compiled. With result
+        types, simulators return probabilities, expectation values or amplitudes instead of
+        measurements; with shots=0 these are exact.
+
+        Verbatim circuit definitions are already compiled to the device's native gates and
+        physical qubits. They are checked against the cached native gates and connectivity,
+        wrapped in a verbatim box and run with qubit rewiring disabled.
+
+        With preview, circuit definitions of up to preview_max_qubits qubits are also
+        simulated locally in the background; get_task_result returns the local result as a
+        labeled preview until the device result is available.
+
         Args:
             circuit: Quantum circuit to run (Qiskit, Braket, or circuit definition)
             device_arn: ARN of the device to run the task on
             shots: Number of shots to run
             s3_bucket: S3 bucket for storing results (optional)
             s3_prefix: S3 prefix for storing results (optional)
+            client_token: Idempotency token distinguishing intentional repeats (optional)
+            tags: Tags to attach to the created quantum tasks (optional)
+            result_types: Result types to compute, for circuit definitions (optional)
+            verbatim: Whether to run a circuit definition without device compilation
+            preview: Whether to simulate a circuit definition locally while the task runs
 
         Returns:
-            str: Task ID of the created quantum task
+            str: Task ID of the created (or deduplicated) quantum task
 
         Raises:
+            CircuitValidationError: If the device cannot run the circuit
             TaskExecutionError: If there is an error executing the task
+            ThrottlingError: If Amazon Braket keeps throttling the submission
         """
         try:
-            # Convert circuit if needed
-            braket_circuit = None
             if isinstance(circuit, QuantumCircuit):
-                qiskit_circuit = self.create_qiskit_circuit(circuit)
-                braket_circuit = self.convert_to_braket_circuit(qiskit_circuit)
-            elif isinstance(circuit, QiskitCircuit):
-                braket_circuit = self.convert_to_braket_circuit(circuit)
-            elif isinstance(circuit, BraketCircuit):
-                braket_circuit = circuit
+                if result_types or shots == 0:
+                    validate_result_types(result_types or [], circuit.num_qubits, shots)
+                self._preflight_check(circuit, device_arn, shots, verbatim)
+                digest = circuit_hash(circuit)
+                if result_types:
+                    digest += result_types_hash(result_types)
+                if verbatim:
+                    digest += ':verbatim'
+                key = submission_key(digest, device_arn, shots, client_token)
+                # A caller's token names one intended run (e.g. a journal entry), so it is
+                # sent as given and stays idempotent across restarts
+                task_id, deduplicated = self.deduplicator.submit_once(
+                    key,
+                    lambda window_token: self._submit_task(
+                        circuit,
+                        device_arn,
+                        shots,
+                        s3_bucket,
+                        s3_prefix,
+                        client_token or window_token,
+                        tags,
+                        result_types,
+                        verbatim,
+                    ),
+                )
+                if deduplicated:
+                    logger.info(f"Returning existing task {task_id} for duplicate submission")
+                else:
+                    self._archive_circuit(task_id, circuit)
+                if preview:
+                    self._start_preview(task_id, circuit, shots, result_types, verbatim)
+                return task_id
+
+            return self._submit_task(
+                circuit, device_arn, shots, s3_bucket, s3_prefix, client_token, tags
+            )
+        except (CircuitValidationError, ThrottlingError):
+            raise
+        except Exception as e:
+            logger.exception(f"Error running quantum task: {str(e)}")
+            raise TaskExecutionError(f"Error running quantum task: {str(e)}")
+
+    def _start_preview(
+        self,
+        task_id: str,
+        circuit: QuantumCircuit,
+        shots: int,
+        result_types: Optional[List[ResultTypeSpec]],
+        verbatim: bool,
+    ) -> None:
+        """Start the local preview of a submitted task; failures only skip the preview."""
+        try:
+            if result_types:
+                braket_circuit = build_result_type_circuit(circuit, result_types, verbatim)
             else:
-                raise TaskExecutionError(f"Unsupported circuit type: {type(circuit)}")
-            
-            # Create the device
-            device = AwsDevice(device_arn)
-            
-            # Run the task
-            task = device.run(
+                braket_circuit = build_braket_circuit(circuit, verbatim=verbatim)
+            self.previews.start(task_id, braket_circuit, circuit.num_qubits, shots)
+        except Exception as e:
+            logger.warning(f"Could not start local preview of {task_id}: {str(e)}")
+
+    def _with_preview(self, result: TaskResult) -> TaskResult:
+        """Attach the local preview to a result until the task reaches a terminal state."""
+        if not self.previews.has(result.task_id):
+            return result
+        if result.status in TERMINAL_STATUSES:
+            self.previews.discard(result.task_id)
+            return result
+        return result.model_copy(update={'preview': self.previews.get(result.task_id)})
+
+    def _submit_task(
+        self,
+        circuit: Union[QiskitCircuit, BraketCircuit, QuantumCircuit],
+        device_arn: str,
+        shots: int,
+        s3_bucket: Optional[str],
+        s3_prefix: Optional[str],
+        client_token: Optional[str],
+        tags: Optional[Dict[str, str]] = None,
+        result_types: Optional[List[ResultTypeSpec]] = None,
+        verbatim: bool = False,
+        disable_qubit_rewiring: bool = False,
+    ) -> str:
+        """Convert a circuit and create the quantum task.
+
+        With direct submission, circuit definitions without result types are rendered straight
+        to an OpenQASM program and created with CreateQuantumTask, skipping the SDK circuit
+        objects and the GetDevice call. Verbatim circuits, and circuits submitted with qubit
+        rewiring disabled, run on the physical qubits their indices name.
+
+        Returns:
+            str: Task ID of the created quantum task
+        """
+        shot_chunks = split_shots(shots, self._get_max_shots(device_arn))
+        if len(shot_chunks) > 1 and result_types:
+            raise CircuitValidationError(
+                f"Result types cannot be merged across split tasks; request at most "
+                f"{max(shot_chunks)} shots, or shots=0 for exact values"
+            )
+
+        disable_qubit_rewiring = disable_qubit_rewiring or verbatim
+        if self.direct_submission and isinstance(circuit, QuantumCircuit) and not result_types:
+            source, qubit_count = emit_openqasm(circuit, verbatim, disable_qubit_rewiring)
+            action = program_action(source)
+            parameters = device_parameters(device_arn, qubit_count, disable_qubit_rewiring)
+
+            def create(chunk: int, token: Optional[str]) -> str:
+                return self._create_task_direct(
+                    device_arn, action, parameters, chunk, s3_bucket, s3_prefix, token, tags
+                )
+
+        else:
+            device, braket_circuit = self._prepare_sdk_task(
+                circuit, device_arn, result_types, verbatim, disable_qubit_rewiring
+            )
+
+            def create(chunk: int, token: Optional[str]) -> str:
+                return self._create_task(
+                    device,
+                    braket_circuit,
+                    chunk,
+                    s3_bucket,
+                    s3_prefix,
+                    token,
+                    tags,
+                    disable_qubit_rewiring=disable_qubit_rewiring,
+                )
+
+        if len(shot_chunks) > 1:
+            return self._submit_composite_task(create, device_arn, shot_chunks, client_token)
+        return create(shots, client_token)
+
+    def _prepare_sdk_task(
+        self,
+        circuit: Union[QiskitCircuit, BraketCircuit, QuantumCircuit],
+        device_arn: str,
+        result_types: Optional[List[ResultTypeSpec]],
+        verbatim: bool,
+        physical: bool = False,
+    ) -> Tuple[AwsDevice, BraketCircuit]:
+        """Convert a circuit to a Braket circuit and create its device for the Braket SDK.
+
+        Circuit definitions on physical qubits are built directly, keeping their qubit labels.
+
+        Returns:
+            Tuple[AwsDevice, BraketCircuit]: The device and the Braket circuit
+        """
+        if isinstance(circuit, QuantumCircuit) and result_types:
+            braket_circuit = build_result_type_circuit(circuit, result_types, verbatim)
+        elif isinstance(circuit, QuantumCircuit) and (verbatim or physical):
+            braket_circuit = build_braket_circuit(circuit, verbatim=verbatim)
+        elif isinstance(circuit, QuantumCircuit):
+            qiskit_circuit = self.create_qiskit_circuit(circuit)
+            braket_circuit = self.convert_to_braket_circuit(qiskit_circuit)
+        elif isinstance(circuit, QiskitCircuit):
+            braket_circuit = self.convert_to_braket_circuit(circuit)
+        elif isinstance(circuit, BraketCircuit):
+            braket_circuit = circuit
+        else:
+            raise TaskExecutionError(f"Unsupported circuit type: {type(circuit)}")
+
+        device = self._call('GetDevice', AwsDevice, device_arn, aws_session=self.aws_session)
+        return device, braket_circuit
+
+    def _create_task(
+        self,
+        device: AwsDevice,
+        braket_circuit: Union[BraketCircuit, OpenQASMProgram],
+        shots: int,
+        s3_bucket: Optional[str],
+        s3_prefix: Optional[str],
+        client_token: Optional[str],
+        tags: Optional[Dict[str, str]] = None,
+        inputs: Optional[Dict[str, float]] = None,
+        disable_qubit_rewiring: bool = False,
+    ) -> str:
+        """Create a single quantum task on a device.
+
+        Returns:
+            str: Task ID of the created quantum task
+        """
+        with self._client_token(client_token):
+            task = self._call(
+                'CreateQuantumTask',
+                device.run,
                 braket_circuit,
                 shots=shots,
                 s3_destination_folder=(s3_bucket, s3_prefix) if s3_bucket and s3_prefix else None,
+                **({'tags': tags} if tags else {}),
+                **({'inputs': inputs} if inputs else {}),
+                **({'disable_qubit_rewiring': True} if disable_qubit_rewiring else {}),
             )
-            
-            return task.id
+        self._prefetch(task.id)
+        return task.id
+
+    def _create_task_direct(
+        self,
+        device_arn: str,
+        action: str,
+        parameters: str,
+        shots: int,
+        s3_bucket: Optional[str],
+        s3_prefix: Optional[str],
+        client_token: Optional[str],
+        tags: Optional[Dict[str, str]] = None,
+    ) -> str:
+        """Create a single quantum task from serialized action and device parameters.
+
+        Results go to the given S3 location, or to the default results location of the SDK
+        (AMZN_BRAKET_TASK_RESULTS_S3_URI or the session's default bucket).
+
+        Returns:
+            str: Task ID of the created quantum task
+        """
+        if not (s3_bucket and s3_prefix):
+            s3_bucket, s3_prefix = self._default_s3_destination()
+        request: Dict[str, Any] = {
+            'deviceArn': device_arn,
+            'action': action,
+            'deviceParameters': parameters,
+            'shots': shots,
+            'outputS3Bucket': s3_bucket,
+            'outputS3KeyPrefix': s3_prefix,
+        }
+        if client_token:
+            request['clientToken'] = client_token
+        if tags:
+            request['tags'] = tags
+        response = self._call(
+            'CreateQuantumTask', self.braket_client.create_quantum_task, **request
+        )
+        self._prefetch(response['quantumTaskArn'])
+        return response['quantumTaskArn']
+
+    def _get_prefetcher(self) -> ResultPrefetcher:
+        """Create the result prefetcher and start its thread."""
+        with self._prefetcher_lock:
+            if self._prefetcher is None:
+                self._prefetcher = ResultPrefetcher(
+                    self.get_task_status,
+                    # Fetch the measurements too, so every later lookup is a cache hit
+                    lambda task_id: self.get_task_result(task_id, packed=True),
+                )
+            self._prefetcher.start()
+            return self._prefetcher
+
+    def _prefetch(self, task_id: str) -> None:
+        """Watch a created task to prefetch its result, if prefetching is enabled."""
+        if self.prefetch_results:
+            self._get_prefetcher().watch(task_id)
+
+    def stop_prefetcher(self, timeout: Optional[float] = None) -> None:
+        """Stop the result prefetcher if it is running."""
+        if self._prefetcher is not None:
+            self._prefetcher.stop(timeout)
+
+    def _default_s3_destination(self) -> Tuple[str, str]:
+        """Get the S3 bucket and prefix the Braket SDK stores results in by default."""
+        uri = os.environ.get('AMZN_BRAKET_TASK_RESULTS_S3_URI')
+        if uri:
+            return AwsSession.parse_s3_uri(uri)
+        return self.aws_session.default_bucket(), 'tasks'
+
+    def _get_max_shots(self, device_arn: str) -> int:
+        """Get the maximum number of shots per task of a device.
+
+        Returns:
+            int: Maximum shots, or 0 if the limit is unknown (shots are then not split)
+        """
+        try:
+            return self.get_device_info(device_arn).max_shots
         except Exception as e:
-            logger.exception(f"Error running quantum task: {str(e)}")
-            raise TaskExecutionError(f"Error running quantum task: {str(e)}")
+            logger.debug(f"Could not determine max shots for {device_arn}: {str(e)}")
+            return 0
+
+    def _submit_composite_task(
+        self,
+        create: Callable[[int, Optional[str]], str],
+        device_arn: str,
+        shot_chunks: List[int],
+        client_token: Optional[str],
+    ) -> str:
+        """Submit the shot chunks of one request concurrently as a composite task.
+
+        If any sub-task cannot be created, the sub-tasks that were created are cancelled.
+
+        Args:
+            create: Function creating the task of one chunk from its shots and client token
+            device_arn: ARN of the device the tasks run on
+            shot_chunks: Shots of each sub-task
+            client_token: Idempotency token of the request (optional)
+
+        Returns:
+            str: ID of the composite task
+        """
+        tokens = [
+            sub_task_token(client_token, index) if client_token else None
+            for index in range(len(shot_chunks))
+        ]
+        workers = min(len(shot_chunks), self.MAX_CONCURRENT_REQUESTS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(create, chunk, token) for chunk, token in zip(shot_chunks, tokens)
+            ]
+
+        sub_task_ids = []
+        errors = []
+        for future in futures:
+            try:
+                sub_task_ids.append(future.result())
+            except Exception as e:
+                errors.append(e)
+
+        if errors:
+            for sub_task_id in sub_task_ids:
+                try:
+                    self.cancel_quantum_task(sub_task_id)
+                except Exception:
+                    logger.warning(f"Could not cancel sub-task {sub_task_id} of failed submission")
+            raise errors[0]
+
+        composite = CompositeTask(device_arn, sub_task_ids, shot_chunks)
+        self._composite_tasks[composite.task_id] = composite
+        logger.info(
+            f"Split {composite.shots} shots into {len(shot_chunks)} tasks "
+            f"as composite task {composite.task_id}"
+        )
+        return composite.task_id
+
+    def get_composite_task(self, task_id: str) -> Optional[CompositeTask]:
+        """Get a composite task by its ID.
+
+        Composite tasks of journaled submissions created before a restart are loaded from
+        the submission journal.
+
+        Args:
+            task_id: ID of the composite task
+
+        Returns:
+            Optional[CompositeTask]: The composite task, or None if it is unknown
+        """
+        composite = self._composite_tasks.get(task_id)
+        if composite is not None or not is_composite_task_id(task_id):
+            return composite
+        journal_path = Path(self.workspace_dir) / self.JOURNAL_FILENAME
+        if self._submission_worker is None and not journal_path.exists():
+            return None
+        composite = self._get_submission_worker().journal.get_composite(task_id)
+        if composite is None:
+            return None
+        return self._composite_tasks.setdefault(task_id, composite)
+
+    def has_task_handle(self, handle: str) -> bool:
+        """Check whether a composite task, sweep or multiplexed task was created by this service."""
+        return (
+            self.get_composite_task(handle) is not None
+            or handle in self._sweeps
+            or handle in self._multiplexed_tasks
+        )
+
+    def _get_composite_task_result(
+        self, task_id: str, include_measurements: bool = False
+    ) -> TaskResult:
+        """Get the merged result of a composite task.
+
+        Only sub-tasks that have not reached a terminal state are queried; completed
+        sub-task results are merged as they arrive. The composite keeps only their counts and
+        metadata. With include_measurements, the measurements of completed sub-tasks are read
+        from the measurement store (fetched and stored on first use) and merged bit-packed.
+        Once a sub-task fails or is cancelled, the remaining sub-tasks are cancelled so they
+        spend no more shots on a result that cannot be merged.
+        """
+        composite = self.get_composite_task(task_id)
+        if composite is None:
+            raise TaskResultError(f"Unknown composite task: {task_id}")
 
-    def get_task_result(self, task_id: str) -> TaskResult:
+        latest = {}
+        pending = composite.pending_sub_tasks()
+        if pending:
+            workers = min(len(pending), self.MAX_CONCURRENT_REQUESTS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(
+                    lambda sub_task_id: self.get_task_result(
+                        sub_task_id, packed=include_measurements
+                    ),
+                    pending,
+                )
+                for result in results:
+                    composite.record(result)
+                    latest[result.task_id] = result
+
+        if composite.stopped() and not composite.cancel_requested:
+            composite.cancel_requested = True
+            for sub_task_id in composite.pending_sub_tasks():
+                try:
+                    self.cancel_quantum_task(sub_task_id)
+                except Exception:
+                    logger.warning(f"Could not cancel sub-task {sub_task_id} of {task_id}")
+
+        merged = composite.merged_result(latest)
+        completed = composite.completed_sub_tasks()
+        if not include_measurements or not completed:
+            return merged
+        workers = min(len(completed), self.MAX_CONCURRENT_REQUESTS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            parts = list(executor.map(self._stored_measurements, completed))
+        packed = concatenate_packed([part.packed() for part in parts])
+        return merged.model_copy(update={'packed_measurements': packed})
+
+    @staticmethod
+    def _has_requested_detail(result: TaskResult, include_measurements: bool) -> bool:
+        """Check whether a cached result has the measurements a lookup asks for."""
+        return (
+            not include_measurements
+            or result.measurements is not None
+            or result.packed_measurements is not None
+            or result.status != TaskStatus.COMPLETED
+            or result.shots == 0
+        )
+
+    @staticmethod
+    def _shape_result(
+        result: TaskResult, include_measurements: bool, packed: bool, counts_only: bool
+    ) -> TaskResult:
+        """Encode the measurements of a result as a lookup asks and drop the parts it did not."""
+        update: Dict[str, Any] = {'measurements': None, 'packed_measurements': None}
+        if counts_only:
+            update.update(metadata=None, result_types=None)
+        elif packed:
+            if result.packed_measurements is None and result.measurements is not None:
+                update['packed_measurements'] = pack_measurements(result.measurements)
+            else:
+                update['packed_measurements'] = result.packed_measurements
+        elif include_measurements:
+            if result.measurements is None and result.packed_measurements is not None:
+                update['measurements'] = unpack_measurements(result.packed_measurements).tolist()
+            else:
+                update['measurements'] = result.measurements
+        return result.model_copy(update=update)
+
+    def _load_task(self, task_id: str) -> Tuple[AwsQuantumTask, Dict[str, Any]]:
+        """Look up a task and its metadata with one GetQuantumTask call."""
+        task = AwsQuantumTask(task_id, aws_session=self.aws_session)
+        return task, self._call('GetQuantumTask', task.metadata)
+
+    def _build_task_result(
+        self,
+        task_id: str,
+        task: AwsQuantumTask,
+        metadata: Dict[str, Any],
+        include_measurements: bool,
+    ) -> TaskResult:
+        """Build the result of a task from its metadata and cache it if it is terminal.
+
+        The result of a completed task is downloaded; other tasks need no further calls.
+        """
+        # Determine the task status
+        status_map = {
+            'CREATED': TaskStatus.CREATED,
+            'QUEUED': TaskStatus.QUEUED,
+            'RUNNING': TaskStatus.RUNNING,
+            'COMPLETED': TaskStatus.COMPLETED,
+            'FAILED': TaskStatus.FAILED,
+            'CANCELLED': TaskStatus.CANCELLED,
+        }
+        status = status_map.get(metadata.get('status'), TaskStatus.FAILED)
+
+        # If the task is completed, get the results
+        packed_measurements = None
+        counts = None
+        execution_time = None
+        result_types = None
+
+        if status == TaskStatus.COMPLETED:
+            result = self._download_result(task_id, task, metadata)
+            # Tasks run with shots=0 have result type values but no measurements
+            raw_measurements = getattr(result, 'measurements', None)
+            if include_measurements and raw_measurements is not None:
+                packed_measurements = pack_measurements(raw_measurements)
+            counts = getattr(result, 'measurement_counts', None)
+            result_types = serialize_result_types(result) or None
+            execution_time = metadata.get('endedAt', 0) - metadata.get('startedAt', 0) if metadata.get('startedAt') and metadata.get('endedAt') else None
+
+        # Create the task result
+        task_result = TaskResult(
+            task_id=task_id,
+            status=status,
+            packed_measurements=packed_measurements,
+            counts=counts,
+            device=metadata.get('deviceArn', ''),
+            shots=metadata.get('shots', 0),
+            execution_time=execution_time,
+            metadata=metadata,
+            result_types=result_types,
+        )
+        # Only fetched measurements are stored: large ones in the measurement store,
+        # the others with the result in the archive
+        cached = self._offload_measurements(task_result)
+        self.result_cache.put(
+            cached, task_result.packed_measurements, store_rows=cached is task_result
+        )
+        if status in TERMINAL_STATUSES:
+            # Terminal results reach callers through the cache, the waiter and batches too
+            self.previews.discard(task_id)
+        return task_result
+
+    def _offload_measurements(self, result: TaskResult) -> TaskResult:
+        """Move large measurements to the memory-mapped measurement store.
+
+        Returns:
+            TaskResult: The result to cache, without the measurements if they were moved
+        """
+        packed = result.packed_measurements
+        if packed is None or packed_size(packed) < self.memmap_threshold_bytes:
+            return result
+        try:
+            if self.measurement_store.get(result.task_id) is None:
+                self.measurement_store.put(result.task_id, packed)
+        except Exception as e:
+            logger.warning(f"Could not store the measurements of {result.task_id}: {str(e)}")
+            return result
+        return result.model_copy(update={'packed_measurements': None})
+
+    def _cached_result(self, task_id: str, include_measurements: bool) -> Optional[TaskResult]:
+        """Get a cached result with the requested detail, mapping stored measurements back in.
+
+        Returns:
+            Optional[TaskResult]: The result, or None if it has to be fetched
+        """
+        cached = self.result_cache.get(task_id)
+        if cached is None or self._has_requested_detail(cached, include_measurements):
+            return cached
+        stored = self.measurement_store.get(task_id)
+        if stored is None:
+            return None
+        return cached.model_copy(update={'packed_measurements': stored.packed()})
+
+    def _archive_circuit(self, task_id: str, circuit: QuantumCircuit) -> None:
+        """Record the circuit of a submitted task (or of each sub-task) in the archive."""
+        if self.archive is None:
+            return
+        composite = self._composite_tasks.get(task_id)
+        digest = circuit_hash(circuit)
+        try:
+            for sub_task_id in composite.sub_task_ids if composite else [task_id]:
+                self.archive.record_circuit(sub_task_id, digest)
+        except Exception as e:
+            logger.warning(f"Could not archive the circuit of {task_id}: {str(e)}")
+
+    @property
+    def s3_client(self) -> Any:
+        """S3 client for direct result downloads, created on first use with the tuned config."""
+        with self._s3_client_lock:
+            if self._s3_client is None:
+                self._s3_client = boto3.client(
+                    's3', region_name=self.region_name, config=self.client_config
+                )
+            return self._s3_client
+
+    def _download_result(
+        self, task_id: str, task: AwsQuantumTask, metadata: Dict[str, Any]
+    ) -> Any:
+        """Download the result of a completed task, directly from S3 where possible.
+
+        Results the direct loader does not handle, or fails to fetch, come from the SDK.
+        """
+        if self.direct_results:
+            try:
+                result = load_result(
+                    self.s3_client, metadata, max_concurrency=self.MAX_CONCURRENT_REQUESTS
+                )
+                if result is not None:
+                    return result
+            except Exception as e:
+                logger.warning(
+                    f"Could not download the result of {task_id} from S3, using the SDK: "
+                    f"{str(e)}"
+                )
+        return self._call('GetQuantumTask', task.result)
+
+    def get_task_result(
+        self,
+        task_id: str,
+        include_measurements: bool = False,
+        counts_only: bool = False,
+        packed: bool = False,
+    ) -> TaskResult:
         """Get the result of a quantum task.
 
+        By default the measurement counts are returned without the per-shot measurements,
+        which are only converted to lists with include_measurements. With packed, they are
+        returned bit-packed under `packed_measurements` instead. counts_only also drops the
+        task metadata and result type values. Fetched measurements are kept bit-packed.
+
+        For composite tasks (shot counts split across several tasks), the counts and
+        measurements of the sub-tasks completed so far are merged into one result. Tasks run
+        with a local preview carry it under `preview` until they reach a terminal state.
+        Results of completed, failed and cancelled tasks are cached, so repeated lookups make
+        no API calls or S3 downloads.
+
         Args:
             task_id: ID of the quantum task
+            include_measurements: Whether to include the per-shot measurements
+            counts_only: Whether to return only the status and measurement counts
+            packed: Whether to return the per-shot measurements bit-packed
 
         Returns:
             TaskResult: Result of the quantum task
 
         Raises:
             TaskResultError: If there is an error retrieving the task result
+            ThrottlingError: If Amazon Braket keeps throttling the status or result lookup
         """
         try:
-            # Retrieve the task
-            task = AwsQuantumTask(task_id)
-            
-            # Get the task metadata
-            metadata = task.metadata()
-            
-            # Determine the task status
-            status_map = {
-                'CREATED': TaskStatus.CREATED,
-                'QUEUED': TaskStatus.QUEUED,
-                'RUNNING': TaskStatus.RUNNING,
-                'COMPLETED': TaskStatus.COMPLETED,
-                'FAILED': TaskStatus.FAILED,
-                'CANCELLED': TaskStatus.CANCELLED,
-            }
-            status = status_map.get(metadata.get('status'), TaskStatus.FAILED)
-            
-            # If the task is completed, get the results
-            measurements = None
-            counts = None
-            execution_time = None
-            
-            if status == TaskStatus.COMPLETED:
-                result = task.result()
-                measurements = result.measurements.tolist() if hasattr(result, 'measurements') else None
-                counts = result.measurement_counts if hasattr(result, 'measurement_counts') else None
-                execution_time = metadata.get('endedAt', 0) - metadata.get('startedAt', 0) if metadata.get('startedAt') and metadata.get('endedAt') else None
+            packed = packed and not counts_only
+            include_measurements = (include_measurements or packed) and not counts_only
+            if is_composite_task_id(task_id):
+                result = self._get_composite_task_result(task_id, include_measurements)
+                return self._with_preview(
+                    self._shape_result(result, include_measurements, packed, counts_only)
+                )
+
+            cached = self._cached_result(task_id, include_measurements)
+            if cached is not None:
+                return self._with_preview(
+                    self._shape_result(cached, include_measurements, packed, counts_only)
+                )
+
+            task, metadata = self._load_task(task_id)
+            task_result = self._build_task_result(task_id, task, metadata, include_measurements)
             
-            # Create the task result
-            task_result = TaskResult(
-                task_id=task_id,
-                status=status,
-                measurements=measurements,
-                counts=counts,
-                device=metadata.get('deviceArn', ''),
-                shots=metadata.get('shots', 0),
-                execution_time=execution_time,
-                metadata=metadata,
+            return self._with_preview(
+                self._shape_result(task_result, include_measurements, packed, counts_only)
             )
-            
-            return task_result
+        except ThrottlingError:
+            raise
         except Exception as e:
             logger.exception(f"Error getting task result: {str(e)}")
             raise TaskResultError(f"Error getting task result: {str(e)}")
 
+    def iter_task_results(
+        self,
+        task_ids: List[str],
+        include_measurements: bool = False,
+        counts_only: bool = False,
+        packed: bool = False,
+        max_downloads: int = MAX_CONCURRENT_REQUESTS,
+    ) -> Iterator[Tuple[str, Union[TaskResult, Exception]]]:
+        """Fetch the results of many tasks concurrently, yielding each as soon as it is ready.
+
+        Cached results are yielded first, without API calls. The metadata of the other tasks
+        is looked up concurrently on the shared Braket client, as wide as its connection pool,
+        and the results of completed tasks are downloaded by at most max_downloads threads.
+        Results are shaped as by get_task_result.
+
+        Args:
+            task_ids: IDs of the quantum tasks (duplicates are fetched once)
+            include_measurements: Whether to include the per-shot measurements
+            counts_only: Whether to return only the status and measurement counts
+            packed: Whether to return the per-shot measurements bit-packed
+            max_downloads: Maximum number of results downloaded at once
+
+        Yields:
+            Tuple[str, Union[TaskResult, Exception]]: A task ID and its result, or the error
+                raised fetching it
+        """
+        packed = packed and not counts_only
+        include_measurements = (include_measurements or packed) and not counts_only
+
+        def shape(result: TaskResult) -> TaskResult:
+            return self._with_preview(
+                self._shape_result(result, include_measurements, packed, counts_only)
+            )
+
+        task_ids = list(dict.fromkeys(task_ids))
+        lookups = max(min(len(task_ids), self.client_config.max_pool_connections or 10), 1)
+        with ThreadPoolExecutor(max_workers=lookups) as lookup_pool, ThreadPoolExecutor(
+            max_workers=max_downloads
+        ) as download_pool:
+            pending: Dict[Future, Tuple[str, str]] = {}
+            for task_id in task_ids:
+                if is_composite_task_id(task_id):
+                    future = download_pool.submit(
+                        self.get_task_result, task_id, include_measurements, counts_only, packed
+                    )
+                    pending[future] = ('composite', task_id)
+                    continue
+                cached = self._cached_result(task_id, include_measurements)
+                if cached is not None:
+                    yield task_id, shape(cached)
+                    continue
+                pending[lookup_pool.submit(self._load_task, task_id)] = ('metadata', task_id)
+
+            while pending:
+                done, _ = wait_for_futures(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage, task_id = pending.pop(future)
+                    try:
+                        value = future.result()
+                    except Exception as e:
+                        logger.warning(f"Error fetching the result of {task_id}: {str(e)}")
+                        yield task_id, e
+                        continue
+                    if stage == 'composite':
+                        yield task_id, value
+                    elif stage == 'result':
+                        yield task_id, shape(value)
+                    else:
+                        task, metadata = value
+                        if metadata.get('status') != 'COMPLETED':
+                            # Only completed tasks have a result to download
+                            yield task_id, shape(
+                                self._build_task_result(
+                                    task_id, task, metadata, include_measurements
+                                )
+                            )
+                            continue
+                        future = download_pool.submit(
+                            self._build_task_result, task_id, task, metadata, include_measurements
+                        )
+                        pending[future] = ('result', task_id)
+
+    def get_task_status(self, task_id: str) -> TaskStatus:
+        """Get the status of a quantum task without fetching its result.
+
+        Tasks with a cached terminal result need no API call; other tasks take a single
+        GetQuantumTask call. The status of a composite task is merged from its sub-tasks.
+
+        Args:
+            task_id: ID of the quantum task
+
+        Returns:
+            TaskStatus: Status of the task (cancelling tasks are reported as running)
+
+        Raises:
+            TaskResultError: If there is an error retrieving the task status
+            ThrottlingError: If Amazon Braket keeps throttling the status lookup
+        """
+        try:
+            if is_composite_task_id(task_id):
+                return self.get_task_result(task_id, counts_only=True).status
+            cached = self.result_cache.get(task_id)
+            if cached is not None:
+                return cached.status
+            response = self._call(
+                'GetQuantumTask', self.braket_client.get_quantum_task, quantumTaskArn=task_id
+            )
+            status = response.get('status')
+            if status == 'CANCELLING':
+                return TaskStatus.RUNNING
+            return TaskStatus.__members__.get(status, TaskStatus.FAILED)
+        except ThrottlingError:
+            raise
+        except Exception as e:
+            logger.exception(f"Error getting task status: {str(e)}")
+            raise TaskResultError(f"Error getting task status: {str(e)}")
+
     def list_devices(self) -> List[DeviceInfo]:
         """List available quantum devices.
 
+        SearchDevices returns summaries without device capabilities, so they are not cached
+        for pre-flight checks; get_device_info caches full GetDevice responses only.
+
         Returns:
             List[DeviceInfo]: List of available quantum devices
 
@@ -367,44 +1348,26 @@ class BraketService:
         """
         try:
             # Get the list of devices
-            response = self.braket_client.search_devices(filters=[])
+            response = self._call('SearchDevices', self.braket_client.search_devices, filters=[])
             
             # Convert to DeviceInfo objects
             devices = []
             for device in response.get('devices', []):
-                device_type = DeviceType.QPU if device.get('deviceType') == 'QPU' else DeviceType.SIMULATOR
-                
-                # Get the supported gates
-                supported_gates = []
-                paradigm = device.get('deviceCapabilities', {}).get('paradigm', {})
-                if paradigm:
-                    supported_gates = list(paradigm.get('supportedGates', []))
-                
-                # Create the device info
-                device_info = DeviceInfo(
-                    device_arn=device.get('deviceArn', ''),
-                    device_name=device.get('deviceName', ''),
-                    device_type=device_type,
-                    provider_name=device.get('providerName', ''),
-                    status=device.get('deviceStatus', ''),
-                    qubits=device.get('deviceCapabilities', {}).get('paradigm', {}).get('qubitCount', 0),
-                    connectivity=device.get('deviceCapabilities', {}).get('paradigm', {}).get('connectivity', ''),
-                    paradigm=device.get('deviceCapabilities', {}).get('paradigm', {}).get('name', ''),
-                    max_shots=device.get('deviceCapabilities', {}).get('service', {}).get('shotsRange', {}).get('max', 0),
-                    supported_gates=supported_gates,
-                )
-                devices.append(device_info)
+                devices.append(self._parse_device_info(device))
             
             return devices
+        except ThrottlingError:
+            raise
         except Exception as e:
             logger.exception(f"Error listing devices: {str(e)}")
             raise DeviceError(f"Error listing devices: {str(e)}")
 
-    def get_device_info(self, device_arn: str) -> DeviceInfo:
+    def get_device_info(self, device_arn: str, use_cache: bool = True) -> DeviceInfo:
         """Get information about a specific quantum device.
 
         Args:
             device_arn: ARN of the device
+            use_cache: Whether to return cached device information younger than the cache TTL
 
         Returns:
             DeviceInfo: Information about the device
@@ -412,38 +1375,204 @@ class BraketService:
         Raises:
             DeviceError: If there is an error retrieving the device information
         """
+        if use_cache:
+            cached = self._device_cache.get(device_arn)
+            if cached is not None and time.monotonic() - cached[1] < self.device_cache_ttl_seconds:
+                return cached[0]
+
         try:
             # Get the device information
-            response = self.braket_client.get_device(deviceArn=device_arn)
-            
-            # Determine the device type
-            device_type = DeviceType.QPU if response.get('deviceType') == 'QPU' else DeviceType.SIMULATOR
-            
-            # Get the supported gates
-            supported_gates = []
-            paradigm = response.get('deviceCapabilities', {}).get('paradigm', {})
-            if paradigm:
-                supported_gates = list(paradigm.get('supportedGates', []))
-            
-            # Create the device info
-            device_info = DeviceInfo(
-                device_arn=response.get('deviceArn', ''),
-                device_name=response.get('deviceName', ''),
-                device_type=device_type,
-                provider_name=response.get('providerName', ''),
-                status=response.get('deviceStatus', ''),
-                qubits=response.get('deviceCapabilities', {}).get('paradigm', {}).get('qubitCount', 0),
-                connectivity=response.get('deviceCapabilities', {}).get('paradigm', {}).get('connectivity', ''),
-                paradigm=response.get('deviceCapabilities', {}).get('paradigm', {}).get('name', ''),
-                max_shots=response.get('deviceCapabilities', {}).get('service', {}).get('shotsRange', {}).get('max', 0),
-                supported_gates=supported_gates,
-            )
+            response = self._call('GetDevice', self.braket_client.get_device, deviceArn=device_arn)
+            
+            device_info = self._parse_device_info(response)
+            self._cache_device_info(device_info)
             
             return device_info
+        except ThrottlingError:
+            raise
         except Exception as e:
             logger.exception(f"Error getting device info: {str(e)}")
             raise DeviceError(f"Error getting device info: {str(e)}")
 
+    def _cache_device_info(self, device_info: DeviceInfo) -> None:
+        """Cache device information for pre-flight checks and shot limits.
+
+        Only device information parsed from a full GetDevice response may be cached; summaries
+        without capabilities would disable the qubit, gate and shot checks.
+        """
+        if device_info.device_arn:
+            self._device_cache[device_info.device_arn] = (device_info, time.monotonic())
+
+    @staticmethod
+    def _parse_device_info(device: Dict[str, Any]) -> DeviceInfo:
+        """Convert a GetDevice or SearchDevices entry to DeviceInfo.
+
+        Amazon Braket returns device capabilities as a JSON document, so both the serialized
+        and the already parsed form are accepted.
+
+        Args:
+            device: Device description returned by Amazon Braket
+
+        Returns:
+            DeviceInfo: Information about the device
+        """
+        capabilities = device.get('deviceCapabilities') or {}
+        if isinstance(capabilities, str):
+            capabilities = json.loads(capabilities)
+        paradigm = capabilities.get('paradigm') or {}
+        service = capabilities.get('service') or {}
+        action = capabilities.get('action') or {}
+
+        # Determine the device type
+        device_type = DeviceType.QPU if device.get('deviceType') == 'QPU' else DeviceType.SIMULATOR
+
+        # Get the supported gates
+        supported_gates = list(paradigm.get('supportedGates', []))
+        if not supported_gates:
+            for action_properties in action.values():
+                supported_gates.extend(action_properties.get('supportedOperations', []))
+
+        # Get the native gates, run unchanged in verbatim boxes
+        native_gates = list(paradigm.get('nativeGateSet', []))
+
+        # Get the paradigm name, inferring it from the supported actions if needed
+        paradigm_name = paradigm.get('name', '')
+        if not paradigm_name:
+            if any('annealing' in name for name in action):
+                paradigm_name = 'annealing'
+            elif any('ahs' in name for name in action):
+                paradigm_name = 'analog-hamiltonian-simulation'
+            elif action:
+                paradigm_name = 'gate-based'
+
+        # Shots range is either {'min': ..., 'max': ...} or [min, max]
+        shots_range = service.get('shotsRange', {})
+        if isinstance(shots_range, (list, tuple)):
+            max_shots = shots_range[1] if len(shots_range) > 1 else 0
+        else:
+            max_shots = shots_range.get('max', 0)
+
+        # Connectivity is either a description or {'fullyConnected': ..., 'connectivityGraph': ...}
+        connectivity = paradigm.get('connectivity', '')
+        connectivity_graph = None
+        if isinstance(connectivity, dict):
+            if not connectivity.get('fullyConnected'):
+                connectivity_graph = connectivity.get('connectivityGraph') or None
+            connectivity = 'full' if connectivity.get('fullyConnected') else 'graph'
+
+        # Availability windows of the device, in UTC
+        execution_windows = [
+            ExecutionWindow(
+                execution_day=str(window.get('executionDay', 'Everyday')),
+                window_start_hour=str(window.get('windowStartHour', '00:00:00')),
+                window_end_hour=str(window.get('windowEndHour', '23:59:59')),
+            )
+            for window in service.get('executionWindows') or []
+        ]
+
+        # Queue depth of normal priority quantum tasks, if reported
+        # (large queues are reported as e.g. '>2000')
+        queue_depth = None
+        for queue in device.get('deviceQueueInfo') or []:
+            if (
+                queue.get('queue') == 'QUANTUM_TASKS_QUEUE'
+                and queue.get('queuePriority', 'Normal') == 'Normal'
+            ):
+                digits = ''.join(c for c in str(queue.get('queueSize', '')) if c.isdigit())
+                queue_depth = int(digits) if digits else None
+
+        return DeviceInfo(
+            device_arn=device.get('deviceArn', ''),
+            device_name=device.get('deviceName', ''),
+            device_type=device_type,
+            provider_name=device.get('providerName', ''),
+            status=device.get('deviceStatus', ''),
+            qubits=paradigm.get('qubitCount', 0),
+            connectivity=connectivity,
+            paradigm=paradigm_name,
+            max_shots=max_shots,
+            supported_gates=supported_gates,
+            queue_depth=queue_depth,
+            connectivity_graph=connectivity_graph,
+            native_gates=native_gates,
+            execution_windows=execution_windows,
+        )
+
+    def validate_quantum_task(
+        self, circuit: QuantumCircuit, device_arn: str, shots: int, verbatim: bool = False
+    ) -> List[str]:
+        """Run the pre-flight checks of a quantum task without submitting it.
+
+        Args:
+            circuit: Circuit definition to run
+            device_arn: ARN of the target device
+            shots: Number of shots requested
+            verbatim: Whether the circuit would run verbatim
+
+        Returns:
+            List[str]: Reasons the device cannot run the request (empty if it can)
+
+        Raises:
+            DeviceError: If the device information cannot be retrieved
+        """
+        return find_preflight_errors(
+            circuit, self.get_device_info(device_arn), shots, verbatim
+        )
+
+    def _preflight_check(
+        self,
+        circuit: QuantumCircuit,
+        device_arn: str,
+        shots: int,
+        verbatim: bool = False,
+        physical: bool = False,
+        free_parameters: bool = False,
+    ) -> None:
+        """Reject a submission the device cannot run, before compiling the circuit.
+
+        The device checks are skipped if the device information is not available; the
+        request is then validated by Amazon Braket. Verbatim and physical circuits address
+        physical qubit labels. Unbound gate parameters are rejected unless they are bound
+        later as task inputs.
+
+        Raises:
+            CircuitValidationError: If the device cannot run the request
+        """
+        try:
+            device_info = self.get_device_info(device_arn)
+        except Exception as e:
+            logger.debug(f"Skipping device pre-flight checks for {device_arn}: {str(e)}")
+            errors = [] if free_parameters else find_parameter_errors(circuit)
+            if errors:
+                raise CircuitValidationError('Pre-flight check failed: ' + '; '.join(errors))
+            return
+        validate_circuit_for_device(
+            circuit, device_info, shots, verbatim, physical, free_parameters
+        )
+
+    def estimate_quantum_tasks(
+        self, circuits: List[QuantumCircuit], device_arn: str, shots: int = 1000
+    ) -> List[TaskEstimate]:
+        """Estimate the cost, runtime and queue wait of quantum tasks without submitting them.
+
+        Args:
+            circuits: Circuit definitions to run
+            device_arn: ARN of the device to run the tasks on
+            shots: Number of shots per circuit
+
+        Returns:
+            List[TaskEstimate]: One estimate per circuit
+        """
+        try:
+            device_info = self.get_device_info(device_arn)
+        except Exception as e:
+            logger.debug(f"Estimating without device information for {device_arn}: {str(e)}")
+            device_info = None
+        return [
+            estimate_task(circuit, device_arn, shots, self.price_table, device_info)
+            for circuit in circuits
+        ]
+
     def cancel_quantum_task(self, task_id: str) -> bool:
         """Cancel a quantum task.
 
@@ -457,9 +1586,19 @@ class BraketService:
             TaskExecutionError: If there is an error cancelling the task
         """
         try:
+            composite = self.get_composite_task(task_id)
+            if composite is not None:
+                for sub_task_id in composite.pending_sub_tasks():
+                    self.cancel_quantum_task(sub_task_id)
+                return True
+
             # Cancel the task
-            self.braket_client.cancel_quantum_task(quantumTaskArn=task_id)
+            self._call(
+                'CancelQuantumTask', self.braket_client.cancel_quantum_task, quantumTaskArn=task_id
+            )
             return True
+        except ThrottlingError:
+            raise
         except Exception as e:
             logger.exception(f"Error cancelling quantum task: {str(e)}")
             raise TaskExecutionError(f"Error cancelling quantum task: {str(e)}")
@@ -516,16 +1655,608 @@ class BraketService:
                 })
             
             # Search for tasks
-            response = self.braket_client.search_quantum_tasks(
+            response = self._call(
+                'SearchQuantumTasks',
+                self.braket_client.search_quantum_tasks,
                 filters=filters,
                 maxResults=max_results,
             )
             
             return response.get('quantumTasks', [])
+        except ThrottlingError:
+            raise
         except Exception as e:
             logger.exception(f"Error searching quantum tasks: {str(e)}")
             raise TaskExecutionError(f"Error searching quantum tasks: {str(e)}")
 
+    def _get_submission_worker(self) -> SubmissionWorker:
+        """Open the submission journal in the workspace directory and create its worker."""
+        with self._submission_worker_lock:
+            if self._submission_worker is None:
+                journal = SubmissionJournal(Path(self.workspace_dir) / self.JOURNAL_FILENAME)
+                self._submission_worker = SubmissionWorker(
+                    journal,
+                    submit=self._submit_journal_entry,
+                    reconcile=self._reconcile_journal_entry,
+                    max_concurrency=self.submission_concurrency,
+                    scheduler=SubmissionScheduler(self.get_device_info, self.device_concurrency),
+                )
+            return self._submission_worker
+
+    def start_submission_worker(self) -> None:
+        """Start draining the submission journal, resuming submissions left by a previous run."""
+        self._get_submission_worker().start()
+
+    def stop_submission_worker(self, timeout: Optional[float] = None) -> None:
+        """Stop the submission worker if it is running."""
+        if self._submission_worker is not None:
+            self._submission_worker.stop(timeout)
+
+    def enqueue_quantum_tasks(
+        self,
+        circuits: List[QuantumCircuit],
+        device_arn: str,
+        shots: int = 1000,
+        s3_bucket: Optional[str] = None,
+        s3_prefix: Optional[str] = None,
+    ) -> List[str]:
+        """Queue circuits in the durable submission journal.
+
+        The circuits are pre-flight checked, recorded in the journal and submitted by the
+        background worker, which survives server restarts.
+
+        Args:
+            circuits: Circuit definitions to run
+            device_arn: ARN of the device to run the tasks on
+            shots: Number of shots per circuit
+            s3_bucket: S3 bucket for storing results (optional)
+            s3_prefix: S3 prefix for storing results (optional)
+
+        Returns:
+            List[str]: Journal entry IDs, in the order of the circuits
+
+        Raises:
+            CircuitValidationError: If the device cannot run one of the circuits
+            TaskExecutionError: If the submissions cannot be journaled
+        """
+        try:
+            for circuit in circuits:
+                self._preflight_check(circuit, device_arn, shots)
+
+            worker = self._get_submission_worker()
+            entry_ids = [
+                worker.journal.enqueue(circuit, device_arn, shots, s3_bucket, s3_prefix)
+                for circuit in circuits
+            ]
+            worker.start()
+            worker.notify()
+            logger.info(f"Queued {len(entry_ids)} submissions for {device_arn}")
+            return entry_ids
+        except CircuitValidationError:
+            raise
+        except Exception as e:
+            logger.exception(f"Error queueing quantum tasks: {str(e)}")
+            raise TaskExecutionError(f"Error queueing quantum tasks: {str(e)}")
+
+    def get_submissions(
+        self,
+        entry_ids: Optional[List[str]] = None,
+        state: Optional[SubmissionState] = None,
+        limit: int = 100,
+    ) -> List[SubmissionEntry]:
+        """Get entries of the submission journal.
+
+        Args:
+            entry_ids: IDs of the entries to get (optional, lists the journal if not provided)
+            state: Only list entries in this state (optional)
+            limit: Maximum number of entries to list
+
+        Returns:
+            List[SubmissionEntry]: The journal entries; unknown entry IDs are skipped
+        """
+        journal = self._get_submission_worker().journal
+        if entry_ids is None:
+            return journal.list(state=state, limit=limit)
+        entries = [journal.get(entry_id) for entry_id in entry_ids]
+        return [
+            entry for entry in entries if entry and (state is None or entry.state == state)
+        ]
+
+    def get_submission_schedule(self) -> List[Dict[str, Any]]:
+        """Get the release schedule of queued submissions per device.
+
+        Returns:
+            List[Dict[str, Any]]: For each device with queued or in-flight submissions, whether
+                its execution window is open, when it opens next and how many submissions are
+                held, queued and in flight
+        """
+        return self._get_submission_worker().schedule()
+
+    def _submit_journal_entry(self, entry: SubmissionEntry) -> str:
+        """Submit a journaled circuit, using the entry ID as its client token.
+
+        Composite tasks are recorded in the journal before the entry is marked submitted, so
+        the handle stored with the entry is resolvable after a restart.
+        """
+        task_id = self.run_quantum_task(
+            entry.circuit,
+            entry.device_arn,
+            shots=entry.shots,
+            s3_bucket=entry.s3_bucket,
+            s3_prefix=entry.s3_prefix,
+            client_token=entry.entry_id,
+            tags={JOURNAL_TAG: entry.entry_id},
+        )
+        composite = self._composite_tasks.get(task_id)
+        if composite is not None:
+            self._get_submission_worker().journal.record_composite(composite)
+        return task_id
+
+    def _reconcile_journal_entry(self, entry: SubmissionEntry) -> Optional[str]:
+        """Find the task created for a submission interrupted by a restart.
+
+        Tasks are matched on the journal tag. Entries split into several sub-tasks are not
+        matched; resubmitting them reuses the sub-tasks' client tokens, so Amazon Braket
+        returns the existing tasks instead of creating new ones.
+
+        Returns:
+            Optional[str]: ID of the created task, or None if no single task was found
+        """
+        created_after = datetime.fromtimestamp(entry.updated_at, tz=timezone.utc) - timedelta(
+            seconds=self.RECONCILE_CLOCK_SKEW_SECONDS
+        )
+        tasks = self.search_quantum_tasks(
+            device_arn=entry.device_arn, created_after=created_after, max_results=100
+        )
+        matches = [
+            task['quantumTaskArn']
+            for task in tasks
+            if (task.get('tags') or {}).get(JOURNAL_TAG) == entry.entry_id
+        ]
+        return matches[0] if len(matches) == 1 else None
+
+    def run_parameter_sweep(
+        self,
+        circuit: QuantumCircuit,
+        device_arn: str,
+        points: List[Dict[str, float]],
+        shots: int = 1000,
+        observable: Optional[str] = None,
+        s3_bucket: Optional[str] = None,
+        s3_prefix: Optional[str] = None,
+    ) -> str:
+        """Run a parameterized circuit for every point of a parameter grid.
+
+        The circuit is validated, built and serialized to OpenQASM once. One task per point is
+        then submitted in the background, at most MAX_CONCURRENT_REQUESTS at a time, with the
+        point's values as task inputs.
+
+        Args:
+            circuit: Circuit definition whose gate parameters may name free parameters
+            device_arn: ARN of the device to run the tasks on
+            points: Values of every free parameter for each point
+            shots: Number of shots per point
+            observable: Pauli Z/I string whose expectation value is reported (optional)
+            s3_bucket: S3 bucket for storing results (optional)
+            s3_prefix: S3 prefix for storing results (optional)
+
+        Returns:
+            str: ID of the sweep
+
+        Raises:
+            CircuitValidationError: If a point does not bind the circuit's parameters or the
+                device cannot run the circuit
+            TaskExecutionError: If the sweep cannot be started
+        """
+        try:
+            free_parameters = set(circuit_parameters(circuit))
+            for index, point in enumerate(points):
+                if set(point) != free_parameters:
+                    raise CircuitValidationError(
+                        f"Point {index} binds {sorted(point)} but the circuit has parameters "
+                        f"{sorted(free_parameters)}"
+                    )
+            self._preflight_check(circuit, device_arn, shots, free_parameters=True)
+
+            # Compile the circuit structure once for all points
+            if self.direct_submission:
+                source, qubit_count = emit_openqasm(circuit)
+                device_params = device_parameters(device_arn, qubit_count, False)
+
+                def create(point: Dict[str, float], token: str) -> str:
+                    return self._create_task_direct(
+                        device_arn,
+                        program_action(source, point),
+                        device_params,
+                        shots,
+                        s3_bucket,
+                        s3_prefix,
+                        token,
+                    )
+
+            else:
+                program = build_braket_circuit(circuit).to_ir(IRType.OPENQASM)
+                device = self._call(
+                    'GetDevice', AwsDevice, device_arn, aws_session=self.aws_session
+                )
+
+                def create(point: Dict[str, float], token: str) -> str:
+                    return self._create_task(
+                        device, program, shots, s3_bucket, s3_prefix, token, inputs=point
+                    )
+
+            sweep = ParameterSweep(device_arn, points, shots, observable)
+            self._sweeps[sweep.sweep_id] = sweep
+            threading.Thread(
+                target=self._submit_sweep,
+                args=(sweep, create),
+                name=f'braket-{sweep.sweep_id}',
+                daemon=True,
+            ).start()
+            logger.info(f"Started sweep {sweep.sweep_id} with {len(points)} points")
+            return sweep.sweep_id
+        except (CircuitValidationError, ThrottlingError):
+            raise
+        except Exception as e:
+            logger.exception(f"Error starting parameter sweep: {str(e)}")
+            raise TaskExecutionError(f"Error starting parameter sweep: {str(e)}")
+
+    def _submit_sweep(
+        self, sweep: ParameterSweep, create: Callable[[Dict[str, float], str], str]
+    ) -> None:
+        """Submit one task per sweep point with bounded concurrency.
+
+        Args:
+            sweep: The sweep to submit
+            create: Function creating the task of a point from its values and client token
+        """
+
+        def submit(index: int) -> None:
+            try:
+                task_id = create(sweep.points[index], sub_task_token(sweep.sweep_id, index))
+                sweep.set_task(index, task_id)
+            except Exception as e:
+                logger.warning(f"Could not submit point {index} of {sweep.sweep_id}: {str(e)}")
+                sweep.set_error(index, str(e))
+
+        with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_REQUESTS) as executor:
+            list(executor.map(submit, range(len(sweep.points))))
+        logger.info(f"Submitted {sweep.submitted} of {len(sweep.points)} tasks of {sweep.sweep_id}")
+
+    def get_sweep(self, sweep_id: str) -> Optional[ParameterSweep]:
+        """Get a parameter sweep by its ID."""
+        return self._sweeps.get(sweep_id)
+
+    def get_sweep_results(self, sweep_id: str) -> Dict[str, Any]:
+        """Get the aggregated results of a parameter sweep.
+
+        Only tasks that have not reached a terminal state are queried; the table is filled in
+        as tasks complete.
+
+        Args:
+            sweep_id: ID of the sweep
+
+        Returns:
+            Dict[str, Any]: Sweep status, progress and one row per point with its counts and
+                expectation value
+
+        Raises:
+            TaskResultError: If the sweep is unknown or its results cannot be retrieved
+        """
+        sweep = self._sweeps.get(sweep_id)
+        if sweep is None:
+            raise TaskResultError(f"Unknown parameter sweep: {sweep_id}")
+
+        latest = {}
+        pending = sweep.pending_tasks()
+        if pending:
+            indices = list(pending)
+            workers = min(len(indices), self.MAX_CONCURRENT_REQUESTS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(self.get_task_result, [pending[i] for i in indices])
+                for index, result in zip(indices, results):
+                    sweep.record(index, result)
+                    latest[index] = result
+
+        return sweep.table(latest)
+
+    def run_multiplexed_tasks(
+        self,
+        circuits: List[QuantumCircuit],
+        device_arn: str,
+        shots: int = 1000,
+        s3_bucket: Optional[str] = None,
+        s3_prefix: Optional[str] = None,
+    ) -> MultiplexedTask:
+        """Run several small circuits as one task, each on its own qubits.
+
+        The circuits are placed on disjoint qubits of the device and combined into one
+        circuit. Where the device reports a connectivity graph, each circuit gets a connected
+        region of physical qubits and the task runs with qubit rewiring disabled, so the
+        placement is kept on the hardware. Otherwise the circuits get consecutive qubits and
+        the device compiler maps them. Every circuit runs for the same number of shots.
+
+        Args:
+            circuits: Circuit definitions to run
+            device_arn: ARN of the device to run the task on
+            shots: Number of shots of the packed task
+            s3_bucket: S3 bucket for storing results (optional)
+            s3_prefix: S3 prefix for storing results (optional)
+
+        Returns:
+            MultiplexedTask: The packed task and the placement of each circuit
+
+        Raises:
+            CircuitValidationError: If the circuits do not fit on the device together
+            TaskExecutionError: If the task cannot be submitted
+            ThrottlingError: If Amazon Braket keeps throttling the submission
+        """
+        try:
+            if not circuits:
+                raise CircuitValidationError('No circuits to multiplex')
+            try:
+                device_info = self.get_device_info(device_arn)
+                device_qubits = device_info.qubits
+                connectivity_graph = device_info.connectivity_graph
+            except Exception as e:
+                logger.debug(f"Packing without device information for {device_arn}: {str(e)}")
+                device_qubits, connectivity_graph = 0, None
+
+            layouts = allocate_qubits(
+                [circuit.num_qubits for circuit in circuits], device_qubits, connectivity_graph
+            )
+            physical = bool(connectivity_graph)
+            packed = pack_circuits(circuits, layouts)
+            self._preflight_check(packed, device_arn, shots, physical=physical)
+
+            task_id = self._submit_task(
+                packed,
+                device_arn,
+                shots,
+                s3_bucket,
+                s3_prefix,
+                None,
+                disable_qubit_rewiring=physical,
+            )
+            multiplexed = MultiplexedTask(task_id, device_arn, circuits, layouts, physical)
+            self._multiplexed_tasks[task_id] = multiplexed
+            logger.info(f"Packed {len(circuits)} circuits into task {task_id}")
+            return multiplexed
+        except (CircuitValidationError, ThrottlingError):
+            raise
+        except Exception as e:
+            logger.exception(f"Error running multiplexed task: {str(e)}")
+            raise TaskExecutionError(f"Error running multiplexed task: {str(e)}")
+
+    def _stored_measurements(self, task_id: str) -> StoredMeasurements:
+        """Open the stored measurements of a task, fetching and storing them on first use."""
+        stored = self.measurement_store.get(task_id)
+        if stored is not None:
+            return stored
+        result = self.get_task_result(task_id, packed=True)
+        if result.status != TaskStatus.COMPLETED:
+            raise TaskResultError(
+                f"Task {task_id} is {result.status.value}; measurements are available "
+                "once it completes"
+            )
+        # Large results were stored while they were fetched
+        stored = self.measurement_store.get(task_id)
+        if stored is not None:
+            return stored
+        if result.packed_measurements is None:
+            raise TaskResultError(f"Task {task_id} has no per-shot measurements")
+        return self.measurement_store.put(task_id, result.packed_measurements)
+
+    def get_task_marginals(
+        self, task_id: str, qubits: Optional[List[int]] = None
+    ) -> Dict[str, Any]:
+        """Count the measured bitstrings of a completed task, or their marginals on some qubits.
+
+        The counts are tallied in chunks over the memory-mapped measurements, stored on first
+        use as for get_task_measurements.
+
+        Args:
+            task_id: ID of the quantum task (or composite task)
+            qubits: Measured qubits to count, in the given order (all qubits if omitted)
+
+        Returns:
+            Dict[str, Any]: The counts of each bitstring of the qubits and the number of shots
+
+        Raises:
+            TaskResultError: If the task has not completed, has no per-shot measurements or
+                the qubits are out of range
+            ThrottlingError: If Amazon Braket keeps throttling the result lookup
+        """
+        try:
+            stored = self._stored_measurements(task_id)
+            return {
+                'task_id': task_id,
+                'total_shots': stored.shots,
+                'qubits': list(qubits) if qubits is not None else list(range(stored.num_qubits)),
+                'counts': stored.counts(qubits),
+            }
+        except ThrottlingError:
+            raise
+        except Exception as e:
+            logger.exception(f"Error getting task marginals: {str(e)}")
+            raise TaskResultError(f"Error getting task marginals: {str(e)}")
+
+    def get_task_measurements(
+        self,
+        task_id: str,
+        offset: int = 0,
+        limit: int = DEFAULT_PAGE_SIZE,
+        qubits: Optional[List[int]] = None,
+    ) -> Dict[str, Any]:
+        """Get a page of the per-shot measurements of a completed task.
+
+        The first request fetches the task result once and stores its bit-packed measurements
+        in the workspace directory. Pages are served from the memory-mapped file, so paging
+        downloads and parses nothing again.
+
+        Args:
+            task_id: ID of the quantum task (or composite task)
+            offset: Index of the first shot
+            limit: Maximum number of shots (at most MAX_PAGE_SIZE)
+            qubits: Measured qubits to return, in the given order (all qubits if omitted)
+
+        Returns:
+            Dict[str, Any]: The page of measurements, the total number of shots and qubits,
+                and the offset of the next page (None after the last page)
+
+        Raises:
+            TaskResultError: If the task has not completed, has no per-shot measurements or
+                the page is out of range
+            ThrottlingError: If Amazon Braket keeps throttling the result lookup
+        """
+        try:
+            stored = self._stored_measurements(task_id)
+            bits = stored.page(offset, limit, qubits)
+            next_offset = offset + len(bits)
+            return {
+                'task_id': task_id,
+                'total_shots': stored.shots,
+                'num_qubits': stored.num_qubits,
+                'qubits': list(qubits) if qubits is not None else list(range(stored.num_qubits)),
+                'offset': offset,
+                'measurements': bits.tolist(),
+                'next_offset': next_offset if next_offset < stored.shots else None,
+            }
+        except ThrottlingError:
+            raise
+        except Exception as e:
+            logger.exception(f"Error getting task measurements: {str(e)}")
+            raise TaskResultError(f"Error getting task measurements: {str(e)}")
+
+    def _get_archive(self) -> ResultArchive:
+        if self.archive is None:
+            raise TaskResultError('The result archive needs a workspace directory')
+        return self.archive
+
+    def search_archived_results(
+        self,
+        task_id: Optional[str] = None,
+        device_arn: Optional[str] = None,
+        circuit_hash: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        status: Optional[TaskStatus] = None,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+    ) -> List[ArchivedResult]:
+        """Search the local archive of fetched results, most recently created first.
+
+        Args:
+            task_id: Only the result of this task
+            device_arn: Only results of this device
+            circuit_hash: Only results of tasks submitted with the circuit of this hash
+            created_after: Only tasks created at or after this time (naive times are UTC)
+            created_before: Only tasks created before this time (naive times are UTC)
+            status: Only results in this status
+            limit: Maximum number of entries to return
+
+        Returns:
+            List[ArchivedResult]: Index entries of the matching results
+
+        Raises:
+            TaskResultError: If there is no archive or the search fails
+        """
+
+        def timestamp(value: Optional[datetime]) -> Optional[float]:
+            if value is None:
+                return None
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=timezone.utc)
+            return value.timestamp()
+
+        try:
+            return self._get_archive().search(
+                task_id=task_id,
+                device_arn=device_arn,
+                circuit_hash=circuit_hash,
+                created_after=timestamp(created_after),
+                created_before=timestamp(created_before),
+                status=status,
+                limit=limit,
+            )
+        except TaskResultError:
+            raise
+        except Exception as e:
+            logger.exception(f"Error searching archived results: {str(e)}")
+            raise TaskResultError(f"Error searching archived results: {str(e)}")
+
+    def get_archived_result(
+        self,
+        task_id: str,
+        include_measurements: bool = False,
+        counts_only: bool = False,
+        packed: bool = False,
+    ) -> TaskResult:
+        """Load a result from the local archive without API calls.
+
+        Args:
+            task_id: ID of the quantum task
+            include_measurements: Whether to include the per-shot measurements
+            counts_only: Whether to return only the status and measurement counts
+            packed: Whether to return the per-shot measurements bit-packed
+
+        Returns:
+            TaskResult: The archived result, shaped as by get_task_result
+
+        Raises:
+            TaskResultError: If there is no archive or the task is not archived
+        """
+        try:
+            result = self._get_archive().get(task_id)
+            if result is None:
+                raise TaskResultError(f"No archived result for task {task_id}")
+            packed = packed and not counts_only
+            include_measurements = (include_measurements or packed) and not counts_only
+            stored = (
+                self.measurement_store.get(task_id)
+                if include_measurements and result.packed_measurements is None
+                else None
+            )
+            if stored is not None:
+                # Large measurements are kept in the measurement store, not in the archive
+                result = result.model_copy(update={'packed_measurements': stored.packed()})
+            return self._shape_result(result, include_measurements, packed, counts_only)
+        except TaskResultError:
+            raise
+        except Exception as e:
+            logger.exception(f"Error loading archived result: {str(e)}")
+            raise TaskResultError(f"Error loading archived result: {str(e)}")
+
+    def get_multiplexed_results(self, task_id: str) -> Dict[str, Any]:
+        """Get the per-circuit counts of a multiplexed task.
+
+        Args:
+            task_id: ID of the multiplexed task
+
+        Returns:
+            Dict[str, Any]: Task status and the counts and qubit layout of each circuit
+
+        Raises:
+            TaskResultError: If the task is unknown or its result cannot be retrieved
+            ThrottlingError: If Amazon Braket keeps throttling the result lookup
+        """
+        multiplexed = self._multiplexed_tasks.get(task_id)
+        if multiplexed is None:
+            raise TaskResultError(f"Unknown multiplexed task: {task_id}")
+
+        result = self.get_task_result(task_id)
+        counts = multiplexed.split(result)
+        return {
+            'task_id': task_id,
+            'device_arn': multiplexed.device_arn,
+            'status': result.status.value,
+            'shots': result.shots,
+            'physical_qubits': multiplexed.physical,
+            'circuits': [
+                {'index': index, 'qubits': layout, 'counts': circuit_counts}
+                for index, (layout, circuit_counts) in enumerate(zip(multiplexed.layouts, counts))
+            ],
+        }
+
     def visualize_circuit(self, circuit: Union[QiskitCircuit, QuantumCircuit]) -> str:
         """Visualize a quantum circuit.
 
@@ -652,9 +2383,18 @@ class BraketService:
             logger.exception(f"Error creating QFT circuit: {str(e)}")
             raise CircuitCreationError(f"Error creating QFT circuit: {str(e)}")
 
+    @staticmethod
+    def _with_counts(result: TaskResult) -> TaskResult:
+        """Fill in the counts of a result that only carries bit-packed measurements."""
+        if result.counts or result.packed_measurements is None:
+            return result
+        return result.model_copy(update={'counts': packed_counts(result.packed_measurements)})
+
     def visualize_results(self, result: TaskResult) -> str:
         """Visualize the results of a quantum task.
 
+        Counts are tallied from bit-packed measurements if the result has no counts.
+
         Args:
             result: Result of the quantum task
 
@@ -674,6 +2414,7 @@ class BraketService:
                 raise TaskResultError("matplotlib is required for results visualization. Please install it with: pip install matplotlib")
             
             # Check if we have counts
+            result = self._with_counts(result)
             if not result.counts:
                 raise TaskResultError("No measurement counts available for visualization")
             
@@ -752,6 +2493,7 @@ class BraketService:
         """
         try:
             # Generate base64 visualization
+            result = self._with_counts(result)
             base64_viz = self.visualize_results(result)
             
             # Create response
@@ -781,4 +2523,4 @@ class BraketService:
         Returns:
             Dictionary containing result description and analysis
         """
-        return self.viz_utils.describe_results(result)
+        return self.viz_utils.describe_results(self._with_counts(result))
@@ -0,0 +1,193 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Composite quantum tasks for shot counts above a device's limit.
+
+A request for more shots than a device accepts is split into several sub-tasks. The
+composite task tracks them under a single handle and merges their counts incrementally, as
+each sub-task completes. Only the counts and metadata of sub-task results are kept; their
+per-shot measurements are read from the measurement store when they are requested. Once a
+sub-task fails or is cancelled the composite can never complete, so its remaining sub-tasks
+are cancelled; it reports FAILED (or CANCELLED) only when every sub-task has stopped.
+"""
+
+import threading
+import uuid
+from awslabs.amazon_braket_mcp_server.models import TaskResult, TaskStatus
+from typing import Dict, List, Optional
+
+
+# Prefix distinguishing composite task handles from Braket task ARNs
+COMPOSITE_TASK_PREFIX = 'composite-'
+
+TERMINAL_STATUSES = {TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED}
+
+
+def is_composite_task_id(task_id: str) -> bool:
+    """Check whether a task ID is a composite task handle."""
+    return task_id.startswith(COMPOSITE_TASK_PREFIX)
+
+
+def split_shots(shots: int, max_shots: int) -> List[int]:
+    """Split a shot count into chunks no larger than the device maximum.
+
+    Args:
+        shots: Total number of shots requested
+        max_shots: Maximum number of shots per task
+
+    Returns:
+        List[int]: Shots per sub-task, as evenly balanced as possible
+    """
+    if max_shots <= 0 or shots <= max_shots:
+        return [shots]
+    num_tasks = -(-shots // max_shots)
+    base, extra = divmod(shots, num_tasks)
+    return [base + 1 if i < extra else base for i in range(num_tasks)]
+
+
+class CompositeTask:
+    """A set of sub-tasks that together run the shots of one request.
+
+    Attributes:
+        task_id: Handle of the composite task
+        device_arn: ARN of the device the sub-tasks run on
+        sub_task_ids: IDs of the sub-tasks, in submission order
+        shots_per_task: Shots requested for each sub-task
+        cancel_requested: Whether the remaining sub-tasks were cancelled after a failure
+    """
+
+    def __init__(
+        self,
+        device_arn: str,
+        sub_task_ids: List[str],
+        shots_per_task: List[int],
+        task_id: Optional[str] = None,
+    ):
+        """Initialize the composite task.
+
+        Args:
+            device_arn: ARN of the device the sub-tasks run on
+            sub_task_ids: IDs of the sub-tasks, in submission order
+            shots_per_task: Shots requested for each sub-task
+            task_id: Handle of a previously created composite task (a new one if omitted)
+        """
+        self.task_id = task_id or f'{COMPOSITE_TASK_PREFIX}{uuid.uuid4()}'
+        self.device_arn = device_arn
+        self.sub_task_ids = sub_task_ids
+        self.shots_per_task = shots_per_task
+        self.cancel_requested = False
+        self._results: Dict[str, TaskResult] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def shots(self) -> int:
+        """Total number of shots across all sub-tasks."""
+        return sum(self.shots_per_task)
+
+    def pending_sub_tasks(self) -> List[str]:
+        """Get the sub-tasks that have not reached a terminal state yet."""
+        with self._lock:
+            return [task_id for task_id in self.sub_task_ids if task_id not in self._results]
+
+    def completed_sub_tasks(self) -> List[str]:
+        """Get the completed sub-tasks, in submission order."""
+        with self._lock:
+            return [
+                task_id
+                for task_id in self.sub_task_ids
+                if task_id in self._results
+                and self._results[task_id].status == TaskStatus.COMPLETED
+            ]
+
+    def stopped(self) -> bool:
+        """Check whether a sub-task failed or was cancelled, so the composite cannot complete."""
+        with self._lock:
+            return any(
+                result.status in (TaskStatus.FAILED, TaskStatus.CANCELLED)
+                for result in self._results.values()
+            )
+
+    def record(self, result: TaskResult) -> None:
+        """Record the latest result of a sub-task.
+
+        Terminal results are kept without their measurements, so completed sub-tasks are
+        never fetched again and composites hold no per-shot data.
+
+        Args:
+            result: Result of one of the sub-tasks
+        """
+        if result.status in TERMINAL_STATUSES:
+            summary = result.model_copy(update={'measurements': None, 'packed_measurements': None})
+            with self._lock:
+                self._results[result.task_id] = summary
+
+    def merged_result(self, latest: Optional[Dict[str, TaskResult]] = None) -> TaskResult:
+        """Merge the sub-task results recorded so far.
+
+        Args:
+            latest: Latest non-terminal results of pending sub-tasks, used for status reporting
+
+        Returns:
+            TaskResult: Combined result with the counts of completed sub-tasks
+        """
+        latest = latest or {}
+        with self._lock:
+            results = dict(self._results)
+
+        counts: Dict[str, int] = {}
+        completed_shots = 0
+        sub_tasks = []
+        statuses = []
+
+        for task_id, shots in zip(self.sub_task_ids, self.shots_per_task):
+            result = results.get(task_id) or latest.get(task_id)
+            status = result.status if result else TaskStatus.CREATED
+            statuses.append(status)
+            sub_tasks.append({'task_id': task_id, 'status': status.value, 'shots': shots})
+
+            if result is None or status != TaskStatus.COMPLETED:
+                continue
+            completed_shots += shots
+            for outcome, count in (result.counts or {}).items():
+                counts[outcome] = counts.get(outcome, 0) + count
+
+        # A failed composite stays RUNNING until its remaining sub-tasks have stopped
+        if all(status == TaskStatus.COMPLETED for status in statuses):
+            status = TaskStatus.COMPLETED
+        elif all(status in TERMINAL_STATUSES for status in statuses):
+            if any(status == TaskStatus.FAILED for status in statuses):
+                status = TaskStatus.FAILED
+            else:
+                status = TaskStatus.CANCELLED
+        elif any(status not in (TaskStatus.CREATED, TaskStatus.QUEUED) for status in statuses):
+            status = TaskStatus.RUNNING
+        elif any(status == TaskStatus.QUEUED for status in statuses):
+            status = TaskStatus.QUEUED
+        else:
+            status = TaskStatus.CREATED
+
+        execution_times = [
+            r.execution_time for r in results.values() if r.execution_time is not None
+        ]
+
+        return TaskResult(
+            task_id=self.task_id,
+            status=status,
+            counts=counts or None,
+            device=self.device_arn,
+            shots=self.shots,
+            execution_time=max(execution_times) if execution_times else None,
+            metadata={
+                'composite': True,
+                'completed_shots': completed_shots,
+                'sub_tasks': sub_tasks,
+            },
+        )
@@ -0,0 +1,181 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Idempotent submission support for quantum tasks.
+
+Agents that retry after a timeout often resubmit the same circuit. This module keys each
+submission by circuit hash, device, shots and an optional client token, and remembers the
+resulting task ID for a configurable window so that retries return the existing task.
+
+The Braket `clientToken` of a deduplicated submission is derived from its key and a random
+nonce drawn when the window opens, so retries within the window are idempotent on the AWS
+side as well, while deliberate re-runs after the window create new tasks.
+"""
+
+import hashlib
+import json
+import threading
+import time
+import uuid
+from awslabs.amazon_braket_mcp_server.models import QuantumCircuit
+from typing import Callable, Dict, Optional, Tuple
+
+
+def circuit_hash(circuit: QuantumCircuit) -> str:
+    """Compute a stable hash of a circuit definition.
+
+    Circuit metadata is excluded, so two circuits with the same qubits and gates hash equally.
+
+    Args:
+        circuit: Circuit definition to hash
+
+    Returns:
+        str: Hex-encoded SHA-256 digest of the canonical circuit structure
+    """
+    canonical = json.dumps(
+        circuit.model_dump(exclude={'metadata'}), sort_keys=True, separators=(',', ':')
+    )
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def submission_key(
+    circuit_digest: str, device_arn: str, shots: int, client_token: Optional[str] = None
+) -> str:
+    """Compute the idempotency key of a submission.
+
+    The key is the same for every submission of the same request; see
+    `SubmissionDeduplicator.submit_once` for the `clientToken` sent to Amazon Braket.
+
+    Args:
+        circuit_digest: Hash of the circuit (see `circuit_hash`)
+        device_arn: ARN of the target device
+        shots: Number of shots
+        client_token: Optional caller-supplied token distinguishing intentional repeats
+
+    Returns:
+        str: Hex-encoded SHA-256 idempotency key
+    """
+    material = '|'.join([circuit_digest, device_arn, str(shots), client_token or ''])
+    return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+
+class SubmissionDeduplicator:
+    """Remember recent submissions so identical requests return the existing task ID.
+
+    Attributes:
+        window_seconds: How long a submission is remembered. Zero disables deduplication.
+    """
+
+    def __init__(self, window_seconds: float = 300.0, clock: Callable[[], float] = time.monotonic):
+        """Initialize the deduplicator.
+
+        Args:
+            window_seconds: How long a submission is remembered (in seconds)
+            clock: Monotonic clock used to expire entries
+        """
+        self.window_seconds = window_seconds
+        self._clock = clock
+        self._entries: Dict[str, Tuple[str, float]] = {}
+        self._tokens: Dict[str, Tuple[str, float]] = {}
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether deduplication is active."""
+        return self.window_seconds > 0
+
+    def _expire(self, now: float) -> None:
+        expired = [key for key, (_, ts) in self._entries.items() if now - ts > self.window_seconds]
+        for key in expired:
+            del self._entries[key]
+            key_lock = self._key_locks.get(key)
+            if key_lock is not None and not key_lock.locked():
+                del self._key_locks[key]
+        stale = [key for key, (_, ts) in self._tokens.items() if now - ts > self.window_seconds]
+        for key in stale:
+            del self._tokens[key]
+
+    def _client_token(self, key: str) -> str:
+        """Get the clientToken of a key's window, drawing a new nonce when the window opens."""
+        with self._lock:
+            now = self._clock()
+            self._expire(now)
+            entry = self._tokens.get(key)
+            if entry is None:
+                token = hashlib.sha256(f'{key}/{uuid.uuid4().hex}'.encode('utf-8')).hexdigest()
+                entry = self._tokens[key] = (token, now)
+            return entry[0]
+
+    def lookup(self, key: str) -> Optional[str]:
+        """Get the task ID recorded for a key within the window.
+
+        Args:
+            key: Idempotency key
+
+        Returns:
+            Optional[str]: The existing task ID, or None if there is none
+        """
+        with self._lock:
+            self._expire(self._clock())
+            entry = self._entries.get(key)
+            return entry[0] if entry else None
+
+    def record(self, key: str, task_id: str) -> None:
+        """Record the task ID created for a key.
+
+        Args:
+            key: Idempotency key
+            task_id: ID of the created task
+        """
+        with self._lock:
+            self._entries[key] = (task_id, self._clock())
+
+    def submit_once(self, key: str, submit: Callable[[Optional[str]], str]) -> Tuple[str, bool]:
+        """Submit unless an identical submission exists within the window.
+
+        Concurrent calls with the same key are serialized so that only one task is created.
+        The submission is called with a `clientToken` that stays the same for retries of a
+        failed attempt within the window, and with None when deduplication is disabled.
+
+        Args:
+            key: Idempotency key
+            submit: Function creating the task with a client token and returning its ID
+
+        Returns:
+            Tuple[str, bool]: The task ID, and whether it was an existing (deduplicated) task
+        """
+        if not self.enabled:
+            return submit(None), False
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            existing = self.lookup(key)
+            if existing is not None:
+                return existing, True
+            task_id = submit(self._client_token(key))
+            self.record(key, task_id)
+            return task_id, False
+
+
+def sub_task_token(client_token: str, index: int) -> str:
+    """Derive the idempotency token of one sub-task of a split submission.
+
+    Args:
+        client_token: Idempotency token of the whole submission
+        index: Position of the sub-task within the submission
+
+    Returns:
+        str: Hex-encoded SHA-256 token, unique per sub-task
+    """
+    return hashlib.sha256(f'{client_token}/{index}'.encode('utf-8')).hexdigest()
@@ -0,0 +1,191 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Cost and duration estimates for quantum tasks.
+
+Estimates combine circuit statistics (qubits, depth, two-qubit gates), cached device
+information (shot limits, queue depth) and a local price table. QPUs are billed per task and
+per shot; managed simulators are billed per minute of runtime, which grows as 2^n x depth for
+state vector simulation (4^n x depth for density matrices).
+"""
+
+import json
+from awslabs.amazon_braket_mcp_server.composite import split_shots
+from awslabs.amazon_braket_mcp_server.models import (
+    CircuitStats,
+    DeviceInfo,
+    QuantumCircuit,
+    TaskEstimate,
+)
+from typing import Any, Dict, Optional
+
+
+# On-demand prices in USD keyed by device ARN fragment; the longest matching fragment wins.
+# QPU entries hold per-task and per-shot prices and the approximate time per shot; simulator
+# entries hold the per-minute price and the simulation method.
+DEFAULT_PRICE_TABLE: Dict[str, Dict[str, Any]] = {
+    'quantum-simulator/amazon/sv1': {'per_minute': 0.075, 'method': 'state_vector'},
+    'quantum-simulator/amazon/dm1': {'per_minute': 0.075, 'method': 'density_matrix'},
+    'quantum-simulator/amazon/tn1': {'per_minute': 0.275, 'method': 'tensor_network'},
+    'qpu/ionq': {'per_task': 0.30, 'per_shot': 0.03, 'shot_seconds': 0.01},
+    'qpu/ionq/forte': {'per_task': 0.30, 'per_shot': 0.08, 'shot_seconds': 0.01},
+    'qpu/rigetti': {'per_task': 0.30, 'per_shot': 0.0009, 'shot_seconds': 0.0002},
+    'qpu/iqm': {'per_task': 0.30, 'per_shot': 0.00145, 'shot_seconds': 0.0002},
+    'qpu/quera': {'per_task': 0.30, 'per_shot': 0.01, 'shot_seconds': 0.2},
+}
+
+# Minimum billed duration of a managed simulator task
+SIMULATOR_MINIMUM_BILLED_SECONDS = 3.0
+
+# Fixed overhead of a simulator task (setup and result upload)
+SIMULATOR_OVERHEAD_SECONDS = 2.0
+
+# Simulator seconds per amplitude (or density matrix element) per gate layer
+SIMULATOR_SECONDS_PER_AMPLITUDE_LAYER = 1e-9
+
+# Assumed average duration of a task ahead in the queue
+QUEUED_TASK_SECONDS = {'QPU': 60.0, 'SIMULATOR': 5.0}
+
+# Operations that do not add gate layers
+_MEASUREMENTS = frozenset({'measure', 'measure_all', 'barrier'})
+
+
+def load_price_table(path: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Load the price table, overriding the defaults with entries from a JSON file.
+
+    Args:
+        path: Path of a JSON file mapping device ARN fragments to prices (optional)
+
+    Returns:
+        Dict[str, Dict[str, Any]]: The price table
+    """
+    table = {fragment: dict(prices) for fragment, prices in DEFAULT_PRICE_TABLE.items()}
+    if path:
+        with open(path) as f:
+            for fragment, prices in json.load(f).items():
+                table.setdefault(fragment.lower(), {}).update(prices)
+    return table
+
+
+def find_pricing(
+    device_arn: str, price_table: Dict[str, Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    """Find the price table entry of a device.
+
+    Args:
+        device_arn: ARN of the device
+        price_table: Price table keyed by device ARN fragment
+
+    Returns:
+        Optional[Dict[str, Any]]: Prices of the device, or None if it is not in the table
+    """
+    arn = device_arn.lower()
+    matches = [fragment for fragment in price_table if fragment in arn]
+    return price_table[max(matches, key=len)] if matches else None
+
+
+def circuit_stats(circuit: QuantumCircuit) -> CircuitStats:
+    """Compute the structural statistics of a circuit.
+
+    Depth is the number of gate layers when every gate is placed right after the latest gate
+    on any of its qubits.
+
+    Args:
+        circuit: Circuit definition
+
+    Returns:
+        CircuitStats: Statistics of the circuit
+    """
+    layers = [0] * circuit.num_qubits
+    gate_count = 0
+    two_qubit_gate_count = 0
+    for gate in circuit.gates:
+        if gate.name in _MEASUREMENTS:
+            continue
+        gate_count += 1
+        if len(gate.qubits) >= 2:
+            two_qubit_gate_count += 1
+        qubits = [q for q in gate.qubits if 0 <= q < circuit.num_qubits]
+        if qubits:
+            layer = max(layers[q] for q in qubits) + 1
+            for q in qubits:
+                layers[q] = layer
+    return CircuitStats(
+        num_qubits=circuit.num_qubits,
+        gate_count=gate_count,
+        two_qubit_gate_count=two_qubit_gate_count,
+        depth=max(layers, default=0),
+    )
+
+
+def estimate_task(
+    circuit: QuantumCircuit,
+    device_arn: str,
+    shots: int,
+    price_table: Dict[str, Dict[str, Any]],
+    device: Optional[DeviceInfo] = None,
+) -> TaskEstimate:
+    """Estimate the cost, runtime and queue wait of a quantum task.
+
+    Args:
+        circuit: Circuit definition to run
+        device_arn: ARN of the device
+        shots: Number of shots
+        price_table: Price table keyed by device ARN fragment
+        device: Cached information about the device (optional)
+
+    Returns:
+        TaskEstimate: The estimate
+    """
+    stats = circuit_stats(circuit)
+    notes = []
+    tasks = len(split_shots(shots, device.max_shots if device else 0))
+    if tasks > 1:
+        notes.append(f'{shots} shots exceed the device maximum and are split into {tasks} tasks')
+
+    pricing = find_pricing(device_arn, price_table)
+    cost = None
+    runtime = None
+    if pricing is None:
+        notes.append('Device is not in the price table; cost and runtime are unknown')
+    elif 'per_minute' in pricing:
+        method = pricing.get('method', 'state_vector')
+        base = 4 if method == 'density_matrix' else 2
+        per_task = SIMULATOR_OVERHEAD_SECONDS + (
+            base**stats.num_qubits * max(stats.depth, 1) * SIMULATOR_SECONDS_PER_AMPLITUDE_LAYER
+        )
+        if method == 'tensor_network':
+            notes.append(
+                'Tensor network runtime depends on entanglement; state vector scaling is assumed'
+            )
+        runtime = per_task * tasks
+        billed = max(per_task, SIMULATOR_MINIMUM_BILLED_SECONDS) * tasks
+        cost = billed / 60.0 * pricing['per_minute']
+    else:
+        cost = pricing.get('per_task', 0.0) * tasks + pricing.get('per_shot', 0.0) * shots
+        runtime = pricing.get('shot_seconds', 0.0) * shots
+
+    queue_wait = None
+    if device is not None and device.queue_depth is not None:
+        queue_wait = device.queue_depth * QUEUED_TASK_SECONDS[device.device_type.value]
+    else:
+        notes.append('Queue depth is unknown')
+
+    return TaskEstimate(
+        device_arn=device_arn,
+        shots=shots,
+        tasks=tasks,
+        stats=stats,
+        cost=round(cost, 6) if cost is not None else None,
+        runtime_seconds=runtime,
+        queue_wait_seconds=queue_wait,
+        notes=notes,
+    )
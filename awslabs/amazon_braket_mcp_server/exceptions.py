@@ -24,6 +24,12 @@ class CircuitCreationError(BraketMCPException):
     pass
 
 
+class CircuitValidationError(BraketMCPException):
+    """Exception raised when a circuit cannot run on the requested device."""
+
+    pass
+
+
 class TaskExecutionError(BraketMCPException):
     """Exception raised when there is an error executing a quantum task."""
 
@@ -46,3 +52,21 @@ class VisualizationError(BraketMCPException):
     """Exception raised when there is an error visualizing a circuit or results."""
 
     pass
+
+
+class ThrottlingError(BraketMCPException):
+    """Exception raised when Amazon Braket keeps throttling a request after all retries.
+
+    Attributes:
+        retry_after: Suggested number of seconds to wait before retrying
+    """
+
+    def __init__(self, message: str, retry_after: float = 0.0):
+        """Initialize the exception.
+
+        Args:
+            message: Error message
+            retry_after: Suggested number of seconds to wait before retrying
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
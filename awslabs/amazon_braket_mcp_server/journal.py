@@ -0,0 +1,517 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Durable submission journal for quantum tasks.
+
+Queued submissions are recorded in an SQLite database in the workspace directory and drained
+by a background worker under a concurrency limit. Every state change (queued, submitting,
+submitted, failed) is committed before it takes effect, so after a server restart the worker
+resumes pending submissions and reconciles interrupted ones with Amazon Braket. With a
+scheduler, submissions stay queued while their device's execution window is closed.
+
+Failed submissions are retried with exponential backoff: a requeued entry records the time
+before which it is not claimed again, so no worker thread sleeps while it waits. Requests that
+can never succeed, such as circuits failing validation, are marked failed at once.
+
+Entries split into several sub-tasks are submitted as a composite task; its sub-task ARNs are
+recorded in the journal too, so the composite handle stays resolvable after a restart.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from awslabs.amazon_braket_mcp_server.composite import CompositeTask
+from awslabs.amazon_braket_mcp_server.exceptions import (
+    CircuitCreationError,
+    CircuitValidationError,
+    ThrottlingError,
+)
+from awslabs.amazon_braket_mcp_server.models import (
+    QuantumCircuit,
+    SubmissionEntry,
+    SubmissionState,
+)
+from awslabs.amazon_braket_mcp_server.scheduler import SubmissionScheduler
+from concurrent.futures import Future, ThreadPoolExecutor
+from loguru import logger
+from pathlib import Path
+from pydantic import ValidationError
+from typing import Any, Callable, Dict, List, Optional, Set, Union
+
+
+# Tag attached to quantum tasks created from journal entries, used for reconciliation
+JOURNAL_TAG = 'braket-mcp-journal-id'
+
+# Submission errors that fail the same way on every attempt
+PERMANENT_ERRORS = (CircuitValidationError, CircuitCreationError, ValidationError)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS submissions (
+    entry_id TEXT PRIMARY KEY,
+    state TEXT NOT NULL,
+    circuit TEXT NOT NULL,
+    device_arn TEXT NOT NULL,
+    shots INTEGER NOT NULL,
+    s3_bucket TEXT,
+    s3_prefix TEXT,
+    task_id TEXT,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    not_before REAL
+);
+CREATE INDEX IF NOT EXISTS submissions_state ON submissions (state, created_at);
+CREATE TABLE IF NOT EXISTS composite_tasks (
+    task_id TEXT PRIMARY KEY,
+    device_arn TEXT NOT NULL,
+    sub_task_ids TEXT NOT NULL,
+    shots_per_task TEXT NOT NULL
+);
+"""
+
+_COLUMNS = (
+    'entry_id, state, circuit, device_arn, shots, s3_bucket, s3_prefix, task_id, error, '
+    'attempts, created_at, updated_at'
+)
+
+
+class SubmissionJournal:
+    """SQLite-backed journal of quantum task submissions.
+
+    Attributes:
+        path: Path of the SQLite database file
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """Open (or create) the journal.
+
+        Args:
+            path: Path of the SQLite database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.executescript(_SCHEMA)
+            # Journals written before retries were delayed lack the not_before column
+            columns = {row[1] for row in self._conn.execute('PRAGMA table_info(submissions)')}
+            if 'not_before' not in columns:
+                self._conn.execute('ALTER TABLE submissions ADD COLUMN not_before REAL')
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _to_entry(row) -> SubmissionEntry:
+        return SubmissionEntry(
+            entry_id=row[0],
+            state=SubmissionState(row[1]),
+            circuit=QuantumCircuit.model_validate_json(row[2]),
+            device_arn=row[3],
+            shots=row[4],
+            s3_bucket=row[5],
+            s3_prefix=row[6],
+            task_id=row[7],
+            error=row[8],
+            attempts=row[9],
+            created_at=row[10],
+            updated_at=row[11],
+        )
+
+    def enqueue(
+        self,
+        circuit: QuantumCircuit,
+        device_arn: str,
+        shots: int,
+        s3_bucket: Optional[str] = None,
+        s3_prefix: Optional[str] = None,
+    ) -> str:
+        """Record a new submission in the QUEUED state.
+
+        Returns:
+            str: ID of the journal entry
+        """
+        entry_id = str(uuid.uuid4())
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                f'INSERT INTO submissions ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, NULL, NULL, 0, ?, ?)',
+                (
+                    entry_id,
+                    SubmissionState.QUEUED.value,
+                    circuit.model_dump_json(),
+                    device_arn,
+                    shots,
+                    s3_bucket,
+                    s3_prefix,
+                    now,
+                    now,
+                ),
+            )
+        return entry_id
+
+    def claim(self, limit: int, device_arn: Optional[str] = None) -> List[SubmissionEntry]:
+        """Move the oldest queued entries to SUBMITTING and return them.
+
+        Entries requeued with a retry delay are skipped until the delay has passed. Entries
+        whose stored circuit can no longer be read are marked failed instead of claimed.
+
+        Args:
+            limit: Maximum number of entries to claim
+            device_arn: Only claim entries for this device (optional)
+
+        Returns:
+            List[SubmissionEntry]: The claimed entries
+        """
+        if limit <= 0:
+            return []
+        now = time.time()
+        query = (
+            f'SELECT {_COLUMNS} FROM submissions WHERE state = ? '
+            'AND (not_before IS NULL OR not_before <= ?)'
+        )
+        params: tuple = (SubmissionState.QUEUED.value, now)
+        if device_arn is not None:
+            query += ' AND device_arn = ?'
+            params += (device_arn,)
+        entries = []
+        malformed = []
+        with self._lock, self._conn:
+            rows = self._conn.execute(
+                query + ' ORDER BY created_at LIMIT ?', (*params, limit)
+            ).fetchall()
+            for row in rows:
+                try:
+                    entry = self._to_entry(row)
+                except ValidationError as e:
+                    malformed.append((SubmissionState.FAILED.value, now, str(e), row[0]))
+                    continue
+                entries.append(
+                    entry.model_copy(
+                        update={
+                            'state': SubmissionState.SUBMITTING,
+                            'attempts': entry.attempts + 1,
+                            'updated_at': now,
+                        }
+                    )
+                )
+            self._conn.executemany(
+                'UPDATE submissions SET state = ?, attempts = attempts + 1, updated_at = ?, '
+                'not_before = NULL WHERE entry_id = ?',
+                [(SubmissionState.SUBMITTING.value, now, entry.entry_id) for entry in entries],
+            )
+            self._conn.executemany(
+                'UPDATE submissions SET state = ?, updated_at = ?, error = ? WHERE entry_id = ?',
+                malformed,
+            )
+        return entries
+
+    def _update(self, entry_id: str, state: SubmissionState, **fields) -> None:
+        assignments = ', '.join(f'{name} = ?' for name in fields)
+        with self._lock, self._conn:
+            self._conn.execute(
+                f'UPDATE submissions SET state = ?, updated_at = ?'
+                f'{", " + assignments if assignments else ""} WHERE entry_id = ?',
+                (state.value, time.time(), *fields.values(), entry_id),
+            )
+
+    def mark_submitted(self, entry_id: str, task_id: str) -> None:
+        """Record the task created for an entry."""
+        self._update(entry_id, SubmissionState.SUBMITTED, task_id=task_id, error=None)
+
+    def record_composite(self, composite: CompositeTask) -> None:
+        """Record the sub-tasks of a composite task created for an entry."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO composite_tasks '
+                '(task_id, device_arn, sub_task_ids, shots_per_task) VALUES (?, ?, ?, ?)',
+                (
+                    composite.task_id,
+                    composite.device_arn,
+                    json.dumps(composite.sub_task_ids),
+                    json.dumps(composite.shots_per_task),
+                ),
+            )
+
+    def get_composite(self, task_id: str) -> Optional[CompositeTask]:
+        """Get a recorded composite task, without any sub-task results."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT device_arn, sub_task_ids, shots_per_task FROM composite_tasks '
+                'WHERE task_id = ?',
+                (task_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return CompositeTask(row[0], json.loads(row[1]), json.loads(row[2]), task_id=task_id)
+
+    def mark_failed(self, entry_id: str, error: str) -> None:
+        """Record a permanent submission failure."""
+        self._update(entry_id, SubmissionState.FAILED, error=error)
+
+    def requeue(
+        self, entry_id: str, error: Optional[str] = None, not_before: Optional[float] = None
+    ) -> None:
+        """Return an entry to the QUEUED state so it is submitted again.
+
+        Args:
+            entry_id: ID of the journal entry
+            error: Error of the failed attempt (optional)
+            not_before: Time (seconds since the epoch) before which the entry is not claimed
+        """
+        self._update(entry_id, SubmissionState.QUEUED, error=error, not_before=not_before)
+
+    def get(self, entry_id: str) -> Optional[SubmissionEntry]:
+        """Get a journal entry by ID."""
+        with self._lock:
+            row = self._conn.execute(
+                f'SELECT {_COLUMNS} FROM submissions WHERE entry_id = ?', (entry_id,)
+            ).fetchone()
+        return self._to_entry(row) if row else None
+
+    def list(
+        self, state: Optional[SubmissionState] = None, limit: int = 100
+    ) -> List[SubmissionEntry]:
+        """List journal entries, oldest first.
+
+        Args:
+            state: Only list entries in this state
+            limit: Maximum number of entries to return
+
+        Returns:
+            List[SubmissionEntry]: The journal entries
+        """
+        query = f'SELECT {_COLUMNS} FROM submissions'
+        params: tuple = ()
+        if state is not None:
+            query += ' WHERE state = ?'
+            params = (state.value,)
+        query += ' ORDER BY created_at LIMIT ?'
+        with self._lock:
+            rows = self._conn.execute(query, (*params, limit)).fetchall()
+        return [self._to_entry(row) for row in rows]
+
+    def queued_devices(self) -> Dict[str, int]:
+        """Count the queued entries of each device, devices with the oldest entries first."""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT device_arn, COUNT(*) FROM submissions WHERE state = ? '
+                'GROUP BY device_arn ORDER BY MIN(created_at)',
+                (SubmissionState.QUEUED.value,),
+            ).fetchall()
+        return dict(rows)
+
+    def count(self, state: SubmissionState) -> int:
+        """Count the entries in a state."""
+        with self._lock:
+            return self._conn.execute(
+                'SELECT COUNT(*) FROM submissions WHERE state = ?', (state.value,)
+            ).fetchone()[0]
+
+
+class SubmissionWorker:
+    """Background worker draining the submission journal under a concurrency limit.
+
+    Attributes:
+        journal: The submission journal to drain
+        max_concurrency: Maximum number of submissions in flight
+        poll_interval: Seconds between journal scans when idle
+        max_attempts: Submission attempts before an entry is marked failed
+        retry_delay: Seconds before the first retry of a failed submission, doubled on each
+            further attempt
+        max_retry_delay: Longest delay between submission attempts, in seconds
+        scheduler: Scheduler releasing queued entries per device (optional)
+    """
+
+    def __init__(
+        self,
+        journal: SubmissionJournal,
+        submit: Callable[[SubmissionEntry], str],
+        reconcile: Callable[[SubmissionEntry], Optional[str]],
+        max_concurrency: int = 4,
+        poll_interval: float = 1.0,
+        max_attempts: int = 5,
+        scheduler: Optional[SubmissionScheduler] = None,
+        retry_delay: float = 1.0,
+        max_retry_delay: float = 60.0,
+    ):
+        """Initialize the worker.
+
+        Args:
+            journal: The submission journal to drain
+            submit: Function submitting an entry and returning the created task ID
+            reconcile: Function looking up the task created for an interrupted entry,
+                returning its ID or None if no task was created
+            max_concurrency: Maximum number of submissions in flight
+            poll_interval: Seconds between journal scans when idle
+            max_attempts: Submission attempts before an entry is marked failed
+            scheduler: Scheduler deciding how many queued entries of each device are
+                released; without one, entries are claimed oldest first
+            retry_delay: Seconds before the first retry of a failed submission, doubled on
+                each further attempt
+            max_retry_delay: Longest delay between submission attempts, in seconds
+        """
+        self.journal = journal
+        self.max_concurrency = max_concurrency
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.scheduler = scheduler
+        self._submit = submit
+        self._reconcile = reconcile
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._device_in_flight: Dict[str, int] = {}
+        self._counts_lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Recover interrupted submissions and start draining the journal."""
+        with self._lock:
+            if self.running:
+                return
+            self.recover()
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run, name='braket-submission-worker', daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the worker, waiting for in-flight submissions to finish."""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def notify(self) -> None:
+        """Wake the worker after new entries were queued."""
+        self._wakeup.set()
+
+    def recover(self) -> None:
+        """Reconcile entries left in SUBMITTING by an interrupted process.
+
+        Entries whose task exists are marked submitted; the others are queued again.
+        """
+        for entry in self.journal.list(state=SubmissionState.SUBMITTING, limit=10000):
+            try:
+                task_id = self._reconcile(entry)
+            except Exception as e:
+                logger.warning(f'Could not reconcile submission {entry.entry_id}: {str(e)}')
+                task_id = None
+            if task_id:
+                logger.info(f'Recovered submission {entry.entry_id} as task {task_id}')
+                self.journal.mark_submitted(entry.entry_id, task_id)
+            else:
+                logger.info(f'Requeueing interrupted submission {entry.entry_id}')
+                self.journal.requeue(entry.entry_id)
+
+    def drain_once(self, executor: ThreadPoolExecutor, in_flight: Set[Future]) -> None:
+        """Claim as many queued entries as the concurrency limit allows and submit them.
+
+        With a scheduler, each device (oldest queued entry first) gets at most the number of
+        entries the scheduler releases to it.
+        """
+        for future in [f for f in in_flight if f.done()]:
+            in_flight.discard(future)
+        free = self.max_concurrency - len(in_flight)
+        if self.scheduler is None:
+            entries = self.journal.claim(free)
+        else:
+            entries = []
+            for device_arn in self.journal.queued_devices():
+                if free <= 0:
+                    break
+                with self._counts_lock:
+                    running = self._device_in_flight.get(device_arn, 0)
+                limit = min(free, self.scheduler.capacity(device_arn, running))
+                claimed = self.journal.claim(limit, device_arn=device_arn)
+                entries.extend(claimed)
+                free -= len(claimed)
+        for entry in entries:
+            with self._counts_lock:
+                self._device_in_flight[entry.device_arn] = (
+                    self._device_in_flight.get(entry.device_arn, 0) + 1
+                )
+            in_flight.add(executor.submit(self._process, entry))
+
+    def schedule(self) -> List[Dict[str, Any]]:
+        """Describe the release schedule of queued and in-flight submissions per device.
+
+        Returns:
+            List[Dict[str, Any]]: Queued and in-flight counts of each device, with its
+                execution window state if the worker has a scheduler
+        """
+        queued = self.journal.queued_devices()
+        with self._counts_lock:
+            in_flight = {arn: count for arn, count in self._device_in_flight.items() if count}
+        devices = list(queued) + [arn for arn in in_flight if arn not in queued]
+        if self.scheduler is None:
+            return [
+                {
+                    'device_arn': arn,
+                    'queued': queued.get(arn, 0),
+                    'in_flight': in_flight.get(arn, 0),
+                }
+                for arn in devices
+            ]
+        return [
+            self.scheduler.device_schedule(arn, queued.get(arn, 0), in_flight.get(arn, 0))
+            for arn in devices
+        ]
+
+    def _run(self) -> None:
+        in_flight: Set[Future] = set()
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            while not self._stopped.is_set():
+                try:
+                    self.drain_once(executor, in_flight)
+                except Exception as e:
+                    logger.exception(f'Error draining submission journal: {str(e)}')
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+
+    def _process(self, entry: SubmissionEntry) -> None:
+        try:
+            task_id = self._submit(entry)
+        except ThrottlingError as e:
+            self.journal.requeue(
+                entry.entry_id, error=str(e), not_before=time.time() + e.retry_after
+            )
+        except PERMANENT_ERRORS as e:
+            self.journal.mark_failed(entry.entry_id, str(e))
+        except Exception as e:
+            if entry.attempts >= self.max_attempts:
+                self.journal.mark_failed(entry.entry_id, str(e))
+            else:
+                delay = min(self.retry_delay * 2 ** (entry.attempts - 1), self.max_retry_delay)
+                self.journal.requeue(entry.entry_id, error=str(e), not_before=time.time() + delay)
+        else:
+            self.journal.mark_submitted(entry.entry_id, task_id)
+        finally:
+            with self._counts_lock:
+                running = self._device_in_flight.get(entry.device_arn, 0)
+                self._device_in_flight[entry.device_arn] = max(running - 1, 0)
+            self._wakeup.set()
@@ -0,0 +1,236 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Memory-mapped store of per-shot measurements.
+
+The bit-packed measurement rows of a completed task are written once to a `.npy` file in the
+workspace directory and opened memory-mapped afterwards. Serving a page of shots then only
+touches the rows on that page: nothing is downloaded or parsed again, and only the requested
+rows are unpacked. Counts and marginals are tallied over the mapped rows in fixed-size chunks,
+so the memory they take does not grow with the number of shots.
+
+Large results are kept here instead of in the result cache, so the server's memory stays flat
+however many large results are open.
+"""
+
+import hashlib
+import json
+import numpy as np
+import os
+import threading
+from awslabs.amazon_braket_mcp_server.measurements import (
+    encode_rows,
+    packed_rows,
+    row_bitstrings,
+)
+from awslabs.amazon_braket_mcp_server.models import PackedMeasurements
+from collections import Counter
+from loguru import logger
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+
+# Default and maximum number of shots in one page
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# Packed size from which results are kept memory-mapped instead of in the result cache
+LARGE_RESULT_BYTES = 1024 * 1024
+
+# Number of shots tallied at once when counting over the mapped rows
+COUNT_CHUNK_SHOTS = 65536
+
+
+def packed_size(packed: PackedMeasurements) -> int:
+    """Get the size of bit-packed measurements in bytes."""
+    shots, width = packed.shape
+    return shots * ((width + 7) // 8)
+
+
+class StoredMeasurements:
+    """Bit-packed measurement rows of one task, mapped from disk.
+
+    Attributes:
+        rows: One row of packed bytes per shot (memory-mapped)
+        num_qubits: Number of measured qubits
+        bit_order: Order of the bits in a byte
+    """
+
+    def __init__(self, rows: np.ndarray, num_qubits: int, bit_order: str):
+        """Initialize the stored measurements.
+
+        Args:
+            rows: One row of packed bytes per shot
+            num_qubits: Number of measured qubits
+            bit_order: Order of the bits in a byte
+        """
+        self.rows = rows
+        self.num_qubits = num_qubits
+        self.bit_order = bit_order
+
+    @property
+    def shots(self) -> int:
+        """Number of stored shots."""
+        return len(self.rows)
+
+    def _check_qubits(self, qubits: Optional[Sequence[int]]) -> None:
+        if qubits is not None:
+            invalid = [q for q in qubits if not 0 <= q < self.num_qubits]
+            if invalid:
+                raise ValueError(
+                    f'Qubits {invalid} out of range for {self.num_qubits} measured qubits'
+                )
+
+    def page(
+        self,
+        offset: int = 0,
+        limit: int = DEFAULT_PAGE_SIZE,
+        qubits: Optional[Sequence[int]] = None,
+    ) -> np.ndarray:
+        """Unpack a page of shots.
+
+        Args:
+            offset: Index of the first shot
+            limit: Maximum number of shots (at most MAX_PAGE_SIZE)
+            qubits: Measured qubits to return, in the given order (all qubits if omitted)
+
+        Returns:
+            np.ndarray: Measured bits (uint8), one row per shot of the page
+
+        Raises:
+            ValueError: If the offset, limit or qubits are out of range
+        """
+        if offset < 0:
+            raise ValueError(f'Offset must not be negative, got {offset}')
+        if not 0 < limit <= MAX_PAGE_SIZE:
+            raise ValueError(f'Limit must be between 1 and {MAX_PAGE_SIZE}, got {limit}')
+        self._check_qubits(qubits)
+        bits = np.unpackbits(
+            self.rows[offset : offset + limit],
+            axis=1,
+            count=self.num_qubits,
+            bitorder=self.bit_order,
+        )
+        return bits if qubits is None else bits[:, list(qubits)]
+
+    def counts(
+        self, qubits: Optional[Sequence[int]] = None, chunk_shots: int = COUNT_CHUNK_SHOTS
+    ) -> Dict[str, int]:
+        """Count the measured bitstrings, or their marginals on some qubits.
+
+        The mapped rows are tallied chunk by chunk; only the distinct rows of each chunk are
+        kept, and only the distinct rows overall are converted to bitstrings.
+
+        Args:
+            qubits: Measured qubits to count, in the given order (all qubits if omitted)
+            chunk_shots: Number of shots tallied at once
+
+        Returns:
+            Dict[str, int]: Number of shots of each bitstring of the qubits
+
+        Raises:
+            ValueError: If the qubits are out of range
+        """
+        self._check_qubits(qubits)
+        width = self.num_qubits if qubits is None else len(qubits)
+        if width == 0:
+            return {}
+        totals: Counter = Counter()
+        for start in range(0, self.shots, chunk_shots):
+            rows = self.rows[start : start + chunk_shots]
+            if qubits is not None:
+                bits = np.unpackbits(rows, axis=1, count=self.num_qubits, bitorder=self.bit_order)[
+                    :, list(qubits)
+                ]
+                rows = np.packbits(bits, axis=1, bitorder=self.bit_order)
+            unique, counts = np.unique(rows, axis=0, return_counts=True)
+            for row, count in zip(unique, counts):
+                totals[row.tobytes()] += int(count)
+        if not totals:
+            return {}
+        unique = np.frombuffer(b''.join(totals), dtype=np.uint8).reshape(len(totals), -1)
+        return dict(zip(row_bitstrings(unique, width, self.bit_order), totals.values()))
+
+    def packed(self) -> PackedMeasurements:
+        """Read all shots into bit-packed measurements.
+
+        Returns:
+            PackedMeasurements: The stored measurements
+        """
+        return encode_rows(np.asarray(self.rows), self.num_qubits, self.bit_order)
+
+
+class MeasurementStore:
+    """Store of bit-packed measurement rows in a directory.
+
+    Attributes:
+        directory: Directory of the measurement files
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        """Initialize the store.
+
+        Args:
+            directory: Directory of the measurement files
+        """
+        self.directory = Path(directory)
+        self._lock = threading.Lock()
+
+    def _paths(self, task_id: str) -> Tuple[Path, Path]:
+        """Get the row and layout files of a task; task ARNs are hashed to portable names."""
+        stem = hashlib.sha256(task_id.encode('utf-8')).hexdigest()
+        return self.directory / f'{stem}.npy', self.directory / f'{stem}.json'
+
+    def get(self, task_id: str) -> Optional[StoredMeasurements]:
+        """Open the stored measurements of a task.
+
+        Args:
+            task_id: ID of the quantum task
+
+        Returns:
+            Optional[StoredMeasurements]: The mapped measurements, or None if none are stored
+        """
+        rows_path, layout_path = self._paths(task_id)
+        try:
+            layout = json.loads(layout_path.read_text())
+            rows = np.load(rows_path, mmap_mode='r')
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f'Ignoring unreadable stored measurements of {task_id}: {str(e)}')
+            return None
+        return StoredMeasurements(rows, layout['num_qubits'], layout['bit_order'])
+
+    def put(self, task_id: str, packed: PackedMeasurements) -> StoredMeasurements:
+        """Store the measurements of a task.
+
+        The layout is written first and the rows are moved into place last, so a file that
+        exists is complete.
+
+        Args:
+            task_id: ID of the quantum task
+            packed: Bit-packed measurements of the task
+
+        Returns:
+            StoredMeasurements: The stored measurements, mapped from disk
+        """
+        rows_path, layout_path = self._paths(task_id)
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            layout_path.write_text(
+                json.dumps({'num_qubits': packed.shape[1], 'bit_order': packed.bit_order})
+            )
+            partial = rows_path.with_suffix(f'.{threading.get_ident()}.tmp.npy')
+            np.save(partial, packed_rows(packed))
+            os.replace(partial, rows_path)
+        return StoredMeasurements(
+            np.load(rows_path, mmap_mode='r'), packed.shape[1], packed.bit_order
+        )
@@ -0,0 +1,160 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Bit-packed encoding of per-shot measurements.
+
+A JSON list of int lists spends three or more characters on every measured bit. Packed with
+`np.packbits`, each shot is a row of whole bytes holding one bit per qubit, and the matrix is
+sent base64-encoded with its shape and bit order. Counts and concatenation work on the packed
+rows directly, so results are never expanded to Python lists on the way.
+"""
+
+import base64
+import numpy as np
+from awslabs.amazon_braket_mcp_server.models import PackedMeasurements
+from typing import Dict, List, Sequence, Union
+
+
+# Bit order of packed measurements: the first qubit is the most significant bit of a byte
+DEFAULT_BIT_ORDER = 'big'
+
+
+def encode_rows(rows: np.ndarray, width: int, bit_order: str) -> PackedMeasurements:
+    """Encode packed byte rows, the inverse of `packed_rows`.
+
+    Args:
+        rows: One row of packed bytes per shot
+        width: Number of measured qubits
+        bit_order: Order of the bits in a byte
+
+    Returns:
+        PackedMeasurements: The base64-encoded rows with their shape and bit order
+    """
+    return PackedMeasurements(
+        data=base64.b64encode(rows.tobytes()).decode('ascii'),
+        shape=[len(rows), width],
+        bit_order=bit_order,
+    )
+
+
+def pack_measurements(
+    measurements: Union[np.ndarray, Sequence[Sequence[int]]], bit_order: str = DEFAULT_BIT_ORDER
+) -> PackedMeasurements:
+    """Pack a measurement matrix into bits.
+
+    Args:
+        measurements: Measured bits, one row per shot
+        bit_order: Order of the bits in a byte ('big' or 'little')
+
+    Returns:
+        PackedMeasurements: The base64-encoded bits with their shape and bit order
+    """
+    bits = np.asarray(measurements, dtype=np.uint8)
+    if bits.ndim != 2:
+        bits = bits.reshape(len(bits), -1)
+    return encode_rows(np.packbits(bits, axis=1, bitorder=bit_order), bits.shape[1], bit_order)
+
+
+def packed_rows(packed: PackedMeasurements) -> np.ndarray:
+    """Decode packed measurements to their byte rows without unpacking the bits.
+
+    Args:
+        packed: Packed measurements
+
+    Returns:
+        np.ndarray: One row of bytes per shot
+    """
+    shots, width = packed.shape
+    data = np.frombuffer(base64.b64decode(packed.data), dtype=np.uint8)
+    return data.reshape(shots, (width + 7) // 8)
+
+
+def unpack_measurements(packed: PackedMeasurements) -> np.ndarray:
+    """Unpack packed measurements to a bit matrix.
+
+    Args:
+        packed: Packed measurements
+
+    Returns:
+        np.ndarray: Measured bits (uint8), one row per shot
+    """
+    return np.unpackbits(
+        packed_rows(packed), axis=1, count=packed.shape[1], bitorder=packed.bit_order
+    )
+
+
+def row_bitstrings(rows: np.ndarray, width: int, bit_order: str) -> List[str]:
+    """Convert packed rows to bitstrings.
+
+    Args:
+        rows: One row of packed bytes per shot
+        width: Number of measured qubits
+        bit_order: Order of the bits in a byte
+
+    Returns:
+        List[str]: Bitstring of each row
+    """
+    bits = np.unpackbits(rows, axis=1, count=width, bitorder=bit_order)
+    keys = (bits + ord('0')).tobytes().decode('ascii')
+    return [keys[i * width : (i + 1) * width] for i in range(len(rows))]
+
+
+def _row_counts(rows: np.ndarray, width: int, bit_order: str) -> Dict[str, int]:
+    """Tally packed rows; only the distinct rows are unpacked to bitstrings."""
+    if len(rows) == 0 or width == 0:
+        return {}
+    unique, counts = np.unique(rows, axis=0, return_counts=True)
+    keys = row_bitstrings(unique, width, bit_order)
+    return {key: int(count) for key, count in zip(keys, counts)}
+
+
+def packed_counts(packed: PackedMeasurements) -> Dict[str, int]:
+    """Count the measured bitstrings of packed measurements.
+
+    Shots are tallied on their packed rows; only the distinct rows are unpacked to bitstrings.
+
+    Args:
+        packed: Packed measurements
+
+    Returns:
+        Dict[str, int]: Number of shots of each bitstring
+    """
+    return _row_counts(packed_rows(packed), packed.shape[1], packed.bit_order)
+
+
+def measurement_counts(measurements: np.ndarray) -> Dict[str, int]:
+    """Count the measured bitstrings of a bit matrix.
+
+    Shots are packed into bytes and tallied on the packed rows.
+
+    Args:
+        measurements: Measured bits (uint8), one row per shot
+
+    Returns:
+        Dict[str, int]: Number of shots of each bitstring
+    """
+    if measurements.ndim != 2:
+        return {}
+    rows = np.packbits(measurements, axis=1, bitorder=DEFAULT_BIT_ORDER)
+    return _row_counts(rows, measurements.shape[1], DEFAULT_BIT_ORDER)
+
+
+def concatenate_packed(parts: Sequence[PackedMeasurements]) -> PackedMeasurements:
+    """Join the shots of several packed measurement matrices as bytes.
+
+    Args:
+        parts: Packed measurements of the same width and bit order, in shot order
+
+    Returns:
+        PackedMeasurements: All shots of the parts
+    """
+    rows = np.concatenate([packed_rows(part) for part in parts])
+    return encode_rows(rows, parts[0].shape[1], parts[0].bit_order)
@@ -18,8 +18,9 @@ The models use Python's dataclass decorator for clean, type-safe data structures
 that represent both the quantum circuit structure and its contents.
 """
 
+import math
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from typing import Dict, List, Optional, Union, Any
 
 
@@ -46,6 +47,13 @@ class GateType(str, Enum):
     # Three-qubit gates
     CCX = "ccx"  # Toffoli gate (Controlled-Controlled-X)
     
+    # Native gates of QPUs (for verbatim circuits)
+    PRX = "prx"  # Phased X rotation (IQM)
+    ISWAP = "iswap"  # iSWAP (Rigetti)
+    GPI = "gpi"  # GPi (IonQ)
+    GPI2 = "gpi2"  # GPi2 (IonQ)
+    MS = "ms"  # Molmer-Sorensen (IonQ)
+
     # Measurement
     MEASURE = "measure"  # Measurement
     MEASURE_ALL = "measure_all"  # Measure all qubits
@@ -57,12 +65,34 @@ class Gate(BaseModel):
     Attributes:
         name: The name of the gate (from GateType)
         qubits: List of qubit indices the gate acts on
-        params: Optional parameters for parameterized gates (e.g., rotation angles)
+        params: Optional parameters for parameterized gates (e.g., rotation angles);
+            a string names a free parameter bound per point of a parameter sweep, and
+            numeric strings are read as numbers
     """
     
     name: str
     qubits: List[int] = []
-    params: Optional[List[float]] = None
+    params: Optional[List[Union[float, str]]] = None
+
+    @field_validator('params')
+    @classmethod
+    def _coerce_numeric_params(
+        cls, params: Optional[List[Union[float, str]]]
+    ) -> Optional[List[Union[float, str]]]:
+        """Read numeric strings such as "0.5" as numbers rather than parameter names."""
+        if params is None:
+            return None
+        coerced: List[Union[float, str]] = []
+        for param in params:
+            if isinstance(param, str):
+                try:
+                    number: Optional[float] = float(param)
+                except ValueError:
+                    number = None
+                if number is not None and math.isfinite(number):
+                    param = number
+            coerced.append(param)
+        return coerced
 
 
 class QuantumCircuit(BaseModel):
@@ -90,6 +120,20 @@ class TaskStatus(str, Enum):
     CANCELLED = "CANCELLED"
 
 
+class PackedMeasurements(BaseModel):
+    """Per-shot measurements packed into bits.
+
+    Attributes:
+        data: Base64-encoded bits; each shot is a row padded to whole bytes
+        shape: Number of shots and number of measured qubits
+        bit_order: Order of the bits in a byte ('big': first qubit in the most significant bit)
+    """
+
+    data: str
+    shape: List[int]
+    bit_order: str = 'big'
+
+
 class TaskResult(BaseModel):
     """Represents the result of a quantum task.
     
@@ -97,21 +141,43 @@ class TaskResult(BaseModel):
         task_id: The ID of the quantum task
         status: The status of the task
         measurements: The measurement results (if available)
+        packed_measurements: The measurement results packed into bits (if requested)
         counts: Counts of each measurement outcome
         device: The device the task ran on
         shots: Number of shots used
         execution_time: Time taken to execute the task (in seconds)
         metadata: Additional metadata about the task
+        result_types: Values of the requested result types (if any), in request order
+        preview: Local simulation result, shown until the task reaches a terminal state
     """
     
     task_id: str
     status: TaskStatus
     measurements: Optional[List[List[int]]] = None
+    packed_measurements: Optional[PackedMeasurements] = None
     counts: Optional[Dict[str, int]] = None
     device: str
     shots: int
     execution_time: Optional[float] = None
     metadata: Optional[Dict[str, Any]] = None
+    result_types: Optional[List[Dict[str, Any]]] = None
+    preview: Optional[Dict[str, Any]] = None
+
+
+class ResultTypeSpec(BaseModel):
+    """A result type computed by a simulator instead of (or besides) sampling.
+
+    Attributes:
+        type: 'probability', 'expectation' or 'amplitude'
+        qubits: Target qubits of probabilities and expectation values (all qubits if omitted)
+        observable: Pauli string of an expectation value, one letter per target qubit (e.g. 'ZZ')
+        states: Basis states whose amplitudes are returned (e.g. ['00', '11'])
+    """
+
+    type: str
+    qubits: Optional[List[int]] = None
+    observable: Optional[str] = None
+    states: Optional[List[str]] = None
 
 
 class DeviceType(str, Enum):
@@ -121,6 +187,21 @@ class DeviceType(str, Enum):
     SIMULATOR = "SIMULATOR"  # Quantum simulator
 
 
+class ExecutionWindow(BaseModel):
+    """A recurring period in which a device runs quantum tasks.
+
+    Attributes:
+        execution_day: Days the window recurs on (Everyday, Weekdays, Weekend or a weekday name)
+        window_start_hour: Start time of the window in UTC (HH:MM:SS)
+        window_end_hour: End time of the window in UTC (HH:MM:SS); windows ending before
+            they start continue past midnight
+    """
+
+    execution_day: str
+    window_start_hour: str
+    window_end_hour: str
+
+
 class DeviceInfo(BaseModel):
     """Information about a quantum device.
     
@@ -135,6 +216,10 @@ class DeviceInfo(BaseModel):
         paradigm: The quantum computing paradigm (gate-based, annealing, etc.)
         max_shots: Maximum number of shots supported
         supported_gates: List of gates supported by the device
+        queue_depth: Number of quantum tasks waiting in the device's normal priority queue
+        connectivity_graph: Neighbors of each qubit, if the device is not fully connected
+        native_gates: Gates the device runs without compilation (for verbatim circuits)
+        execution_windows: Periods in which the device runs tasks (empty if always available)
     """
     
     device_arn: str
@@ -147,3 +232,117 @@ class DeviceInfo(BaseModel):
     paradigm: str
     max_shots: int
     supported_gates: List[str] = []
+    queue_depth: Optional[int] = None
+    connectivity_graph: Optional[Dict[str, List[str]]] = None
+    native_gates: List[str] = []
+    execution_windows: List[ExecutionWindow] = []
+
+
+class SubmissionState(str, Enum):
+    """Enumeration of the states of a journaled submission."""
+
+    QUEUED = "QUEUED"  # Waiting for the submission worker
+    SUBMITTING = "SUBMITTING"  # Claimed by the worker, CreateQuantumTask in flight
+    SUBMITTED = "SUBMITTED"  # Quantum task created
+    FAILED = "FAILED"  # Submission failed permanently
+
+
+class SubmissionEntry(BaseModel):
+    """A quantum task submission recorded in the durable submission journal.
+
+    Attributes:
+        entry_id: ID of the journal entry (also used as the submission's client token)
+        state: Submission state
+        circuit: Circuit definition to run
+        device_arn: ARN of the device to run the task on
+        shots: Number of shots to run
+        s3_bucket: S3 bucket for storing results
+        s3_prefix: S3 prefix for storing results
+        task_id: ID of the created quantum task (once submitted)
+        error: Error message of a failed submission
+        attempts: Number of submission attempts
+        created_at: Time the entry was queued (Unix timestamp)
+        updated_at: Time the entry last changed state (Unix timestamp)
+    """
+
+    entry_id: str
+    state: SubmissionState
+    circuit: QuantumCircuit
+    device_arn: str
+    shots: int
+    s3_bucket: Optional[str] = None
+    s3_prefix: Optional[str] = None
+    task_id: Optional[str] = None
+    error: Optional[str] = None
+    attempts: int = 0
+    created_at: float
+    updated_at: float
+
+
+class CircuitStats(BaseModel):
+    """Structural statistics of a quantum circuit.
+
+    Attributes:
+        num_qubits: Number of qubits in the circuit
+        gate_count: Number of gates, excluding measurements
+        two_qubit_gate_count: Number of gates acting on two or more qubits
+        depth: Number of gate layers, excluding measurements
+    """
+
+    num_qubits: int
+    gate_count: int
+    two_qubit_gate_count: int
+    depth: int
+
+
+class TaskEstimate(BaseModel):
+    """Estimated cost and duration of a quantum task.
+
+    Attributes:
+        device_arn: ARN of the device
+        shots: Number of shots
+        tasks: Number of tasks the shots are split into
+        stats: Statistics of the circuit
+        cost: Estimated cost in USD (None if the device has no known pricing)
+        runtime_seconds: Estimated execution time across all tasks
+        queue_wait_seconds: Estimated time waiting in the device queue (None if unknown)
+        notes: Assumptions and caveats of the estimate
+    """
+
+    device_arn: str
+    shots: int
+    tasks: int
+    stats: CircuitStats
+    cost: Optional[float] = None
+    runtime_seconds: Optional[float] = None
+    queue_wait_seconds: Optional[float] = None
+    notes: List[str] = []
+
+
+class ArchivedResult(BaseModel):
+    """Index entry of a task result in the local result archive.
+
+    Attributes:
+        task_id: ID of the quantum task
+        device_arn: ARN of the device the task ran on
+        status: Terminal status of the task
+        shots: Number of shots
+        circuit_hash: Hash of the submitted circuit definition (None if not submitted by
+            this server)
+        created_at: Time the task was created (Unix timestamp)
+        ended_at: Time the task ended (Unix timestamp)
+        archived_at: Time the result was archived (Unix timestamp)
+        num_qubits: Number of measured qubits (None without per-shot measurements)
+        has_measurements: Whether the per-shot measurements are archived
+    """
+
+    task_id: str
+    device_arn: str
+    status: TaskStatus
+    shots: int
+    circuit_hash: Optional[str] = None
+    created_at: Optional[float] = None
+    ended_at: Optional[float] = None
+    archived_at: float
+    num_qubits: Optional[int] = None
+    has_measurements: bool = False
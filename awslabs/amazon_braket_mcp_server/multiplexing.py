@@ -0,0 +1,284 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Qubit multiplexing of small circuits onto one larger task.
+
+Independent small circuits are placed on disjoint qubit sets of one circuit, so several
+experiments share one task fee and one queue slot. Where the device connectivity graph is
+known, each circuit is placed on a connected region of physical qubits, addressed by their
+device labels (which need not start at 0; IQM devices number them from 1), and the task runs
+with qubit rewiring disabled so the placement reaches the hardware. Otherwise circuits get
+consecutive logical qubits, which the device compiler maps. The packed task measures every
+allocated qubit, and the measured bitstrings are split back into per-circuit counts by
+slicing the bit columns of each circuit.
+"""
+
+import numpy as np
+from awslabs.amazon_braket_mcp_server.exceptions import CircuitValidationError
+from awslabs.amazon_braket_mcp_server.measurements import unpack_measurements
+from awslabs.amazon_braket_mcp_server.models import Gate, QuantumCircuit, TaskResult
+from collections import deque
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+def measured_qubits(circuit: QuantumCircuit) -> List[int]:
+    """Get the logical qubits a circuit measures, in ascending order.
+
+    Circuits without measurements, or with `measure_all`, measure every qubit.
+    """
+    measured = set()
+    for gate in circuit.gates:
+        if gate.name == 'measure_all' or (gate.name == 'measure' and not gate.qubits):
+            return list(range(circuit.num_qubits))
+        if gate.name == 'measure':
+            measured.update(gate.qubits)
+    return sorted(measured) if measured else list(range(circuit.num_qubits))
+
+
+def _connected_region(
+    start: int, size: int, free: set, graph: Dict[int, List[int]]
+) -> Optional[List[int]]:
+    """Collect `size` free qubits connected to `start` by breadth-first search."""
+    region = [start]
+    seen = {start}
+    queue = deque([start])
+    while queue and len(region) < size:
+        for neighbor in sorted(graph.get(queue.popleft(), [])):
+            if neighbor in free and neighbor not in seen:
+                seen.add(neighbor)
+                region.append(neighbor)
+                queue.append(neighbor)
+                if len(region) == size:
+                    break
+    return region if len(region) == size else None
+
+
+def allocate_qubits(
+    sizes: Sequence[int],
+    device_qubits: int,
+    connectivity_graph: Optional[Dict[str, List[str]]] = None,
+) -> List[List[int]]:
+    """Allocate disjoint qubits to circuits.
+
+    With a connectivity graph, each circuit gets a connected region of physical qubits, so its
+    two-qubit gates need little routing. Without one (or on fully connected devices), circuits
+    get consecutive logical qubits from 0.
+
+    Args:
+        sizes: Number of qubits of each circuit
+        device_qubits: Number of qubits of the device (0 if unknown)
+        connectivity_graph: Device connectivity as adjacency lists keyed by qubit (optional)
+
+    Returns:
+        List[List[int]]: Packed qubit of each logical qubit, per circuit (physical qubit
+            labels with a connectivity graph)
+
+    Raises:
+        CircuitValidationError: If the circuits do not fit on the device
+    """
+    total = sum(sizes)
+    if device_qubits and total > device_qubits:
+        raise CircuitValidationError(
+            f'Circuits need {total} qubits together but the device has {device_qubits}'
+        )
+
+    if not connectivity_graph:
+        layouts = []
+        offset = 0
+        for size in sizes:
+            layouts.append(list(range(offset, offset + size)))
+            offset += size
+        return layouts
+
+    graph = {
+        int(qubit): [int(neighbor) for neighbor in neighbors]
+        for qubit, neighbors in connectivity_graph.items()
+    }
+    for qubit, neighbors in list(graph.items()):
+        for neighbor in neighbors:
+            graph.setdefault(neighbor, [])
+            if qubit not in graph[neighbor]:
+                graph[neighbor].append(qubit)
+    free = set(graph)
+
+    # Place the largest circuits first, while large connected regions are still free
+    layouts: List[Optional[List[int]]] = [None] * len(sizes)
+    for index in sorted(range(len(sizes)), key=lambda i: -sizes[i]):
+        for start in sorted(free):
+            region = _connected_region(start, sizes[index], free, graph)
+            if region is not None:
+                layouts[index] = region
+                free.difference_update(region)
+                break
+        else:
+            raise CircuitValidationError(
+                f'Could not place circuit {index} ({sizes[index]} qubits) on a connected '
+                f'region of free device qubits'
+            )
+    return layouts
+
+
+def pack_circuits(
+    circuits: Sequence[QuantumCircuit], layouts: Sequence[Sequence[int]]
+) -> QuantumCircuit:
+    """Combine circuits placed on disjoint qubits into one circuit.
+
+    Gates keep the allocated qubit labels, so physical placements survive into the packed
+    circuit. It measures every allocated qubit explicitly, in ascending order of the labels.
+
+    Args:
+        circuits: Circuits to combine
+        layouts: Packed qubit of each logical qubit, per circuit
+
+    Returns:
+        QuantumCircuit: The packed circuit
+    """
+    allocated = sorted(q for layout in layouts for q in layout)
+    gates = []
+    for circuit, layout in zip(circuits, layouts):
+        for gate in circuit.gates:
+            if gate.name in ('measure', 'measure_all'):
+                continue
+            gates.append(
+                Gate(name=gate.name, qubits=[layout[q] for q in gate.qubits], params=gate.params)
+            )
+    gates.append(Gate(name='measure', qubits=allocated))
+    return QuantumCircuit(
+        num_qubits=allocated[-1] + 1 if allocated else 0,
+        gates=gates,
+        metadata={'multiplexed_circuits': len(circuits)},
+    )
+
+
+def measurement_columns(
+    circuits: Sequence[QuantumCircuit], layouts: Sequence[Sequence[int]]
+) -> List[List[int]]:
+    """Get the bit columns of each circuit's measured qubits in the packed measurements.
+
+    Args:
+        circuits: The packed circuits
+        layouts: Packed qubit of each logical qubit, per circuit
+
+    Returns:
+        List[List[int]]: Column indices per circuit, in logical qubit order
+    """
+    allocated = sorted(q for layout in layouts for q in layout)
+    position = {qubit: column for column, qubit in enumerate(allocated)}
+    return [
+        [position[layout[q]] for q in measured_qubits(circuit)]
+        for circuit, layout in zip(circuits, layouts)
+    ]
+
+
+def bit_matrix_from_counts(counts: Dict[str, int]) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert measurement counts to a bit matrix of the distinct bitstrings and their counts.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: One row of bits per distinct bitstring, and its count
+    """
+    if not counts:
+        return np.zeros((0, 0), dtype=np.uint8), np.zeros(0, dtype=np.int64)
+    keys = list(counts)
+    width = len(keys[0])
+    bits = (np.frombuffer(''.join(keys).encode('ascii'), dtype=np.uint8) - ord('0')).reshape(
+        len(keys), width
+    )
+    return bits, np.fromiter(counts.values(), dtype=np.int64, count=len(keys))
+
+
+def demultiplex(
+    bits: np.ndarray, columns: Sequence[Sequence[int]], weights: Optional[np.ndarray] = None
+) -> List[Dict[str, int]]:
+    """Split packed measurements into per-circuit counts.
+
+    Each circuit's columns are sliced out of the bit matrix for all shots at once, encoded as
+    integers and tallied in one pass.
+
+    Args:
+        bits: Measured bits, one row per shot (or per distinct bitstring with weights)
+        columns: Bit columns of each circuit, in logical qubit order
+        weights: Number of shots of each row (optional, one shot per row by default)
+
+    Returns:
+        List[Dict[str, int]]: Counts of each circuit's bitstrings
+    """
+    bits = np.asarray(bits, dtype=np.int64)
+    results = []
+    for cols in columns:
+        width = len(cols)
+        if not width or bits.size == 0:
+            results.append({})
+            continue
+        powers = 1 << np.arange(width - 1, -1, -1, dtype=np.int64)
+        codes = bits[:, list(cols)] @ powers
+        unique, inverse = np.unique(codes, return_inverse=True)
+        tally = np.bincount(inverse.ravel(), weights=weights, minlength=len(unique))
+        results.append(
+            {format(int(code), f'0{width}b'): int(count) for code, count in zip(unique, tally)}
+        )
+    return results
+
+
+class MultiplexedTask:
+    """A task running several circuits packed onto disjoint qubits.
+
+    Attributes:
+        task_id: ID of the packed task
+        device_arn: ARN of the device the task runs on
+        circuits: The packed circuits
+        layouts: Packed qubit of each logical qubit, per circuit
+        physical: Whether the layouts are physical qubits, run with qubit rewiring disabled
+        columns: Bit columns of each circuit in the packed measurements
+    """
+
+    def __init__(
+        self,
+        task_id: str,
+        device_arn: str,
+        circuits: Sequence[QuantumCircuit],
+        layouts: Sequence[Sequence[int]],
+        physical: bool = False,
+    ):
+        """Initialize the multiplexed task.
+
+        Args:
+            task_id: ID of the packed task
+            device_arn: ARN of the device the task runs on
+            circuits: The packed circuits
+            layouts: Packed qubit of each logical qubit, per circuit
+            physical: Whether the layouts are physical qubits
+        """
+        self.task_id = task_id
+        self.device_arn = device_arn
+        self.circuits = list(circuits)
+        self.layouts = [list(layout) for layout in layouts]
+        self.physical = physical
+        self.columns = measurement_columns(circuits, layouts)
+
+    def split(self, result: TaskResult) -> List[Dict[str, int]]:
+        """Split the result of the packed task into per-circuit counts.
+
+        Per-shot measurements are used when available, otherwise the counts.
+
+        Args:
+            result: Result of the packed task
+
+        Returns:
+            List[Dict[str, int]]: Counts of each circuit (empty until the task completes)
+        """
+        if result.packed_measurements is not None and result.packed_measurements.shape[0]:
+            return demultiplex(unpack_measurements(result.packed_measurements), self.columns)
+        if result.measurements:
+            return demultiplex(np.asarray(result.measurements, dtype=np.uint8), self.columns)
+        if result.counts:
+            bits, weights = bit_matrix_from_counts(result.counts)
+            return demultiplex(bits, self.columns, weights)
+        return [{} for _ in self.circuits]
@@ -0,0 +1,152 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Direct OpenQASM 3 emission of circuit definitions.
+
+Circuit definitions are rendered straight to the OpenQASM source, action and device parameter
+documents that CreateQuantumTask expects, without building SDK circuit objects. The output
+matches the Braket SDK serialization of the same circuit.
+"""
+
+import json
+from awslabs.amazon_braket_mcp_server.braket_circuits import BRAKET_GATES
+from awslabs.amazon_braket_mcp_server.exceptions import CircuitCreationError
+from awslabs.amazon_braket_mcp_server.models import QuantumCircuit
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+
+# Schema header of OpenQASM program actions
+PROGRAM_HEADER = {'name': 'braket.ir.openqasm.program', 'version': '1'}
+
+# Device parameter schemas by ARN fragment; other devices take the simulator schema
+DEVICE_PARAMETER_SCHEMAS = (
+    ('ionq', 'braket.device_schema.ionq.ionq_device_parameters'),
+    ('rigetti', 'braket.device_schema.rigetti.rigetti_device_parameters'),
+    ('oqc', 'braket.device_schema.oqc.oqc_device_parameters'),
+)
+SIMULATOR_PARAMETER_SCHEMA = (
+    'braket.device_schema.simulators.gate_model_simulator_device_parameters'
+)
+
+
+@lru_cache(maxsize=256)
+def _header(parameters: Tuple[str, ...], num_bits: int, num_qubits: int, physical: bool) -> str:
+    """Build the declarations of a program; they repeat across circuits of the same shape."""
+    lines = ['OPENQASM 3.0;']
+    lines.extend(f'input float {name};' for name in parameters)
+    lines.append(f'bit[{num_bits}] b;')
+    if not physical:
+        lines.append(f'qubit[{num_qubits}] q;')
+    return '\n'.join(lines) + '\n'
+
+
+def _format_param(param) -> str:
+    """Format a gate parameter like the SDK: free parameters by name, numbers in full precision."""
+    return param if isinstance(param, str) else repr(float(param))
+
+
+def emit_openqasm(
+    circuit_def: QuantumCircuit, verbatim: bool = False, physical: bool = False
+) -> Tuple[str, int]:
+    """Render a circuit definition to OpenQASM 3 source.
+
+    Measurements follow `build_braket_circuit`: explicitly measured qubits (all qubits for
+    `measure_all`) are measured in ascending order, otherwise every qubit the circuit acts on,
+    in ascending order or, inside a verbatim box, in order of first use.
+
+    Args:
+        circuit_def: Circuit definition
+        verbatim: Whether to wrap the gates in a verbatim box on physical qubits
+        physical: Whether the qubit indices are physical qubit labels (implied by verbatim)
+
+    Returns:
+        Tuple[str, int]: The OpenQASM source and the number of qubits the program uses
+
+    Raises:
+        CircuitCreationError: If the circuit uses an unsupported gate
+    """
+    physical = physical or verbatim
+    ref = '${}'.format if physical else 'q[{}]'.format
+    body: List[str] = []
+    used: Dict[int, None] = {}
+    measured: List[int] = []
+    parameters = set()
+    for gate in circuit_def.gates:
+        if gate.name == 'measure_all' or (gate.name == 'measure' and not gate.qubits):
+            measured = list(range(circuit_def.num_qubits))
+            continue
+        if gate.name == 'measure':
+            measured.extend(q for q in gate.qubits if q not in measured)
+            continue
+        name = BRAKET_GATES.get(gate.name)
+        if name is None:
+            raise CircuitCreationError(f'Unsupported gate: {gate.name}')
+        targets = ', '.join(ref(q) for q in gate.qubits)
+        used.update(dict.fromkeys(gate.qubits))
+        if gate.params:
+            parameters.update(p for p in gate.params if isinstance(p, str))
+            args = ', '.join(_format_param(p) for p in gate.params)
+            body.append(f'{name}({args}) {targets};')
+        else:
+            body.append(f'{name} {targets};')
+
+    if verbatim and body:
+        body = ['#pragma braket verbatim', 'box{', *body, '}']
+    if measured:
+        measured = sorted(measured)
+        used.update(dict.fromkeys(measured))
+    else:
+        measured = list(used) if verbatim else sorted(used)
+    body.extend(f'b[{bit}] = measure {ref(q)};' for bit, q in enumerate(measured))
+
+    header = _header(
+        tuple(sorted(parameters)), len(measured), max(used) + 1 if used else 0, physical
+    )
+    return header + '\n'.join(body), len(used)
+
+
+def program_action(source: str, inputs: Optional[Dict[str, float]] = None) -> str:
+    """Serialize an OpenQASM program as a CreateQuantumTask action document."""
+    return json.dumps(
+        {'braketSchemaHeader': PROGRAM_HEADER, 'source': source, 'inputs': inputs or {}}
+    )
+
+
+@lru_cache(maxsize=256)
+def device_parameters(device_arn: str, qubit_count: int, disable_qubit_rewiring: bool) -> str:
+    """Serialize the gate model device parameters of a CreateQuantumTask request.
+
+    Args:
+        device_arn: ARN of the target device
+        qubit_count: Number of qubits the program uses
+        disable_qubit_rewiring: Whether the device may remap qubits
+
+    Returns:
+        str: The device parameters document
+    """
+    schema = next(
+        (name for fragment, name in DEVICE_PARAMETER_SCHEMAS if fragment in device_arn),
+        SIMULATOR_PARAMETER_SCHEMA,
+    )
+    return json.dumps(
+        {
+            'braketSchemaHeader': {'name': schema, 'version': '1'},
+            'paradigmParameters': {
+                'braketSchemaHeader': {
+                    'name': 'braket.device_schema.gate_model_parameters',
+                    'version': '1',
+                },
+                'qubitCount': qubit_count,
+                'disableQubitRewiring': disable_qubit_rewiring,
+            },
+        }
+    )
@@ -0,0 +1,224 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Background prefetching of quantum task results.
+
+Without it, the first `get_task_result` after a task completes downloads the result while
+the agent waits. The prefetcher watches recently created tasks in a background thread and
+fetches each result into the result cache as soon as the task reaches a terminal state, so
+the agent's lookup is answered from the cache.
+
+Every task is checked on its own schedule: its interval doubles while the status stays the
+same and returns to the base interval when the status changes. Tasks waiting in a QPU queue
+are then checked rarely, while tasks that just started running are checked often.
+"""
+
+import heapq
+import threading
+import time
+from awslabs.amazon_braket_mcp_server.composite import TERMINAL_STATUSES
+from awslabs.amazon_braket_mcp_server.exceptions import ThrottlingError
+from awslabs.amazon_braket_mcp_server.models import TaskStatus
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from loguru import logger
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# Check interval of a newly watched or changed task, and the interval it backs off to
+# (in seconds)
+DEFAULT_PREFETCH_INTERVAL = 2.0
+MAX_PREFETCH_INTERVAL = 60.0
+
+# Maximum number of watched tasks; the oldest are dropped first
+MAX_WATCHED_TASKS = 1000
+
+
+class ResultPrefetcher:
+    """Background watcher fetching task results as soon as the tasks finish.
+
+    Attributes:
+        base_interval: Check interval of a newly watched or changed task (in seconds)
+        max_interval: Longest check interval (in seconds)
+        max_tasks: Maximum number of watched tasks
+        max_concurrency: Maximum number of status checks and downloads at once
+        prefetched: Number of results fetched so far
+    """
+
+    def __init__(
+        self,
+        get_status: Callable[[str], TaskStatus],
+        fetch_result: Callable[[str], Any],
+        base_interval: float = DEFAULT_PREFETCH_INTERVAL,
+        max_interval: float = MAX_PREFETCH_INTERVAL,
+        max_tasks: int = MAX_WATCHED_TASKS,
+        max_concurrency: int = 4,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the prefetcher.
+
+        Args:
+            get_status: Function looking up the status of a task
+            fetch_result: Function fetching the result of a finished task into the cache
+            base_interval: Check interval of a newly watched or changed task (in seconds)
+            max_interval: Longest check interval (in seconds)
+            max_tasks: Maximum number of watched tasks; the oldest are dropped first
+            max_concurrency: Maximum number of status checks and downloads at once
+            clock: Function returning the current monotonic time
+        """
+        self.base_interval = base_interval
+        self.max_interval = max_interval
+        self.max_tasks = max_tasks
+        self.max_concurrency = max_concurrency
+        self.prefetched = 0
+        self._get_status = get_status
+        self._fetch_result = fetch_result
+        self._clock = clock
+        # Last known status and current check interval of each watched task
+        self._tasks: 'OrderedDict[str, Tuple[Optional[TaskStatus], float]]' = OrderedDict()
+        # Next check time of each watched task (entries of dropped tasks are skipped)
+        self._schedule: List[Tuple[float, str]] = []
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        """Whether the prefetcher thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def watched(self) -> Dict[str, Optional[TaskStatus]]:
+        """Last known status of each watched task (None before its first check)."""
+        with self._lock:
+            return {task_id: status for task_id, (status, _) in self._tasks.items()}
+
+    def start(self) -> None:
+        """Start checking watched tasks in the background."""
+        with self._thread_lock:
+            if self.running:
+                return
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run, name='braket-result-prefetcher', daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the prefetcher, waiting for in-flight checks to finish."""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def watch(self, task_id: str) -> None:
+        """Watch a task and fetch its result once it finishes.
+
+        Args:
+            task_id: ID of the quantum task
+        """
+        with self._lock:
+            if task_id in self._tasks:
+                return
+            self._tasks[task_id] = (None, self.base_interval)
+            heapq.heappush(self._schedule, (self._clock() + self.base_interval, task_id))
+            while len(self._tasks) > self.max_tasks:
+                dropped, _ = self._tasks.popitem(last=False)
+                logger.debug(f'No longer prefetching the result of {dropped}')
+        self._wakeup.set()
+
+    def _reschedule(self, task_id: str, status: Optional[TaskStatus], interval: float) -> None:
+        with self._lock:
+            if task_id in self._tasks:
+                self._tasks[task_id] = (status, interval)
+                heapq.heappush(self._schedule, (self._clock() + interval, task_id))
+
+    def _forget(self, task_id: str) -> None:
+        with self._lock:
+            self._tasks.pop(task_id, None)
+
+    def _check(self, task_id: str) -> None:
+        """Check the status of a task and fetch its result if it finished."""
+        with self._lock:
+            if task_id not in self._tasks:
+                return
+            last_status, interval = self._tasks[task_id]
+        try:
+            status = self._get_status(task_id)
+        except ThrottlingError as e:
+            self._reschedule(task_id, last_status, max(interval, e.retry_after))
+            return
+        except Exception as e:
+            logger.warning(f'Could not check the status of {task_id}: {str(e)}')
+            self._reschedule(task_id, last_status, min(interval * 2, self.max_interval))
+            return
+
+        if status not in TERMINAL_STATUSES:
+            interval = (
+                self.base_interval
+                if status != last_status
+                else min(interval * 2, self.max_interval)
+            )
+            self._reschedule(task_id, status, interval)
+            return
+
+        try:
+            self._fetch_result(task_id)
+        except ThrottlingError as e:
+            self._reschedule(task_id, status, max(interval, e.retry_after))
+            return
+        except Exception as e:
+            # The agent's own lookup fetches the result instead
+            logger.warning(f'Could not prefetch the result of {task_id}: {str(e)}')
+        else:
+            with self._lock:
+                self.prefetched += 1
+            logger.debug(f'Prefetched the result of {task_id}')
+        self._forget(task_id)
+
+    def poll_due(self, executor: ThreadPoolExecutor) -> List[str]:
+        """Check every watched task whose next check is due, waiting for the checks.
+
+        Args:
+            executor: Executor running the checks
+
+        Returns:
+            List[str]: IDs of the checked tasks
+        """
+        now = self._clock()
+        due = []
+        with self._lock:
+            while self._schedule and self._schedule[0][0] <= now:
+                _, task_id = heapq.heappop(self._schedule)
+                if task_id in self._tasks:
+                    due.append(task_id)
+        list(executor.map(self._check, due))
+        return due
+
+    def _seconds_to_next_check(self) -> Optional[float]:
+        with self._lock:
+            while self._schedule and self._schedule[0][1] not in self._tasks:
+                heapq.heappop(self._schedule)
+            if not self._schedule:
+                return None
+            return max(self._schedule[0][0] - self._clock(), 0.0)
+
+    def _run(self) -> None:
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            while not self._stopped.is_set():
+                try:
+                    self.poll_due(executor)
+                except Exception as e:
+                    logger.exception(f'Error prefetching task results: {str(e)}')
+                self._wakeup.wait(self._seconds_to_next_check())
+                self._wakeup.clear()
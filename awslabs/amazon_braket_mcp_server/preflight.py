@@ -0,0 +1,256 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Pre-flight validation of quantum tasks against device capabilities.
+
+The checks run against cached device information before any circuit compilation or AWS
+round trip, so requests that a device cannot run are rejected immediately with a precise
+reason.
+"""
+
+from awslabs.amazon_braket_mcp_server.braket_circuits import circuit_parameters
+from awslabs.amazon_braket_mcp_server.exceptions import CircuitValidationError
+from awslabs.amazon_braket_mcp_server.models import DeviceInfo, DeviceType, QuantumCircuit
+from typing import Dict, FrozenSet, List
+
+
+# Names under which devices may report each circuit gate
+GATE_ALIASES: Dict[str, FrozenSet[str]] = {
+    'h': frozenset({'h'}),
+    'x': frozenset({'x'}),
+    'y': frozenset({'y'}),
+    'z': frozenset({'z'}),
+    's': frozenset({'s'}),
+    't': frozenset({'t'}),
+    'rx': frozenset({'rx'}),
+    'ry': frozenset({'ry'}),
+    'rz': frozenset({'rz'}),
+    'cx': frozenset({'cx', 'cnot'}),
+    'cnot': frozenset({'cx', 'cnot'}),
+    'cy': frozenset({'cy'}),
+    'cz': frozenset({'cz'}),
+    'swap': frozenset({'swap'}),
+    'ccx': frozenset({'ccx', 'ccnot', 'toffoli'}),
+    'toffoli': frozenset({'ccx', 'ccnot', 'toffoli'}),
+}
+
+# Operations that are not gates and need no device support check
+NON_GATE_OPERATIONS = frozenset({'measure', 'measure_all', 'barrier'})
+
+# Device statuses that accept new quantum tasks
+AVAILABLE_STATUSES = frozenset({'ONLINE'})
+
+# Paradigm name fragments of devices that cannot run gate-model circuits
+NON_GATE_PARADIGMS = ('anneal', 'analog', 'ahs')
+
+
+def device_qubit_labels(device: DeviceInfo) -> FrozenSet[int]:
+    """Get the physical qubit labels of a device from its connectivity graph.
+
+    Labels need not start at 0 (IQM devices number their qubits from 1).
+
+    Returns:
+        FrozenSet[int]: The qubit labels (empty if the connectivity graph is not known)
+    """
+    labels = set()
+    for qubit, neighbors in (device.connectivity_graph or {}).items():
+        labels.add(int(qubit))
+        labels.update(int(neighbor) for neighbor in neighbors)
+    return frozenset(labels)
+
+
+def find_parameter_errors(circuit: QuantumCircuit) -> List[str]:
+    """Check that every gate parameter of a circuit is bound to a number.
+
+    Free parameters are only bound by parameter sweeps, which send their values as task
+    inputs; anywhere else they would fail at Amazon Braket after submission.
+
+    Returns:
+        List[str]: Reasons the circuit cannot run as given (empty if it can)
+    """
+    unbound = circuit_parameters(circuit)
+    if not unbound:
+        return []
+    return [
+        f'Gate parameters {unbound} are not bound to numbers; free parameters are only '
+        f'supported by run_parameter_sweep'
+    ]
+
+
+def find_verbatim_errors(circuit: QuantumCircuit, device: DeviceInfo) -> List[str]:
+    """Check that a pre-compiled circuit can run verbatim on a device.
+
+    Verbatim circuits must use only the device's native gates, and multi-qubit gates must act
+    on physically connected qubits, since the device compiler neither translates nor routes
+    them. Checks whose device data is not known are skipped.
+
+    Args:
+        circuit: Circuit definition on physical qubits
+        device: Cached information about the target device
+
+    Returns:
+        List[str]: Reasons the circuit cannot run verbatim (empty if it can)
+    """
+    errors = []
+
+    if device.native_gates:
+        native = {name.lower() for name in device.native_gates}
+        non_native = sorted(
+            {
+                gate.name
+                for gate in circuit.gates
+                if gate.name not in NON_GATE_OPERATIONS
+                and not (GATE_ALIASES.get(gate.name, frozenset({gate.name})) & native)
+            }
+        )
+        if non_native:
+            errors.append(
+                f'Gates {non_native} are not native to device {device.device_name}; '
+                f'native gates: {sorted(native)}'
+            )
+
+    if device.connectivity_graph:
+        edges = set()
+        for qubit, neighbors in device.connectivity_graph.items():
+            for neighbor in neighbors:
+                edges.add(frozenset({int(qubit), int(neighbor)}))
+        qubits = device_qubit_labels(device)
+        for index, gate in enumerate(circuit.gates):
+            # Qubits the device does not have are reported by the qubit label check
+            if gate.name in NON_GATE_OPERATIONS or not set(gate.qubits) <= qubits:
+                continue
+            unconnected = [
+                (a, b)
+                for i, a in enumerate(gate.qubits)
+                for b in gate.qubits[i + 1 :]
+                if frozenset({a, b}) not in edges
+            ]
+            if unconnected:
+                errors.append(
+                    f'Gate {index} ({gate.name}) acts on unconnected qubits {unconnected} of '
+                    f'device {device.device_name}'
+                )
+
+    return errors
+
+
+def find_preflight_errors(
+    circuit: QuantumCircuit,
+    device: DeviceInfo,
+    shots: int,
+    verbatim: bool = False,
+    physical: bool = False,
+    free_parameters: bool = False,
+) -> List[str]:
+    """Check a circuit and shot count against a device's capabilities.
+
+    Args:
+        circuit: Circuit definition to run
+        device: Cached information about the target device
+        shots: Number of shots requested
+        verbatim: Whether the circuit runs verbatim; its gates are then checked against the
+            native gates and connectivity instead of the supported gates, and its qubits
+            against the device's qubit labels instead of its qubit count
+        physical: Whether the qubit indices are physical qubit labels (implied by verbatim),
+            checked against the device's qubit labels
+        free_parameters: Whether named gate parameters are bound later, as task inputs
+
+    Returns:
+        List[str]: Reasons the device cannot run the request (empty if it can)
+    """
+    errors = []
+
+    if device.status and device.status.upper() not in AVAILABLE_STATUSES:
+        errors.append(f'Device {device.device_name} is {device.status} and not accepting tasks')
+
+    paradigm = (device.paradigm or '').lower()
+    if any(fragment in paradigm for fragment in NON_GATE_PARADIGMS):
+        errors.append(
+            f'Device {device.device_name} uses the {device.paradigm} paradigm and cannot run '
+            f'gate-based circuits'
+        )
+
+    # Physical qubit labels may not start at 0
+    labels = device_qubit_labels(device) if verbatim or physical else frozenset()
+    if labels:
+        missing = sorted({q for gate in circuit.gates for q in gate.qubits} - labels)
+        if missing:
+            errors.append(
+                f'Circuit targets qubits {missing} that device {device.device_name} does not '
+                f'have; its qubits are {sorted(labels)}'
+            )
+    elif device.qubits and circuit.num_qubits > device.qubits:
+        errors.append(
+            f'Circuit uses {circuit.num_qubits} qubits but device {device.device_name} '
+            f'supports at most {device.qubits}'
+        )
+
+    if not free_parameters:
+        errors.extend(find_parameter_errors(circuit))
+
+    for index, gate in enumerate(circuit.gates):
+        out_of_range = [q for q in gate.qubits if q < 0 or q >= circuit.num_qubits]
+        if out_of_range:
+            errors.append(
+                f'Gate {index} ({gate.name}) targets qubits {out_of_range} outside the '
+                f'{circuit.num_qubits}-qubit circuit'
+            )
+
+    if verbatim:
+        errors.extend(find_verbatim_errors(circuit, device))
+    elif device.supported_gates:
+        supported = {name.lower() for name in device.supported_gates}
+        unsupported = sorted(
+            {
+                gate.name
+                for gate in circuit.gates
+                if gate.name not in NON_GATE_OPERATIONS
+                and not (GATE_ALIASES.get(gate.name, frozenset({gate.name})) & supported)
+            }
+        )
+        if unsupported:
+            errors.append(
+                f'Device {device.device_name} does not support gates {unsupported}; '
+                f'supported gates: {sorted(supported)}'
+            )
+
+    if shots < 0:
+        errors.append(f'Shots must not be negative, got {shots}')
+    elif shots == 0 and device.device_type == DeviceType.QPU:
+        errors.append(f'QPU {device.device_name} requires at least one shot')
+
+    return errors
+
+
+def validate_circuit_for_device(
+    circuit: QuantumCircuit,
+    device: DeviceInfo,
+    shots: int,
+    verbatim: bool = False,
+    physical: bool = False,
+    free_parameters: bool = False,
+) -> None:
+    """Validate that a device can run a circuit with the given number of shots.
+
+    Args:
+        circuit: Circuit definition to run
+        device: Cached information about the target device
+        shots: Number of shots requested
+        verbatim: Whether the circuit runs verbatim (see `find_verbatim_errors`)
+        physical: Whether the qubit indices are physical qubit labels
+        free_parameters: Whether named gate parameters are bound later, as task inputs
+
+    Raises:
+        CircuitValidationError: If the device cannot run the request
+    """
+    errors = find_preflight_errors(circuit, device, shots, verbatim, physical, free_parameters)
+    if errors:
+        raise CircuitValidationError('Pre-flight check failed: ' + '; '.join(errors))
@@ -0,0 +1,147 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Local simulator previews of remote quantum tasks.
+
+While a task waits in a device queue, the same circuit is simulated locally in the
+background. The noise-free local result is returned as a labeled preview until the device
+result is available, so callers can keep working without blocking on the queue.
+"""
+
+import threading
+from awslabs.amazon_braket_mcp_server.result_types import serialize_result_types
+from braket.circuits import Circuit as BraketCircuit
+from braket.devices import LocalSimulator
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from loguru import logger
+from typing import Any, Dict, Optional
+
+
+# Largest circuit simulated locally; state vectors double in size with every qubit
+PREVIEW_MAX_QUBITS = 20
+
+# Default number of previews kept; the oldest are dropped first
+PREVIEW_CACHE_SIZE = 64
+
+# Label of preview results
+PREVIEW_SOURCE = 'local_simulator'
+
+
+class LocalPreviews:
+    """Background local simulations of remote tasks, keyed by task ID.
+
+    Attributes:
+        max_qubits: Largest number of qubits simulated locally
+        max_previews: Maximum number of previews kept; the oldest are dropped first
+    """
+
+    def __init__(
+        self,
+        max_qubits: int = PREVIEW_MAX_QUBITS,
+        max_workers: int = 2,
+        max_previews: int = PREVIEW_CACHE_SIZE,
+    ):
+        """Initialize the previews.
+
+        Args:
+            max_qubits: Largest number of qubits simulated locally
+            max_workers: Maximum number of simulations running at once
+            max_previews: Maximum number of previews kept; the oldest are dropped first
+        """
+        self.max_qubits = max_qubits
+        self.max_previews = max_previews
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._previews: 'OrderedDict[str, Future]' = OrderedDict()
+        self._shots: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def start(self, task_id: str, circuit: BraketCircuit, num_qubits: int, shots: int) -> bool:
+        """Start simulating a task's circuit locally in the background.
+
+        Args:
+            task_id: ID of the remote task
+            circuit: Braket circuit of the task
+            num_qubits: Number of qubits of the circuit
+            shots: Number of shots (0 for exact result types)
+
+        Returns:
+            bool: Whether a preview is running for the task
+        """
+        if num_qubits > self.max_qubits:
+            logger.debug(f'Not previewing {task_id}: {num_qubits} qubits exceed {self.max_qubits}')
+            return False
+        evicted = []
+        with self._lock:
+            if task_id in self._previews:
+                return True
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix='braket-preview'
+                )
+            self._previews[task_id] = self._executor.submit(self._simulate, circuit, shots)
+            self._shots[task_id] = shots
+            while len(self._previews) > self.max_previews:
+                oldest, future = self._previews.popitem(last=False)
+                self._shots.pop(oldest, None)
+                evicted.append(future)
+        for future in evicted:
+            future.cancel()
+        return True
+
+    @staticmethod
+    def _simulate(circuit: BraketCircuit, shots: int) -> Dict[str, Any]:
+        """Run a circuit on the local state vector simulator."""
+        result = LocalSimulator().run(circuit, shots=shots).result()
+        counts = getattr(result, 'measurement_counts', None)
+        return {
+            'counts': dict(counts) if counts else None,
+            'result_types': serialize_result_types(result) or None,
+        }
+
+    def has(self, task_id: str) -> bool:
+        """Check whether a preview was started for a task."""
+        return task_id in self._previews
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Get the preview of a task without waiting for it.
+
+        Returns:
+            Optional[Dict[str, Any]]: The preview (status RUNNING, COMPLETED or FAILED, with
+                counts or result type values once completed), or None if there is none
+        """
+        future = self._previews.get(task_id)
+        if future is None:
+            return None
+        preview: Dict[str, Any] = {
+            'source': PREVIEW_SOURCE,
+            'approximate': True,
+            'note': 'Noise-free local simulation, shown until the device result is available',
+            'shots': self._shots.get(task_id),
+        }
+        if not future.done():
+            preview['status'] = 'RUNNING'
+        elif future.exception() is not None:
+            preview['status'] = 'FAILED'
+            preview['error'] = str(future.exception())
+        else:
+            preview['status'] = 'COMPLETED'
+            preview.update(future.result())
+        return preview
+
+    def discard(self, task_id: str) -> None:
+        """Forget the preview of a task, e.g. once its device result is available."""
+        with self._lock:
+            future = self._previews.pop(task_id, None)
+            self._shots.pop(task_id, None)
+        if future is not None:
+            future.cancel()
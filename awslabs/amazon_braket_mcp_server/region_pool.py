@@ -0,0 +1,203 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Region-keyed pool of Braket services.
+
+Amazon Braket devices live in different regions, so each call is routed to a service for the
+region named in the device or task ARN. Services are created lazily and share one rate
+limiter and one submission journal.
+"""
+
+import threading
+from awslabs.amazon_braket_mcp_server.braket_service import BraketService
+from awslabs.amazon_braket_mcp_server.exceptions import DeviceError
+from awslabs.amazon_braket_mcp_server.journal import SubmissionJournal, SubmissionWorker
+from awslabs.amazon_braket_mcp_server.models import DeviceInfo
+from awslabs.amazon_braket_mcp_server.scheduler import (
+    DEFAULT_DEVICE_CONCURRENCY,
+    SubmissionScheduler,
+)
+from awslabs.amazon_braket_mcp_server.throttling import RateLimiter
+from concurrent.futures import ThreadPoolExecutor
+from loguru import logger
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+
+def region_from_arn(arn: Optional[str]) -> Optional[str]:
+    """Get the region of a Braket device or task ARN.
+
+    Args:
+        arn: Device or quantum task ARN
+
+    Returns:
+        Optional[str]: The region, or None for regionless ARNs (e.g. managed simulators)
+            and IDs that are not ARNs
+    """
+    if not arn or not arn.startswith('arn:'):
+        return None
+    parts = arn.split(':')
+    return (parts[3] or None) if len(parts) > 3 else None
+
+
+def is_device_arn(arn: str) -> bool:
+    """Check whether an ARN names a device rather than a task or task handle."""
+    return ':device/' in arn
+
+
+def list_devices_across_regions(
+    get_service: Callable[[str], BraketService], regions: Iterable[str]
+) -> List[DeviceInfo]:
+    """List devices in several regions in parallel and merge the results.
+
+    Devices returned by more than one region (such as the managed simulators) are listed
+    once. Regions that cannot be listed are skipped.
+
+    Args:
+        get_service: Function returning the service for a region
+        regions: Regions to list
+
+    Returns:
+        List[DeviceInfo]: The devices, in region order
+
+    Raises:
+        DeviceError: If no region could be listed
+    """
+    regions = sorted(regions)
+
+    def list_region(region: str) -> Optional[List[DeviceInfo]]:
+        try:
+            return get_service(region).list_devices()
+        except Exception as e:
+            logger.warning(f'Could not list devices in {region}: {str(e)}')
+            return None
+
+    with ThreadPoolExecutor(max_workers=max(len(regions), 1)) as executor:
+        results = list(executor.map(list_region, regions))
+
+    if regions and all(result is None for result in results):
+        raise DeviceError(f'Could not list devices in any of the regions {regions}')
+
+    devices = []
+    seen = set()
+    for result in results:
+        for device in result or []:
+            if device.device_arn not in seen:
+                seen.add(device.device_arn)
+                devices.append(device)
+    return devices
+
+
+class BraketServicePool:
+    """Lazily created Braket services keyed by region.
+
+    Attributes:
+        default_region: Region for calls without a regional ARN
+        rate_limiter: Rate limiter shared by all services
+        submission_worker: Submission worker shared by all services, if a workspace is set
+    """
+
+    def __init__(
+        self,
+        factory: Callable[..., BraketService],
+        default_region: Optional[str] = None,
+        workspace_dir: Optional[str] = None,
+        submission_concurrency: int = 4,
+        device_concurrency: int = DEFAULT_DEVICE_CONCURRENCY,
+    ):
+        """Initialize the pool.
+
+        Args:
+            factory: Function creating the service for a region; it receives the region and
+                the shared rate_limiter and submission_worker as keyword arguments
+            default_region: Region for calls without a regional ARN (None uses the AWS
+                configuration default)
+            workspace_dir: Directory of the shared submission journal (optional)
+            submission_concurrency: Maximum number of queued submissions submitted at once
+            device_concurrency: Maximum number of queued submissions to one device submitted
+                at once
+        """
+        self.default_region = default_region
+        self.rate_limiter = RateLimiter()
+        self._factory = factory
+        self._services: Dict[Optional[str], BraketService] = {}
+        self._region_locks: Dict[Optional[str], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+        self.submission_worker: Optional[SubmissionWorker] = None
+        if workspace_dir:
+            journal = SubmissionJournal(Path(workspace_dir) / BraketService.JOURNAL_FILENAME)
+            self.submission_worker = SubmissionWorker(
+                journal,
+                submit=lambda entry: self.for_arn(entry.device_arn)._submit_journal_entry(entry),
+                reconcile=lambda entry: self.for_arn(entry.device_arn)._reconcile_journal_entry(
+                    entry
+                ),
+                max_concurrency=submission_concurrency,
+                scheduler=SubmissionScheduler(
+                    lambda arn: self.for_arn(arn).get_device_info(arn), device_concurrency
+                ),
+            )
+
+    def get(self, region: Optional[str] = None) -> BraketService:
+        """Get the service for a region, creating it on first use.
+
+        Args:
+            region: AWS region (None for the default region)
+
+        Returns:
+            BraketService: The service for the region
+        """
+        region = region or self.default_region
+        service = self._services.get(region)
+        if service is not None:
+            return service
+
+        # Create services of different regions concurrently, each region once
+        with self._lock:
+            region_lock = self._region_locks.setdefault(region, threading.Lock())
+        with region_lock:
+            service = self._services.get(region)
+            if service is None:
+                logger.info(f'Creating Braket service for region {region}')
+                service = self._factory(
+                    region,
+                    rate_limiter=self.rate_limiter,
+                    submission_worker=self.submission_worker,
+                )
+                with self._lock:
+                    self._services[region] = service
+            return service
+
+    def for_arn(self, arn: Optional[str]) -> BraketService:
+        """Get the service for the region of a device or task ARN.
+
+        Composite task, sweep and multiplexed task IDs are routed to the service that created
+        them, since a multiplexed task on a regionless simulator is created by the default
+        service but has a regional task ARN.
+
+        Args:
+            arn: Device ARN, quantum task ARN, composite task ID or sweep ID
+
+        Returns:
+            BraketService: The service for the ARN's region
+        """
+        if arn and not is_device_arn(arn):
+            with self._lock:
+                services = list(self._services.values())
+            for service in services:
+                if service.has_task_handle(arn):
+                    return service
+        return self.get(region_from_arn(arn))
+
+    def list_devices(self) -> List[DeviceInfo]:
+        """List the devices of all supported regions in parallel."""
+        return list_devices_across_regions(self.get, BraketService.SUPPORTED_REGIONS)
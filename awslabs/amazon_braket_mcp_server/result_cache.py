@@ -0,0 +1,113 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Cache of quantum task results in terminal states.
+
+Results of completed, failed and cancelled tasks never change, so they are kept in an
+in-memory LRU cache backed by the persistent result archive in the workspace directory.
+Repeated lookups, also after a server restart, then need neither Braket API calls nor S3
+downloads, and each result is written to disk once.
+"""
+
+import threading
+from awslabs.amazon_braket_mcp_server.archive import ResultArchive
+from awslabs.amazon_braket_mcp_server.composite import TERMINAL_STATUSES
+from awslabs.amazon_braket_mcp_server.models import PackedMeasurements, TaskResult
+from collections import OrderedDict
+from loguru import logger
+from typing import Optional
+
+
+# Default number of results kept in memory
+DEFAULT_RESULT_CACHE_SIZE = 256
+
+
+class ResultCache:
+    """Two-tier cache of terminal task results.
+
+    Attributes:
+        archive: Result archive used as the on-disk tier (None keeps results in memory only)
+        max_entries: Maximum number of results kept in memory
+    """
+
+    def __init__(
+        self,
+        archive: Optional[ResultArchive] = None,
+        max_entries: int = DEFAULT_RESULT_CACHE_SIZE,
+    ):
+        """Initialize the cache.
+
+        Args:
+            archive: Result archive used as the on-disk tier (None keeps results in memory only)
+            max_entries: Maximum number of results kept in memory
+        """
+        self.archive = archive
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, TaskResult]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _remember(self, result: TaskResult) -> None:
+        with self._lock:
+            self._entries[result.task_id] = result
+            self._entries.move_to_end(result.task_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, task_id: str) -> Optional[TaskResult]:
+        """Get the cached result of a task.
+
+        Args:
+            task_id: ID of the quantum task
+
+        Returns:
+            Optional[TaskResult]: The result, or None if the task's result is not cached
+        """
+        with self._lock:
+            result = self._entries.get(task_id)
+            if result is not None:
+                self._entries.move_to_end(task_id)
+                return result
+        if self.archive is None:
+            return None
+        try:
+            result = self.archive.get(task_id)
+        except Exception as e:
+            logger.warning(f'Ignoring unreadable archived result of {task_id}: {str(e)}')
+            return None
+        if result is None:
+            return None
+        self._remember(result)
+        return result
+
+    def put(
+        self,
+        result: TaskResult,
+        measurements: Optional[PackedMeasurements] = None,
+        store_rows: bool = True,
+    ) -> None:
+        """Cache a task result if the task is in a terminal state.
+
+        Args:
+            result: Result of the quantum task, as kept in memory
+            measurements: Bit-packed measurements archived with the result (defaults to those
+                of the result)
+            store_rows: Whether the measurement rows are written to the archive; without it
+                they are only indexed, e.g. when the measurement store keeps them
+        """
+        if result.status not in TERMINAL_STATUSES:
+            return
+        self._remember(result)
+        if self.archive is None:
+            return
+        try:
+            self.archive.put(result, measurements, store_rows=store_rows)
+        except Exception as e:
+            logger.warning(f'Could not archive the result of {result.task_id}: {str(e)}')
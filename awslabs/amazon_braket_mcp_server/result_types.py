@@ -0,0 +1,196 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Braket result types for exact simulator results.
+
+Simulators can return probabilities, expectation values and state amplitudes computed from
+the final state vector instead of sampled measurements. Run with shots=0, these values are
+exact, cheaper to compute and free of sampling noise.
+"""
+
+import hashlib
+import json
+import numpy as np
+from awslabs.amazon_braket_mcp_server.braket_circuits import build_braket_circuit
+from awslabs.amazon_braket_mcp_server.exceptions import CircuitValidationError
+from awslabs.amazon_braket_mcp_server.models import QuantumCircuit, ResultTypeSpec
+from braket.circuits import Circuit as BraketCircuit
+from braket.circuits import Observable
+from functools import reduce
+from typing import Any, Dict, List, Sequence
+
+
+# Supported result types
+PROBABILITY = 'probability'
+EXPECTATION = 'expectation'
+AMPLITUDE = 'amplitude'
+RESULT_TYPES = (PROBABILITY, EXPECTATION, AMPLITUDE)
+
+# Braket observables of each Pauli letter
+PAULI_OBSERVABLES = {
+    'I': Observable.I,
+    'X': Observable.X,
+    'Y': Observable.Y,
+    'Z': Observable.Z,
+}
+
+
+def find_result_type_errors(
+    specs: Sequence[ResultTypeSpec], num_qubits: int, shots: int
+) -> List[str]:
+    """Check requested result types against a circuit and shot count.
+
+    Args:
+        specs: Requested result types
+        num_qubits: Number of qubits of the circuit
+        shots: Number of shots requested
+
+    Returns:
+        List[str]: Reasons the result types cannot be computed (empty if they can)
+    """
+    errors = []
+    if shots == 0 and not specs:
+        errors.append('Tasks with shots=0 must request at least one result type')
+
+    for index, spec in enumerate(specs):
+        if spec.type not in RESULT_TYPES:
+            errors.append(
+                f'Result type {index} has unknown type {spec.type!r}; '
+                f'supported types: {list(RESULT_TYPES)}'
+            )
+            continue
+        out_of_range = [q for q in spec.qubits or [] if q < 0 or q >= num_qubits]
+        if out_of_range:
+            errors.append(
+                f'Result type {index} ({spec.type}) targets qubits {out_of_range} outside the '
+                f'{num_qubits}-qubit circuit'
+            )
+        if spec.type == EXPECTATION:
+            observable = (spec.observable or '').upper()
+            width = len(spec.qubits) if spec.qubits else num_qubits
+            if not observable or set(observable) - set(PAULI_OBSERVABLES):
+                errors.append(
+                    f'Result type {index} (expectation) needs a Pauli string observable '
+                    f'such as "ZZ", got {spec.observable!r}'
+                )
+            elif len(observable) != width:
+                errors.append(
+                    f'Result type {index} (expectation) observable {observable} has '
+                    f'{len(observable)} factors for {width} qubits'
+                )
+        if spec.type == AMPLITUDE:
+            if shots:
+                errors.append(f'Result type {index} (amplitude) requires shots=0')
+            states = spec.states or []
+            invalid = [
+                state for state in states if len(state) != num_qubits or set(state) - {'0', '1'}
+            ]
+            if not states or invalid:
+                errors.append(
+                    f'Result type {index} (amplitude) needs {num_qubits}-bit basis states, '
+                    f'got {states}'
+                )
+    return errors
+
+
+def validate_result_types(specs: Sequence[ResultTypeSpec], num_qubits: int, shots: int) -> None:
+    """Validate requested result types against a circuit and shot count.
+
+    Raises:
+        CircuitValidationError: If the result types cannot be computed
+    """
+    errors = find_result_type_errors(specs, num_qubits, shots)
+    if errors:
+        raise CircuitValidationError('Invalid result types: ' + '; '.join(errors))
+
+
+def result_types_hash(specs: Sequence[ResultTypeSpec]) -> str:
+    """Compute a stable hash of requested result types, for submission deduplication."""
+    canonical = json.dumps(
+        [spec.model_dump() for spec in specs], sort_keys=True, separators=(',', ':')
+    )
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def pauli_observable(pauli: str) -> Observable:
+    """Build the Braket observable of a Pauli string such as 'XZ'."""
+    return reduce(lambda a, b: a @ b, [PAULI_OBSERVABLES[p]() for p in pauli.upper()])
+
+
+def build_result_type_circuit(
+    circuit_def: QuantumCircuit, specs: Sequence[ResultTypeSpec], verbatim: bool = False
+) -> BraketCircuit:
+    """Build a Braket circuit computing result types instead of measuring.
+
+    Braket does not allow result types next to measurement instructions, so the circuit's
+    measurements are dropped.
+
+    Args:
+        circuit_def: Circuit definition
+        specs: Validated result types
+        verbatim: Whether to wrap the gates in a verbatim box
+
+    Returns:
+        BraketCircuit: The Braket circuit with its result types
+    """
+    circuit = build_braket_circuit(
+        QuantumCircuit(
+            num_qubits=circuit_def.num_qubits,
+            gates=[g for g in circuit_def.gates if g.name not in ('measure', 'measure_all')],
+        ),
+        verbatim=verbatim,
+    )
+    num_qubits = circuit_def.num_qubits
+    for spec in specs:
+        qubits = list(spec.qubits) if spec.qubits else list(range(num_qubits))
+        if spec.type == PROBABILITY:
+            circuit.probability(target=qubits)
+        elif spec.type == EXPECTATION:
+            circuit.expectation(pauli_observable(spec.observable), target=qubits)
+        elif spec.type == AMPLITUDE:
+            circuit.amplitude(state=list(spec.states))
+    return circuit
+
+
+def serialize_result_types(result: Any) -> List[Dict[str, Any]]:
+    """Convert the result type values of a Braket task result to JSON-compatible values.
+
+    Probabilities are returned by bitstring of the target qubits (zero entries omitted) and
+    amplitudes as [real, imaginary] pairs, in the order the result types were requested.
+
+    Args:
+        result: Braket gate model task result
+
+    Returns:
+        List[Dict[str, Any]]: Type and value of each result type
+    """
+    values = []
+    for result_type in getattr(result, 'result_types', None) or []:
+        kind = type(result_type.type).__name__.lower()
+        value = result_type.value
+        if kind == PROBABILITY:
+            probabilities = np.asarray(value, dtype=float)
+            width = max(int(probabilities.size).bit_length() - 1, 0)
+            value = {
+                format(int(index), f'0{width}b'): float(probabilities[index])
+                for index in np.flatnonzero(probabilities)
+            }
+        elif kind == AMPLITUDE:
+            value = {
+                state: [float(np.real(amplitude)), float(np.imag(amplitude))]
+                for state, amplitude in value.items()
+            }
+        elif isinstance(value, np.ndarray):
+            value = value.tolist()
+        elif isinstance(value, (np.floating, float)):
+            value = float(value)
+        values.append({'type': kind, 'value': value})
+    return values
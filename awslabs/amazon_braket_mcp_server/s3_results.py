@@ -0,0 +1,237 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Direct download of gate model task results from S3.
+
+`AwsQuantumTask.result()` downloads the result object in one GET and parses it into Python
+lists and SDK objects. For large shot counts, the download and parse dominate a lookup. The
+loader instead reads the output location from the task metadata. It downloads the object in
+concurrent ranged GETs on a pooled S3 client and parses the measurement matrix straight from
+the downloaded bytes into a NumPy array. Only the small remainder of the document goes
+through `json.loads`.
+
+Results the loader does not handle (other schemas, result types or no measurements) are left
+to the SDK.
+"""
+
+import json
+import numpy as np
+import re
+from awslabs.amazon_braket_mcp_server.measurements import measurement_counts
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+
+# Name of the result object in a task's output directory
+RESULTS_FILENAME = 'results.json'
+
+# Schema of the results handled by the loader
+GATE_MODEL_SCHEMA = 'braket.task_result.gate_model_task_result'
+
+# Size of each ranged GET, and the maximum number of GETs of one object at once
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+DEFAULT_DOWNLOAD_CONCURRENCY = 8
+
+# The measurement matrix: nested lists of digits only
+_MEASUREMENTS = re.compile(rb'"measurements"\s*:\s*(\[[\[\]0-9,\s]*\])')
+
+
+class DownloadedResult:
+    """Gate model task result downloaded from S3.
+
+    Has the attributes of the SDK result that task results are built from.
+
+    Attributes:
+        measurements: Measured bits (uint8), one row per shot
+        measurement_counts: Number of shots of each measured bitstring
+        measured_qubits: Qubits the columns of the measurements belong to
+        task_metadata: Task metadata stored with the result
+        result_types: Always None; results with result types are left to the SDK
+    """
+
+    def __init__(
+        self,
+        measurements: np.ndarray,
+        measured_qubits: List[int],
+        task_metadata: Dict[str, Any],
+    ):
+        """Initialize the result.
+
+        Args:
+            measurements: Measured bits (uint8), one row per shot
+            measured_qubits: Qubits the columns of the measurements belong to
+            task_metadata: Task metadata stored with the result
+        """
+        self.measurements = measurements
+        self.measurement_counts = measurement_counts(measurements)
+        self.measured_qubits = measured_qubits
+        self.task_metadata = task_metadata
+        self.result_types = None
+
+
+def result_location(metadata: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+    """Get the S3 bucket and key of a task's result object.
+
+    Args:
+        metadata: GetQuantumTask response of the task
+
+    Returns:
+        Optional[Tuple[str, str]]: Bucket and key, or None if the metadata has no output
+            location
+    """
+    bucket = metadata.get('outputS3Bucket')
+    directory = metadata.get('outputS3Directory')
+    if not (isinstance(bucket, str) and isinstance(directory, str) and bucket and directory):
+        return None
+    return bucket, f'{directory.rstrip("/")}/{RESULTS_FILENAME}'
+
+
+def _object_size(response: Dict[str, Any], received: int) -> int:
+    """Get the object size from the Content-Range of a ranged GET (bytes 0-99/1234)."""
+    content_range = response.get('ContentRange')
+    if isinstance(content_range, str) and '/' in content_range:
+        return int(content_range.rsplit('/', 1)[1])
+    return received
+
+
+def download_object(
+    s3_client: Any,
+    bucket: str,
+    key: str,
+    part_size: int = DEFAULT_PART_SIZE,
+    max_concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY,
+) -> bytearray:
+    """Download an S3 object in concurrent ranged GETs.
+
+    The first GET returns the first part and the object size. The remaining parts are then
+    fetched concurrently into one buffer, pinned to the ETag of the first part.
+
+    Args:
+        s3_client: Boto3 S3 client
+        bucket: Bucket of the object
+        key: Key of the object
+        part_size: Size of each ranged GET (in bytes)
+        max_concurrency: Maximum number of GETs at once
+
+    Returns:
+        bytearray: Content of the object
+
+    Raises:
+        ValueError: If a part is shorter than requested
+    """
+    first = s3_client.get_object(Bucket=bucket, Key=key, Range=f'bytes=0-{part_size - 1}')
+    head = first['Body'].read()
+    size = _object_size(first, len(head))
+    buffer = bytearray(size)
+    buffer[: len(head)] = head
+    etag = first.get('ETag')
+
+    def fetch(start: int) -> None:
+        end = min(start + part_size, size) - 1
+        response = s3_client.get_object(
+            Bucket=bucket,
+            Key=key,
+            Range=f'bytes={start}-{end}',
+            **({'IfMatch': etag} if etag else {}),
+        )
+        body = response['Body'].read()
+        if len(body) != end - start + 1:
+            raise ValueError(
+                f'Expected {end - start + 1} bytes at offset {start} of s3://{bucket}/{key}, '
+                f'got {len(body)}'
+            )
+        buffer[start : end + 1] = body
+
+    starts = range(len(head), size, part_size)
+    if starts:
+        with ThreadPoolExecutor(max_workers=min(len(starts), max_concurrency)) as executor:
+            list(executor.map(fetch, starts))
+    return buffer
+
+
+def parse_measurement_matrix(text: Union[bytes, bytearray, memoryview]) -> np.ndarray:
+    """Parse a JSON matrix of 0/1 values to a bit matrix without building Python lists.
+
+    Args:
+        text: JSON text of the matrix, e.g. b'[[0, 1], [1, 1]]'
+
+    Returns:
+        np.ndarray: Measured bits (uint8), one row per shot
+
+    Raises:
+        ValueError: If the values are not single bits or the rows differ in length
+    """
+    chars = np.frombuffer(text, dtype=np.uint8)
+    digits = chars[(chars >= ord('0')) & (chars <= ord('9'))]
+    shots = int(np.count_nonzero(chars == ord('['))) - 1
+    if shots <= 0 or digits.size == 0:
+        return np.zeros((max(shots, 0), 0), dtype=np.uint8)
+    if (digits > ord('1')).any() or np.count_nonzero(chars == ord(',')) != digits.size - 1:
+        raise ValueError('Measurements must be single bits')
+    if digits.size % shots:
+        raise ValueError('Measurement rows differ in length')
+    return (digits - ord('0')).reshape(shots, -1)
+
+
+def parse_result(data: Union[bytes, bytearray]) -> Optional[DownloadedResult]:
+    """Parse a gate model result object with measurements.
+
+    Args:
+        data: Content of the result object
+
+    Returns:
+        Optional[DownloadedResult]: The result, or None if the SDK should parse it (other
+            schemas, result types or no measurements)
+
+    Raises:
+        ValueError: If the measurements are malformed
+    """
+    match = _MEASUREMENTS.search(data)
+    if match is None:
+        return None
+    start, end = match.span(1)
+    view = memoryview(data)
+    document = json.loads(b''.join((view[:start], b'null', view[end:])))
+    header = document.get('braketSchemaHeader') or {}
+    if header.get('name') != GATE_MODEL_SCHEMA or document.get('resultTypes'):
+        return None
+    measurements = parse_measurement_matrix(view[start:end])
+    if measurements.size == 0:
+        return None
+    return DownloadedResult(
+        measurements,
+        document.get('measuredQubits') or list(range(measurements.shape[1])),
+        document.get('taskMetadata') or {},
+    )
+
+
+def load_result(
+    s3_client: Any,
+    metadata: Dict[str, Any],
+    part_size: int = DEFAULT_PART_SIZE,
+    max_concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY,
+) -> Optional[DownloadedResult]:
+    """Download and parse the result of a completed task from its output location.
+
+    Args:
+        s3_client: Boto3 S3 client
+        metadata: GetQuantumTask response of the task
+        part_size: Size of each ranged GET (in bytes)
+        max_concurrency: Maximum number of GETs at once
+
+    Returns:
+        Optional[DownloadedResult]: The result, or None if the SDK should fetch it
+    """
+    location = result_location(metadata)
+    if location is None:
+        return None
+    bucket, key = location
+    return parse_result(download_object(s3_client, bucket, key, part_size, max_concurrency))
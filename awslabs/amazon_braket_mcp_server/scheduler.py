@@ -0,0 +1,186 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Execution window aware scheduling of queued submissions.
+
+QPUs only run tasks during the execution windows published in their capabilities. Tasks
+created outside a window wait in the device queue, so queued submissions for a QPU are held
+in the journal until its window opens and then released in batches, with at most a fixed
+number of submissions to one device in flight.
+"""
+
+from awslabs.amazon_braket_mcp_server.models import DeviceInfo, DeviceType, ExecutionWindow
+from datetime import datetime, time, timedelta, timezone
+from loguru import logger
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+# Maximum number of submissions to one device in flight
+DEFAULT_DEVICE_CONCURRENCY = 2
+
+# Weekdays (Monday is 0) of each execution day
+EXECUTION_DAYS = {
+    'everyday': (0, 1, 2, 3, 4, 5, 6),
+    'weekdays': (0, 1, 2, 3, 4),
+    'weekend': (5, 6),
+    'monday': (0,),
+    'tuesday': (1,),
+    'wednesday': (2,),
+    'thursday': (3,),
+    'friday': (4,),
+    'saturday': (5,),
+    'sunday': (6,),
+}
+
+
+def _window_ranges(
+    windows: Sequence[ExecutionWindow],
+) -> List[Tuple[Tuple[int, ...], time, time]]:
+    """Parse execution windows to their weekdays, start and end times; invalid ones are skipped."""
+    ranges = []
+    for window in windows:
+        days = EXECUTION_DAYS.get(window.execution_day.lower())
+        try:
+            start = time.fromisoformat(window.window_start_hour)
+            end = time.fromisoformat(window.window_end_hour)
+        except ValueError:
+            days = None
+        if days is None:
+            logger.debug(f'Ignoring unrecognized execution window {window}')
+            continue
+        ranges.append((days, start, end))
+    return ranges
+
+
+def window_open(windows: Sequence[ExecutionWindow], at: datetime) -> bool:
+    """Check whether a device is inside one of its execution windows.
+
+    Devices without (recognized) windows are always available.
+
+    Args:
+        windows: Execution windows of the device
+        at: Time to check (timezone-aware)
+
+    Returns:
+        bool: Whether a window is open at the given time
+    """
+    ranges = _window_ranges(windows)
+    if not ranges:
+        return True
+    at = at.astimezone(timezone.utc)
+    now = at.time()
+    weekday = at.weekday()
+    for days, start, end in ranges:
+        if start < end:
+            if weekday in days and start <= now <= end:
+                return True
+        elif (weekday in days and now >= start) or ((weekday - 1) % 7 in days and now <= end):
+            return True
+    return False
+
+
+def next_window_open(windows: Sequence[ExecutionWindow], at: datetime) -> Optional[datetime]:
+    """Get the time the next execution window opens.
+
+    Args:
+        windows: Execution windows of the device
+        at: Time to search from (timezone-aware)
+
+    Returns:
+        Optional[datetime]: The given time if a window is open, otherwise the next window
+            start in UTC (None if the windows never open)
+    """
+    if window_open(windows, at):
+        return at
+    at = at.astimezone(timezone.utc)
+    starts = [
+        datetime.combine(at.date() + timedelta(days=offset), start, tzinfo=timezone.utc)
+        for offset in range(8)
+        for days, start, _ in _window_ranges(windows)
+        if (at.weekday() + offset) % 7 in days
+    ]
+    return min((start for start in starts if start > at), default=None)
+
+
+class SubmissionScheduler:
+    """Decides how many queued submissions to release to each device.
+
+    Attributes:
+        max_per_device: Maximum number of submissions to one device in flight
+    """
+
+    def __init__(
+        self,
+        get_device_info: Callable[[str], DeviceInfo],
+        max_per_device: int = DEFAULT_DEVICE_CONCURRENCY,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            get_device_info: Function returning (cached) information about a device
+            max_per_device: Maximum number of submissions to one device in flight
+            clock: Function returning the current time
+        """
+        self.max_per_device = max_per_device
+        self._get_device_info = get_device_info
+        self._clock = clock
+
+    def _windows(self, device_arn: str) -> List[ExecutionWindow]:
+        """Get the execution windows of a QPU; simulators and unknown devices have none."""
+        try:
+            device = self._get_device_info(device_arn)
+        except Exception as e:
+            logger.debug(f'Could not get execution windows of {device_arn}: {str(e)}')
+            return []
+        if device.device_type != DeviceType.QPU:
+            return []
+        return list(device.execution_windows)
+
+    def capacity(self, device_arn: str, in_flight: int) -> int:
+        """Get the number of queued submissions that may be released to a device now.
+
+        Args:
+            device_arn: ARN of the device
+            in_flight: Number of submissions to the device in flight
+
+        Returns:
+            int: Number of submissions to release (0 while the device's window is closed)
+        """
+        if not window_open(self._windows(device_arn), self._clock()):
+            return 0
+        return max(self.max_per_device - in_flight, 0)
+
+    def device_schedule(self, device_arn: str, queued: int, in_flight: int) -> Dict[str, Any]:
+        """Describe the schedule of a device's queued submissions.
+
+        Args:
+            device_arn: ARN of the device
+            queued: Number of submissions to the device waiting in the journal
+            in_flight: Number of submissions to the device in flight
+
+        Returns:
+            Dict[str, Any]: Window state, next window start and submission counts
+        """
+        windows = self._windows(device_arn)
+        now = self._clock()
+        is_open = window_open(windows, now)
+        opens_at = None if is_open else next_window_open(windows, now)
+        return {
+            'device_arn': device_arn,
+            'window_open': is_open,
+            'next_window_open': opens_at.isoformat() if opens_at else None,
+            'execution_windows': [window.model_dump() for window in windows],
+            'queued': queued,
+            'held': 0 if is_open else queued,
+            'in_flight': in_flight,
+            'max_in_flight': self.max_per_device,
+        }
@@ -11,6 +11,8 @@
 
 """awslabs braket MCP Server implementation."""
 
+import asyncio
+import json
 import os
 import sys
 from datetime import datetime, timedelta
@@ -23,10 +25,21 @@ from awslabs.amazon_braket_mcp_server.models import (
     TaskStatus,
     DeviceInfo,
     DeviceType,
+    ResultTypeSpec,
+    SubmissionState,
 )
-from awslabs.amazon_braket_mcp_server.braket_service import BraketService
+from awslabs.amazon_braket_mcp_server.braket_service import BraketService, make_client_config
+from awslabs.amazon_braket_mcp_server.composite import TERMINAL_STATUSES, is_composite_task_id
+from awslabs.amazon_braket_mcp_server.deduplication import circuit_hash as hash_circuit
+from awslabs.amazon_braket_mcp_server.exceptions import ThrottlingError
+from awslabs.amazon_braket_mcp_server.region_pool import (
+    BraketServicePool,
+    list_devices_across_regions,
+)
+from awslabs.amazon_braket_mcp_server.sweep import expand_grid
+from awslabs.amazon_braket_mcp_server.waiter import DEFAULT_WAIT_TIMEOUT, TaskPoller
 from loguru import logger
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
 
 
 # Remove all default handlers then add our own
@@ -40,28 +53,125 @@ mcp = FastMCP(
     dependencies=['pydantic', 'loguru', 'boto3', 'amazon-braket-sdk', 'qiskit', 'qiskit-braket-provider'],
 )
 
-# Global variable to hold the braket service instance
-_braket_service = None
+# Global variable to hold the pool of regional braket service instances
+_service_pool = None
+
+# Global variable to hold the poll loop shared by waiting tool calls
+_task_poller = None
 
 
-def get_braket_service():
-    """Lazily initialize the Braket service connection.
+def get_service_pool():
+    """Lazily initialize the pool of regional Braket service connections.
 
-    This function ensures the service is only initialized when needed,
+    This function ensures the services are only initialized when needed,
     not at import time, which helps with testing.
 
     Returns:
-        BraketService: The initialized Braket service instance
+        BraketServicePool: The pool of Braket services keyed by region
     """
-    global _braket_service
-    if _braket_service is None:
+    global _service_pool
+    if _service_pool is None:
         region = os.environ.get('AWS_REGION', None)
         workspace_dir = os.environ.get('BRAKET_WORKSPACE_DIR', os.getcwd())
+        dedup_window = float(os.environ.get('BRAKET_DEDUP_WINDOW_SECONDS', '300'))
+        submission_concurrency = int(os.environ.get('BRAKET_SUBMISSION_CONCURRENCY', '4'))
+        device_concurrency = int(os.environ.get('BRAKET_DEVICE_CONCURRENCY', '2'))
+        price_table_path = os.environ.get('BRAKET_PRICE_TABLE') or None
+        preview_max_qubits = int(os.environ.get('BRAKET_PREVIEW_MAX_QUBITS', '20'))
+        result_cache_size = int(os.environ.get('BRAKET_RESULT_CACHE_SIZE', '256'))
+        direct_submission = os.environ.get('BRAKET_DIRECT_SUBMISSION', 'true').lower() in (
+            '1',
+            'true',
+            'yes',
+        )
+        prefetch_results = os.environ.get('BRAKET_PREFETCH_RESULTS', 'false').lower() in (
+            '1',
+            'true',
+            'yes',
+        )
+        direct_results = os.environ.get('BRAKET_DIRECT_RESULTS', 'true').lower() in (
+            '1',
+            'true',
+            'yes',
+        )
+        memmap_threshold = int(os.environ.get('BRAKET_MEMMAP_THRESHOLD_BYTES', str(1 << 20)))
+        client_config = make_client_config(
+            max_pool_connections=int(os.environ.get('BRAKET_MAX_POOL_CONNECTIONS', '50')),
+            retry_mode=os.environ.get('BRAKET_RETRY_MODE', 'standard'),
+            max_attempts=int(os.environ.get('BRAKET_MAX_ATTEMPTS', '2')),
+            connect_timeout=float(os.environ.get('BRAKET_CONNECT_TIMEOUT', '10')),
+            read_timeout=float(os.environ.get('BRAKET_READ_TIMEOUT', '60')),
+            tcp_keepalive=os.environ.get('BRAKET_TCP_KEEPALIVE', 'true').lower() in ('1', 'true', 'yes'),
+        )
         logger.info(f'AWS_REGION: {region}')
         logger.info(f'BRAKET_WORKSPACE_DIR: {workspace_dir}')
-        _braket_service = BraketService(region_name=region, workspace_dir=workspace_dir)
 
-    return _braket_service
+        def create_service(service_region, **shared):
+            return BraketService(
+                region_name=service_region,
+                workspace_dir=workspace_dir,
+                dedup_window_seconds=dedup_window,
+                submission_concurrency=submission_concurrency,
+                device_concurrency=device_concurrency,
+                price_table_path=price_table_path,
+                client_config=client_config,
+                preview_max_qubits=preview_max_qubits,
+                direct_submission=direct_submission,
+                result_cache_size=result_cache_size,
+                prefetch_results=prefetch_results,
+                direct_results=direct_results,
+                memmap_threshold_bytes=memmap_threshold,
+                **shared,
+            )
+
+        _service_pool = BraketServicePool(
+            create_service,
+            default_region=region,
+            workspace_dir=workspace_dir,
+            submission_concurrency=submission_concurrency,
+            device_concurrency=device_concurrency,
+        )
+
+    return _service_pool
+
+
+def get_braket_service(arn: Optional[str] = None, region: Optional[str] = None):
+    """Get the Braket service for a device or task ARN, or for a region.
+
+    Args:
+        arn: Device ARN, quantum task ARN or composite task ID to route by (optional)
+        region: AWS region (optional, uses AWS_REGION if neither is provided)
+
+    Returns:
+        BraketService: The Braket service for the region
+    """
+    pool = get_service_pool()
+    if region:
+        return pool.get(region)
+    return pool.for_arn(arn)
+
+
+def _list_all_devices() -> List[DeviceInfo]:
+    """List devices across all supported regions in parallel."""
+    return list_devices_across_regions(
+        lambda region: get_braket_service(region=region), BraketService.SUPPORTED_REGIONS
+    )
+
+
+def get_task_poller() -> TaskPoller:
+    """Lazily initialize the poller shared by all `wait_for_task` calls.
+
+    Returns:
+        TaskPoller: The shared task poller
+    """
+    global _task_poller
+    if _task_poller is None:
+        _task_poller = TaskPoller(
+            lambda task_id: get_braket_service(task_id).get_task_status(task_id),
+            base_interval=float(os.environ.get('BRAKET_POLL_INTERVAL', '1')),
+            max_interval=float(os.environ.get('BRAKET_MAX_POLL_INTERVAL', '30')),
+        )
+    return _task_poller
 
 
 # Add default device ARN support
@@ -73,10 +183,44 @@ def get_default_device_arn():
     return arn
 
 
+def _parse_circuit(circuit: Dict[str, Any]) -> QuantumCircuit:
+    """Convert a circuit dictionary to a QuantumCircuit object."""
+    return QuantumCircuit(
+        num_qubits=circuit.get('num_qubits'),
+        gates=[
+            Gate(
+                name=gate_dict.get('name'),
+                qubits=gate_dict.get('qubits', []),
+                params=gate_dict.get('params'),
+            )
+            for gate_dict in circuit.get('gates', [])
+        ],
+        metadata=circuit.get('metadata'),
+    )
+
+
 @mcp.resource(uri='amazon-braket://devices', name='QuantumDevices', mime_type='application/json')
 def get_devices_resource() -> List[DeviceInfo]:
     """Get the list of available quantum devices."""
-    return get_braket_service().list_devices()
+    return _list_all_devices()
+
+
+@mcp.resource(
+    uri='amazon-braket://metrics/throttling', name='ThrottlingMetrics', mime_type='application/json'
+)
+def get_throttling_metrics_resource() -> Dict[str, Dict[str, Any]]:
+    """Get client-side rate limiting metrics for Amazon Braket API calls."""
+    return get_braket_service().get_throttling_metrics()
+
+
+@mcp.resource(
+    uri='amazon-braket://schedule/submissions',
+    name='SubmissionSchedule',
+    mime_type='application/json',
+)
+def get_submission_schedule_resource() -> List[Dict[str, Any]]:
+    """Get the execution window schedule of queued submissions per device."""
+    return get_braket_service().get_submission_schedule()
 
 
 @mcp.tool(name='create_quantum_circuit')
@@ -125,15 +269,36 @@ def run_quantum_task(
     shots: int = 1000,
     s3_bucket: Optional[str] = None,
     s3_prefix: Optional[str] = None,
+    client_token: Optional[str] = None,
+    result_types: Optional[List[Dict[str, Any]]] = None,
+    verbatim: bool = False,
+    preview: bool = False,
 ) -> Dict[str, Any]:
     """Run a quantum circuit on an Amazon Braket device.
     
+    Resubmitting the same circuit, device and shots within the deduplication window
+    (BRAKET_DEDUP_WINDOW_SECONDS) returns the existing task instead of creating a new one.
+    Pass a different client_token to deliberately run an identical circuit again.
+    If shots exceed the device's maximum, the shots are split across several tasks and a
+    composite task ID is returned; get_task_result merges the sub-task results.
+    On simulators, request result types with shots=0 to get exact probabilities, expectation
+    values or amplitudes instead of sampled measurements.
+    With verbatim=True, a circuit already compiled to the device's native gates and physical
+    qubits runs without device compilation or qubit rewiring.
+    With preview=True, circuits of up to BRAKET_PREVIEW_MAX_QUBITS qubits are also simulated
+    locally; get_task_result returns that noise-free result under 'preview' until the device
+    result arrives.
+
     Args:
         circuit: Quantum circuit definition
         device_arn: ARN of the device to run the task on (optional, uses default if not provided)
         shots: Number of shots to run
         s3_bucket: S3 bucket for storing results (optional)
         s3_prefix: S3 prefix for storing results (optional)
+        client_token: Idempotency token for the submission (optional)
+        result_types: Result types to compute (optional), e.g. [{"type": "probability", "qubits": [0, 1]}, {"type": "expectation", "observable": "ZZ", "qubits": [0, 1]}, {"type": "amplitude", "states": ["00", "11"]}]
+        verbatim: Whether to skip device compilation (the circuit must use native gates on connected qubits)
+        preview: Whether to also simulate the circuit locally for an immediate approximate result
     
     Returns:
         Dictionary containing the task ID and status
@@ -161,46 +326,679 @@ def run_quantum_task(
         )
         
         # Run the quantum task
-        task_id = get_braket_service().run_quantum_task(
+        service = get_braket_service(device_arn)
+        task_id = service.run_quantum_task(
             circuit=circuit_def,
             device_arn=device_arn,
             shots=shots,
             s3_bucket=s3_bucket,
             s3_prefix=s3_prefix,
+            client_token=client_token,
+            result_types=(
+                [ResultTypeSpec(**spec) for spec in result_types] if result_types else None
+            ),
+            verbatim=verbatim,
+            preview=preview,
         )
         
-        return {
+        response = {
             'task_id': task_id,
             'status': 'CREATED',
             'device_arn': device_arn,
             'shots': shots,
         }
+        if preview:
+            response['preview'] = service.previews.has(task_id)
+        if is_composite_task_id(task_id):
+            composite = service.get_composite_task(task_id)
+            response['sub_task_ids'] = composite.sub_task_ids
+            response['shots_per_task'] = composite.shots_per_task
+
+        return response
+    except ThrottlingError as e:
+        logger.warning(f"Quantum task submission throttled: {str(e)}")
+        return {'error': str(e), 'throttled': True, 'retry_after': e.retry_after}
     except Exception as e:
         logger.exception(f"Error running quantum task: {str(e)}")
         return {'error': str(e)}
 
 
+@mcp.tool(name='validate_quantum_task')
+def validate_quantum_task(
+    circuit: Dict[str, Any],
+    device_arn: Optional[str] = None,
+    shots: int = 1000,
+    verbatim: bool = False,
+) -> Dict[str, Any]:
+    """Check whether a device can run a circuit, without submitting it.
+
+    The circuit is checked against cached device information: qubit count, supported
+    gates, shots, device status and paradigm. Verbatim circuits are checked against the
+    device's native gates and qubit connectivity instead of its supported gates.
+
+    Args:
+        circuit: Quantum circuit definition
+        device_arn: ARN of the device (optional, uses default if not provided)
+        shots: Number of shots to run
+        verbatim: Whether the circuit would run verbatim
+
+    Returns:
+        Dictionary with 'valid' and the list of reasons the request would be rejected
+    """
+    try:
+        if device_arn is None:
+            device_arn = get_default_device_arn()
+
+        errors = get_braket_service(device_arn).validate_quantum_task(
+            _parse_circuit(circuit), device_arn, shots, verbatim=verbatim
+        )
+
+        return {
+            'valid': not errors,
+            'errors': errors,
+            'device_arn': device_arn,
+            'shots': shots,
+        }
+    except Exception as e:
+        logger.exception(f"Error validating quantum task: {str(e)}")
+        return {'error': str(e)}
+
+
+@mcp.tool(name='estimate_quantum_task')
+def estimate_quantum_task(
+    circuits: List[Dict[str, Any]],
+    device_arn: Optional[str] = None,
+    shots: int = 1000,
+) -> Dict[str, Any]:
+    """Estimate the cost, runtime and queue wait of running circuits, without submitting them.
+
+    QPU estimates use the per-task and per-shot prices of the device. Simulator estimates
+    scale with 2^n x depth (4^n x depth for DM1) and the per-minute price. Prices come from a
+    built-in table, which BRAKET_PRICE_TABLE can override.
+
+    Args:
+        circuits: Quantum circuit definitions (a batch is estimated in one call)
+        device_arn: ARN of the device (optional, uses default if not provided)
+        shots: Number of shots per circuit
+
+    Returns:
+        Dictionary containing one estimate per circuit and the batch totals
+    """
+    try:
+        if device_arn is None:
+            device_arn = get_default_device_arn()
+
+        estimates = get_braket_service(device_arn).estimate_quantum_tasks(
+            [_parse_circuit(circuit) for circuit in circuits], device_arn, shots
+        )
+
+        costs = [estimate.cost for estimate in estimates]
+        return {
+            'estimates': [estimate.model_dump() for estimate in estimates],
+            'total_cost': round(sum(costs), 6) if None not in costs else None,
+            'total_runtime_seconds': sum(estimate.runtime_seconds or 0.0 for estimate in estimates),
+            'currency': 'USD',
+            'device_arn': device_arn,
+        }
+    except Exception as e:
+        logger.exception(f"Error estimating quantum tasks: {str(e)}")
+        return {'error': str(e)}
+
+
+@mcp.tool(name='queue_quantum_tasks')
+def queue_quantum_tasks(
+    circuits: List[Dict[str, Any]],
+    device_arn: Optional[str] = None,
+    shots: int = 1000,
+    s3_bucket: Optional[str] = None,
+    s3_prefix: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Queue circuits for submission through the durable submission journal.
+
+    The submissions are recorded in a journal in BRAKET_WORKSPACE_DIR and submitted by a
+    background worker (at most BRAKET_SUBMISSION_CONCURRENCY at a time). Queued submissions
+    survive server restarts; use get_submission_status to follow them and get their task IDs.
+
+    Args:
+        circuits: Quantum circuit definitions
+        device_arn: ARN of the device to run the tasks on (optional, uses default if not provided)
+        shots: Number of shots per circuit
+        s3_bucket: S3 bucket for storing results (optional)
+        s3_prefix: S3 prefix for storing results (optional)
+
+    Returns:
+        Dictionary containing the journal entry IDs, in the order of the circuits
+    """
+    try:
+        if device_arn is None:
+            device_arn = get_default_device_arn()
+
+        entry_ids = get_braket_service(device_arn).enqueue_quantum_tasks(
+            [_parse_circuit(circuit) for circuit in circuits],
+            device_arn,
+            shots=shots,
+            s3_bucket=s3_bucket,
+            s3_prefix=s3_prefix,
+        )
+
+        return {
+            'entry_ids': entry_ids,
+            'status': 'QUEUED',
+            'device_arn': device_arn,
+            'shots': shots,
+        }
+    except Exception as e:
+        logger.exception(f"Error queueing quantum tasks: {str(e)}")
+        return {'error': str(e)}
+
+
+@mcp.tool(name='get_submission_status')
+def get_submission_status(
+    entry_ids: Optional[List[str]] = None,
+    state: Optional[str] = None,
+    limit: int = 100,
+) -> Dict[str, Any]:
+    """Get the status of queued submissions.
+
+    Args:
+        entry_ids: Journal entry IDs returned by queue_quantum_tasks (optional, lists the journal if not provided)
+        state: Only include submissions in this state: QUEUED, SUBMITTING, SUBMITTED or FAILED (optional)
+        limit: Maximum number of submissions to list
+
+    Returns:
+        Dictionary containing the submissions and the number in each state
+    """
+    try:
+        entries = get_braket_service().get_submissions(
+            entry_ids=entry_ids,
+            state=SubmissionState(state.upper()) if state else None,
+            limit=limit,
+        )
+
+        summary = {submission_state.value: 0 for submission_state in SubmissionState}
+        for entry in entries:
+            summary[entry.state.value] += 1
+
+        return {
+            'submissions': [
+                entry.model_dump(mode='json', exclude={'circuit'}) for entry in entries
+            ],
+            'summary': summary,
+        }
+    except Exception as e:
+        logger.exception(f"Error getting submission status: {str(e)}")
+        return {'error': str(e)}
+
+
+@mcp.tool(name='run_parameter_sweep')
+def run_parameter_sweep(
+    circuit: Dict[str, Any],
+    parameter_grid: Optional[Dict[str, List[float]]] = None,
+    points: Optional[List[Dict[str, float]]] = None,
+    device_arn: Optional[str] = None,
+    shots: int = 1000,
+    observable: Optional[str] = None,
+    s3_bucket: Optional[str] = None,
+    s3_prefix: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Run a parameterized circuit over a grid of parameter values.
+
+    Gate parameters given as names (e.g. {"name": "rx", "qubits": [0], "params": ["theta"]})
+    are free parameters. The circuit is compiled once and one task per point is submitted in
+    the background with bounded concurrency. Use get_sweep_results to follow the sweep.
+
+    Args:
+        circuit: Quantum circuit definition with named parameters
+        parameter_grid: Values of each parameter; every combination is run (e.g. {"beta": [0.1, 0.2], "gamma": [0.5, 1.0]})
+        points: Explicit parameter points, instead of a grid
+        device_arn: ARN of the device to run the tasks on (optional, uses default if not provided)
+        shots: Number of shots per point
+        observable: Pauli Z/I string over the measured bits whose expectation value is reported per point (e.g. "ZZ")
+        s3_bucket: S3 bucket for storing results (optional)
+        s3_prefix: S3 prefix for storing results (optional)
+
+    Returns:
+        Dictionary containing the sweep ID and number of points
+    """
+    try:
+        if device_arn is None:
+            device_arn = get_default_device_arn()
+        if (parameter_grid is None) == (points is None):
+            return {'error': 'Provide exactly one of parameter_grid or points'}
+
+        sweep_points = expand_grid(parameter_grid) if parameter_grid is not None else points
+        sweep_id = get_braket_service(device_arn).run_parameter_sweep(
+            _parse_circuit(circuit),
+            device_arn,
+            sweep_points,
+            shots=shots,
+            observable=observable,
+            s3_bucket=s3_bucket,
+            s3_prefix=s3_prefix,
+        )
+
+        return {
+            'sweep_id': sweep_id,
+            'points': len(sweep_points),
+            'device_arn': device_arn,
+            'shots': shots,
+            'status': 'SUBMITTING',
+        }
+    except ThrottlingError as e:
+        logger.warning(f"Parameter sweep throttled: {str(e)}")
+        return {'error': str(e), 'throttled': True, 'retry_after': e.retry_after}
+    except Exception as e:
+        logger.exception(f"Error running parameter sweep: {str(e)}")
+        return {'error': str(e)}
+
+
+@mcp.tool(name='get_sweep_results')
+def get_sweep_results(sweep_id: str) -> Dict[str, Any]:
+    """Get the aggregated results of a parameter sweep.
+
+    Args:
+        sweep_id: ID returned by run_parameter_sweep
+
+    Returns:
+        Dictionary with the sweep status, progress and one row per point with its parameters, task ID, status, counts and expectation value
+    """
+    try:
+        return get_braket_service(sweep_id).get_sweep_results(sweep_id)
+    except ThrottlingError as e:
+        logger.warning(f"Sweep result lookup throttled: {str(e)}")
+        return {'error': str(e), 'throttled': True, 'retry_after': e.retry_after}
+    except Exception as e:
+        logger.exception(f"Error getting sweep results: {str(e)}")
+        return {'error': str(e)}
+
+
+@mcp.tool(name='run_multiplexed_tasks')
+def run_multiplexed_tasks(
+    circuits: List[Dict[str, Any]],
+    device_arn: Optional[str] = None,
+    shots: int = 1000,
+    s3_bucket: Optional[str] = None,
+    s3_prefix: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Run several small circuits as one quantum task, each on its own qubits.
+
+    The circuits are placed on disjoint qubits of the device so they share one task fee and one
+    queue slot. Where the device reports its connectivity, each circuit is pinned to a connected
+    region of physical qubits (qubit rewiring is disabled); otherwise the device compiler maps
+    the qubits. Use get_multiplexed_results to get the counts of each circuit.
+
+    Args:
+        circuits: Quantum circuit definitions to pack
+        device_arn: ARN of the device to run the task on (optional, uses default if not provided)
+        shots: Number of shots, shared by every circuit
+        s3_bucket: S3 bucket for storing results (optional)
+        s3_prefix: S3 prefix for storing results (optional)
+
+    Returns:
+        Dictionary containing the task ID, the qubits of each circuit and whether they are
+        physical qubits
+    """
+    try:
+        if device_arn is None:
+            device_arn = get_default_device_arn()
+
+        multiplexed = get_braket_service(device_arn).run_multiplexed_tasks(
+            [_parse_circuit(circuit) for circuit in circuits],
+            device_arn,
+            shots=shots,
+            s3_bucket=s3_bucket,
+            s3_prefix=s3_prefix,
+        )
+
+        return {
+            'task_id': multiplexed.task_id,
+            'device_arn': device_arn,
+            'shots': shots,
+            'num_circuits': len(multiplexed.circuits),
+            'layouts': multiplexed.layouts,
+            'physical_qubits': multiplexed.physical,
+            'status': 'CREATED',
+        }
+    except ThrottlingError as e:
+        logger.warning(f"Multiplexed task submission throttled: {str(e)}")
+        return {'error': str(e), 'throttled': True, 'retry_after': e.retry_after}
+    except Exception as e:
+        logger.exception(f"Error running multiplexed task: {str(e)}")
+        return {'error': str(e)}
+
+
+@mcp.tool(name='get_multiplexed_results')
+def get_multiplexed_results(task_id: str) -> Dict[str, Any]:
+    """Get the counts of each circuit of a multiplexed task.
+
+    Args:
+        task_id: ID returned by run_multiplexed_tasks
+
+    Returns:
+        Dictionary with the task status and, per circuit, its qubits and counts
+    """
+    try:
+        return get_braket_service(task_id).get_multiplexed_results(task_id)
+    except ThrottlingError as e:
+        logger.warning(f"Multiplexed result lookup throttled: {str(e)}")
+        return {'error': str(e), 'throttled': True, 'retry_after': e.retry_after}
+    except Exception as e:
+        logger.exception(f"Error getting multiplexed results: {str(e)}")
+        return {'error': str(e)}
+
+
 @mcp.tool(name='get_task_result')
-def get_task_result(task_id: str) -> Dict[str, Any]:
+def get_task_result(
+    task_id: str,
+    include_measurements: bool = False,
+    counts_only: bool = False,
+    packed: bool = False,
+) -> Dict[str, Any]:
     """Get the result of a quantum task.
     
     Args:
         task_id: ID of the quantum task
+        include_measurements: Whether to include the per-shot measurements (one list of bits
+            per shot); by default only the measurement counts are returned
+        counts_only: Whether to return only the task status and measurement counts
+        packed: Whether to return the per-shot measurements bit-packed under
+            `packed_measurements` (base64 of `np.packbits` rows, with shape and bit order)
     
     Returns:
         Dictionary containing the task result
     """
     try:
         # Get the task result
-        result = get_braket_service().get_task_result(task_id)
+        result = get_braket_service(task_id).get_task_result(
+            task_id,
+            include_measurements=include_measurements,
+            counts_only=counts_only,
+            packed=packed,
+        )
         
         # Return the result as a dictionary
+        if counts_only:
+            return result.model_dump(exclude_none=True)
         return result.model_dump()
+    except ThrottlingError as e:
+        logger.warning(f"Task result lookup throttled: {str(e)}")
+        return {'error': str(e), 'throttled': True, 'retry_after': e.retry_after}
     except Exception as e:
         logger.exception(f"Error getting task result: {str(e)}")
         return {'error': str(e)}
 
 
+def _batch_entry(task_id: str, result: Any, counts_only: bool) -> Dict[str, Any]:
+    """Format one result (or error) of a batch result lookup."""
+    if isinstance(result, ThrottlingError):
+        return {
+            'task_id': task_id,
+            'error': str(result),
+            'throttled': True,
+            'retry_after': result.retry_after,
+        }
+    if isinstance(result, Exception):
+        return {'task_id': task_id, 'error': str(result)}
+    return result.model_dump(exclude_none=counts_only)
+
+
+@mcp.tool(name='get_task_results')
+async def get_task_results(
+    task_ids: List[str],
+    include_measurements: bool = False,
+    counts_only: bool = False,
+    packed: bool = False,
+    max_concurrency: int = 8,
+    ctx: Context = None,
+) -> Dict[str, Any]:
+    """Get the results of many quantum tasks at once.
+
+    Task metadata is looked up concurrently and completed results are downloaded in
+    parallel. Each task's result is sent as a progress notification as soon as it is ready.
+
+    Args:
+        task_ids: IDs of the quantum tasks
+        include_measurements: Whether to include the per-shot measurements
+        counts_only: Whether to return only the task status and measurement counts
+        packed: Whether to return the per-shot measurements bit-packed
+        max_concurrency: Maximum number of results downloaded at once per region (default: 8)
+        ctx: MCP request context, used to send each result as a progress notification
+
+    Returns:
+        Dictionary with the result (or error) of each task, in request order
+    """
+    try:
+        task_ids = list(dict.fromkeys(task_ids))
+        groups: Dict[int, Any] = {}
+        for task_id in task_ids:
+            service = get_braket_service(task_id)
+            groups.setdefault(id(service), (service, []))[1].append(task_id)
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+
+        def fetch(service, group_ids):
+            reported = set()
+            try:
+                for task_id, result in service.iter_task_results(
+                    group_ids, include_measurements, counts_only, packed, max_concurrency
+                ):
+                    reported.add(task_id)
+                    loop.call_soon_threadsafe(queue.put_nowait, (task_id, result))
+            except Exception as e:
+                for task_id in group_ids:
+                    if task_id not in reported:
+                        loop.call_soon_threadsafe(queue.put_nowait, (task_id, e))
+
+        fetchers = [
+            asyncio.create_task(asyncio.to_thread(fetch, service, group_ids))
+            for service, group_ids in groups.values()
+        ]
+        entries = {}
+        for done in range(1, len(task_ids) + 1):
+            task_id, result = await queue.get()
+            entries[task_id] = _batch_entry(task_id, result, counts_only)
+            if ctx is not None:
+                await ctx.report_progress(
+                    done, len(task_ids), message=json.dumps(entries[task_id], default=str)
+                )
+        await asyncio.gather(*fetchers)
+
+        return {'results': [entries[task_id] for task_id in task_ids]}
+    except Exception as e:
+        logger.exception(f"Error getting task results: {str(e)}")
+        return {'error': str(e)}
+
+
+@mcp.tool(name='wait_for_task')
+async def wait_for_task(
+    task_ids: List[str],
+    timeout: float = DEFAULT_WAIT_TIMEOUT,
+    return_when: str = 'all',
+    ctx: Context = None,
+) -> Dict[str, Any]:
+    """Wait on the server until quantum tasks reach a terminal state.
+
+    Use this instead of calling get_task_result repeatedly. The server polls the task
+    statuses with backoff, in one poll loop shared by all waiting calls, and sends progress
+    notifications as tasks finish.
+
+    Args:
+        task_ids: IDs of the quantum tasks
+        timeout: Longest time to wait in seconds (default: 300)
+        return_when: 'all' to wait for every task, 'any' to return once one task finishes
+        ctx: MCP request context, used to send a progress notification as each task finishes
+
+    Returns:
+        Dictionary with the status of each task, the finished and pending task IDs, and
+        whether the wait timed out
+    """
+    async def report_progress(finished, total, statuses):
+        if ctx is not None:
+            await ctx.report_progress(
+                finished, total, message=f"{finished} of {total} tasks finished"
+            )
+
+    try:
+        statuses = await get_task_poller().wait(task_ids, timeout, return_when, report_progress)
+
+        finished = [
+            task_id for task_id, status in statuses.items() if status in TERMINAL_STATUSES
+        ]
+        pending = [task_id for task_id in statuses if task_id not in finished]
+        return {
+            'tasks': [
+                {'task_id': task_id, 'status': status.value if status else None}
+                for task_id, status in statuses.items()
+            ],
+            'finished': finished,
+            'pending': pending,
+            'timed_out': bool(pending) and (return_when == 'all' or not finished),
+        }
+    except Exception as e:
+        logger.exception(f"Error waiting for tasks: {str(e)}")
+        return {'error': str(e)}
+
+
+@mcp.tool(name='get_task_measurements')
+def get_task_measurements(
+    task_id: str,
+    offset: int = 0,
+    limit: int = 100,
+    qubits: Optional[List[int]] = None,
+) -> Dict[str, Any]:
+    """Get a page of the per-shot measurements of a completed quantum task.
+
+    The measurements are fetched once and kept in a memory-mapped file in the workspace
+    directory, so further pages are served locally.
+
+    Args:
+        task_id: ID of the quantum task
+        offset: Index of the first shot (default: 0)
+        limit: Maximum number of shots, at most 1000 (default: 100)
+        qubits: Measured qubits to return, in the given order (default: all)
+
+    Returns:
+        Dictionary with the measurements of the page (one list of bits per shot), the total
+        number of shots and qubits, and the offset of the next page (None after the last page)
+    """
+    try:
+        return get_braket_service(task_id).get_task_measurements(
+            task_id, offset=offset, limit=limit, qubits=qubits
+        )
+    except ThrottlingError as e:
+        logger.warning(f"Task measurement lookup throttled: {str(e)}")
+        return {'error': str(e), 'throttled': True, 'retry_after': e.retry_after}
+    except Exception as e:
+        logger.exception(f"Error getting task measurements: {str(e)}")
+        return {'error': str(e)}
+
+
+@mcp.tool(name='get_task_marginals')
+def get_task_marginals(task_id: str, qubits: Optional[List[int]] = None) -> Dict[str, Any]:
+    """Count the measured bitstrings of a completed task, or their marginals on some qubits.
+
+    The counts are computed locally over the memory-mapped measurements in the workspace
+    directory, so large results are never loaded into memory at once.
+
+    Args:
+        task_id: ID of the quantum task
+        qubits: Measured qubits to count, in the given order (default: all)
+
+    Returns:
+        Dictionary with the number of shots of each bitstring of the qubits and the total
+        number of shots
+    """
+    try:
+        return get_braket_service(task_id).get_task_marginals(task_id, qubits=qubits)
+    except ThrottlingError as e:
+        logger.warning(f"Task marginals lookup throttled: {str(e)}")
+        return {'error': str(e), 'throttled': True, 'retry_after': e.retry_after}
+    except Exception as e:
+        logger.exception(f"Error getting task marginals: {str(e)}")
+        return {'error': str(e)}
+
+
+@mcp.tool(name='search_result_archive')
+def search_result_archive(
+    task_id: Optional[str] = None,
+    device_arn: Optional[str] = None,
+    circuit: Optional[Dict[str, Any]] = None,
+    circuit_hash: Optional[str] = None,
+    created_after: Optional[str] = None,
+    created_before: Optional[str] = None,
+    status: Optional[str] = None,
+    limit: int = 100,
+) -> List[Dict[str, Any]]:
+    """Search the local archive of fetched task results without calling AWS.
+
+    Every terminal result fetched by the server is archived in the workspace directory.
+
+    Args:
+        task_id: Only the result of this task
+        device_arn: Only results of this device
+        circuit: Only results of tasks submitted with this circuit definition
+        circuit_hash: Only results of tasks submitted with the circuit of this hash
+        created_after: Only tasks created at or after this ISO 8601 time (UTC if no offset)
+        created_before: Only tasks created before this ISO 8601 time (UTC if no offset)
+        status: Only results in this status (COMPLETED, FAILED or CANCELLED)
+        limit: Maximum number of results to return (default: 100)
+
+    Returns:
+        List of archived results, most recently created first, with their device, status,
+        shots, circuit hash, times (Unix timestamps) and whether measurements are archived
+    """
+    try:
+        entries = get_braket_service().search_archived_results(
+            task_id=task_id,
+            device_arn=device_arn,
+            circuit_hash=hash_circuit(_parse_circuit(circuit)) if circuit else circuit_hash,
+            created_after=datetime.fromisoformat(created_after) if created_after else None,
+            created_before=datetime.fromisoformat(created_before) if created_before else None,
+            status=TaskStatus(status) if status else None,
+            limit=limit,
+        )
+        return [entry.model_dump() for entry in entries]
+    except Exception as e:
+        logger.exception(f"Error searching archived results: {str(e)}")
+        return [{'error': str(e)}]
+
+
+@mcp.tool(name='get_archived_result')
+def get_archived_result(
+    task_id: str,
+    include_measurements: bool = False,
+    counts_only: bool = False,
+    packed: bool = False,
+) -> Dict[str, Any]:
+    """Load a task result from the local archive without calling AWS.
+
+    Args:
+        task_id: ID of the quantum task
+        include_measurements: Whether to include the per-shot measurements (one list of bits
+            per shot); by default only the measurement counts are returned
+        counts_only: Whether to return only the task status and measurement counts
+        packed: Whether to return the per-shot measurements bit-packed under
+            `packed_measurements`
+
+    Returns:
+        Dictionary containing the archived task result
+    """
+    try:
+        result = get_braket_service().get_archived_result(
+            task_id,
+            include_measurements=include_measurements,
+            counts_only=counts_only,
+            packed=packed,
+        )
+        if counts_only:
+            return result.model_dump(exclude_none=True)
+        return result.model_dump()
+    except Exception as e:
+        logger.exception(f"Error loading archived result: {str(e)}")
+        return {'error': str(e)}
+
+
 @mcp.tool(name='list_devices')
 def list_devices() -> List[Dict[str, Any]]:
     """List available quantum devices.
@@ -210,7 +1008,7 @@ def list_devices() -> List[Dict[str, Any]]:
     """
     try:
         # Get the list of devices
-        devices = get_braket_service().list_devices()
+        devices = _list_all_devices()
         
         # Convert to dictionaries
         return [device.model_dump() for device in devices]
@@ -231,7 +1029,7 @@ def get_device_info(device_arn: str) -> Dict[str, Any]:
     """
     try:
         # Get the device information
-        device_info = get_braket_service().get_device_info(device_arn)
+        device_info = get_braket_service(device_arn).get_device_info(device_arn)
         
         # Return the device info as a dictionary
         return device_info.model_dump()
@@ -252,7 +1050,7 @@ def cancel_quantum_task(task_id: str) -> Dict[str, Any]:
     """
     try:
         # Cancel the task
-        success = get_braket_service().cancel_quantum_task(task_id)
+        success = get_braket_service(task_id).cancel_quantum_task(task_id)
         
         return {
             'task_id': task_id,
@@ -288,7 +1086,7 @@ def search_quantum_tasks(
             created_after = datetime.now() - timedelta(days=days_ago)
         
         # Search for tasks
-        tasks = get_braket_service().search_quantum_tasks(
+        tasks = get_braket_service(device_arn).search_quantum_tasks(
             device_arn=device_arn,
             state=state,
             max_results=max_results,
@@ -446,6 +1244,7 @@ def visualize_results(result: Dict[str, Any]) -> Dict[str, Any]:
             task_id=result.get('task_id'),
             status=result.get('status'),
             measurements=result.get('measurements'),
+            packed_measurements=result.get('packed_measurements'),
             counts=result.get('counts'),
             device=result.get('device'),
             shots=result.get('shots'),
@@ -510,6 +1309,7 @@ def describe_visualization(visualization_data: Dict[str, Any]) -> Dict[str, Any]
                 task_id=result_dict.get('task_id'),
                 status=result_dict.get('status'),
                 measurements=result_dict.get('measurements'),
+                packed_measurements=result_dict.get('packed_measurements'),
                 counts=result_dict.get('counts'),
                 device=result_dict.get('device'),
                 shots=result_dict.get('shots'),
@@ -535,6 +1335,11 @@ def describe_visualization(visualization_data: Dict[str, Any]) -> Dict[str, Any]
 
 def main():
     """Run the MCP server with CLI argument support."""
+    # Resume submissions journaled before a restart
+    try:
+        get_braket_service().start_submission_worker()
+    except Exception as e:
+        logger.warning(f"Could not start the submission worker: {str(e)}")
     mcp.run()
 
 
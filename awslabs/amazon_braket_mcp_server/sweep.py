@@ -0,0 +1,195 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Parameter sweeps over a parameterized circuit.
+
+A sweep runs one compiled circuit for every point of a parameter grid, one task per point.
+The sweep tracks the tasks under a single handle and aggregates their counts (and optionally
+a Z-basis expectation value) into one table, filled in as tasks complete.
+"""
+
+import itertools
+import threading
+import uuid
+from awslabs.amazon_braket_mcp_server.composite import TERMINAL_STATUSES
+from awslabs.amazon_braket_mcp_server.models import TaskResult, TaskStatus
+from typing import Any, Dict, List, Optional
+
+
+# Prefix distinguishing sweep handles from Braket task ARNs
+SWEEP_ID_PREFIX = 'sweep-'
+
+
+def is_sweep_id(task_id: str) -> bool:
+    """Check whether an ID is a parameter sweep handle."""
+    return task_id.startswith(SWEEP_ID_PREFIX)
+
+
+def expand_grid(grid: Dict[str, List[float]]) -> List[Dict[str, float]]:
+    """Expand a value grid into the Cartesian product of its parameter values.
+
+    Args:
+        grid: Values of each parameter
+
+    Returns:
+        List[Dict[str, float]]: Parameter points, varying the last parameter fastest
+    """
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+
+
+def z_expectation(counts: Dict[str, int], observable: str) -> Optional[float]:
+    """Compute the expectation value of a Pauli Z/I string from measurement counts.
+
+    Args:
+        counts: Counts of each measured bitstring
+        observable: One 'Z' or 'I' per measured bit, e.g. 'ZZI'
+
+    Returns:
+        Optional[float]: The expectation value, or None if there are no counts
+    """
+    positions = [i for i, pauli in enumerate(observable.upper()) if pauli == 'Z']
+    total = sum(counts.values())
+    if not total:
+        return None
+    value = 0
+    for bitstring, count in counts.items():
+        parity = sum(bitstring[i] == '1' for i in positions if i < len(bitstring)) % 2
+        value += -count if parity else count
+    return value / total
+
+
+class ParameterSweep:
+    """The tasks of a parameter sweep and their aggregated results.
+
+    Attributes:
+        sweep_id: Handle of the sweep
+        device_arn: ARN of the device the tasks run on
+        points: Parameter values of each point
+        shots: Shots per point
+        observable: Pauli Z/I string whose expectation value is reported (optional)
+        task_ids: Task ID of each point, None until submitted
+        errors: Submission errors by point index
+    """
+
+    def __init__(
+        self,
+        device_arn: str,
+        points: List[Dict[str, float]],
+        shots: int,
+        observable: Optional[str] = None,
+    ):
+        """Initialize the sweep.
+
+        Args:
+            device_arn: ARN of the device the tasks run on
+            points: Parameter values of each point
+            shots: Shots per point
+            observable: Pauli Z/I string whose expectation value is reported (optional)
+        """
+        self.sweep_id = f'{SWEEP_ID_PREFIX}{uuid.uuid4()}'
+        self.device_arn = device_arn
+        self.points = points
+        self.shots = shots
+        self.observable = observable
+        self.task_ids: List[Optional[str]] = [None] * len(points)
+        self.errors: Dict[int, str] = {}
+        self._results: Dict[int, TaskResult] = {}
+        self._lock = threading.Lock()
+
+    def set_task(self, index: int, task_id: str) -> None:
+        """Record the task submitted for a point."""
+        with self._lock:
+            self.task_ids[index] = task_id
+
+    def set_error(self, index: int, error: str) -> None:
+        """Record that the task of a point could not be submitted."""
+        with self._lock:
+            self.errors[index] = error
+
+    @property
+    def submitted(self) -> int:
+        """Number of points whose task was submitted."""
+        return sum(task_id is not None for task_id in self.task_ids)
+
+    def pending_tasks(self) -> Dict[int, str]:
+        """Submitted tasks that have not reached a terminal state, by point index."""
+        with self._lock:
+            return {
+                index: task_id
+                for index, task_id in enumerate(self.task_ids)
+                if task_id is not None and index not in self._results
+            }
+
+    def record(self, index: int, result: TaskResult) -> None:
+        """Record the result of a point's task, keeping it once it is terminal."""
+        if result.status in TERMINAL_STATUSES:
+            with self._lock:
+                self._results[index] = result
+
+    def table(self, latest: Optional[Dict[int, TaskResult]] = None) -> Dict[str, Any]:
+        """Aggregate the results of all points.
+
+        Args:
+            latest: Latest results of non-terminal tasks, by point index (optional)
+
+        Returns:
+            Dict[str, Any]: Sweep status, progress and one row per point
+        """
+        latest = latest or {}
+        rows = []
+        statuses = []
+        for index, point in enumerate(self.points):
+            result = self._results.get(index) or latest.get(index)
+            if index in self.errors:
+                status = TaskStatus.FAILED.value
+            elif result is not None:
+                status = result.status.value
+            elif self.task_ids[index] is not None:
+                status = TaskStatus.CREATED.value
+            else:
+                status = 'PENDING_SUBMISSION'
+            statuses.append(status)
+
+            row: Dict[str, Any] = {
+                'index': index,
+                'parameters': point,
+                'task_id': self.task_ids[index],
+                'status': status,
+            }
+            if index in self.errors:
+                row['error'] = self.errors[index]
+            if result is not None and result.status == TaskStatus.COMPLETED:
+                row['counts'] = result.counts
+                if self.observable:
+                    row['expectation'] = z_expectation(result.counts or {}, self.observable)
+            rows.append(row)
+
+        completed = statuses.count(TaskStatus.COMPLETED.value)
+        terminal = {status.value for status in TERMINAL_STATUSES}
+        if all(status in terminal for status in statuses):
+            status = (
+                TaskStatus.COMPLETED.value
+                if completed == len(statuses)
+                else TaskStatus.FAILED.value
+            )
+        else:
+            status = TaskStatus.RUNNING.value
+        return {
+            'sweep_id': self.sweep_id,
+            'device_arn': self.device_arn,
+            'status': status,
+            'total': len(self.points),
+            'submitted': self.submitted,
+            'completed': completed,
+            'observable': self.observable,
+            'points': rows,
+        }
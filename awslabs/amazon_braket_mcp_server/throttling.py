@@ -0,0 +1,302 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Client-side rate limiting for Amazon Braket API calls.
+
+This module provides a token-bucket limiter keyed by API operation and region. Calls that
+are throttled by the service are retried with jittered exponential backoff, and the bucket
+rate adapts to the throttling it observes so that bursts settle at the sustainable rate
+instead of turning into error storms.
+"""
+
+import random
+import threading
+import time
+from awslabs.amazon_braket_mcp_server.exceptions import ThrottlingError
+from loguru import logger
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+# Error codes returned by AWS services when a request is throttled
+THROTTLING_ERROR_CODES = {
+    'Throttling',
+    'ThrottlingException',
+    'ThrottledException',
+    'TooManyRequestsException',
+    'RequestLimitExceeded',
+    'RequestThrottled',
+    'RequestThrottledException',
+    'SlowDown',
+}
+
+
+def is_throttling_error(error: BaseException) -> bool:
+    """Check whether an exception is a throttling response from AWS.
+
+    Args:
+        error: The exception raised by a boto3 or Braket SDK call
+
+    Returns:
+        bool: True if the error indicates that the request was throttled
+    """
+    response = getattr(error, 'response', None)
+    if isinstance(response, dict):
+        code = response.get('Error', {}).get('Code', '')
+        if code in THROTTLING_ERROR_CODES:
+            return True
+        status = response.get('ResponseMetadata', {}).get('HTTPStatusCode')
+        if status == 429:
+            return True
+    return False
+
+
+def sdk_retry_attempts(value: Any) -> int:
+    """Get the number of retries botocore made for a response or a failed call.
+
+    Args:
+        value: The return value of a boto3 call, or the exception it raised
+
+    Returns:
+        int: Retries reported in the response metadata (0 if there is none)
+    """
+    response = getattr(value, 'response', value)
+    if isinstance(response, dict):
+        metadata = response.get('ResponseMetadata')
+        if isinstance(metadata, dict):
+            attempts = metadata.get('RetryAttempts')
+            if isinstance(attempts, int):
+                return attempts
+    return 0
+
+
+class TokenBucket:
+    """A thread-safe token bucket with an adaptive refill rate.
+
+    The refill rate is halved every time the service throttles a call and recovers
+    additively on each successful call, up to the configured maximum.
+
+    Attributes:
+        max_rate: Maximum refill rate in tokens per second
+        rate: Current refill rate in tokens per second
+        capacity: Maximum number of tokens the bucket can hold (burst size)
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        min_rate: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the token bucket.
+
+        Args:
+            rate: Refill rate in tokens per second
+            capacity: Burst size. Defaults to the refill rate (at least one token).
+            min_rate: Lower bound for the adaptive refill rate
+            clock: Monotonic clock used to measure elapsed time
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._clock = clock
+        self._last_refill = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._last_refill
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._last_refill = now
+
+    def reserve(self) -> float:
+        """Take a token, returning how long the caller must wait before using it.
+
+        Tokens may go negative, which queues concurrent callers fairly behind each other.
+
+        Returns:
+            float: Seconds to wait before the reserved token becomes valid
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def on_throttle(self) -> None:
+        """Multiplicatively decrease the refill rate after a throttling response."""
+        with self._lock:
+            self._refill()
+            self.rate = max(self.min_rate, self.rate / 2)
+
+    def on_success(self) -> None:
+        """Additively recover the refill rate after a successful call."""
+        with self._lock:
+            if self.rate < self.max_rate:
+                self._refill()
+                self.rate = min(self.max_rate, self.rate + self.max_rate * 0.05)
+
+
+class RateLimiter:
+    """Token-bucket rate limiter keyed by Braket API operation and region.
+
+    Attributes:
+        rates: Sustained request rate per operation (requests per second)
+        max_retries: Number of retries after a throttling response
+        base_delay: Base delay for exponential backoff (in seconds)
+        max_delay: Upper bound for a single backoff delay (in seconds)
+    """
+
+    # Default sustained rates, kept below the Amazon Braket per-account API quotas
+    DEFAULT_RATES = {
+        'CreateQuantumTask': 10.0,
+        'GetQuantumTask': 50.0,
+        'CancelQuantumTask': 2.0,
+        'SearchQuantumTasks': 4.0,
+        'GetDevice': 4.0,
+        'SearchDevices': 4.0,
+    }
+
+    # Rate used for operations without an explicit entry
+    FALLBACK_RATE = 10.0
+
+    def __init__(
+        self,
+        rates: Optional[Dict[str, float]] = None,
+        max_retries: int = 6,
+        base_delay: float = 0.25,
+        max_delay: float = 20.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize the rate limiter.
+
+        Args:
+            rates: Overrides for the per-operation request rates
+            max_retries: Number of retries after a throttling response
+            base_delay: Base delay for exponential backoff (in seconds)
+            max_delay: Upper bound for a single backoff delay (in seconds)
+            sleep: Function used to wait, injectable for testing
+        """
+        self.rates = {**self.DEFAULT_RATES, **(rates or {})}
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._sleep = sleep
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._metrics: Dict[Tuple[str, str], Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, key: Tuple[str, str]) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(self.rates.get(key[0], self.FALLBACK_RATE))
+                self._buckets[key] = bucket
+                self._metrics[key] = {
+                    'calls': 0,
+                    'throttled': 0,
+                    'sdk_retries': 0,
+                    'wait_seconds': 0.0,
+                    'backoff_seconds': 0.0,
+                }
+            return bucket
+
+    def _record(self, key: Tuple[str, str], name: str, value: float) -> None:
+        with self._lock:
+            self._metrics[key][name] += value
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Compute a full-jitter exponential backoff delay.
+
+        Args:
+            attempt: Zero-based retry attempt number
+
+        Returns:
+            float: Delay in seconds
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2**attempt)))
+
+    def call(
+        self, operation: str, region: Optional[str], func: Callable[..., Any], *args, **kwargs
+    ) -> Any:
+        """Call a function under the rate limit for an operation and region.
+
+        Args:
+            operation: Braket API operation name (e.g. 'CreateQuantumTask')
+            region: AWS region the call is made against
+            func: Function performing the API call
+            *args: Positional arguments for the function
+            **kwargs: Keyword arguments for the function
+
+        Returns:
+            Any: The return value of the function
+
+        Raises:
+            ThrottlingError: If the call is still throttled after all retries
+        """
+        key = (operation, region or 'default')
+        bucket = self._bucket(key)
+
+        for attempt in range(self.max_retries + 1):
+            wait = bucket.reserve()
+            if wait > 0:
+                self._record(key, 'wait_seconds', wait)
+                self._sleep(wait)
+            self._record(key, 'calls', 1)
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                self._record(key, 'sdk_retries', sdk_retry_attempts(e))
+                if not is_throttling_error(e):
+                    raise
+                self._record(key, 'throttled', 1)
+                bucket.on_throttle()
+                if attempt == self.max_retries:
+                    retry_after = min(self.max_delay, self.base_delay * (2 ** (attempt + 1)))
+                    raise ThrottlingError(
+                        f'{operation} throttled in region {key[1]} after {attempt + 1} attempts; '
+                        f'retry after {retry_after:.1f} seconds',
+                        retry_after=retry_after,
+                    ) from e
+                delay = self.backoff_delay(attempt)
+                logger.debug(
+                    f'{operation} throttled in {key[1]}, backing off {delay:.2f}s '
+                    f'(attempt {attempt + 1}/{self.max_retries})'
+                )
+                self._record(key, 'backoff_seconds', delay)
+                self._sleep(delay)
+            else:
+                self._record(key, 'sdk_retries', sdk_retry_attempts(result))
+                bucket.on_success()
+                return result
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Get the rate limiting metrics for every operation and region seen so far.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Metrics keyed by '<region>/<operation>', including
+                the number of calls, throttled responses, retries made inside botocore,
+                time spent waiting for tokens, time spent in backoff, and the current
+                adaptive rate
+        """
+        with self._lock:
+            return {
+                f'{region}/{operation}': {
+                    **metrics,
+                    'current_rate': self._buckets[(operation, region)].rate,
+                    'max_rate': self._buckets[(operation, region)].max_rate,
+                }
+                for (operation, region), metrics in self._metrics.items()
+            }
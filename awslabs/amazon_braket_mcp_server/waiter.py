@@ -0,0 +1,179 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Server-side waiting for quantum tasks.
+
+Agents waiting for tasks would otherwise call `get_task_result` in a loop, paying an MCP
+round trip and a GetQuantumTask call every time. Waiters instead register their task IDs
+with one shared poller. In each round it looks up every watched task that has not reached a
+terminal state, once, however many waiters watch it. Rounds back off exponentially with
+jitter while nothing changes and return to the base interval when a status changes or a new
+task is watched.
+"""
+
+import asyncio
+import random
+from awslabs.amazon_braket_mcp_server.composite import TERMINAL_STATUSES
+from awslabs.amazon_braket_mcp_server.models import TaskStatus
+from loguru import logger
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+
+
+# Poll interval after a status change, and the interval it backs off to (in seconds)
+DEFAULT_POLL_INTERVAL = 1.0
+MAX_POLL_INTERVAL = 30.0
+
+# How long a waiter waits by default (in seconds)
+DEFAULT_WAIT_TIMEOUT = 300.0
+
+# When a wait returns: once any or once all of the tasks reach a terminal state
+RETURN_WHEN = ('all', 'any')
+
+ProgressCallback = Callable[[int, int, Dict[str, Optional[TaskStatus]]], Awaitable[None]]
+
+
+class TaskPoller:
+    """Shared poll loop for the tasks of all concurrent waiters.
+
+    Attributes:
+        base_interval: Poll interval after a status change (in seconds)
+        max_interval: Longest poll interval (in seconds)
+        statuses: Last known status of each watched task
+        rounds: Number of completed poll rounds
+    """
+
+    def __init__(
+        self,
+        get_status: Callable[[str], TaskStatus],
+        base_interval: float = DEFAULT_POLL_INTERVAL,
+        max_interval: float = MAX_POLL_INTERVAL,
+    ):
+        """Initialize the poller.
+
+        Args:
+            get_status: Function looking up the status of a task (called in worker threads)
+            base_interval: Poll interval after a status change (in seconds)
+            max_interval: Longest poll interval (in seconds)
+        """
+        self.base_interval = base_interval
+        self.max_interval = max_interval
+        self.statuses: Dict[str, TaskStatus] = {}
+        self.rounds = 0
+        self._get_status = get_status
+        self._watchers: Dict[str, int] = {}
+        self._round = asyncio.Event()
+        self._wakeup = asyncio.Event()
+        self._loop_task: Optional[asyncio.Task] = None
+
+    def _watch(self, task_ids: Iterable[str]) -> None:
+        for task_id in task_ids:
+            self._watchers[task_id] = self._watchers.get(task_id, 0) + 1
+            if task_id not in self.statuses:
+                self._wakeup.set()
+        if self._loop_task is None or self._loop_task.done():
+            self._loop_task = asyncio.create_task(self._run())
+
+    def _unwatch(self, task_ids: Iterable[str]) -> None:
+        for task_id in task_ids:
+            self._watchers[task_id] -= 1
+            if not self._watchers[task_id]:
+                del self._watchers[task_id]
+                self.statuses.pop(task_id, None)
+        if not self._watchers:
+            # Let the poll loop end instead of sleeping out its interval
+            self._wakeup.set()
+
+    def _poll(self, task_id: str) -> Optional[TaskStatus]:
+        """Look up the status of a task; failed lookups are retried in the next round."""
+        try:
+            return self._get_status(task_id)
+        except Exception as e:
+            logger.warning(f'Could not get the status of {task_id}: {str(e)}')
+            return None
+
+    async def _run(self) -> None:
+        interval = self.base_interval
+        while self._watchers:
+            self._wakeup.clear()
+            task_ids = [
+                task_id
+                for task_id in self._watchers
+                if self.statuses.get(task_id) not in TERMINAL_STATUSES
+            ]
+            statuses = await asyncio.gather(
+                *(asyncio.to_thread(self._poll, task_id) for task_id in task_ids)
+            )
+            changed = False
+            for task_id, status in zip(task_ids, statuses):
+                if status is not None and self.statuses.get(task_id) != status:
+                    changed = True
+                    if task_id in self._watchers:
+                        self.statuses[task_id] = status
+            self.rounds += 1
+            finished, self._round = self._round, asyncio.Event()
+            finished.set()
+
+            interval = self.base_interval if changed else min(interval * 2, self.max_interval)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), random.uniform(interval / 2, interval))
+                interval = self.base_interval
+            except asyncio.TimeoutError:
+                pass
+
+    async def wait(
+        self,
+        task_ids: List[str],
+        timeout: float = DEFAULT_WAIT_TIMEOUT,
+        return_when: str = 'all',
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> Dict[str, Optional[TaskStatus]]:
+        """Wait until tasks reach a terminal state.
+
+        Args:
+            task_ids: IDs of the tasks to wait for
+            timeout: Longest time to wait (in seconds)
+            return_when: 'all' to wait for every task, 'any' to return once one task finishes
+            on_progress: Coroutine called whenever the statuses change, with the number of
+                finished tasks, the number of tasks and their statuses
+
+        Returns:
+            Dict[str, Optional[TaskStatus]]: Last known status of each task (None if it could
+                not be looked up yet)
+
+        Raises:
+            ValueError: If return_when is not 'all' or 'any'
+        """
+        if return_when not in RETURN_WHEN:
+            raise ValueError(f'return_when must be one of {RETURN_WHEN}, got {return_when!r}')
+        task_ids = list(dict.fromkeys(task_ids))
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        self._watch(task_ids)
+        try:
+            reported = None
+            while True:
+                next_round = self._round
+                statuses = {task_id: self.statuses.get(task_id) for task_id in task_ids}
+                finished = sum(status in TERMINAL_STATUSES for status in statuses.values())
+                if on_progress is not None and statuses != reported:
+                    reported = statuses
+                    await on_progress(finished, len(task_ids), statuses)
+                if finished == len(task_ids) or (return_when == 'any' and finished):
+                    return statuses
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return statuses
+                try:
+                    await asyncio.wait_for(next_round.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._unwatch(task_ids)
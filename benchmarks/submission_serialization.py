@@ -0,0 +1,73 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Benchmark the serialization of circuit definitions for task submission.
+
+Compares the direct OpenQASM emission with the Braket SDK circuit route and the Qiskit
+conversion route, on a 10-qubit circuit of 190 gates. Only the serialization is timed; the
+direct route also saves the GetDevice round trip, which is not measured here.
+
+Run from the package root:
+
+    python benchmarks/submission_serialization.py
+"""
+
+import argparse
+import statistics
+import timeit
+from awslabs.amazon_braket_mcp_server.braket_circuits import build_braket_circuit
+from awslabs.amazon_braket_mcp_server.braket_service import BraketService
+from awslabs.amazon_braket_mcp_server.models import Gate, QuantumCircuit
+from awslabs.amazon_braket_mcp_server.openqasm import emit_openqasm, program_action
+from braket.circuits.serialization import IRType
+from loguru import logger
+from unittest.mock import patch
+
+
+def deep_circuit(num_qubits: int = 10, layers: int = 10) -> QuantumCircuit:
+    """Build layers of single-qubit rotations followed by a chain of CNOTs."""
+    gates = []
+    for _ in range(layers):
+        gates.extend(Gate(name='rx', qubits=[q], params=[0.1 * q]) for q in range(num_qubits))
+        gates.extend(Gate(name='cx', qubits=[q, q + 1]) for q in range(num_qubits - 1))
+    return QuantumCircuit(num_qubits=num_qubits, gates=gates)
+
+
+def main() -> None:
+    """Time each serialization route and print the median per call."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=7, help='Timing rounds per route')
+    parser.add_argument('--number', type=int, default=20, help='Calls per timing round')
+    args = parser.parse_args()
+
+    # The Qiskit route logs each gate its fallback conversion does not handle
+    logger.disable('awslabs.amazon_braket_mcp_server')
+    circuit = deep_circuit()
+    # The Qiskit route runs through service methods; no AWS call is made
+    with patch('boto3.client'):
+        service = BraketService(region_name='us-east-1')
+
+    routes = {
+        'direct OpenQASM': lambda: program_action(emit_openqasm(circuit)[0]),
+        'Braket SDK circuit': lambda: build_braket_circuit(circuit).to_ir(IRType.OPENQASM),
+        'Qiskit conversion': lambda: service.convert_to_braket_circuit(
+            service.create_qiskit_circuit(circuit)
+        ).to_ir(IRType.OPENQASM),
+    }
+    print(f'{circuit.num_qubits} qubits, {len(circuit.gates)} gates')
+    for name, route in routes.items():
+        route()
+        times = timeit.repeat(route, repeat=args.repeat, number=args.number)
+        print(f'{name:>20}: {statistics.median(times) / args.number * 1000:8.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
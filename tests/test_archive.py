@@ -0,0 +1,138 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Tests for the persistent local result archive."""
+
+import numpy as np
+from awslabs.amazon_braket_mcp_server.archive import ResultArchive
+from awslabs.amazon_braket_mcp_server.braket_service import BraketService
+from awslabs.amazon_braket_mcp_server.deduplication import circuit_hash
+from awslabs.amazon_braket_mcp_server.measurements import pack_measurements, unpack_measurements
+from awslabs.amazon_braket_mcp_server.models import Gate, QuantumCircuit, TaskResult, TaskStatus
+from awslabs.amazon_braket_mcp_server.server import get_archived_result, search_result_archive
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+
+SV1_ARN = 'arn:aws:braket:::device/quantum-simulator/amazon/sv1'
+ARIA_ARN = 'arn:aws:braket:us-east-1::device/qpu/ionq/Aria-1'
+
+MEASUREMENTS = np.random.default_rng(9).integers(0, 2, size=(50, 3), dtype=np.uint8)
+
+BELL = QuantumCircuit(
+    num_qubits=2, gates=[Gate(name='h', qubits=[0]), Gate(name='cx', qubits=[0, 1])]
+)
+
+
+def day(number):
+    """Get midnight UTC of a day in January 2025."""
+    return datetime(2025, 1, number, tzinfo=timezone.utc)
+
+
+def make_result(task_id, device=SV1_ARN, status=TaskStatus.COMPLETED, created=1):
+    """Create a task result created on a day in January 2025."""
+    return TaskResult(
+        task_id=task_id,
+        status=status,
+        counts={'000': 30, '111': 20} if status == TaskStatus.COMPLETED else None,
+        device=device,
+        shots=50,
+        execution_time=1.5,
+        metadata={'createdAt': day(created), 'endedAt': day(created).isoformat()},
+    )
+
+
+def test_results_round_trip(tmp_path):
+    """Archived results load with their counts, measurements and summary."""
+    archive = ResultArchive(tmp_path)
+    entry = archive.put(make_result('t1'), pack_measurements(MEASUREMENTS))
+
+    assert (entry.num_qubits, entry.has_measurements) == (3, True)
+    assert entry.created_at == day(1).timestamp()
+    assert list(tmp_path.glob('*.npz'))
+
+    result = ResultArchive(tmp_path).get('t1')
+    assert result.counts == {'000': 30, '111': 20}
+    assert result.execution_time == 1.5
+    np.testing.assert_array_equal(unpack_measurements(result.packed_measurements), MEASUREMENTS)
+    assert archive.get('t2') is None
+    assert archive.put(make_result('t3', status=TaskStatus.RUNNING)) is None
+
+
+def test_search(tmp_path):
+    """Results are found by task, device, time range, status and circuit."""
+    archive = ResultArchive(tmp_path)
+    archive.record_circuit('t1', 'bell')
+    archive.put(make_result('t1', created=1))
+    archive.put(make_result('t2', created=2, device=ARIA_ARN))
+    archive.put(make_result('t3', created=3, status=TaskStatus.FAILED))
+    archive.record_circuit('t3', 'bell')
+
+    def found(**filters):
+        return [entry.task_id for entry in archive.search(**filters)]
+
+    assert found() == ['t3', 't2', 't1']
+    assert found(task_id='t2') == ['t2']
+    assert found(device_arn=SV1_ARN) == ['t3', 't1']
+    assert found(circuit_hash='bell') == ['t3', 't1']
+    assert found(status=TaskStatus.COMPLETED, limit=1) == ['t2']
+    assert found(created_after=day(2).timestamp(), created_before=day(3).timestamp()) == ['t2']
+
+
+@patch('awslabs.amazon_braket_mcp_server.braket_service.AwsQuantumTask')
+def test_fetched_results_are_archived(mock_aws_quantum_task, tmp_path, monkeypatch):
+    """Submitted circuits and fetched results are archived, measurements included."""
+    monkeypatch.setenv('AMZN_BRAKET_TASK_RESULTS_S3_URI', 's3://bucket/results')
+    with patch('boto3.client'):
+        service = BraketService(region_name='us-west-2', workspace_dir=str(tmp_path))
+    service.braket_client.create_quantum_task.return_value = {'quantumTaskArn': 't1'}
+    task = mock_aws_quantum_task.return_value
+    task.metadata.return_value = {
+        'status': 'COMPLETED',
+        'deviceArn': SV1_ARN,
+        'shots': 50,
+        'createdAt': day(5),
+    }
+    task.result.return_value.measurements = MEASUREMENTS
+    task.result.return_value.measurement_counts = {'000': 50}
+
+    task_id = service.run_quantum_task(BELL, SV1_ARN, shots=50)
+    assert service.get_task_result(task_id).measurements is None
+
+    [entry] = service.search_archived_results(
+        circuit_hash=circuit_hash(BELL), created_after=datetime(2025, 1, 5)
+    )
+    assert (entry.task_id, entry.has_measurements) == ('t1', False)
+
+    # Measurements are archived once they are fetched
+    service.get_task_result(task_id, include_measurements=True)
+    [entry] = service.search_archived_results(task_id='t1')
+    assert entry.has_measurements
+    archived = service.get_archived_result('t1', include_measurements=True)
+    assert archived.measurements == MEASUREMENTS.tolist()
+    assert task.result.call_count == 2
+
+
+def test_archive_tools(tmp_path):
+    """The tools resolve circuits to hashes, parse times and report errors."""
+    with patch('boto3.client'):
+        service = BraketService(region_name='us-west-2', workspace_dir=str(tmp_path))
+    service.archive.put(make_result('t1', created=4))
+    service.archive.record_circuit('t1', circuit_hash(BELL))
+
+    with patch('awslabs.amazon_braket_mcp_server.server.get_braket_service', return_value=service):
+        bell = BELL.model_dump()
+        [entry] = search_result_archive(circuit=bell, created_after='2025-01-04')
+        assert entry['task_id'] == 't1'
+        assert search_result_archive(created_before='2025-01-04T00:00:00+00:00') == []
+        assert get_archived_result('t1', counts_only=True)['counts'] == {'000': 30, '111': 20}
+        assert 'error' in get_archived_result('t2')
+        assert 'error' in search_result_archive(status='UNKNOWN')[0]
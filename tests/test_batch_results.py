@@ -0,0 +1,153 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Tests for batch result lookups."""
+
+import pytest
+import threading
+import time
+from awslabs.amazon_braket_mcp_server.braket_service import BraketService
+from awslabs.amazon_braket_mcp_server.exceptions import ThrottlingError
+from awslabs.amazon_braket_mcp_server.models import TaskResult, TaskStatus
+from awslabs.amazon_braket_mcp_server.server import get_task_results
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+SV1_ARN = 'arn:aws:braket:::device/quantum-simulator/amazon/sv1'
+
+
+class FakeTasks:
+    """Mocked AwsQuantumTask factory tracking result downloads."""
+
+    def __init__(self, statuses, download_seconds=0.0):
+        """Map task IDs to statuses (or lookup errors) and per-task download times."""
+        self.statuses = statuses
+        if not isinstance(download_seconds, dict):
+            download_seconds = dict.fromkeys(statuses, download_seconds)
+        self.download_seconds = download_seconds
+        self.downloads = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def download(self, task_id):
+        """Download a result, tracking how many downloads run at once."""
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.download_seconds[task_id])
+        with self._lock:
+            self.in_flight -= 1
+            self.downloads.append(task_id)
+        result = MagicMock()
+        result.measurement_counts = {'1': 10}
+        return result
+
+    def __call__(self, task_id, **kwargs):
+        """Create a mocked task in its configured status."""
+        status = self.statuses[task_id]
+        task = MagicMock()
+        if isinstance(status, Exception):
+            task.metadata.side_effect = status
+        else:
+            task.metadata.return_value = {'status': status, 'deviceArn': SV1_ARN, 'shots': 10}
+        task.result.side_effect = lambda: self.download(task_id)
+        return task
+
+
+@pytest.fixture
+def braket_service():
+    """Create a BraketService with a mocked client."""
+    with patch('boto3.client'):
+        return BraketService(region_name='us-west-2')
+
+
+@patch('awslabs.amazon_braket_mcp_server.braket_service.AwsQuantumTask')
+def test_iter_task_results(mock_aws_quantum_task, braket_service):
+    """Only completed tasks are downloaded; cached results and errors are reported too."""
+    tasks = FakeTasks({'t1': 'COMPLETED', 't2': 'RUNNING', 't3': Exception('not found')})
+    mock_aws_quantum_task.side_effect = tasks
+    braket_service.result_cache.put(
+        TaskResult(task_id='t0', status=TaskStatus.COMPLETED, device=SV1_ARN, shots=10)
+    )
+
+    results = dict(braket_service.iter_task_results(['t0', 't1', 't2', 't3', 't1']))
+
+    assert results['t0'].status == TaskStatus.COMPLETED
+    assert results['t1'].counts == {'1': 10}
+    assert results['t2'].status == TaskStatus.RUNNING
+    assert isinstance(results['t3'], Exception)
+    assert tasks.downloads == ['t1']
+    assert [call.args[0] for call in mock_aws_quantum_task.call_args_list].count('t1') == 1
+
+
+@patch('awslabs.amazon_braket_mcp_server.braket_service.AwsQuantumTask')
+def test_downloads_are_parallel_and_bounded(mock_aws_quantum_task, braket_service):
+    """Results are downloaded concurrently by at most max_downloads threads."""
+    task_ids = [f't{i}' for i in range(12)]
+    tasks = FakeTasks(dict.fromkeys(task_ids, 'COMPLETED'), download_seconds=0.02)
+    mock_aws_quantum_task.side_effect = tasks
+
+    results = list(braket_service.iter_task_results(task_ids, max_downloads=4))
+
+    assert len(results) == 12
+    assert 1 < tasks.max_in_flight <= 4
+
+
+@patch('awslabs.amazon_braket_mcp_server.braket_service.AwsQuantumTask')
+def test_results_stream_as_they_are_ready(mock_aws_quantum_task, braket_service):
+    """A quick result is yielded before a slow one requested earlier."""
+    tasks = FakeTasks({'slow': 'COMPLETED', 'quick': 'COMPLETED'}, {'slow': 0.2, 'quick': 0.0})
+    mock_aws_quantum_task.side_effect = tasks
+
+    order = [task_id for task_id, _ in braket_service.iter_task_results(['slow', 'quick'])]
+
+    assert order == ['quick', 'slow']
+
+
+async def test_get_task_results_tool():
+    """The tool streams each result as progress and returns them in request order."""
+    ctx = MagicMock()
+    ctx.report_progress = AsyncMock()
+    completed = TaskResult(
+        task_id='t2', status=TaskStatus.COMPLETED, counts={'0': 5}, device=SV1_ARN, shots=5
+    )
+    with patch('awslabs.amazon_braket_mcp_server.server.get_braket_service') as mock_get_service:
+        mock_get_service.return_value.iter_task_results.return_value = iter(
+            [('t2', completed), ('t1', ThrottlingError('slow down', retry_after=2.0))]
+        )
+
+        response = await get_task_results(['t1', 't2'], counts_only=True, ctx=ctx)
+
+    first, second = response['results']
+    assert first == {
+        'task_id': 't1',
+        'error': 'slow down',
+        'throttled': True,
+        'retry_after': 2.0,
+    }
+    assert second['counts'] == {'0': 5}
+    assert 'metadata' not in second
+    assert ctx.report_progress.call_count == 2
+    assert ctx.report_progress.call_args_list[0].args == (1, 2)
+
+
+async def test_get_task_results_tool_reports_lookup_failures():
+    """A failing region lookup reports an error for each of its tasks."""
+    with patch('awslabs.amazon_braket_mcp_server.server.get_braket_service') as mock_get_service:
+        mock_get_service.return_value.iter_task_results.side_effect = Exception('no credentials')
+
+        response = await get_task_results(['t1', 't2'])
+
+    assert response['results'] == [
+        {'task_id': 't1', 'error': 'no credentials'},
+        {'task_id': 't2', 'error': 'no credentials'},
+    ]
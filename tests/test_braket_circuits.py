@@ -0,0 +1,72 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Tests for the direct conversion of circuit definitions to Braket circuits."""
+
+import pytest
+from awslabs.amazon_braket_mcp_server.braket_circuits import (
+    build_braket_circuit,
+    circuit_parameters,
+)
+from awslabs.amazon_braket_mcp_server.exceptions import CircuitCreationError
+from awslabs.amazon_braket_mcp_server.models import Gate, QuantumCircuit
+from braket.circuits.serialization import IRType
+
+
+QAOA = QuantumCircuit(
+    num_qubits=2,
+    gates=[
+        Gate(name='h', qubits=[0]),
+        Gate(name='h', qubits=[1]),
+        Gate(name='cx', qubits=[0, 1]),
+        Gate(name='rz', qubits=[1], params=['gamma']),
+        Gate(name='cx', qubits=[0, 1]),
+        Gate(name='rx', qubits=[0], params=['beta']),
+        Gate(name='rx', qubits=[1], params=[0.5]),
+        Gate(name='measure_all'),
+    ],
+)
+
+
+def test_named_params_become_free_parameters():
+    """String parameters are kept symbolic in the compiled program."""
+    assert circuit_parameters(QAOA) == ['beta', 'gamma']
+
+    circuit = build_braket_circuit(QAOA)
+
+    assert {str(p) for p in circuit.parameters} == {'beta', 'gamma'}
+    source = circuit.to_ir(IRType.OPENQASM).source
+    assert 'input float beta;' in source
+    assert 'rz(gamma) q[1];' in source
+    assert 'cnot q[0], q[1];' in source
+
+
+def test_partial_measurement():
+    """Measurements of specific qubits are kept."""
+    circuit_def = QuantumCircuit(
+        num_qubits=3,
+        gates=[
+            Gate(name='h', qubits=[0]),
+            Gate(name='ccx', qubits=[0, 1, 2]),
+            Gate(name='measure', qubits=[2]),
+        ],
+    )
+
+    source = build_braket_circuit(circuit_def).to_ir(IRType.OPENQASM).source
+
+    assert 'ccnot q[0], q[1], q[2];' in source
+    assert 'b[0] = measure q[2];' in source
+
+
+def test_unsupported_gate():
+    """Unknown gates are rejected."""
+    with pytest.raises(CircuitCreationError, match='Unsupported gate: foo'):
+        build_braket_circuit(QuantumCircuit(num_qubits=1, gates=[Gate(name='foo', qubits=[0])]))
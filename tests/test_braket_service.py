@@ -15,7 +15,7 @@ import pytest
 import numpy as np
 from unittest.mock import patch, MagicMock
 
-from awslabs.amazon_braket_mcp_server.braket_service import BraketService
+from awslabs.amazon_braket_mcp_server.braket_service import BraketService, make_client_config
 from awslabs.amazon_braket_mcp_server.models import (
     QuantumCircuit, Gate, TaskResult, TaskStatus, DeviceInfo, DeviceType
 )
@@ -73,6 +73,9 @@ def test_create_qiskit_circuit(mock_qiskit_circuit_class, braket_service):
 @patch('awslabs.amazon_braket_mcp_server.braket_service.QiskitCircuit')
 def test_run_quantum_task(mock_qiskit_circuit_class, mock_aws_device, braket_service):
     """Test running a quantum task."""
+    # Submit through the Qiskit conversion and the Braket SDK
+    braket_service.direct_submission = False
+
     # Mock the QiskitCircuit instance
     mock_qiskit_circuit = MagicMock()
     mock_qiskit_circuit_class.return_value = mock_qiskit_circuit
@@ -177,6 +180,9 @@ def test_create_qiskit_circuit(mock_qiskit_circuit_class, braket_service):
 @patch('awslabs.amazon_braket_mcp_server.braket_service.QiskitCircuit')
 def test_run_quantum_task(mock_qiskit_circuit_class, mock_aws_device, braket_service):
     """Test running a quantum task."""
+    # Submit through the Qiskit conversion and the Braket SDK
+    braket_service.direct_submission = False
+
     # Mock the QiskitCircuit instance
     mock_qiskit_circuit = MagicMock()
     mock_qiskit_circuit_class.return_value = mock_qiskit_circuit
@@ -246,6 +252,46 @@ def test_get_task_result(mock_aws_quantum_task, braket_service):
     assert mock_task_instance.metadata.called
     assert mock_task_instance.result.called
 
+
+@patch('awslabs.amazon_braket_mcp_server.braket_service.AwsQuantumTask')
+def test_get_task_result_returns_counts_unless_measurements_are_requested(
+    mock_aws_quantum_task, braket_service
+):
+    """Per-shot measurements are only returned when they are requested."""
+    mock_task_instance = MagicMock()
+    mock_task_instance.metadata.return_value = {
+        'status': 'COMPLETED',
+        'deviceArn': 'arn:aws:braket:::device/quantum-simulator/amazon/sv1',
+        'shots': 4,
+    }
+    mock_result = mock_task_instance.result.return_value
+    mock_result.measurements = np.array([[0, 0], [0, 1], [1, 0], [1, 1]])
+    mock_result.measurement_counts = {'00': 1, '01': 1, '10': 1, '11': 1}
+    mock_aws_quantum_task.return_value = mock_task_instance
+
+    result = braket_service.get_task_result('task-123')
+    assert result.counts == {'00': 1, '01': 1, '10': 1, '11': 1}
+    assert result.measurements is None
+    assert result.packed_measurements is None
+
+    counts = braket_service.get_task_result('task-123', counts_only=True)
+    assert counts.metadata is None
+    assert counts.counts == result.counts
+
+    # The cached result has no measurements, so the task is fetched again
+    full = braket_service.get_task_result('task-123', include_measurements=True)
+    assert full.measurements == [[0, 0], [0, 1], [1, 0], [1, 1]]
+    assert mock_aws_quantum_task.call_count == 2
+
+    # The full result is served from the cache for every shape
+    assert braket_service.get_task_result('task-123').measurements is None
+    assert braket_service.get_task_result('task-123', include_measurements=True) == full
+    packed = braket_service.get_task_result('task-123', packed=True)
+    assert packed.measurements is None
+    assert packed.packed_measurements.shape == [4, 2]
+    assert mock_aws_quantum_task.call_count == 2
+
+
 class TestBraketServiceValidation:
     """Test service validation functionality."""
     
@@ -275,6 +321,18 @@ class TestBraketServiceValidation:
         # Should not raise an exception - it just logs a warning
         assert mock_boto3_client.search_devices.call_count >= 1
 
+    def test_shared_client_uses_tuned_config(self):
+        """The Braket client is created once with the tuned config and shared by the SDK session."""
+        config = make_client_config(max_pool_connections=64, retry_mode='standard', read_timeout=5)
+        with patch('boto3.client') as mock_client:
+            braket_service = BraketService(region_name='us-west-2', client_config=config)
+
+        mock_client.assert_called_once_with('braket', region_name='us-west-2', config=config)
+        assert braket_service.aws_session.braket_client is braket_service.braket_client
+        assert config.max_pool_connections == 64
+        assert config.retries == {'mode': 'standard', 'total_max_attempts': 2}
+        assert config.tcp_keepalive is True
+
 
 class TestCircuitConversion:
     """Test circuit conversion functionality."""
@@ -0,0 +1,263 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Tests for shot splitting and composite tasks."""
+
+import numpy as np
+import pytest
+from awslabs.amazon_braket_mcp_server.braket_service import BraketService
+from awslabs.amazon_braket_mcp_server.composite import (
+    CompositeTask,
+    is_composite_task_id,
+    split_shots,
+)
+from awslabs.amazon_braket_mcp_server.exceptions import TaskExecutionError
+from awslabs.amazon_braket_mcp_server.models import (
+    DeviceInfo,
+    DeviceType,
+    Gate,
+    QuantumCircuit,
+    TaskResult,
+    TaskStatus,
+)
+from unittest.mock import MagicMock, patch
+
+
+SV1_ARN = 'arn:aws:braket:::device/quantum-simulator/amazon/sv1'
+
+
+def make_result(task_id, status, counts=None, measurements=None, shots=0):
+    """Build a sub-task result."""
+    return TaskResult(
+        task_id=task_id,
+        status=status,
+        counts=counts,
+        measurements=measurements,
+        device=SV1_ARN,
+        shots=shots,
+    )
+
+
+class TestSplitShots:
+    """Test shot splitting."""
+
+    def test_no_split_needed(self):
+        """Shots within the limit are not split."""
+        assert split_shots(1000, 100000) == [1000]
+        assert split_shots(1000, 0) == [1000]
+
+    def test_balanced_split(self):
+        """Shots are split into balanced chunks within the limit."""
+        chunks = split_shots(250001, 100000)
+        assert chunks == [83334, 83334, 83333]
+        assert sum(chunks) == 250001
+        assert split_shots(200000, 100000) == [100000, 100000]
+
+
+class TestCompositeTask:
+    """Test incremental merging of sub-task results."""
+
+    def test_partial_merge(self):
+        """Completed sub-tasks are merged while others are still running."""
+        composite = CompositeTask(SV1_ARN, ['t1', 't2'], [2, 2])
+        assert is_composite_task_id(composite.task_id)
+
+        composite.record(
+            make_result('t1', TaskStatus.COMPLETED, {'00': 1, '11': 1}, [[0, 0], [1, 1]])
+        )
+        running = make_result('t2', TaskStatus.RUNNING)
+        composite.record(running)
+
+        assert composite.pending_sub_tasks() == ['t2']
+        result = composite.merged_result({'t2': running})
+        assert result.status == TaskStatus.RUNNING
+        assert result.counts == {'00': 1, '11': 1}
+        assert result.shots == 4
+        assert result.metadata['completed_shots'] == 2
+
+    def test_full_merge(self):
+        """All completed sub-tasks merge counts; their measurements are not kept."""
+        composite = CompositeTask(SV1_ARN, ['t1', 't2'], [2, 1])
+        composite.record(
+            make_result('t1', TaskStatus.COMPLETED, {'00': 1, '11': 1}, [[0, 0], [1, 1]])
+        )
+        composite.record(make_result('t2', TaskStatus.COMPLETED, {'11': 1}, [[1, 1]]))
+
+        result = composite.merged_result()
+        assert result.status == TaskStatus.COMPLETED
+        assert result.counts == {'00': 1, '11': 2}
+        assert result.measurements is None and result.packed_measurements is None
+        assert composite.pending_sub_tasks() == []
+        assert composite.completed_sub_tasks() == ['t1', 't2']
+
+    def test_failed_sub_task(self):
+        """A failed sub-task fails the composite task once every sub-task has stopped."""
+        composite = CompositeTask(SV1_ARN, ['t1', 't2', 't3'], [1, 1, 1])
+        composite.record(make_result('t1', TaskStatus.COMPLETED, {'0': 1}))
+        composite.record(make_result('t2', TaskStatus.FAILED))
+        queued = make_result('t3', TaskStatus.QUEUED)
+
+        assert composite.stopped()
+        assert composite.merged_result({'t3': queued}).status == TaskStatus.RUNNING
+
+        composite.record(make_result('t3', TaskStatus.CANCELLED))
+        assert composite.merged_result().status == TaskStatus.FAILED
+
+
+@pytest.fixture
+def braket_service(tmp_path):
+    """Create a BraketService whose devices accept at most 100 shots."""
+    with patch('boto3.client'):
+        service = BraketService(region_name='us-west-2', workspace_dir=str(tmp_path))
+    service.create_qiskit_circuit = MagicMock()
+    service.convert_to_braket_circuit = MagicMock()
+    service.get_device_info = MagicMock(
+        return_value=DeviceInfo(
+            device_arn=SV1_ARN,
+            device_name='SV1',
+            device_type=DeviceType.SIMULATOR,
+            provider_name='Amazon',
+            status='ONLINE',
+            qubits=34,
+            paradigm='gate-based',
+            max_shots=100,
+        )
+    )
+    return service
+
+
+CIRCUIT = QuantumCircuit(num_qubits=1, gates=[Gate(name='x', qubits=[0])])
+
+
+def test_run_quantum_task_splits_shots(braket_service):
+    """Oversized shot requests become a composite task of concurrent sub-tasks."""
+    create = braket_service.braket_client.create_quantum_task
+    create.side_effect = lambda **request: {'quantumTaskArn': f'task-{request["shots"]}'}
+
+    task_id = braket_service.run_quantum_task(
+        CIRCUIT, SV1_ARN, shots=250, s3_bucket='bucket', s3_prefix='results'
+    )
+
+    assert is_composite_task_id(task_id)
+    composite = braket_service.get_composite_task(task_id)
+    assert composite.shots_per_task == [84, 83, 83]
+    assert sorted(composite.sub_task_ids) == ['task-83', 'task-83', 'task-84']
+    assert create.call_count == 3
+    assert len({call.kwargs['clientToken'] for call in create.call_args_list}) == 3
+
+
+@patch('awslabs.amazon_braket_mcp_server.braket_service.AwsDevice')
+def test_run_quantum_task_splits_shots_with_sdk(mock_aws_device, braket_service):
+    """Shots are also split when circuits are submitted through the Braket SDK."""
+    braket_service.direct_submission = False
+    mock_device = MagicMock()
+    mock_device.run.side_effect = lambda circuit, shots, **kwargs: MagicMock(id=f'task-{shots}')
+    mock_aws_device.return_value = mock_device
+
+    task_id = braket_service.run_quantum_task(CIRCUIT, SV1_ARN, shots=250)
+
+    composite = braket_service.get_composite_task(task_id)
+    assert sorted(composite.sub_task_ids) == ['task-83', 'task-83', 'task-84']
+    assert mock_device.run.call_count == 3
+
+
+def test_failed_split_cancels_created_sub_tasks(braket_service):
+    """If one sub-task cannot be created, the others are cancelled."""
+    braket_service.braket_client = MagicMock()
+    braket_service.braket_client.create_quantum_task.side_effect = [
+        {'quantumTaskArn': 'task-1'},
+        Exception('quota exceeded'),
+    ]
+
+    with pytest.raises(TaskExecutionError, match='quota exceeded'):
+        braket_service.run_quantum_task(
+            CIRCUIT, SV1_ARN, shots=200, s3_bucket='bucket', s3_prefix='results'
+        )
+
+    braket_service.braket_client.cancel_quantum_task.assert_called_once_with(
+        quantumTaskArn='task-1'
+    )
+
+
+@patch('awslabs.amazon_braket_mcp_server.braket_service.AwsQuantumTask')
+def test_get_composite_task_result_is_incremental(mock_aws_quantum_task, braket_service):
+    """Completed sub-tasks are fetched once and merged as they complete."""
+    composite = CompositeTask(SV1_ARN, ['t1', 't2'], [100, 100])
+    braket_service._composite_tasks[composite.task_id] = composite
+
+    states = {'t1': 'COMPLETED', 't2': 'RUNNING'}
+
+    def make_task(task_id, **kwargs):
+        task = MagicMock()
+        task.metadata.return_value = {
+            'status': states[task_id],
+            'deviceArn': SV1_ARN,
+            'shots': 100,
+        }
+        task.result.return_value.measurements = np.ones((100, 1), dtype=np.uint8)
+        task.result.return_value.measurement_counts = {'1': 100}
+        return task
+
+    mock_aws_quantum_task.side_effect = make_task
+
+    first = braket_service.get_task_result(composite.task_id)
+    assert first.status == TaskStatus.RUNNING
+    assert first.counts == {'1': 100}
+
+    states['t2'] = 'COMPLETED'
+    second = braket_service.get_task_result(composite.task_id)
+    assert second.status == TaskStatus.COMPLETED
+    assert second.counts == {'1': 200}
+    assert second.measurements is None
+
+    # t1 was fetched on the first call only
+    fetched = [call.args[0] for call in mock_aws_quantum_task.call_args_list]
+    assert fetched.count('t1') == 1
+    assert fetched.count('t2') == 2
+
+    # Measurements are fetched into the measurement store when they are requested
+    third = braket_service.get_task_result(composite.task_id, include_measurements=True)
+    assert len(third.measurements) == 200
+    fetched = [call.args[0] for call in mock_aws_quantum_task.call_args_list]
+    assert fetched.count('t1') == 2
+    assert braket_service.measurement_store.get('t1').shots == 100
+
+    # The composite keeps no measurements; later lookups read them from the store
+    assert all(result.packed_measurements is None for result in composite._results.values())
+    fourth = braket_service.get_task_result(composite.task_id, include_measurements=True)
+    assert fourth.measurements == third.measurements
+    fetched = [call.args[0] for call in mock_aws_quantum_task.call_args_list]
+    assert fetched.count('t1') == 2
+
+
+@patch('awslabs.amazon_braket_mcp_server.braket_service.AwsQuantumTask')
+def test_failed_sub_task_cancels_the_others(mock_aws_quantum_task, braket_service):
+    """Once a sub-task fails, the remaining ones are cancelled before the composite fails."""
+    composite = CompositeTask(SV1_ARN, ['t1', 't2'], [100, 100])
+    braket_service._composite_tasks[composite.task_id] = composite
+    states = {'t1': 'FAILED', 't2': 'QUEUED'}
+
+    def make_task(task_id, **kwargs):
+        task = MagicMock()
+        task.metadata.return_value = {'status': states[task_id], 'deviceArn': SV1_ARN}
+        return task
+
+    mock_aws_quantum_task.side_effect = make_task
+    cancel = braket_service.braket_client.cancel_quantum_task
+
+    assert braket_service.get_task_result(composite.task_id).status == TaskStatus.RUNNING
+    cancel.assert_called_once_with(quantumTaskArn='t2')
+
+    # The cancellation is requested once; the composite fails when t2 has stopped
+    assert braket_service.get_task_result(composite.task_id).status == TaskStatus.RUNNING
+    states['t2'] = 'CANCELLED'
+    assert braket_service.get_task_result(composite.task_id).status == TaskStatus.FAILED
+    assert cancel.call_count == 1
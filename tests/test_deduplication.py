@@ -0,0 +1,231 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Tests for idempotent quantum task submission."""
+
+import pytest
+import threading
+from awslabs.amazon_braket_mcp_server.braket_service import BraketService
+from awslabs.amazon_braket_mcp_server.deduplication import (
+    SubmissionDeduplicator,
+    circuit_hash,
+    submission_key,
+)
+from awslabs.amazon_braket_mcp_server.models import Gate, QuantumCircuit
+from unittest.mock import MagicMock, patch
+
+
+SV1_ARN = 'arn:aws:braket:::device/quantum-simulator/amazon/sv1'
+
+
+def bell_circuit(metadata=None):
+    """Build a Bell pair circuit definition."""
+    return QuantumCircuit(
+        num_qubits=2,
+        gates=[Gate(name='h', qubits=[0]), Gate(name='cx', qubits=[0, 1])],
+        metadata=metadata,
+    )
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        """Start the clock at zero."""
+        self.now = 0.0
+
+    def __call__(self):
+        """Return the current time."""
+        return self.now
+
+
+class TestSubmissionKeys:
+    """Test circuit hashing and key derivation."""
+
+    def test_circuit_hash_ignores_metadata(self):
+        """Metadata does not change the circuit hash."""
+        assert circuit_hash(bell_circuit()) == circuit_hash(bell_circuit({'name': 'bell'}))
+
+    def test_circuit_hash_depends_on_gates(self):
+        """Different gates produce different hashes."""
+        other = QuantumCircuit(num_qubits=2, gates=[Gate(name='x', qubits=[0])])
+        assert circuit_hash(bell_circuit()) != circuit_hash(other)
+
+    def test_submission_key(self):
+        """Keys depend on every component and are valid client tokens."""
+        digest = circuit_hash(bell_circuit())
+        key = submission_key(digest, SV1_ARN, 100)
+
+        assert len(key) == 64
+        assert key == submission_key(digest, SV1_ARN, 100)
+        assert key != submission_key(digest, SV1_ARN, 200)
+        assert key != submission_key(digest, SV1_ARN, 100, client_token='run-2')
+
+
+class TestSubmissionDeduplicator:
+    """Test the deduplication window."""
+
+    def test_duplicate_within_window(self):
+        """A duplicate within the window returns the existing task ID."""
+        dedup = SubmissionDeduplicator(window_seconds=60, clock=FakeClock())
+        submit = MagicMock(side_effect=['task-1', 'task-2'])
+
+        assert dedup.submit_once('key', submit) == ('task-1', False)
+        assert dedup.submit_once('key', submit) == ('task-1', True)
+        assert submit.call_count == 1
+
+    def test_window_expiry(self):
+        """A submission outside the window creates a new task."""
+        clock = FakeClock()
+        dedup = SubmissionDeduplicator(window_seconds=60, clock=clock)
+        submit = MagicMock(side_effect=['task-1', 'task-2'])
+
+        dedup.submit_once('key', submit)
+        clock.now = 61
+        assert dedup.submit_once('key', submit) == ('task-2', False)
+
+    def test_disabled(self):
+        """A zero window disables deduplication."""
+        dedup = SubmissionDeduplicator(window_seconds=0)
+        submit = MagicMock(side_effect=['task-1', 'task-2'])
+
+        assert dedup.submit_once('key', submit) == ('task-1', False)
+        assert dedup.submit_once('key', submit) == ('task-2', False)
+
+    def test_failed_submission_is_not_recorded(self):
+        """A failed submission can be retried."""
+        dedup = SubmissionDeduplicator()
+        submit = MagicMock(side_effect=[RuntimeError('boom'), 'task-1'])
+
+        with pytest.raises(RuntimeError):
+            dedup.submit_once('key', submit)
+        assert dedup.submit_once('key', submit) == ('task-1', False)
+
+    def test_concurrent_duplicates_create_one_task(self):
+        """Concurrent identical submissions create a single task."""
+        dedup = SubmissionDeduplicator()
+        submit = MagicMock(return_value='task-1')
+        results = []
+
+        threads = [
+            threading.Thread(target=lambda: results.append(dedup.submit_once('key', submit)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert submit.call_count == 1
+        assert {task_id for task_id, _ in results} == {'task-1'}
+
+
+@pytest.fixture
+def braket_service():
+    """Create a BraketService with a mocked boto3 client."""
+    with patch('boto3.client'):
+        service = BraketService(region_name='us-west-2')
+        service.create_qiskit_circuit = MagicMock()
+        service.convert_to_braket_circuit = MagicMock()
+        yield service
+
+
+def test_run_quantum_task_deduplicates(braket_service, monkeypatch):
+    """Identical submissions reuse the task; different client tokens do not."""
+    monkeypatch.setenv('AMZN_BRAKET_TASK_RESULTS_S3_URI', 's3://bucket/results')
+    create = braket_service.braket_client.create_quantum_task
+    create.side_effect = [{'quantumTaskArn': 'task-1'}, {'quantumTaskArn': 'task-2'}]
+
+    first = braket_service.run_quantum_task(bell_circuit(), SV1_ARN, shots=100)
+    retry = braket_service.run_quantum_task(bell_circuit(), SV1_ARN, shots=100)
+    repeat = braket_service.run_quantum_task(
+        bell_circuit(), SV1_ARN, shots=100, client_token='run-2'
+    )
+
+    assert first == retry == 'task-1'
+    assert repeat == 'task-2'
+    assert create.call_count == 2
+    assert create.call_args.kwargs['outputS3Bucket'] == 'bucket'
+    assert create.call_args.kwargs['outputS3KeyPrefix'] == 'results'
+
+
+def test_client_token_is_scoped_to_the_window(braket_service, monkeypatch):
+    """Retries within the window reuse the clientToken; later re-runs get a new one."""
+    monkeypatch.setenv('AMZN_BRAKET_TASK_RESULTS_S3_URI', 's3://bucket/results')
+    clock = FakeClock()
+    braket_service.deduplicator = SubmissionDeduplicator(window_seconds=60, clock=clock)
+    create = braket_service.braket_client.create_quantum_task
+    create.side_effect = [
+        RuntimeError('timeout'),
+        {'quantumTaskArn': 'task-1'},
+        {'quantumTaskArn': 'task-2'},
+    ]
+
+    with pytest.raises(Exception, match='timeout'):
+        braket_service.run_quantum_task(bell_circuit(), SV1_ARN, shots=100)
+    braket_service.run_quantum_task(bell_circuit(), SV1_ARN, shots=100)
+    clock.now = 61
+    assert braket_service.run_quantum_task(bell_circuit(), SV1_ARN, shots=100) == 'task-2'
+
+    failed, retried, rerun = (call.kwargs['clientToken'] for call in create.call_args_list)
+    key = submission_key(circuit_hash(bell_circuit()), SV1_ARN, 100)
+    assert failed == retried
+    assert rerun not in (retried, key)
+
+
+def test_callers_token_is_sent_as_given(braket_service, monkeypatch):
+    """Caller tokens stay idempotent on AWS across windows and restarts."""
+    monkeypatch.setenv('AMZN_BRAKET_TASK_RESULTS_S3_URI', 's3://bucket/results')
+    create = braket_service.braket_client.create_quantum_task
+    create.return_value = {'quantumTaskArn': 'task-1'}
+
+    braket_service.run_quantum_task(bell_circuit(), SV1_ARN, shots=100, client_token='entry-1')
+
+    assert create.call_args.kwargs['clientToken'] == 'entry-1'
+
+
+def test_disabled_deduplication_sends_only_the_callers_token(braket_service, monkeypatch):
+    """Without deduplication, identical submissions are not made idempotent on AWS."""
+    monkeypatch.setenv('AMZN_BRAKET_TASK_RESULTS_S3_URI', 's3://bucket/results')
+    braket_service.deduplicator = SubmissionDeduplicator(window_seconds=0)
+    create = braket_service.braket_client.create_quantum_task
+    create.return_value = {'quantumTaskArn': 'task-1'}
+
+    braket_service.run_quantum_task(bell_circuit(), SV1_ARN, shots=100)
+    assert 'clientToken' not in create.call_args.kwargs
+
+    braket_service.run_quantum_task(bell_circuit(), SV1_ARN, shots=100, client_token='run-2')
+    assert create.call_args.kwargs['clientToken'] == 'run-2'
+
+
+@patch('awslabs.amazon_braket_mcp_server.braket_service.AwsDevice')
+def test_submission_key_is_injected_into_sdk_requests(mock_aws_device, braket_service):
+    """The idempotency key is injected into the Braket SDK's CreateQuantumTask request."""
+    braket_service.direct_submission = False
+    captured = {}
+
+    def run(*args, **kwargs):
+        params = {'deviceArn': SV1_ARN}
+        braket_service._inject_client_token(params)
+        captured.update(params)
+        return MagicMock(id='task-1')
+
+    mock_aws_device.return_value.run.side_effect = run
+
+    braket_service.run_quantum_task(bell_circuit(), SV1_ARN, shots=100)
+
+    key = submission_key(circuit_hash(bell_circuit()), SV1_ARN, 100)
+    assert braket_service.deduplicator._client_token(key) == captured['clientToken']
+
+    # The token does not leak into later requests on the same thread
+    params = {}
+    braket_service._inject_client_token(params)
+    assert 'clientToken' not in params
@@ -0,0 +1,144 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Tests for cost and duration estimates."""
+
+import json
+import pytest
+from awslabs.amazon_braket_mcp_server.braket_service import BraketService
+from awslabs.amazon_braket_mcp_server.estimator import (
+    circuit_stats,
+    estimate_task,
+    find_pricing,
+    load_price_table,
+)
+from awslabs.amazon_braket_mcp_server.models import (
+    DeviceInfo,
+    DeviceType,
+    Gate,
+    QuantumCircuit,
+)
+from awslabs.amazon_braket_mcp_server.server import estimate_quantum_task
+from unittest.mock import patch
+
+
+SV1_ARN = 'arn:aws:braket:::device/quantum-simulator/amazon/sv1'
+DM1_ARN = 'arn:aws:braket:::device/quantum-simulator/amazon/dm1'
+ARIA_ARN = 'arn:aws:braket:us-east-1::device/qpu/ionq/Aria-1'
+FORTE_ARN = 'arn:aws:braket:us-east-1::device/qpu/ionq/Forte-1'
+
+GHZ = QuantumCircuit(
+    num_qubits=3,
+    gates=[
+        Gate(name='h', qubits=[0]),
+        Gate(name='cx', qubits=[0, 1]),
+        Gate(name='cx', qubits=[1, 2]),
+        Gate(name='x', qubits=[0]),
+        Gate(name='measure_all'),
+    ],
+)
+
+
+def test_circuit_stats():
+    """Depth counts gate layers; measurements are excluded."""
+    stats = circuit_stats(GHZ)
+    assert stats.num_qubits == 3
+    assert stats.gate_count == 4
+    assert stats.two_qubit_gate_count == 2
+    assert stats.depth == 3
+
+
+def test_find_pricing_prefers_longest_fragment():
+    """Device-specific entries override provider entries."""
+    table = load_price_table()
+    assert find_pricing(FORTE_ARN, table)['per_shot'] == 0.08
+    assert find_pricing(ARIA_ARN, table)['per_shot'] == 0.03
+    assert find_pricing('arn:aws:braket:::device/qpu/unknown/x', table) is None
+
+
+def test_price_table_override(tmp_path):
+    """Entries from a JSON file override the defaults."""
+    path = tmp_path / 'prices.json'
+    path.write_text(json.dumps({'qpu/ionq': {'per_shot': 0.05}}))
+
+    table = load_price_table(str(path))
+
+    assert table['qpu/ionq'] == {'per_task': 0.30, 'per_shot': 0.05, 'shot_seconds': 0.01}
+
+
+def test_qpu_estimate_includes_split_tasks_and_queue():
+    """QPU cost is the task fee per sub-task plus the shot price."""
+    device = DeviceInfo(
+        device_arn=ARIA_ARN,
+        device_name='Aria 1',
+        device_type=DeviceType.QPU,
+        provider_name='IonQ',
+        status='ONLINE',
+        qubits=25,
+        paradigm='gate-based',
+        max_shots=1000,
+        queue_depth=10,
+    )
+
+    estimate = estimate_task(GHZ, ARIA_ARN, 2500, load_price_table(), device)
+
+    assert estimate.tasks == 3
+    assert estimate.cost == pytest.approx(3 * 0.30 + 2500 * 0.03)
+    assert estimate.runtime_seconds == pytest.approx(25.0)
+    assert estimate.queue_wait_seconds == 600.0
+
+
+def test_simulator_estimate_scales_with_qubits():
+    """Simulator runtime grows as 2^n for SV1 and 4^n for DM1, with a billing minimum."""
+    table = load_price_table()
+    small = estimate_task(GHZ, SV1_ARN, 1000, table)
+    wide = QuantumCircuit(num_qubits=30, gates=[Gate(name='h', qubits=[q]) for q in range(30)])
+    large = estimate_task(wide, SV1_ARN, 1000, table)
+    dense = estimate_task(GHZ, DM1_ARN, 1000, table)
+
+    assert small.cost == pytest.approx(3.0 / 60 * 0.075)
+    assert large.runtime_seconds == pytest.approx(2.0 + 2**30 * 1e-9)
+    assert dense.runtime_seconds > small.runtime_seconds
+    assert 'Queue depth is unknown' in small.notes
+
+
+def test_parse_device_queue_depth():
+    """The normal priority task queue size is parsed from GetDevice."""
+    device_info = BraketService._parse_device_info(
+        {
+            'deviceArn': ARIA_ARN,
+            'deviceType': 'QPU',
+            'deviceQueueInfo': [
+                {'queue': 'QUANTUM_TASKS_QUEUE', 'queueSize': '4', 'queuePriority': 'Priority'},
+                {'queue': 'QUANTUM_TASKS_QUEUE', 'queueSize': '>2000', 'queuePriority': 'Normal'},
+                {'queue': 'JOBS_QUEUE', 'queueSize': '1'},
+            ],
+        }
+    )
+    assert device_info.queue_depth == 2000
+
+
+def test_estimate_quantum_task_tool_batches():
+    """The tool estimates a batch and sums the cost."""
+    with patch('awslabs.amazon_braket_mcp_server.server.get_braket_service') as mock_get_service:
+        table = load_price_table()
+        mock_get_service.return_value.estimate_quantum_tasks.side_effect = (
+            lambda circuits, device_arn, shots: [
+                estimate_task(circuit, device_arn, shots, table) for circuit in circuits
+            ]
+        )
+        circuit = {'num_qubits': 1, 'gates': [{'name': 'h', 'qubits': [0]}]}
+
+        result = estimate_quantum_task(circuits=[circuit, circuit], device_arn=ARIA_ARN, shots=100)
+
+    assert len(result['estimates']) == 2
+    assert result['total_cost'] == pytest.approx(2 * (0.30 + 100 * 0.03))
+    assert result['currency'] == 'USD'
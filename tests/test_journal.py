@@ -0,0 +1,338 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Tests for the durable submission journal."""
+
+import pytest
+import sqlite3
+import threading
+import time
+from awslabs.amazon_braket_mcp_server.braket_service import BraketService
+from awslabs.amazon_braket_mcp_server.composite import is_composite_task_id
+from awslabs.amazon_braket_mcp_server.exceptions import CircuitValidationError, ThrottlingError
+from awslabs.amazon_braket_mcp_server.journal import (
+    _SCHEMA,
+    JOURNAL_TAG,
+    SubmissionJournal,
+    SubmissionWorker,
+)
+from awslabs.amazon_braket_mcp_server.models import (
+    DeviceInfo,
+    DeviceType,
+    Gate,
+    QuantumCircuit,
+    SubmissionState,
+)
+from awslabs.amazon_braket_mcp_server.server import get_submission_status
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+
+SV1_ARN = 'arn:aws:braket:::device/quantum-simulator/amazon/sv1'
+
+CIRCUIT = QuantumCircuit(num_qubits=1, gates=[Gate(name='x', qubits=[0])])
+
+
+@pytest.fixture
+def journal(tmp_path):
+    """Create a journal in a temporary directory."""
+    journal = SubmissionJournal(tmp_path / 'journal.sqlite3')
+    yield journal
+    journal.close()
+
+
+def wait_for(condition, timeout=5.0):
+    """Wait until a condition holds."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, 'timed out'
+        time.sleep(0.01)
+
+
+class TestSubmissionJournal:
+    """Test journal state transitions."""
+
+    def test_lifecycle(self, journal):
+        """Entries move from queued to submitting to submitted."""
+        entry_id = journal.enqueue(CIRCUIT, SV1_ARN, 100)
+        assert journal.get(entry_id).state == SubmissionState.QUEUED
+
+        (claimed,) = journal.claim(10)
+        assert claimed.entry_id == entry_id
+        assert claimed.state == SubmissionState.SUBMITTING
+        assert claimed.attempts == 1
+        assert claimed.circuit == CIRCUIT
+        assert journal.claim(10) == []
+
+        journal.mark_submitted(entry_id, 'task-1')
+        entry = journal.get(entry_id)
+        assert entry.state == SubmissionState.SUBMITTED
+        assert entry.task_id == 'task-1'
+
+    def test_claim_is_oldest_first_and_limited(self, journal):
+        """Claims respect queue order and the limit."""
+        ids = [journal.enqueue(CIRCUIT, SV1_ARN, 100) for _ in range(3)]
+
+        assert [entry.entry_id for entry in journal.claim(2)] == ids[:2]
+        assert journal.count(SubmissionState.QUEUED) == 1
+        assert journal.count(SubmissionState.SUBMITTING) == 2
+
+    def test_survives_reopen(self, tmp_path):
+        """Entries persist across journal instances."""
+        path = tmp_path / 'journal.sqlite3'
+        first = SubmissionJournal(path)
+        entry_id = first.enqueue(CIRCUIT, SV1_ARN, 100, 'bucket', 'prefix')
+        first.claim(1)
+        first.close()
+
+        second = SubmissionJournal(path)
+        entry = second.get(entry_id)
+        assert entry.state == SubmissionState.SUBMITTING
+        assert entry.s3_bucket == 'bucket'
+        second.close()
+
+    def test_opens_journals_without_retry_delays(self, tmp_path):
+        """Journals written before retries were delayed gain the not_before column."""
+        path = tmp_path / 'journal.sqlite3'
+        with sqlite3.connect(str(path)) as conn:
+            conn.executescript(_SCHEMA.replace(',\n    not_before REAL', ''))
+        journal = SubmissionJournal(path)
+        entry_id = journal.enqueue(CIRCUIT, SV1_ARN, 100)
+
+        assert [entry.entry_id for entry in journal.claim(1)] == [entry_id]
+        journal.close()
+
+
+class TestSubmissionWorker:
+    """Test draining and recovery."""
+
+    def test_recover_reconciles_interrupted_submissions(self, journal):
+        """Interrupted entries with a task are marked submitted, the others requeued."""
+        found = journal.enqueue(CIRCUIT, SV1_ARN, 100)
+        missing = journal.enqueue(CIRCUIT, SV1_ARN, 100)
+        journal.claim(2)
+
+        worker = SubmissionWorker(
+            journal,
+            submit=MagicMock(),
+            reconcile=lambda entry: 'task-1' if entry.entry_id == found else None,
+        )
+        worker.recover()
+
+        assert journal.get(found).state == SubmissionState.SUBMITTED
+        assert journal.get(found).task_id == 'task-1'
+        assert journal.get(missing).state == SubmissionState.QUEUED
+
+    def test_drain_respects_concurrency(self, journal):
+        """No more than max_concurrency submissions are in flight."""
+        for _ in range(5):
+            journal.enqueue(CIRCUIT, SV1_ARN, 100)
+        release = threading.Event()
+
+        def submit(entry):
+            release.wait(5)
+            return f'task-{entry.entry_id}'
+
+        worker = SubmissionWorker(journal, submit=submit, reconcile=MagicMock(), max_concurrency=2)
+        in_flight = set()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            worker.drain_once(executor, in_flight)
+            assert len(in_flight) == 2
+            assert journal.count(SubmissionState.QUEUED) == 3
+            release.set()
+
+        worker.start()
+        wait_for(lambda: journal.count(SubmissionState.SUBMITTED) == 5)
+        worker.stop(timeout=5)
+
+    def test_failures_are_retried_then_failed(self, journal):
+        """Throttled submissions are requeued; errors fail after max_attempts."""
+        throttled = journal.enqueue(CIRCUIT, SV1_ARN, 100)
+        worker = SubmissionWorker(
+            journal,
+            submit=MagicMock(side_effect=ThrottlingError('slow down')),
+            reconcile=MagicMock(),
+        )
+        worker._process(journal.claim(1)[0])
+        assert journal.get(throttled).state == SubmissionState.QUEUED
+
+        worker = SubmissionWorker(
+            journal,
+            submit=MagicMock(side_effect=ValueError('bad')),
+            reconcile=MagicMock(),
+            max_attempts=3,
+            retry_delay=0,
+        )
+        worker._process(journal.claim(1)[0])
+        assert journal.get(throttled).state == SubmissionState.QUEUED
+        worker._process(journal.claim(1)[0])
+        entry = journal.get(throttled)
+        assert entry.state == SubmissionState.FAILED
+        assert entry.error == 'bad'
+
+    def test_permanent_errors_fail_at_once(self, journal):
+        """Submissions that can never succeed are not retried."""
+        entry_id = journal.enqueue(CIRCUIT, SV1_ARN, 100)
+        worker = SubmissionWorker(
+            journal,
+            submit=MagicMock(side_effect=CircuitValidationError('Pre-flight check failed')),
+            reconcile=MagicMock(),
+        )
+
+        worker._process(journal.claim(1)[0])
+
+        entry = journal.get(entry_id)
+        assert entry.state == SubmissionState.FAILED
+        assert entry.attempts == 1
+
+    def test_retries_wait_in_the_journal(self, journal):
+        """Requeued entries are not claimed before their delay; no worker thread sleeps."""
+        entry_id = journal.enqueue(CIRCUIT, SV1_ARN, 100)
+        worker = SubmissionWorker(
+            journal,
+            submit=MagicMock(side_effect=ThrottlingError('slow down', retry_after=60)),
+            reconcile=MagicMock(),
+        )
+
+        started = time.monotonic()
+        worker._process(journal.claim(1)[0])
+        assert time.monotonic() - started < 1
+        assert journal.get(entry_id).state == SubmissionState.QUEUED
+        assert journal.claim(1) == []
+
+        journal.requeue(entry_id, not_before=time.time() - 1)
+        assert [entry.entry_id for entry in journal.claim(1)] == [entry_id]
+
+    def test_retry_delay_doubles(self, journal):
+        """Failed attempts are retried after exponentially growing delays."""
+        entry_id = journal.enqueue(CIRCUIT, SV1_ARN, 100)
+        worker = SubmissionWorker(
+            journal,
+            submit=MagicMock(side_effect=ValueError('bad')),
+            reconcile=MagicMock(),
+            retry_delay=10,
+            max_retry_delay=15,
+        )
+        entry = journal.claim(1)[0]
+
+        for attempts, delay in ((1, 10), (2, 15)):
+            now = time.time()
+            worker._process(entry.model_copy(update={'attempts': attempts}))
+            (not_before,) = journal._conn.execute(
+                'SELECT not_before FROM submissions WHERE entry_id = ?', (entry_id,)
+            ).fetchone()
+            assert not_before == pytest.approx(now + delay, abs=1)
+
+    def test_malformed_entries_are_failed(self, journal):
+        """Entries whose circuit cannot be read are failed instead of claimed."""
+        entry_id = journal.enqueue(CIRCUIT, SV1_ARN, 100)
+        with journal._conn:
+            journal._conn.execute(
+                'UPDATE submissions SET circuit = ? WHERE entry_id = ?', ('{', entry_id)
+            )
+
+        assert journal.claim(1) == []
+        assert journal.count(SubmissionState.FAILED) == 1
+
+
+@pytest.fixture
+def braket_service(tmp_path):
+    """Create a BraketService with its workspace in a temporary directory."""
+    with patch('boto3.client') as mock_client:
+        mock_client.return_value = MagicMock()
+        service = BraketService(region_name='us-east-1', workspace_dir=str(tmp_path))
+    service.create_qiskit_circuit = MagicMock()
+    service.convert_to_braket_circuit = MagicMock()
+    yield service
+    service.stop_submission_worker(timeout=5)
+
+
+def test_enqueue_submits_with_journal_tag(braket_service, monkeypatch):
+    """Queued circuits are submitted in the background, tagged with their entry ID."""
+    monkeypatch.setenv('AMZN_BRAKET_TASK_RESULTS_S3_URI', 's3://bucket/results')
+    create = braket_service.braket_client.create_quantum_task
+    create.return_value = {'quantumTaskArn': 'task-1'}
+
+    (entry_id,) = braket_service.enqueue_quantum_tasks([CIRCUIT], SV1_ARN, shots=10)
+
+    wait_for(
+        lambda: braket_service.get_submissions([entry_id])[0].state == SubmissionState.SUBMITTED
+    )
+    assert braket_service.get_submissions([entry_id])[0].task_id == 'task-1'
+    assert create.call_args.kwargs['tags'] == {JOURNAL_TAG: entry_id}
+
+
+def test_composite_entries_survive_a_restart(braket_service, tmp_path, monkeypatch):
+    """Composite handles of submitted entries resolve to their sub-tasks after a restart."""
+    monkeypatch.setenv('AMZN_BRAKET_TASK_RESULTS_S3_URI', 's3://bucket/results')
+    braket_service._cache_device_info(
+        DeviceInfo(
+            device_arn=SV1_ARN,
+            device_name='SV1',
+            device_type=DeviceType.SIMULATOR,
+            provider_name='Amazon',
+            status='ONLINE',
+            qubits=34,
+            paradigm='gate-based',
+            max_shots=100,
+        )
+    )
+    create = braket_service.braket_client.create_quantum_task
+    create.side_effect = lambda **request: {'quantumTaskArn': f'task-{request["clientToken"]}'}
+
+    (entry_id,) = braket_service.enqueue_quantum_tasks([CIRCUIT], SV1_ARN, shots=150)
+    wait_for(
+        lambda: braket_service.get_submissions([entry_id])[0].state == SubmissionState.SUBMITTED
+    )
+    braket_service.stop_submission_worker(timeout=5)
+    task_id = braket_service.get_submissions([entry_id])[0].task_id
+    sub_task_ids = braket_service.get_composite_task(task_id).sub_task_ids
+
+    with patch('boto3.client'):
+        restarted = BraketService(region_name='us-east-1', workspace_dir=str(tmp_path))
+
+    assert is_composite_task_id(task_id)
+    composite = restarted.get_composite_task(task_id)
+    assert (composite.sub_task_ids, composite.shots_per_task) == (sub_task_ids, [75, 75])
+    assert restarted.has_task_handle(task_id)
+    assert restarted.cancel_quantum_task(task_id)
+    cancelled = restarted.braket_client.cancel_quantum_task.call_args_list
+    assert sorted(call.kwargs['quantumTaskArn'] for call in cancelled) == sorted(sub_task_ids)
+
+
+def test_reconcile_matches_journal_tag(braket_service):
+    """Interrupted submissions are matched to tasks by their journal tag."""
+    journal = braket_service._get_submission_worker().journal
+    entry_id = journal.enqueue(CIRCUIT, SV1_ARN, 10)
+    (entry,) = journal.claim(1)
+    braket_service.braket_client.search_quantum_tasks.return_value = {
+        'quantumTasks': [
+            {'quantumTaskArn': 'other', 'tags': {JOURNAL_TAG: 'another-entry'}},
+            {'quantumTaskArn': 'task-1', 'tags': {JOURNAL_TAG: entry_id}},
+        ]
+    }
+
+    assert braket_service._reconcile_journal_entry(entry) == 'task-1'
+
+
+def test_get_submission_status_tool():
+    """The status tool summarizes submissions by state."""
+    with patch('awslabs.amazon_braket_mcp_server.server.get_braket_service') as mock_get_service:
+        journal_entry = MagicMock()
+        journal_entry.state = SubmissionState.SUBMITTED
+        journal_entry.model_dump.return_value = {'entry_id': 'e1', 'task_id': 'task-1'}
+        mock_get_service.return_value.get_submissions.return_value = [journal_entry]
+
+        result = get_submission_status(entry_ids=['e1'])
+
+    assert result['submissions'] == [{'entry_id': 'e1', 'task_id': 'task-1'}]
+    assert result['summary']['SUBMITTED'] == 1
+    assert result['summary']['QUEUED'] == 0
@@ -0,0 +1,176 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Tests for paged retrieval of stored measurements."""
+
+import numpy as np
+import pytest
+from awslabs.amazon_braket_mcp_server.braket_service import BraketService
+from awslabs.amazon_braket_mcp_server.exceptions import TaskResultError
+from awslabs.amazon_braket_mcp_server.measurement_store import MeasurementStore
+from awslabs.amazon_braket_mcp_server.measurements import pack_measurements
+from awslabs.amazon_braket_mcp_server.server import get_task_marginals, get_task_measurements
+from collections import Counter
+from unittest.mock import MagicMock, patch
+
+
+SV1_ARN = 'arn:aws:braket:::device/quantum-simulator/amazon/sv1'
+
+MEASUREMENTS = np.random.default_rng(3).integers(0, 2, size=(250, 5), dtype=np.uint8)
+
+
+def make_task(status='COMPLETED'):
+    """Create a mocked task with measurements."""
+    task = MagicMock()
+    task.metadata.return_value = {'status': status, 'deviceArn': SV1_ARN, 'shots': 250}
+    task.result.return_value.measurements = MEASUREMENTS
+    task.result.return_value.measurement_counts = {}
+    return task
+
+
+def make_service(workspace_dir):
+    """Create a BraketService with a mocked client."""
+    with patch('boto3.client'):
+        return BraketService(region_name='us-west-2', workspace_dir=str(workspace_dir))
+
+
+def test_pages_are_served_from_the_mapped_file(tmp_path):
+    """Pages slice shots and qubits out of the memory-mapped rows."""
+    store = MeasurementStore(tmp_path)
+    store.put('task-1', pack_measurements(MEASUREMENTS))
+
+    stored = store.get('task-1')
+
+    assert isinstance(stored.rows, np.memmap)
+    assert (stored.shots, stored.num_qubits) == (250, 5)
+    np.testing.assert_array_equal(stored.page(10, 20), MEASUREMENTS[10:30])
+    np.testing.assert_array_equal(stored.page(240, 100, [4, 0]), MEASUREMENTS[240:, [4, 0]])
+    assert store.get('task-2') is None
+
+
+@pytest.mark.parametrize(
+    'offset, limit, qubits', [(-1, 10, None), (0, 0, None), (0, 5000, None), (0, 10, [5])]
+)
+def test_invalid_pages(tmp_path, offset, limit, qubits):
+    """Negative offsets, oversized pages and unknown qubits are rejected."""
+    stored = MeasurementStore(tmp_path).put('task-1', pack_measurements(MEASUREMENTS))
+
+    with pytest.raises(ValueError):
+        stored.page(offset, limit, qubits)
+
+
+@patch('awslabs.amazon_braket_mcp_server.braket_service.AwsQuantumTask')
+def test_get_task_measurements_fetches_once(mock_aws_quantum_task, tmp_path):
+    """The result is fetched on the first page only, also across server restarts."""
+    mock_aws_quantum_task.return_value = make_task()
+    service = make_service(tmp_path)
+
+    first = service.get_task_measurements('task-1', offset=0, limit=100)
+    assert first['measurements'] == MEASUREMENTS[:100].tolist()
+    assert (first['total_shots'], first['num_qubits'], first['next_offset']) == (250, 5, 100)
+
+    last = service.get_task_measurements('task-1', offset=200, limit=100, qubits=[1, 3])
+    assert last['measurements'] == MEASUREMENTS[200:, [1, 3]].tolist()
+    assert last['qubits'] == [1, 3]
+    assert last['next_offset'] is None
+
+    restarted = make_service(tmp_path)
+    assert restarted.get_task_measurements('task-1', offset=100)['next_offset'] == 200
+    assert mock_aws_quantum_task.call_count == 1
+
+
+@patch('awslabs.amazon_braket_mcp_server.braket_service.AwsQuantumTask')
+def test_get_task_measurements_of_running_task(mock_aws_quantum_task, tmp_path):
+    """Measurements are only available once the task completes."""
+    mock_aws_quantum_task.return_value = make_task('RUNNING')
+    service = make_service(tmp_path)
+
+    with pytest.raises(TaskResultError, match='once it completes'):
+        service.get_task_measurements('task-1')
+
+
+def test_get_task_measurements_tool():
+    """The tool passes the page request on and reports errors."""
+    with patch('awslabs.amazon_braket_mcp_server.server.get_braket_service') as mock_get_service:
+        service = mock_get_service.return_value
+        service.get_task_measurements.return_value = {'task_id': 'task-1', 'measurements': []}
+
+        assert get_task_measurements('task-1', offset=5, limit=10, qubits=[0]) == {
+            'task_id': 'task-1',
+            'measurements': [],
+        }
+        service.get_task_measurements.assert_called_once_with(
+            'task-1', offset=5, limit=10, qubits=[0]
+        )
+
+        service.get_task_measurements.side_effect = TaskResultError('Task task-1 is RUNNING')
+        assert get_task_measurements('task-1') == {'error': 'Task task-1 is RUNNING'}
+
+
+def bitstring_counts(bits):
+    """Count the rows of a bit matrix as bitstrings."""
+    return dict(Counter(''.join(str(bit) for bit in row) for row in bits.tolist()))
+
+
+def test_chunked_counts_and_marginals(tmp_path):
+    """Counts tallied chunk by chunk match the counts of the whole matrix."""
+    stored = MeasurementStore(tmp_path).put('task-1', pack_measurements(MEASUREMENTS))
+
+    assert stored.counts(chunk_shots=16) == bitstring_counts(MEASUREMENTS)
+    assert stored.counts([3, 0], chunk_shots=7) == bitstring_counts(MEASUREMENTS[:, [3, 0]])
+    assert sum(stored.counts([2]).values()) == 250
+    with pytest.raises(ValueError):
+        stored.counts([5])
+
+
+@patch('awslabs.amazon_braket_mcp_server.braket_service.AwsQuantumTask')
+def test_large_results_are_kept_memory_mapped(mock_aws_quantum_task, tmp_path):
+    """Large measurements are stored once, outside the archive, and read back without a refetch."""
+    mock_aws_quantum_task.return_value = make_task()
+    with patch('boto3.client'):
+        service = BraketService(
+            region_name='us-west-2', workspace_dir=str(tmp_path), memmap_threshold_bytes=100
+        )
+
+    assert service.get_task_result('task-1').measurements is None
+    assert service.measurement_store.get('task-1') is None
+
+    result = service.get_task_result('task-1', include_measurements=True)
+    assert result.measurements == MEASUREMENTS.tolist()
+    assert service.result_cache.get('task-1').packed_measurements is None
+    assert service.measurement_store.get('task-1').shots == 250
+    [entry] = service.search_archived_results(task_id='task-1')
+    assert (entry.has_measurements, entry.num_qubits) == (True, 5)
+    with np.load(service.archive._data_path('task-1')) as data:
+        assert 'measurements' not in data
+    archived = service.get_archived_result('task-1', packed=True)
+    assert archived.packed_measurements == service.measurement_store.get('task-1').packed()
+
+    result = service.get_task_result('task-1', include_measurements=True)
+    assert result.measurements == MEASUREMENTS.tolist()
+    marginals = service.get_task_marginals('task-1', qubits=[4])
+    assert marginals['counts'] == bitstring_counts(MEASUREMENTS[:, [4]])
+    assert (marginals['qubits'], marginals['total_shots']) == ([4], 250)
+    # Only the counts-only lookup and the first lookup with measurements fetch the result
+    assert mock_aws_quantum_task.call_count == 2
+
+
+def test_get_task_marginals_tool():
+    """The tool passes the qubits on and reports errors."""
+    with patch('awslabs.amazon_braket_mcp_server.server.get_braket_service') as mock_get_service:
+        service = mock_get_service.return_value
+        service.get_task_marginals.return_value = {'task_id': 'task-1', 'counts': {'0': 1}}
+
+        assert get_task_marginals('task-1', qubits=[0])['counts'] == {'0': 1}
+        service.get_task_marginals.assert_called_once_with('task-1', qubits=[0])
+
+        service.get_task_marginals.side_effect = TaskResultError('Task task-1 is RUNNING')
+        assert get_task_marginals('task-1') == {'error': 'Task task-1 is RUNNING'}
@@ -0,0 +1,117 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Tests for bit-packed measurement encoding."""
+
+import json
+import numpy as np
+import pytest
+from awslabs.amazon_braket_mcp_server.braket_service import BraketService
+from awslabs.amazon_braket_mcp_server.composite import CompositeTask
+from awslabs.amazon_braket_mcp_server.measurements import (
+    concatenate_packed,
+    pack_measurements,
+    packed_counts,
+    unpack_measurements,
+)
+from awslabs.amazon_braket_mcp_server.models import Gate, QuantumCircuit, TaskResult, TaskStatus
+from awslabs.amazon_braket_mcp_server.multiplexing import MultiplexedTask
+from collections import Counter
+from unittest.mock import patch
+
+
+SV1_ARN = 'arn:aws:braket:::device/quantum-simulator/amazon/sv1'
+
+RNG = np.random.default_rng(7)
+MEASUREMENTS = RNG.integers(0, 2, size=(1000, 11), dtype=np.uint8)
+
+
+def make_result(task_id, measurements, shots):
+    """Create a completed result carrying packed measurements only."""
+    return TaskResult(
+        task_id=task_id,
+        status=TaskStatus.COMPLETED,
+        packed_measurements=pack_measurements(measurements),
+        device=SV1_ARN,
+        shots=shots,
+    )
+
+
+@pytest.mark.parametrize('bit_order', ['big', 'little'])
+def test_round_trip(bit_order):
+    """Packing keeps the shape and bit order and unpacks to the same matrix."""
+    packed = pack_measurements(MEASUREMENTS, bit_order)
+
+    assert packed.shape == [1000, 11]
+    assert packed.bit_order == bit_order
+    np.testing.assert_array_equal(unpack_measurements(packed), MEASUREMENTS)
+
+
+def test_packed_counts():
+    """Counts of packed rows match counting the bitstrings."""
+    expected = Counter(''.join(map(str, shot)) for shot in MEASUREMENTS.tolist())
+
+    assert packed_counts(pack_measurements(MEASUREMENTS)) == expected
+    assert packed_counts(pack_measurements(MEASUREMENTS, 'little')) == expected
+    assert packed_counts(pack_measurements(np.zeros((0, 3)))) == {}
+
+
+def test_concatenate_packed():
+    """Shots of several parts are joined in order."""
+    parts = [pack_measurements(MEASUREMENTS[:300]), pack_measurements(MEASUREMENTS[300:])]
+
+    np.testing.assert_array_equal(unpack_measurements(concatenate_packed(parts)), MEASUREMENTS)
+
+
+def test_payload_is_smaller_than_int_lists():
+    """The packed payload is an order of magnitude smaller than JSON int lists."""
+    lists = json.dumps(MEASUREMENTS.tolist())
+    packed = pack_measurements(MEASUREMENTS).model_dump_json()
+
+    assert len(lists) / len(packed) > 8
+
+
+def test_composite_merges_stored_measurements(tmp_path):
+    """Stored sub-task measurements are merged packed, without expanding them to lists."""
+    with patch('boto3.client'):
+        service = BraketService(region_name='us-west-2', workspace_dir=str(tmp_path))
+    composite = CompositeTask(SV1_ARN, ['t1', 't2'], [300, 700])
+    service._composite_tasks[composite.task_id] = composite
+    for task_id, part in (('t1', MEASUREMENTS[:300]), ('t2', MEASUREMENTS[300:])):
+        result = make_result(task_id, part, len(part))
+        composite.record(result)
+        service.measurement_store.put(task_id, result.packed_measurements)
+
+    merged = service.get_task_result(composite.task_id, packed=True)
+
+    assert merged.measurements is None
+    np.testing.assert_array_equal(unpack_measurements(merged.packed_measurements), MEASUREMENTS)
+
+
+def test_multiplexed_split_uses_packed_measurements():
+    """Per-circuit counts are sliced from packed measurements."""
+    circuits = [QuantumCircuit(num_qubits=1, gates=[Gate(name='x', qubits=[0])])] * 2
+    task = MultiplexedTask('task-1', SV1_ARN, circuits, [[0], [1]])
+    result = make_result('task-1', [[1, 0]] * 5 + [[1, 1]] * 3, 8)
+
+    assert task.split(result) == [{'1': 8}, {'0': 5, '1': 3}]
+
+
+def test_describe_results_counts_packed_measurements():
+    """Results carrying only packed measurements can be described and visualized."""
+    with patch('boto3.client'):
+        service = BraketService(region_name='us-west-2')
+    result = make_result('task-1', [[0, 0]] * 3 + [[1, 1]] * 5, 8)
+
+    description = service.describe_results(result)
+
+    assert description['statistics']['total_shots'] == 8
+    assert service._with_counts(result).counts == {'00': 3, '11': 5}
@@ -0,0 +1,257 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Tests for qubit multiplexing."""
+
+import json
+import numpy as np
+import pytest
+from awslabs.amazon_braket_mcp_server.braket_service import BraketService
+from awslabs.amazon_braket_mcp_server.exceptions import CircuitValidationError
+from awslabs.amazon_braket_mcp_server.models import (
+    DeviceInfo,
+    DeviceType,
+    Gate,
+    QuantumCircuit,
+    TaskResult,
+    TaskStatus,
+)
+from awslabs.amazon_braket_mcp_server.multiplexing import (
+    MultiplexedTask,
+    allocate_qubits,
+    bit_matrix_from_counts,
+    demultiplex,
+    measured_qubits,
+    pack_circuits,
+)
+from awslabs.amazon_braket_mcp_server.preflight import find_preflight_errors
+from awslabs.amazon_braket_mcp_server.server import run_multiplexed_tasks
+from unittest.mock import MagicMock, patch
+
+
+GARNET_ARN = 'arn:aws:braket:eu-north-1::device/qpu/iqm/Garnet'
+
+BELL = QuantumCircuit(
+    num_qubits=2,
+    gates=[Gate(name='h', qubits=[0]), Gate(name='cx', qubits=[0, 1]), Gate(name='measure_all')],
+)
+FLIP = QuantumCircuit(
+    num_qubits=3,
+    gates=[Gate(name='x', qubits=[0]), Gate(name='measure', qubits=[0, 2])],
+)
+
+# A line of six qubits: 0 - 1 - 2 - 3 - 4 - 5
+LINE = {str(q): [str(q + 1)] for q in range(5)}
+
+
+def test_measured_qubits():
+    """Explicitly measured qubits are used, otherwise every qubit."""
+    assert measured_qubits(BELL) == [0, 1]
+    assert measured_qubits(FLIP) == [0, 2]
+    assert measured_qubits(QuantumCircuit(num_qubits=2, gates=[])) == [0, 1]
+
+
+def test_allocate_qubits_without_topology():
+    """Without a connectivity graph, circuits get consecutive qubits."""
+    assert allocate_qubits([2, 3], 0) == [[0, 1], [2, 3, 4]]
+    with pytest.raises(CircuitValidationError, match='need 5 qubits'):
+        allocate_qubits([2, 3], 4)
+
+
+def test_allocate_qubits_follows_connectivity():
+    """Circuits are placed on connected regions, largest first."""
+    layouts = allocate_qubits([2, 3], 6, LINE)
+    assert layouts == [[3, 4], [0, 1, 2]]
+
+    # Two disconnected pairs cannot hold a three-qubit circuit
+    with pytest.raises(CircuitValidationError, match='connected region'):
+        allocate_qubits([3], 4, {'0': ['1'], '2': ['3']})
+
+
+def test_pack_circuits_remaps_gates():
+    """Gates are moved to the allocated qubits and every allocated qubit is measured."""
+    packed = pack_circuits([BELL, FLIP], [[3, 4], [0, 1, 2]])
+
+    assert packed.num_qubits == 5
+    assert [(gate.name, gate.qubits) for gate in packed.gates] == [
+        ('h', [3]),
+        ('cx', [3, 4]),
+        ('x', [0]),
+        ('measure', [0, 1, 2, 3, 4]),
+    ]
+
+
+def test_pack_circuits_on_one_based_topology():
+    """Physical qubit labels starting at 1 are kept and pass pre-flight checks."""
+    one_based = {str(q): [str(q + 1)] for q in range(1, 6)}
+    layouts = allocate_qubits([3, 3], 6, one_based)
+    assert layouts == [[1, 2, 3], [4, 5, 6]]
+
+    packed = pack_circuits([FLIP, FLIP], layouts)
+
+    assert packed.num_qubits == 7
+    assert [(gate.name, gate.qubits) for gate in packed.gates] == [
+        ('x', [1]),
+        ('x', [4]),
+        ('measure', [1, 2, 3, 4, 5, 6]),
+    ]
+    device = DeviceInfo(
+        device_arn=GARNET_ARN,
+        device_name='Garnet',
+        device_type=DeviceType.QPU,
+        provider_name='IQM',
+        status='ONLINE',
+        qubits=6,
+        paradigm='gate-based',
+        max_shots=1000,
+        supported_gates=['x'],
+        connectivity_graph=one_based,
+    )
+    assert find_preflight_errors(packed, device, 100, physical=True) == []
+    (error,) = find_preflight_errors(packed, device, 100)
+    assert 'Circuit uses 7 qubits' in error
+    multiplexed = MultiplexedTask('task-1', GARNET_ARN, [FLIP, FLIP], layouts)
+    assert multiplexed.columns == [[0, 2], [3, 5]]
+
+
+def test_demultiplex_slices_columns():
+    """Per-shot bits and weighted counts are split into the same per-circuit counts."""
+    bits = np.array([[1, 0, 0, 0, 0], [1, 0, 0, 1, 1], [1, 0, 0, 0, 0]])
+    columns = [[3, 4], [0, 2]]
+    assert demultiplex(bits, columns) == [{'00': 2, '11': 1}, {'10': 3}]
+
+    counts_bits, weights = bit_matrix_from_counts({'10000': 2, '10011': 1})
+    assert demultiplex(counts_bits, columns, weights) == [{'00': 2, '11': 1}, {'10': 3}]
+
+
+def test_multiplexed_task_splits_results():
+    """Results are split into counts of each circuit's measured qubits."""
+    multiplexed = MultiplexedTask('task-1', GARNET_ARN, [BELL, FLIP], [[3, 4], [0, 1, 2]])
+    result = TaskResult(
+        task_id='task-1',
+        status=TaskStatus.COMPLETED,
+        counts={'10000': 60, '10011': 40},
+        device=GARNET_ARN,
+        shots=100,
+    )
+
+    assert multiplexed.columns == [[3, 4], [0, 2]]
+    assert multiplexed.split(result) == [{'00': 60, '11': 40}, {'10': 100}]
+
+
+@pytest.fixture
+def mock_boto3_client():
+    """Create a mock boto3 client for testing."""
+    with patch('boto3.client') as mock_client:
+        mock_braket = MagicMock()
+        mock_client.return_value = mock_braket
+        yield mock_braket
+
+
+@pytest.fixture
+def braket_service(mock_boto3_client):
+    """Create a BraketService with a mocked client."""
+    return BraketService(region_name='eu-north-1')
+
+
+@patch('awslabs.amazon_braket_mcp_server.braket_service.AwsQuantumTask')
+def test_run_multiplexed_tasks(mock_aws_quantum_task, braket_service, mock_boto3_client):
+    """One task is pinned to the device topology and its results are demultiplexed."""
+    braket_service._cache_device_info(
+        DeviceInfo(
+            device_arn=GARNET_ARN,
+            device_name='Garnet',
+            device_type=DeviceType.QPU,
+            provider_name='IQM',
+            status='ONLINE',
+            qubits=6,
+            paradigm='gate-based',
+            max_shots=1000,
+            supported_gates=['h', 'cnot', 'x'],
+            connectivity_graph=LINE,
+        )
+    )
+    mock_boto3_client.create_quantum_task.return_value = {'quantumTaskArn': 'task-1'}
+
+    multiplexed = braket_service.run_multiplexed_tasks(
+        [BELL, FLIP], GARNET_ARN, shots=100, s3_bucket='bucket', s3_prefix='results'
+    )
+
+    assert multiplexed.task_id == 'task-1'
+    assert multiplexed.layouts == [[3, 4], [0, 1, 2]]
+    assert multiplexed.physical
+    assert mock_boto3_client.create_quantum_task.call_count == 1
+    assert braket_service.has_task_handle('task-1')
+
+    # The placement is sent on physical qubits, which the device may not remap
+    request = mock_boto3_client.create_quantum_task.call_args.kwargs
+    source = json.loads(request['action'])['source']
+    assert 'cnot $3, $4;' in source
+    assert 'b[4] = measure $4;' in source
+    parameters = json.loads(request['deviceParameters'])
+    assert parameters['paradigmParameters']['disableQubitRewiring'] is True
+
+    task = mock_aws_quantum_task.return_value
+    task.metadata.return_value = {'status': 'COMPLETED', 'deviceArn': GARNET_ARN, 'shots': 100}
+    task.result.return_value.measurements.tolist.return_value = [[1, 0, 0, 1, 1]] * 100
+    task.result.return_value.measurement_counts = {'10011': 100}
+
+    results = braket_service.get_multiplexed_results('task-1')
+
+    assert results['status'] == TaskStatus.COMPLETED.value
+    assert results['physical_qubits'] is True
+    assert [circuit['counts'] for circuit in results['circuits']] == [{'11': 100}, {'10': 100}]
+
+
+def test_run_multiplexed_tasks_tool():
+    """The tool returns the task ID and the layout of each circuit."""
+    with patch('awslabs.amazon_braket_mcp_server.server.get_braket_service') as mock_get_service:
+        mock_get_service.return_value.run_multiplexed_tasks.return_value = MultiplexedTask(
+            'task-1', GARNET_ARN, [BELL, FLIP], [[0, 1], [2, 3, 4]]
+        )
+
+        result = run_multiplexed_tasks(
+            circuits=[BELL.model_dump(), FLIP.model_dump()], device_arn=GARNET_ARN
+        )
+
+    assert result['task_id'] == 'task-1'
+    assert result['num_circuits'] == 2
+    assert result['layouts'] == [[0, 1], [2, 3, 4]]
+    assert result['physical_qubits'] is False
+
+
+def test_run_multiplexed_tasks_without_topology(braket_service, mock_boto3_client):
+    """Without a connectivity graph, the device compiler may remap the consecutive qubits."""
+    braket_service._cache_device_info(
+        DeviceInfo(
+            device_arn=GARNET_ARN,
+            device_name='Garnet',
+            device_type=DeviceType.QPU,
+            provider_name='IQM',
+            status='ONLINE',
+            qubits=6,
+            paradigm='gate-based',
+            max_shots=1000,
+            supported_gates=['h', 'cnot', 'x'],
+        )
+    )
+    mock_boto3_client.create_quantum_task.return_value = {'quantumTaskArn': 'task-1'}
+
+    multiplexed = braket_service.run_multiplexed_tasks(
+        [BELL, FLIP], GARNET_ARN, shots=100, s3_bucket='bucket', s3_prefix='results'
+    )
+
+    assert multiplexed.layouts == [[0, 1], [2, 3, 4]]
+    assert not multiplexed.physical
+    request = mock_boto3_client.create_quantum_task.call_args.kwargs
+    assert 'qubit[5] q;' in json.loads(request['action'])['source']
+    parameters = json.loads(request['deviceParameters'])
+    assert parameters['paradigmParameters']['disableQubitRewiring'] is False
@@ -0,0 +1,163 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Tests for direct OpenQASM emission and submission."""
+
+import json
+import pytest
+from awslabs.amazon_braket_mcp_server.braket_circuits import build_braket_circuit
+from awslabs.amazon_braket_mcp_server.braket_service import BraketService
+from awslabs.amazon_braket_mcp_server.exceptions import CircuitCreationError
+from awslabs.amazon_braket_mcp_server.models import Gate, QuantumCircuit
+from awslabs.amazon_braket_mcp_server.openqasm import (
+    device_parameters,
+    emit_openqasm,
+    program_action,
+)
+from braket.circuits.serialization import (
+    IRType,
+    OpenQASMSerializationProperties,
+    QubitReferenceType,
+)
+from unittest.mock import patch
+
+
+SV1_ARN = 'arn:aws:braket:::device/quantum-simulator/amazon/sv1'
+ARIA_ARN = 'arn:aws:braket:us-east-1::device/qpu/ionq/Aria-1'
+
+CIRCUITS = [
+    QuantumCircuit(
+        num_qubits=3,
+        gates=[
+            Gate(name='h', qubits=[2]),
+            Gate(name='cx', qubits=[2, 0]),
+            Gate(name='rx', qubits=[1], params=['theta']),
+            Gate(name='rz', qubits=[0], params=[0.1]),
+        ],
+    ),
+    QuantumCircuit(
+        num_qubits=4,
+        gates=[
+            Gate(name='h', qubits=[0]),
+            Gate(name='cz', qubits=[0, 1]),
+            Gate(name='measure_all'),
+        ],
+    ),
+    QuantumCircuit(
+        num_qubits=3,
+        gates=[
+            Gate(name='ry', qubits=[0], params=['phi']),
+            Gate(name='rx', qubits=[0], params=[1]),
+            Gate(name='swap', qubits=[0, 2]),
+            Gate(name='measure', qubits=[2, 0]),
+        ],
+    ),
+    QuantumCircuit(num_qubits=2, gates=[Gate(name='x', qubits=[1]), Gate(name='measure_all')]),
+]
+
+
+def sdk_source(circuit: QuantumCircuit, verbatim: bool, physical: bool = False) -> str:
+    """Serialize a circuit definition through the Braket SDK."""
+    properties = OpenQASMSerializationProperties(
+        qubit_reference_type=(
+            QubitReferenceType.PHYSICAL if verbatim or physical else QubitReferenceType.VIRTUAL
+        )
+    )
+    return (
+        build_braket_circuit(circuit, verbatim=verbatim)
+        .to_ir(IRType.OPENQASM, serialization_properties=properties)
+        .source
+    )
+
+
+@pytest.mark.parametrize('verbatim, physical', [(False, False), (False, True), (True, False)])
+@pytest.mark.parametrize('circuit', CIRCUITS)
+def test_emission_matches_sdk(circuit, verbatim, physical):
+    """Emitted programs are identical to the Braket SDK serialization."""
+    source, qubit_count = emit_openqasm(circuit, verbatim, physical)
+
+    assert source == sdk_source(circuit, verbatim, physical)
+    assert qubit_count == build_braket_circuit(circuit, verbatim=verbatim).qubit_count
+
+
+def test_unsupported_gate():
+    """Unknown gates are rejected."""
+    with pytest.raises(CircuitCreationError, match='Unsupported gate'):
+        emit_openqasm(QuantumCircuit(num_qubits=1, gates=[Gate(name='foo', qubits=[0])]))
+
+
+def test_numeric_string_params():
+    """Numeric strings are emitted as numbers, not as free parameters."""
+    circuit = QuantumCircuit(num_qubits=1, gates=[Gate(name='rx', qubits=[0], params=['0.5'])])
+
+    source, _ = emit_openqasm(circuit)
+
+    assert 'input float' not in source
+    assert 'rx(0.5) q[0];' in source
+
+
+def test_request_documents():
+    """Actions carry the program and inputs; device parameters follow the device provider."""
+    action = json.loads(program_action('OPENQASM 3.0;', {'theta': 0.5}))
+    assert action['braketSchemaHeader']['name'] == 'braket.ir.openqasm.program'
+    assert action['inputs'] == {'theta': 0.5}
+
+    simulator = json.loads(device_parameters(SV1_ARN, 2, False))
+    ionq = json.loads(device_parameters(ARIA_ARN, 2, True))
+    assert simulator['braketSchemaHeader']['name'].endswith(
+        'gate_model_simulator_device_parameters'
+    )
+    assert ionq['braketSchemaHeader']['name'] == 'braket.device_schema.ionq.ionq_device_parameters'
+    assert ionq['paradigmParameters'] == {
+        'braketSchemaHeader': {
+            'name': 'braket.device_schema.gate_model_parameters',
+            'version': '1',
+        },
+        'qubitCount': 2,
+        'disableQubitRewiring': True,
+    }
+
+
+def test_emission_matches_sdk_for_deep_circuits():
+    """Deep parameterized circuits are emitted exactly as the SDK serializes them."""
+    gates = []
+    for _ in range(10):
+        gates.extend(Gate(name='rx', qubits=[q], params=[0.1 * q]) for q in range(10))
+        gates.extend(Gate(name='cx', qubits=[q, q + 1]) for q in range(9))
+    circuit = QuantumCircuit(num_qubits=10, gates=gates)
+
+    assert emit_openqasm(circuit)[0] == sdk_source(circuit, False)
+
+
+@pytest.fixture
+def braket_service():
+    """Create a BraketService with a mocked client."""
+    with patch('boto3.client'):
+        return BraketService(region_name='us-west-2')
+
+
+@patch('awslabs.amazon_braket_mcp_server.braket_service.AwsDevice')
+def test_direct_submission(mock_aws_device, braket_service, monkeypatch):
+    """Circuit definitions are submitted with CreateQuantumTask without the SDK device."""
+    monkeypatch.setenv('AMZN_BRAKET_TASK_RESULTS_S3_URI', 's3://bucket/results')
+    create = braket_service.braket_client.create_quantum_task
+    create.return_value = {'quantumTaskArn': 'task-1'}
+
+    task_id = braket_service.run_quantum_task(CIRCUITS[1], SV1_ARN, shots=100)
+
+    request = create.call_args.kwargs
+    assert task_id == 'task-1'
+    assert request['deviceArn'] == SV1_ARN
+    assert request['shots'] == 100
+    assert (request['outputS3Bucket'], request['outputS3KeyPrefix']) == ('bucket', 'results')
+    assert json.loads(request['action'])['source'] == sdk_source(CIRCUITS[1], False)
+    assert json.loads(request['deviceParameters'])['paradigmParameters']['qubitCount'] == 4
+    assert not mock_aws_device.called
@@ -0,0 +1,172 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Tests for background prefetching of task results."""
+
+import pytest
+import time
+from awslabs.amazon_braket_mcp_server import server
+from awslabs.amazon_braket_mcp_server.braket_service import BraketService
+from awslabs.amazon_braket_mcp_server.exceptions import ThrottlingError
+from awslabs.amazon_braket_mcp_server.models import TaskStatus
+from awslabs.amazon_braket_mcp_server.prefetcher import ResultPrefetcher
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+
+SV1_ARN = 'arn:aws:braket:::device/quantum-simulator/amazon/sv1'
+
+
+class Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        """Start the clock at zero."""
+        self.now = 0.0
+
+    def __call__(self):
+        """Return the current time."""
+        return self.now
+
+
+@pytest.fixture
+def executor():
+    """Executor running prefetcher checks."""
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+def make_prefetcher(get_status, fetch_result=None, **kwargs):
+    """Create a prefetcher with a manual clock and intervals of 2 to 8 seconds."""
+    clock = Clock()
+    prefetcher = ResultPrefetcher(
+        get_status,
+        fetch_result or MagicMock(),
+        base_interval=2.0,
+        max_interval=8.0,
+        clock=clock,
+        **kwargs,
+    )
+    return prefetcher, clock
+
+
+def poll_at(prefetcher, clock, now, executor):
+    """Advance the clock and check the due tasks."""
+    clock.now = now
+    return prefetcher.poll_due(executor)
+
+
+def test_checks_back_off_until_the_status_changes(executor):
+    """A task's interval doubles while its status stays the same and resets on a change."""
+    statuses = iter([TaskStatus.QUEUED] * 3 + [TaskStatus.RUNNING, TaskStatus.RUNNING])
+    prefetcher, clock = make_prefetcher(lambda task_id: next(statuses))
+    prefetcher.watch('t1')
+
+    checks = [now for now in range(0, 21) if poll_at(prefetcher, clock, now, executor) == ['t1']]
+
+    # QUEUED is first seen at 2, then unchanged at 4 and 8; RUNNING at 16 resets to 2 seconds
+    assert checks == [2, 4, 8, 16, 18]
+    assert prefetcher.watched == {'t1': TaskStatus.RUNNING}
+
+
+def test_results_are_fetched_once_tasks_finish(executor):
+    """Finished tasks are fetched once and no longer watched."""
+    statuses = {'t1': TaskStatus.COMPLETED, 't2': TaskStatus.RUNNING, 't3': TaskStatus.FAILED}
+    fetch_result = MagicMock()
+    prefetcher, clock = make_prefetcher(statuses.get, fetch_result)
+    for task_id in statuses:
+        prefetcher.watch(task_id)
+    prefetcher.watch('t1')
+
+    assert sorted(poll_at(prefetcher, clock, 2, executor)) == ['t1', 't2', 't3']
+
+    assert sorted(call.args[0] for call in fetch_result.call_args_list) == ['t1', 't3']
+    assert prefetcher.prefetched == 2
+    assert prefetcher.watched == {'t2': TaskStatus.RUNNING}
+
+
+def test_throttled_and_failed_lookups(executor):
+    """Throttled lookups wait for retry_after; failed fetches are left to the agent."""
+    get_status = MagicMock(
+        side_effect=[ThrottlingError('slow down', retry_after=5.0), TaskStatus.COMPLETED]
+    )
+    fetch_result = MagicMock(side_effect=Exception('access denied'))
+    prefetcher, clock = make_prefetcher(get_status, fetch_result)
+    prefetcher.watch('t1')
+
+    assert poll_at(prefetcher, clock, 2, executor) == ['t1']
+    assert poll_at(prefetcher, clock, 6, executor) == []
+    assert poll_at(prefetcher, clock, 7, executor) == ['t1']
+
+    assert prefetcher.watched == {}
+    assert prefetcher.prefetched == 0
+
+
+def test_oldest_tasks_are_dropped(executor):
+    """Only the most recently watched tasks are kept."""
+    get_status = MagicMock(return_value=TaskStatus.QUEUED)
+    prefetcher, clock = make_prefetcher(get_status, max_tasks=2)
+    for task_id in ['t1', 't2', 't3']:
+        prefetcher.watch(task_id)
+
+    assert sorted(poll_at(prefetcher, clock, 2, executor)) == ['t2', 't3']
+
+
+@patch('awslabs.amazon_braket_mcp_server.braket_service.AwsQuantumTask')
+def test_created_tasks_are_prefetched_into_the_cache(mock_aws_quantum_task):
+    """A created task's result is cached in the background once it completes."""
+    with patch('boto3.client'):
+        service = BraketService(region_name='us-west-2', prefetch_results=True)
+    service.braket_client.create_quantum_task.return_value = {'quantumTaskArn': 't1'}
+    service.braket_client.get_quantum_task.return_value = {'status': 'COMPLETED'}
+    task = mock_aws_quantum_task.return_value
+    task.metadata.return_value = {'status': 'COMPLETED', 'deviceArn': SV1_ARN, 'shots': 10}
+    task.result.return_value.measurements = None
+    task.result.return_value.measurement_counts = {'00': 10}
+    service._get_prefetcher().base_interval = 0.01
+
+    try:
+        service._create_task_direct(SV1_ARN, '{}', '{}', 10, 'bucket', 'prefix', None)
+        deadline = time.monotonic() + 5
+        while service.result_cache.get('t1') is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        service.stop_prefetcher(timeout=5)
+
+    assert service.result_cache.get('t1').counts == {'00': 10}
+    assert service.get_task_result('t1').counts == {'00': 10}
+    assert task.result.call_count == 1
+
+
+def test_prefetching_is_opt_in():
+    """Services only watch created tasks when prefetching is enabled."""
+    with patch('boto3.client'):
+        service = BraketService(region_name='us-west-2')
+    service.braket_client.create_quantum_task.return_value = {'quantumTaskArn': 't1'}
+
+    service._create_task_direct(SV1_ARN, '{}', '{}', 10, 'bucket', 'prefix', None)
+
+    assert service._prefetcher is None
+
+
+def test_server_leaves_prefetching_off_by_default(monkeypatch, tmp_path):
+    """The server only prefetches results when BRAKET_PREFETCH_RESULTS enables it."""
+    monkeypatch.delenv('BRAKET_PREFETCH_RESULTS', raising=False)
+    monkeypatch.setenv('AWS_REGION', 'us-west-2')
+    monkeypatch.setenv('BRAKET_WORKSPACE_DIR', str(tmp_path))
+    monkeypatch.setattr(server, '_service_pool', None)
+    with patch('boto3.client'):
+        service = server.get_service_pool().get()
+    service.braket_client.create_quantum_task.return_value = {'quantumTaskArn': 't1'}
+
+    service._create_task_direct(SV1_ARN, '{}', '{}', 10, 'bucket', 'prefix', None)
+
+    assert service._prefetcher is None
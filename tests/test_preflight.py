@@ -0,0 +1,339 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Tests for pre-flight validation and device information caching."""
+
+import json
+import pytest
+from awslabs.amazon_braket_mcp_server.braket_service import BraketService
+from awslabs.amazon_braket_mcp_server.exceptions import CircuitValidationError
+from awslabs.amazon_braket_mcp_server.models import (
+    DeviceInfo,
+    DeviceType,
+    Gate,
+    QuantumCircuit,
+)
+from awslabs.amazon_braket_mcp_server.preflight import (
+    find_preflight_errors,
+    find_verbatim_errors,
+    validate_circuit_for_device,
+)
+from awslabs.amazon_braket_mcp_server.server import validate_quantum_task
+from unittest.mock import MagicMock, patch
+
+
+ARIA_ARN = 'arn:aws:braket:us-east-1::device/qpu/ionq/Aria-1'
+
+
+def make_device(**overrides):
+    """Build device information for a small QPU."""
+    fields = {
+        'device_arn': ARIA_ARN,
+        'device_name': 'Aria 1',
+        'device_type': DeviceType.QPU,
+        'provider_name': 'IonQ',
+        'status': 'ONLINE',
+        'qubits': 4,
+        'paradigm': 'gate-based',
+        'max_shots': 5000,
+        'supported_gates': ['h', 'x', 'cnot', 'rz'],
+    }
+    fields.update(overrides)
+    return DeviceInfo(**fields)
+
+
+BELL = QuantumCircuit(
+    num_qubits=2,
+    gates=[Gate(name='h', qubits=[0]), Gate(name='cx', qubits=[0, 1]), Gate(name='measure_all')],
+)
+
+
+class TestPreflightChecks:
+    """Test the individual pre-flight checks."""
+
+    def test_valid_request(self):
+        """A request within the device capabilities passes, using gate aliases."""
+        assert find_preflight_errors(BELL, make_device(), 100) == []
+        validate_circuit_for_device(BELL, make_device(), 100)
+
+    def test_offline_device(self):
+        """Devices that are not online are rejected."""
+        errors = find_preflight_errors(BELL, make_device(status='OFFLINE'), 100)
+        assert errors == ['Device Aria 1 is OFFLINE and not accepting tasks']
+
+    def test_too_many_qubits(self):
+        """Circuits wider than the device are rejected."""
+        wide = QuantumCircuit(num_qubits=6, gates=[Gate(name='h', qubits=[5])])
+        errors = find_preflight_errors(wide, make_device(), 100)
+        assert errors == ['Circuit uses 6 qubits but device Aria 1 supports at most 4']
+
+    def test_qubit_out_of_range(self):
+        """Gates targeting qubits outside the circuit are rejected."""
+        circuit = QuantumCircuit(num_qubits=2, gates=[Gate(name='x', qubits=[2])])
+        errors = find_preflight_errors(circuit, make_device(), 100)
+        assert errors == ['Gate 0 (x) targets qubits [2] outside the 2-qubit circuit']
+
+    def test_unsupported_gates(self):
+        """Gates the device does not support are listed."""
+        circuit = QuantumCircuit(
+            num_qubits=3, gates=[Gate(name='ccx', qubits=[0, 1, 2]), Gate(name='t', qubits=[0])]
+        )
+        (error,) = find_preflight_errors(circuit, make_device(), 100)
+        assert "does not support gates ['ccx', 't']" in error
+
+    def test_shots(self):
+        """Negative shots and zero shots on a QPU are rejected."""
+        assert find_preflight_errors(BELL, make_device(), -1) == [
+            'Shots must not be negative, got -1'
+        ]
+        assert find_preflight_errors(BELL, make_device(), 0) == [
+            'QPU Aria 1 requires at least one shot'
+        ]
+        assert find_preflight_errors(BELL, make_device(device_type=DeviceType.SIMULATOR), 0) == []
+
+    def test_unbound_parameters(self):
+        """Named parameters are rejected unless they are bound later as task inputs."""
+        circuit = QuantumCircuit(
+            num_qubits=1, gates=[Gate(name='rz', qubits=[0], params=['theta', '0.5'])]
+        )
+        assert circuit.gates[0].params == ['theta', 0.5]
+
+        assert find_preflight_errors(circuit, make_device(), 100) == [
+            "Gate parameters ['theta'] are not bound to numbers; free parameters are only "
+            'supported by run_parameter_sweep'
+        ]
+        assert find_preflight_errors(circuit, make_device(), 100, free_parameters=True) == []
+
+    def test_non_gate_paradigm(self):
+        """Annealing and analog devices cannot run gate circuits."""
+        (error,) = find_preflight_errors(
+            BELL, make_device(paradigm='analog-hamiltonian-simulation', supported_gates=[]), 100
+        )
+        assert 'cannot run gate-based circuits' in error
+
+    def test_validation_error_combines_reasons(self):
+        """All failures are reported in one exception."""
+        with pytest.raises(CircuitValidationError, match='OFFLINE.*at least one shot'):
+            validate_circuit_for_device(BELL, make_device(status='OFFLINE'), 0)
+
+
+GARNET_ARN = 'arn:aws:braket:eu-north-1::device/qpu/iqm/Garnet'
+
+# Native circuit on physical qubits 1 and 2 of a 0 - 1 - 2 - 3 line
+NATIVE = QuantumCircuit(
+    num_qubits=4,
+    gates=[
+        Gate(name='prx', qubits=[1], params=[0.5, 0.0]),
+        Gate(name='cz', qubits=[1, 2]),
+        Gate(name='measure', qubits=[1, 2]),
+    ],
+)
+
+
+def make_native_device(**overrides):
+    """Build device information for a QPU with native gates and a line topology."""
+    fields = {
+        'device_arn': GARNET_ARN,
+        'device_name': 'Garnet',
+        'device_type': DeviceType.QPU,
+        'provider_name': 'IQM',
+        'status': 'ONLINE',
+        'qubits': 4,
+        'paradigm': 'gate-based',
+        'max_shots': 1000,
+        'supported_gates': ['h', 'cnot', 'cz'],
+        'connectivity_graph': {'0': ['1'], '1': ['2'], '2': ['3']},
+        'native_gates': ['cz', 'prx'],
+    }
+    fields.update(overrides)
+    return DeviceInfo(**fields)
+
+
+class TestVerbatimChecks:
+    """Test the checks of pre-compiled circuits run verbatim."""
+
+    def test_native_circuit(self):
+        """Native gates on connected qubits pass, without the supported gates check."""
+        assert find_preflight_errors(NATIVE, make_native_device(), 100, verbatim=True) == []
+        (error,) = find_preflight_errors(NATIVE, make_native_device(), 100)
+        assert 'does not support gates' in error
+
+    def test_non_native_gates(self):
+        """Gates outside the native gate set are rejected."""
+        (error,) = find_verbatim_errors(BELL, make_native_device())
+        assert "Gates ['cx', 'h'] are not native" in error
+
+    def test_unconnected_qubits(self):
+        """Two-qubit gates must act on connected physical qubits."""
+        circuit = QuantumCircuit(num_qubits=4, gates=[Gate(name='cz', qubits=[0, 3])])
+        (error,) = find_verbatim_errors(circuit, make_native_device())
+        assert 'unconnected qubits [(0, 3)]' in error
+
+    def test_qubit_labels(self):
+        """Verbatim qubits are checked against the device's labels, which may start at 1."""
+        device = make_native_device(connectivity_graph={'1': ['2'], '2': ['3'], '3': ['4']})
+        top = QuantumCircuit(
+            num_qubits=5,
+            gates=[Gate(name='cz', qubits=[3, 4]), Gate(name='measure', qubits=[3, 4])],
+        )
+        assert find_preflight_errors(top, device, 100, verbatim=True) == []
+
+        bottom = QuantumCircuit(num_qubits=2, gates=[Gate(name='cz', qubits=[0, 1])])
+        (error,) = find_preflight_errors(bottom, device, 100, verbatim=True)
+        assert error == (
+            'Circuit targets qubits [0] that device Garnet does not have; '
+            'its qubits are [1, 2, 3, 4]'
+        )
+
+    def test_unknown_device_data_is_skipped(self):
+        """Checks without native gate or connectivity data are skipped."""
+        device = make_native_device(native_gates=[], connectivity_graph=None)
+        assert find_verbatim_errors(BELL, device) == []
+
+
+@pytest.fixture
+def mock_boto3_client():
+    """Create a mock boto3 client for testing."""
+    with patch('boto3.client') as mock_client:
+        mock_braket = MagicMock()
+        mock_client.return_value = mock_braket
+        yield mock_braket
+
+
+GET_DEVICE_RESPONSE = {
+    'deviceArn': ARIA_ARN,
+    'deviceName': 'Aria 1',
+    'deviceType': 'QPU',
+    'providerName': 'IonQ',
+    'deviceStatus': 'OFFLINE',
+    'deviceCapabilities': json.dumps(
+        {
+            'service': {'shotsRange': [1, 5000]},
+            'action': {'braket.ir.openqasm.program': {'supportedOperations': ['h', 'x', 'cnot']}},
+            'paradigm': {
+                'qubitCount': 25,
+                'connectivity': {'fullyConnected': True, 'connectivityGraph': {}},
+            },
+        }
+    ),
+}
+
+
+class TestServiceIntegration:
+    """Test pre-flight checks and caching in the service."""
+
+    def test_parses_serialized_capabilities(self, mock_boto3_client):
+        """Device capabilities returned as JSON documents are parsed."""
+        mock_boto3_client.get_device.return_value = GET_DEVICE_RESPONSE
+        service = BraketService(region_name='us-east-1')
+
+        device = service.get_device_info(ARIA_ARN)
+
+        assert device.qubits == 25
+        assert device.max_shots == 5000
+        assert device.supported_gates == ['h', 'x', 'cnot']
+        assert device.paradigm == 'gate-based'
+        assert device.connectivity == 'full'
+
+    def test_device_info_is_cached(self, mock_boto3_client):
+        """Repeated lookups within the TTL hit the cache."""
+        mock_boto3_client.get_device.return_value = GET_DEVICE_RESPONSE
+        service = BraketService(region_name='us-east-1')
+
+        service.get_device_info(ARIA_ARN)
+        service.get_device_info(ARIA_ARN)
+        assert mock_boto3_client.get_device.call_count == 1
+
+        service.get_device_info(ARIA_ARN, use_cache=False)
+        assert mock_boto3_client.get_device.call_count == 2
+
+    def test_device_summaries_are_not_cached(self, mock_boto3_client):
+        """Listing devices leaves pre-flight checks on full device capabilities."""
+        summary = {
+            key: GET_DEVICE_RESPONSE[key]
+            for key in ('deviceArn', 'deviceName', 'deviceType', 'providerName')
+        }
+        mock_boto3_client.search_devices.return_value = {
+            'devices': [dict(summary, deviceStatus='ONLINE')]
+        }
+        mock_boto3_client.get_device.return_value = dict(
+            GET_DEVICE_RESPONSE, deviceStatus='ONLINE'
+        )
+        service = BraketService(region_name='us-east-1')
+        wide = QuantumCircuit(num_qubits=40, gates=[Gate(name='h', qubits=[39])])
+
+        service.list_devices()
+        device = service.get_device_info(ARIA_ARN)
+
+        assert mock_boto3_client.get_device.call_count == 1
+        assert find_preflight_errors(wide, device, 100) == [
+            'Circuit uses 40 qubits but device Aria 1 supports at most 25'
+        ]
+
+    @patch('awslabs.amazon_braket_mcp_server.braket_service.AwsDevice')
+    def test_rejects_before_compiling(self, mock_aws_device, mock_boto3_client):
+        """Rejected submissions never reach compilation or AWS."""
+        mock_boto3_client.get_device.return_value = GET_DEVICE_RESPONSE
+        service = BraketService(region_name='us-east-1')
+        service.create_qiskit_circuit = MagicMock()
+
+        with pytest.raises(CircuitValidationError, match='OFFLINE'):
+            service.run_quantum_task(BELL, ARIA_ARN, shots=100)
+
+        assert not service.create_qiskit_circuit.called
+        assert not mock_aws_device.called
+
+    def test_rejects_unbound_parameters_without_device_info(self, mock_boto3_client):
+        """Unbound parameters are rejected even when the device checks are skipped."""
+        mock_boto3_client.get_device.side_effect = RuntimeError('unavailable')
+        service = BraketService(region_name='us-east-1')
+        circuit = QuantumCircuit(
+            num_qubits=1, gates=[Gate(name='rx', qubits=[0], params=['theta'])]
+        )
+
+        with pytest.raises(CircuitValidationError, match='not bound'):
+            service.run_quantum_task(circuit, ARIA_ARN, shots=100)
+
+        mock_boto3_client.create_quantum_task.assert_not_called()
+
+    def test_verbatim_submission(self, mock_boto3_client):
+        """Verbatim circuits run in a verbatim box with qubit rewiring disabled."""
+        service = BraketService(region_name='eu-north-1')
+        service._cache_device_info(make_native_device())
+        mock_boto3_client.create_quantum_task.return_value = {'quantumTaskArn': 'task-1'}
+
+        task_id = service.run_quantum_task(
+            NATIVE, GARNET_ARN, shots=100, s3_bucket='bucket', s3_prefix='results', verbatim=True
+        )
+
+        assert task_id == 'task-1'
+
+        request = mock_boto3_client.create_quantum_task.call_args.kwargs
+        parameters = json.loads(request['deviceParameters'])
+        assert parameters['paradigmParameters']['disableQubitRewiring'] is True
+        assert '#pragma braket verbatim' in json.loads(request['action'])['source']
+
+        with pytest.raises(CircuitValidationError, match='not native'):
+            service.run_quantum_task(BELL, GARNET_ARN, shots=100, verbatim=True)
+
+
+def test_validate_quantum_task_tool():
+    """The validation tool reports reasons without submitting."""
+    with patch('awslabs.amazon_braket_mcp_server.server.get_braket_service') as mock_get_service:
+        mock_get_service.return_value.validate_quantum_task.return_value = ['Device is OFFLINE']
+
+        result = validate_quantum_task(
+            circuit={'num_qubits': 1, 'gates': [{'name': 'h', 'qubits': [0]}]},
+            device_arn=ARIA_ARN,
+        )
+
+    assert result['valid'] is False
+    assert result['errors'] == ['Device is OFFLINE']
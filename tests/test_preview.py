@@ -0,0 +1,132 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Tests for local simulator previews."""
+
+import pytest
+import time
+from awslabs.amazon_braket_mcp_server.braket_service import BraketService
+from awslabs.amazon_braket_mcp_server.models import Gate, QuantumCircuit, TaskStatus
+from awslabs.amazon_braket_mcp_server.preview import PREVIEW_SOURCE, LocalPreviews
+from braket.circuits import Circuit
+from unittest.mock import patch
+
+
+SV1_ARN = 'arn:aws:braket:::device/quantum-simulator/amazon/sv1'
+
+BELL = QuantumCircuit(
+    num_qubits=2,
+    gates=[Gate(name='h', qubits=[0]), Gate(name='cx', qubits=[0, 1]), Gate(name='measure_all')],
+)
+
+
+def wait_for_preview(previews, task_id):
+    """Wait until a preview is no longer running."""
+    deadline = time.monotonic() + 10
+    while previews.get(task_id)['status'] == 'RUNNING' and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return previews.get(task_id)
+
+
+def test_preview_runs_locally():
+    """Circuits are simulated in the background and labeled as previews."""
+    previews = LocalPreviews()
+
+    assert previews.start('task-1', Circuit().x(0).cnot(0, 1), 2, 100)
+    preview = wait_for_preview(previews, 'task-1')
+
+    assert preview['status'] == 'COMPLETED'
+    assert preview['source'] == PREVIEW_SOURCE
+    assert preview['approximate'] is True
+    assert preview['counts'] == {'11': 100}
+
+    previews.discard('task-1')
+    assert previews.get('task-1') is None
+
+
+def test_oldest_previews_are_dropped():
+    """Only the most recent previews are kept."""
+    previews = LocalPreviews(max_previews=2)
+
+    for task_id in ('task-1', 'task-2', 'task-3'):
+        previews.start(task_id, Circuit().h(0), 1, 10)
+
+    assert not previews.has('task-1')
+    assert previews.has('task-2')
+    assert previews.has('task-3')
+
+
+def test_large_circuits_are_not_previewed():
+    """Circuits above the qubit limit are not simulated."""
+    previews = LocalPreviews(max_qubits=1)
+
+    assert not previews.start('task-1', Circuit().h(0).cnot(0, 1), 2, 100)
+    assert not previews.has('task-1')
+
+
+def test_failed_preview_reports_error():
+    """Simulation errors are reported in the preview."""
+    previews = LocalPreviews()
+    previews.start('task-1', Circuit().h(0), 1, -1)
+
+    preview = wait_for_preview(previews, 'task-1')
+
+    assert preview['status'] == 'FAILED'
+    assert preview['error']
+
+
+@pytest.fixture
+def braket_service():
+    """Create a BraketService with a mocked client."""
+    with patch('boto3.client'):
+        return BraketService(region_name='us-west-2')
+
+
+@patch('awslabs.amazon_braket_mcp_server.braket_service.AwsQuantumTask')
+def test_task_result_carries_preview_until_completed(mock_aws_quantum_task, braket_service):
+    """The preview is attached while the task is queued and dropped once it completes."""
+    braket_service.braket_client.create_quantum_task.return_value = {'quantumTaskArn': 'task-1'}
+    task_id = braket_service.run_quantum_task(
+        BELL, SV1_ARN, shots=100, s3_bucket='bucket', s3_prefix='results', preview=True
+    )
+    wait_for_preview(braket_service.previews, task_id)
+
+    task = mock_aws_quantum_task.return_value
+    task.metadata.return_value = {'status': 'QUEUED', 'deviceArn': SV1_ARN, 'shots': 100}
+    queued = braket_service.get_task_result(task_id)
+
+    assert queued.status == TaskStatus.QUEUED
+    assert queued.counts is None
+    assert queued.preview['status'] == 'COMPLETED'
+    assert sum(queued.preview['counts'].values()) == 100
+    assert set(queued.preview['counts']) <= {'00', '11'}
+
+    task.metadata.return_value = {'status': 'COMPLETED', 'deviceArn': SV1_ARN, 'shots': 100}
+    task.result.return_value.measurements.tolist.return_value = []
+    task.result.return_value.measurement_counts = {'00': 50, '11': 50}
+    completed = braket_service.get_task_result(task_id)
+
+    assert completed.preview is None
+    assert completed.counts == {'00': 50, '11': 50}
+    assert not braket_service.previews.has(task_id)
+
+
+@patch('awslabs.amazon_braket_mcp_server.braket_service.AwsQuantumTask')
+def test_terminal_result_drops_preview(mock_aws_quantum_task, braket_service):
+    """The preview is dropped whichever path builds the terminal result."""
+    braket_service.previews.start('task-1', Circuit().h(0), 1, 10)
+    task = mock_aws_quantum_task.return_value
+
+    braket_service._build_task_result('task-1', task, {'status': 'QUEUED'}, False)
+    assert braket_service.previews.has('task-1')
+
+    braket_service._build_task_result('task-1', task, {'status': 'CANCELLED'}, False)
+    assert not braket_service.previews.has('task-1')
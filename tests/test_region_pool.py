@@ -0,0 +1,135 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Tests for the region-keyed service pool."""
+
+import pytest
+from awslabs.amazon_braket_mcp_server.exceptions import DeviceError
+from awslabs.amazon_braket_mcp_server.models import DeviceInfo, DeviceType
+from awslabs.amazon_braket_mcp_server.region_pool import (
+    BraketServicePool,
+    list_devices_across_regions,
+    region_from_arn,
+)
+from unittest.mock import MagicMock
+
+
+SV1_ARN = 'arn:aws:braket:::device/quantum-simulator/amazon/sv1'
+ARIA_ARN = 'arn:aws:braket:us-east-1::device/qpu/ionq/Aria-1'
+GARNET_ARN = 'arn:aws:braket:eu-north-1::device/qpu/iqm/Garnet'
+
+
+def make_device(device_arn):
+    """Build device information for an ARN."""
+    return DeviceInfo(
+        device_arn=device_arn,
+        device_name=device_arn.rsplit('/', 1)[-1],
+        device_type=DeviceType.QPU,
+        provider_name='Test',
+        status='ONLINE',
+        qubits=2,
+        paradigm='gate-based',
+        max_shots=100,
+    )
+
+
+def make_pool(tmp_path=None):
+    """Create a pool of mock services that record their region."""
+
+    def factory(region, **shared):
+        service = MagicMock()
+        service.region_name = region
+        service.shared = shared
+        service.has_task_handle.return_value = False
+        return service
+
+    return BraketServicePool(
+        factory, default_region='us-west-2', workspace_dir=str(tmp_path) if tmp_path else None
+    )
+
+
+def test_region_from_arn():
+    """Regions are read from device and task ARNs."""
+    assert region_from_arn(ARIA_ARN) == 'us-east-1'
+    assert (
+        region_from_arn('arn:aws:braket:eu-north-1:123456789012:quantum-task/abc') == 'eu-north-1'
+    )
+    assert region_from_arn(SV1_ARN) is None
+    assert region_from_arn('composite-123') is None
+    assert region_from_arn(None) is None
+
+
+def test_services_are_created_lazily_per_region(tmp_path):
+    """Each region gets one service, sharing the rate limiter and submission worker."""
+    pool = make_pool(tmp_path)
+
+    aria = pool.for_arn(ARIA_ARN)
+    assert aria.region_name == 'us-east-1'
+    assert pool.for_arn(ARIA_ARN) is aria
+    assert pool.for_arn(SV1_ARN).region_name == 'us-west-2'
+    assert pool.get().region_name == 'us-west-2'
+
+    garnet = pool.for_arn(GARNET_ARN)
+    assert garnet.shared['rate_limiter'] is aria.shared['rate_limiter']
+    assert garnet.shared['submission_worker'] is pool.submission_worker
+    pool.submission_worker.journal.close()
+
+
+def test_composite_tasks_route_to_their_service():
+    """Composite task and sweep IDs are routed to the service holding them."""
+    pool = make_pool()
+    aria = pool.for_arn(ARIA_ARN)
+    pool.get()
+    aria.has_task_handle.side_effect = lambda handle: handle in ('composite-1', 'sweep-1')
+
+    assert pool.for_arn('composite-1') is aria
+    assert pool.for_arn('sweep-1') is aria
+    assert pool.for_arn('composite-2') is pool.get()
+
+
+def test_held_task_arns_route_to_their_service():
+    """Task ARNs held by a service (e.g. multiplexed simulator tasks) are routed to it."""
+    pool = make_pool()
+    default = pool.for_arn(SV1_ARN)
+    task_arn = 'arn:aws:braket:us-east-1:123456789012:quantum-task/abc'
+    default.has_task_handle.side_effect = lambda handle: handle == task_arn
+
+    assert pool.for_arn(task_arn) is default
+    assert pool.for_arn(ARIA_ARN).region_name == 'us-east-1'
+
+
+def test_list_devices_merges_regions():
+    """Devices are listed in every region and merged without duplicates."""
+    devices = {
+        'us-east-1': [make_device(SV1_ARN), make_device(ARIA_ARN)],
+        'eu-north-1': [make_device(SV1_ARN), make_device(GARNET_ARN)],
+    }
+
+    def get_service(region):
+        service = MagicMock()
+        if region in devices:
+            service.list_devices.return_value = devices[region]
+        else:
+            service.list_devices.side_effect = Exception('not available')
+        return service
+
+    merged = list_devices_across_regions(get_service, ['us-east-1', 'eu-north-1', 'us-west-1'])
+
+    assert [device.device_arn for device in merged] == [SV1_ARN, GARNET_ARN, ARIA_ARN]
+
+
+def test_list_devices_fails_when_no_region_responds():
+    """An error is raised if no region can be listed."""
+    service = MagicMock()
+    service.list_devices.side_effect = Exception('no credentials')
+
+    with pytest.raises(DeviceError):
+        list_devices_across_regions(lambda region: service, ['us-east-1', 'us-west-1'])
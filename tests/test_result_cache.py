@@ -0,0 +1,103 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Tests for the terminal task result cache."""
+
+from awslabs.amazon_braket_mcp_server.archive import INDEX_FILENAME, ResultArchive
+from awslabs.amazon_braket_mcp_server.braket_service import BraketService
+from awslabs.amazon_braket_mcp_server.measurements import pack_measurements
+from awslabs.amazon_braket_mcp_server.models import TaskResult, TaskStatus
+from awslabs.amazon_braket_mcp_server.result_cache import ResultCache
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+
+SV1_ARN = 'arn:aws:braket:::device/quantum-simulator/amazon/sv1'
+TASK_ARN = 'arn:aws:braket:us-west-2:123456789012:quantum-task/abc'
+
+
+def make_result(task_id: str, status: TaskStatus = TaskStatus.COMPLETED) -> TaskResult:
+    """Create a task result."""
+    return TaskResult(
+        task_id=task_id,
+        status=status,
+        measurements=[[0, 1], [1, 1]],
+        counts={'01': 1, '11': 1},
+        device=SV1_ARN,
+        shots=2,
+        metadata={'status': status.value, 'createdAt': datetime(2025, 6, 2, tzinfo=timezone.utc)},
+    )
+
+
+def test_memory_tier_is_lru():
+    """The least recently used result is evicted first."""
+    cache = ResultCache(max_entries=2)
+    for task_id in ('a', 'b'):
+        cache.put(make_result(task_id))
+    cache.get('a')
+    cache.put(make_result('c'))
+
+    assert cache.get('a') is not None
+    assert cache.get('b') is None
+    assert cache.get('c') is not None
+
+
+def test_only_terminal_results_are_cached(tmp_path):
+    """Results of tasks that can still change are not cached."""
+    cache = ResultCache(ResultArchive(tmp_path))
+    cache.put(make_result('queued', TaskStatus.QUEUED))
+    cache.put(make_result('cancelled', TaskStatus.CANCELLED))
+
+    assert cache.get('queued') is None
+    assert cache.get('cancelled').status == TaskStatus.CANCELLED
+
+
+def test_archive_tier_survives_restarts(tmp_path):
+    """Archived results are found by a new cache and promoted to memory."""
+    packed = pack_measurements([[0, 1], [1, 1]])
+    ResultCache(ResultArchive(tmp_path)).put(make_result(TASK_ARN), packed)
+
+    cache = ResultCache(ResultArchive(tmp_path))
+    result = cache.get(TASK_ARN)
+
+    assert result.counts == {'01': 1, '11': 1}
+    assert result.packed_measurements == packed
+    assert TASK_ARN in cache._entries
+
+
+def test_unreadable_archive_is_ignored(tmp_path):
+    """A corrupt archive index is treated as a miss."""
+    (tmp_path / INDEX_FILENAME).write_text('not a database')
+    cache = ResultCache(ResultArchive(tmp_path))
+
+    assert cache.get(TASK_ARN) is None
+
+
+@patch('awslabs.amazon_braket_mcp_server.braket_service.AwsQuantumTask')
+def test_repeat_lookups_make_no_calls(mock_aws_quantum_task, tmp_path):
+    """Terminal results are served from the cache, also by a restarted service."""
+    task = mock_aws_quantum_task.return_value
+    task.metadata.return_value = {'status': 'COMPLETED', 'deviceArn': SV1_ARN, 'shots': 2}
+    task.result.return_value.measurements.tolist.return_value = [[0, 1], [1, 1]]
+    task.result.return_value.measurement_counts = {'01': 1, '11': 1}
+    task.result.return_value.result_types = []
+
+    with patch('boto3.client'):
+        service = BraketService(region_name='us-west-2', workspace_dir=str(tmp_path))
+        restarted = BraketService(region_name='us-west-2', workspace_dir=str(tmp_path))
+
+    first = service.get_task_result(TASK_ARN)
+    second = service.get_task_result(TASK_ARN)
+    after_restart = restarted.get_task_result(TASK_ARN)
+
+    assert first == second == after_restart
+    assert mock_aws_quantum_task.call_count == 1
+    assert task.result.call_count == 1
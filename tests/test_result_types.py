@@ -0,0 +1,150 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Tests for exact result types."""
+
+import pytest
+from awslabs.amazon_braket_mcp_server.braket_service import BraketService
+from awslabs.amazon_braket_mcp_server.exceptions import CircuitValidationError
+from awslabs.amazon_braket_mcp_server.models import (
+    DeviceInfo,
+    DeviceType,
+    Gate,
+    QuantumCircuit,
+    ResultTypeSpec,
+    TaskStatus,
+)
+from awslabs.amazon_braket_mcp_server.result_types import (
+    build_result_type_circuit,
+    find_result_type_errors,
+    serialize_result_types,
+)
+from awslabs.amazon_braket_mcp_server.server import run_quantum_task
+from braket.devices import LocalSimulator
+from unittest.mock import MagicMock, patch
+
+
+SV1_ARN = 'arn:aws:braket:::device/quantum-simulator/amazon/sv1'
+
+BELL = QuantumCircuit(
+    num_qubits=2,
+    gates=[Gate(name='h', qubits=[0]), Gate(name='cx', qubits=[0, 1]), Gate(name='measure_all')],
+)
+
+SPECS = [
+    ResultTypeSpec(type='probability', qubits=[0, 1]),
+    ResultTypeSpec(type='expectation', observable='ZZ', qubits=[0, 1]),
+    ResultTypeSpec(type='amplitude', states=['00', '11']),
+]
+
+
+def test_find_result_type_errors():
+    """Invalid result types and shot counts are reported."""
+    assert find_result_type_errors(SPECS, 2, 0) == []
+
+    errors = find_result_type_errors(
+        [
+            ResultTypeSpec(type='variance'),
+            ResultTypeSpec(type='expectation', observable='ZQ'),
+            ResultTypeSpec(type='expectation', observable='ZZZ'),
+            ResultTypeSpec(type='probability', qubits=[2]),
+            ResultTypeSpec(type='amplitude', states=['0']),
+        ],
+        2,
+        100,
+    )
+    assert len(errors) == 6
+    assert 'requires shots=0' in errors[4]
+    assert find_result_type_errors([], 2, 0) == [
+        'Tasks with shots=0 must request at least one result type'
+    ]
+
+
+def test_exact_results_from_simulator():
+    """Result types are computed exactly and serialized in request order."""
+    circuit = build_result_type_circuit(BELL, SPECS)
+    result = LocalSimulator().run(circuit, shots=0).result()
+
+    values = serialize_result_types(result)
+
+    assert [value['type'] for value in values] == ['probability', 'expectation', 'amplitude']
+    assert values[0]['value'] == pytest.approx({'00': 0.5, '11': 0.5})
+    assert values[1]['value'] == pytest.approx(1.0)
+    assert values[2]['value']['11'] == pytest.approx([2**-0.5, 0.0])
+
+
+@pytest.fixture
+def braket_service():
+    """Create a BraketService with a mocked client and cached SV1 information."""
+    with patch('boto3.client'):
+        service = BraketService(region_name='us-west-2')
+    service._cache_device_info(
+        DeviceInfo(
+            device_arn=SV1_ARN,
+            device_name='SV1',
+            device_type=DeviceType.SIMULATOR,
+            provider_name='Amazon Braket',
+            status='ONLINE',
+            qubits=34,
+            paradigm='gate-based',
+            max_shots=100000,
+        )
+    )
+    return service
+
+
+@patch('awslabs.amazon_braket_mcp_server.braket_service.AwsQuantumTask')
+@patch('awslabs.amazon_braket_mcp_server.braket_service.AwsDevice')
+def test_run_quantum_task_with_result_types(
+    mock_aws_device, mock_aws_quantum_task, braket_service
+):
+    """Shots=0 tasks carry the result types and return their values."""
+    mock_aws_device.return_value.run.return_value = MagicMock(id='task-1')
+
+    task_id = braket_service.run_quantum_task(BELL, SV1_ARN, shots=0, result_types=SPECS)
+
+    program = mock_aws_device.return_value.run.call_args.args[0]
+    assert task_id == 'task-1'
+    assert len(program.result_types) == 3
+    assert mock_aws_device.return_value.run.call_args.kwargs['shots'] == 0
+
+    simulated = LocalSimulator().run(program, shots=0).result()
+    task = mock_aws_quantum_task.return_value
+    task.metadata.return_value = {'status': 'COMPLETED', 'deviceArn': SV1_ARN, 'shots': 0}
+    task.result.return_value = simulated
+
+    result = braket_service.get_task_result(task_id)
+
+    assert result.status == TaskStatus.COMPLETED
+    assert result.measurements is None
+    assert result.result_types[1] == {'type': 'expectation', 'value': pytest.approx(1.0)}
+
+
+def test_shots_zero_requires_result_types(braket_service):
+    """Shots=0 without result types is rejected before submission."""
+    with pytest.raises(CircuitValidationError, match='at least one result type'):
+        braket_service.run_quantum_task(BELL, SV1_ARN, shots=0)
+
+
+def test_run_quantum_task_tool_parses_result_types():
+    """The tool converts result type dictionaries to specifications."""
+    with patch('awslabs.amazon_braket_mcp_server.server.get_braket_service') as mock_get_service:
+        mock_get_service.return_value.run_quantum_task.return_value = 'task-1'
+
+        run_quantum_task(
+            circuit=BELL.model_dump(),
+            device_arn=SV1_ARN,
+            shots=0,
+            result_types=[{'type': 'probability', 'qubits': [0]}],
+        )
+
+    specs = mock_get_service.return_value.run_quantum_task.call_args.kwargs['result_types']
+    assert specs == [ResultTypeSpec(type='probability', qubits=[0])]
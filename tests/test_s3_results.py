@@ -0,0 +1,171 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Tests for direct result downloads from S3."""
+
+import boto3
+import io
+import json
+import numpy as np
+import pytest
+import threading
+from awslabs.amazon_braket_mcp_server.braket_service import BraketService
+from awslabs.amazon_braket_mcp_server.s3_results import (
+    GATE_MODEL_SCHEMA,
+    download_object,
+    load_result,
+    parse_measurement_matrix,
+    parse_result,
+)
+from collections import Counter
+from moto import mock_aws
+from unittest.mock import patch
+
+
+SV1_ARN = 'arn:aws:braket:::device/quantum-simulator/amazon/sv1'
+
+MEASUREMENTS = np.random.default_rng(5).integers(0, 2, size=(300, 4), dtype=np.uint8)
+
+METADATA = {
+    'status': 'COMPLETED',
+    'deviceArn': SV1_ARN,
+    'shots': 300,
+    'outputS3Bucket': 'results-bucket',
+    'outputS3Directory': 'tasks/t1',
+}
+
+
+def result_document(measurements=MEASUREMENTS, **fields):
+    """Serialize a gate model result as Amazon Braket stores it."""
+    document = {
+        'braketSchemaHeader': {'name': GATE_MODEL_SCHEMA, 'version': '1'},
+        'measurements': measurements.tolist(),
+        'measuredQubits': list(range(measurements.shape[1])),
+        'taskMetadata': {'id': 't1', 'shots': len(measurements), 'deviceId': SV1_ARN},
+        'additionalMetadata': {'action': {'source': 'OPENQASM 3;'}},
+    }
+    document.update(fields)
+    return json.dumps(document).encode('utf-8')
+
+
+class FakeS3:
+    """S3 client serving objects with ranged GETs and recording the requests."""
+
+    def __init__(self, objects):
+        """Serve the given object contents, keyed by bucket and key."""
+        self.objects = objects
+        self.ranges = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def get_object(self, Bucket, Key, Range=None, IfMatch=None):
+        """Return the requested byte range of an object."""
+        data = self.objects[(Bucket, Key)]
+        start, end = (int(value) for value in Range.removeprefix('bytes=').split('-'))
+        end = min(end, len(data) - 1)
+        with self._lock:
+            self.ranges.append((start, end))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            return {
+                'Body': io.BytesIO(data[start : end + 1]),
+                'ContentRange': f'bytes {start}-{end}/{len(data)}',
+                'ETag': '"etag"',
+            }
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def test_download_object_in_ranged_parts():
+    """Objects are fetched in parts of the given size and reassembled in order."""
+    data = bytes(range(256)) * 4
+    s3 = FakeS3({('bucket', 'key'): data})
+
+    assert download_object(s3, 'bucket', 'key', part_size=100) == data
+    assert sorted(s3.ranges) == [(start, min(start + 99, 1023)) for start in range(0, 1024, 100)]
+
+    small = FakeS3({('bucket', 'key'): b'{}'})
+    assert download_object(small, 'bucket', 'key') == b'{}'
+    assert small.ranges == [(0, 1)]
+
+
+def test_parse_result():
+    """Measurements are parsed to a bit matrix and counted like the SDK counts them."""
+    result = parse_result(result_document())
+
+    np.testing.assert_array_equal(result.measurements, MEASUREMENTS)
+    assert result.measurements.dtype == np.uint8
+    expected = Counter(''.join(str(bit) for bit in row) for row in MEASUREMENTS.tolist())
+    assert result.measurement_counts == dict(expected)
+    assert result.measured_qubits == [0, 1, 2, 3]
+    assert result.task_metadata['id'] == 't1'
+
+
+def test_results_left_to_the_sdk():
+    """Other schemas and results with result types are not parsed."""
+    other = {'name': 'braket.task_result.annealing_task_result', 'version': '1'}
+    assert parse_result(result_document(braketSchemaHeader=other)) is None
+    assert parse_result(result_document(resultTypes=[{'type': {}, 'value': 0.5}])) is None
+    assert parse_result(b'{"measurementProbabilities": {"00": 1.0}}') is None
+    assert load_result(FakeS3({}), {'status': 'COMPLETED'}) is None
+
+
+@pytest.mark.parametrize('text', [b'[[0, 2], [1, 0]]', b'[[0, 10], [1, 0]]', b'[[0, 1], [1]]'])
+def test_malformed_measurements(text):
+    """Values other than single bits and ragged rows are rejected."""
+    with pytest.raises(ValueError):
+        parse_measurement_matrix(text)
+
+
+@patch('awslabs.amazon_braket_mcp_server.braket_service.AwsQuantumTask')
+def test_get_task_result_downloads_from_s3(mock_aws_quantum_task):
+    """Completed results are read from the output location instead of through the SDK."""
+    mock_aws_quantum_task.return_value.metadata.return_value = METADATA
+    with patch('boto3.client'):
+        service = BraketService(region_name='us-west-2')
+    s3 = FakeS3({('results-bucket', 'tasks/t1/results.json'): result_document()})
+    service._s3_client = s3
+
+    result = service.get_task_result('t1', include_measurements=True)
+
+    assert result.measurements == MEASUREMENTS.tolist()
+    assert sum(result.counts.values()) == 300
+    mock_aws_quantum_task.return_value.result.assert_not_called()
+
+
+@patch('awslabs.amazon_braket_mcp_server.braket_service.AwsQuantumTask')
+def test_failed_downloads_fall_back_to_the_sdk(mock_aws_quantum_task):
+    """The SDK fetches the result if the direct download fails."""
+    task = mock_aws_quantum_task.return_value
+    task.metadata.return_value = METADATA
+    task.result.return_value.measurements = None
+    task.result.return_value.measurement_counts = {'00': 300}
+    with patch('boto3.client'):
+        service = BraketService(region_name='us-west-2')
+    service._s3_client = FakeS3({})
+
+    assert service.get_task_result('t1').counts == {'00': 300}
+    task.result.assert_called_once()
+
+
+def test_load_result_from_moto():
+    """Results are loaded from a local S3 stand-in."""
+    with mock_aws():
+        s3 = boto3.client('s3', region_name='us-east-1')
+        s3.create_bucket(Bucket='results-bucket')
+        s3.put_object(Bucket='results-bucket', Key='tasks/t1/results.json', Body=result_document())
+
+        result = load_result(s3, METADATA, part_size=1024)
+
+    np.testing.assert_array_equal(result.measurements, MEASUREMENTS)
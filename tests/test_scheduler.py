@@ -0,0 +1,206 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Tests for execution window aware submission scheduling."""
+
+import json
+import pytest
+import threading
+from awslabs.amazon_braket_mcp_server.braket_service import BraketService
+from awslabs.amazon_braket_mcp_server.journal import SubmissionJournal, SubmissionWorker
+from awslabs.amazon_braket_mcp_server.models import (
+    DeviceInfo,
+    DeviceType,
+    ExecutionWindow,
+    Gate,
+    QuantumCircuit,
+    SubmissionState,
+)
+from awslabs.amazon_braket_mcp_server.scheduler import (
+    SubmissionScheduler,
+    next_window_open,
+    window_open,
+)
+from awslabs.amazon_braket_mcp_server.server import get_submission_schedule_resource
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+
+SV1_ARN = 'arn:aws:braket:::device/quantum-simulator/amazon/sv1'
+QPU_ARN = 'arn:aws:braket:us-east-1::device/qpu/ionq/Aria-1'
+
+CIRCUIT = QuantumCircuit(num_qubits=1, gates=[Gate(name='x', qubits=[0])])
+
+# Monday 2025-06-02
+MONDAY = datetime(2025, 6, 2, tzinfo=timezone.utc)
+
+WEEKDAY_MORNINGS = [
+    ExecutionWindow(
+        execution_day='Weekdays', window_start_hour='09:00:00', window_end_hour='12:00:00'
+    )
+]
+FRIDAY_NIGHTS = [
+    ExecutionWindow(
+        execution_day='Friday', window_start_hour='22:00:00', window_end_hour='02:00:00'
+    )
+]
+
+
+def make_device(device_arn: str, windows=()) -> DeviceInfo:
+    """Create device information with execution windows."""
+    return DeviceInfo(
+        device_arn=device_arn,
+        device_name='Device',
+        device_type=DeviceType.SIMULATOR if device_arn == SV1_ARN else DeviceType.QPU,
+        provider_name='Provider',
+        status='ONLINE',
+        qubits=25,
+        paradigm='gate-based',
+        max_shots=10000,
+        execution_windows=list(windows),
+    )
+
+
+def test_window_open():
+    """Windows recur on their days and may continue past midnight."""
+    assert window_open([], MONDAY)
+    assert window_open(WEEKDAY_MORNINGS, MONDAY.replace(hour=10))
+    assert not window_open(WEEKDAY_MORNINGS, MONDAY.replace(hour=13))
+    assert not window_open(WEEKDAY_MORNINGS, MONDAY.replace(day=7, hour=10))
+
+    assert window_open(FRIDAY_NIGHTS, MONDAY.replace(day=6, hour=23))
+    assert window_open(FRIDAY_NIGHTS, MONDAY.replace(day=7, hour=1))
+    assert not window_open(FRIDAY_NIGHTS, MONDAY.replace(day=7, hour=3))
+
+
+def test_next_window_open():
+    """The next window start is found across days and weeks."""
+    assert next_window_open(WEEKDAY_MORNINGS, MONDAY.replace(hour=10)) == MONDAY.replace(hour=10)
+    assert next_window_open(WEEKDAY_MORNINGS, MONDAY.replace(hour=13)) == MONDAY.replace(
+        day=3, hour=9
+    )
+    assert next_window_open(WEEKDAY_MORNINGS, MONDAY.replace(day=6, hour=13)) == MONDAY.replace(
+        day=9, hour=9
+    )
+    assert next_window_open(FRIDAY_NIGHTS, MONDAY) == MONDAY.replace(day=6, hour=22)
+
+
+def test_capacity():
+    """Closed QPU windows hold submissions; simulators are only limited per device."""
+    devices = {
+        QPU_ARN: make_device(QPU_ARN, WEEKDAY_MORNINGS),
+        SV1_ARN: make_device(SV1_ARN, WEEKDAY_MORNINGS),
+    }
+    now = [MONDAY.replace(hour=8)]
+    scheduler = SubmissionScheduler(devices.__getitem__, max_per_device=2, clock=lambda: now[0])
+
+    assert scheduler.capacity(QPU_ARN, 0) == 0
+    assert scheduler.capacity(SV1_ARN, 1) == 1
+    schedule = scheduler.device_schedule(QPU_ARN, queued=3, in_flight=0)
+    assert schedule['held'] == 3
+    assert schedule['next_window_open'] == MONDAY.replace(hour=9).isoformat()
+
+    now[0] = MONDAY.replace(hour=9, minute=30)
+    assert scheduler.capacity(QPU_ARN, 0) == 2
+    assert scheduler.capacity(QPU_ARN, 2) == 0
+
+
+def test_unknown_devices_are_not_held():
+    """Submissions are released if the device information cannot be loaded."""
+    scheduler = SubmissionScheduler(MagicMock(side_effect=Exception('GetDevice failed')))
+
+    assert scheduler.capacity(QPU_ARN, 0) == 2
+
+
+def test_worker_releases_batches_when_window_opens(tmp_path):
+    """Queued QPU submissions wait for the window, then go out under the device limit."""
+    journal = SubmissionJournal(tmp_path / 'journal.sqlite3')
+    qpu_entries = [journal.enqueue(CIRCUIT, QPU_ARN, 100) for _ in range(3)]
+    sv1_entry = journal.enqueue(CIRCUIT, SV1_ARN, 100)
+    now = [MONDAY.replace(hour=8)]
+    devices = {QPU_ARN: make_device(QPU_ARN, WEEKDAY_MORNINGS), SV1_ARN: make_device(SV1_ARN)}
+    release = threading.Event()
+
+    def submit(entry):
+        release.wait(5)
+        return f'task-{entry.entry_id}'
+
+    worker = SubmissionWorker(
+        journal,
+        submit=submit,
+        reconcile=MagicMock(),
+        max_concurrency=4,
+        scheduler=SubmissionScheduler(devices.__getitem__, max_per_device=2, clock=lambda: now[0]),
+    )
+    in_flight = set()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        worker.drain_once(executor, in_flight)
+        assert len(in_flight) == 1
+        assert journal.get(sv1_entry).state == SubmissionState.SUBMITTING
+        assert [journal.get(e).state for e in qpu_entries] == [SubmissionState.QUEUED] * 3
+        (qpu_schedule,) = [s for s in worker.schedule() if s['device_arn'] == QPU_ARN]
+        assert qpu_schedule['held'] == 3
+
+        now[0] = MONDAY.replace(hour=9)
+        worker.drain_once(executor, in_flight)
+        assert len(in_flight) == 3
+        assert journal.count(SubmissionState.QUEUED) == 1
+
+        release.set()
+        for future in list(in_flight):
+            future.result(timeout=5)
+        worker.drain_once(executor, in_flight)
+        assert journal.count(SubmissionState.QUEUED) == 0
+    journal.close()
+
+
+def test_parse_execution_windows():
+    """Execution windows are read from the device capabilities."""
+    device = BraketService._parse_device_info(
+        {
+            'deviceArn': QPU_ARN,
+            'deviceType': 'QPU',
+            'deviceCapabilities': json.dumps(
+                {
+                    'service': {
+                        'executionWindows': [
+                            {
+                                'executionDay': 'Weekdays',
+                                'windowStartHour': '09:00:00',
+                                'windowEndHour': '12:00:00',
+                            }
+                        ]
+                    }
+                }
+            ),
+        }
+    )
+
+    assert device.execution_windows == WEEKDAY_MORNINGS
+
+
+def test_submission_schedule_resource():
+    """The schedule is exposed as a resource."""
+    with patch('awslabs.amazon_braket_mcp_server.server.get_braket_service') as mock_get_service:
+        mock_get_service.return_value.get_submission_schedule.return_value = [
+            {'device_arn': QPU_ARN, 'held': 3}
+        ]
+
+        assert get_submission_schedule_resource() == [{'device_arn': QPU_ARN, 'held': 3}]
+
+
+@pytest.mark.parametrize('day', ['Someday', 'Weekdays'])
+def test_invalid_windows_are_ignored(day):
+    """Unrecognized windows do not hold submissions forever."""
+    windows = [ExecutionWindow(execution_day=day, window_start_hour='9am', window_end_hour='5pm')]
+
+    assert window_open(windows, MONDAY)
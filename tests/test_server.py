@@ -33,6 +33,7 @@ from awslabs.amazon_braket_mcp_server.server import (
 from awslabs.amazon_braket_mcp_server.models import (
     QuantumCircuit, Gate, TaskResult, TaskStatus, DeviceInfo, DeviceType
 )
+from awslabs.amazon_braket_mcp_server.exceptions import ThrottlingError
 
 
 @pytest.fixture
@@ -178,6 +179,17 @@ class TestQuantumTaskExecution:
         assert 'error' in result
         assert 'Device unavailable' in result['error']
 
+    def test_run_quantum_task_throttled(self, mock_braket_service):
+        """Test that throttling is reported with a retry hint."""
+        mock_braket_service.run_quantum_task.side_effect = ThrottlingError(
+            'CreateQuantumTask throttled', retry_after=4.0
+        )
+
+        result = run_quantum_task(circuit={'num_qubits': 1, 'gates': []})
+
+        assert result['throttled'] is True
+        assert result['retry_after'] == 4.0
+
 
 class TestTaskResultRetrieval:
     """Test task result retrieval endpoints."""
@@ -203,6 +215,29 @@ class TestTaskResultRetrieval:
         assert result['measurements'] == [[0, 1], [1, 0]]
         assert result['counts'] == {'01': 500, '10': 500}
         assert result['execution_time'] == 5.5
+
+    def test_get_task_result_counts_only(self, mock_braket_service):
+        """Test that counts-only results leave out empty fields."""
+        mock_braket_service.get_task_result.return_value = TaskResult(
+            task_id='task-123',
+            status=TaskStatus.COMPLETED,
+            counts={'01': 500, '10': 500},
+            device='arn:aws:braket:::device/quantum-simulator/amazon/sv1',
+            shots=1000,
+        )
+
+        result = get_task_result('task-123', counts_only=True)
+
+        mock_braket_service.get_task_result.assert_called_once_with(
+            'task-123', include_measurements=False, counts_only=True, packed=False
+        )
+        assert result == {
+            'task_id': 'task-123',
+            'status': TaskStatus.COMPLETED,
+            'counts': {'01': 500, '10': 500},
+            'device': 'arn:aws:braket:::device/quantum-simulator/amazon/sv1',
+            'shots': 1000,
+        }
     
     def test_get_task_result_error(self, mock_braket_service):
         """Test task result retrieval error handling."""
@@ -0,0 +1,186 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Tests for parameter sweeps."""
+
+import json
+import pytest
+import time
+from awslabs.amazon_braket_mcp_server.braket_service import BraketService
+from awslabs.amazon_braket_mcp_server.exceptions import CircuitValidationError
+from awslabs.amazon_braket_mcp_server.models import Gate, QuantumCircuit, TaskResult, TaskStatus
+from awslabs.amazon_braket_mcp_server.server import run_parameter_sweep
+from awslabs.amazon_braket_mcp_server.sweep import (
+    ParameterSweep,
+    expand_grid,
+    is_sweep_id,
+    z_expectation,
+)
+from unittest.mock import MagicMock, patch
+
+
+SV1_ARN = 'arn:aws:braket:::device/quantum-simulator/amazon/sv1'
+
+CIRCUIT = QuantumCircuit(
+    num_qubits=2,
+    gates=[
+        Gate(name='rx', qubits=[0], params=['theta']),
+        Gate(name='cx', qubits=[0, 1]),
+        Gate(name='measure_all'),
+    ],
+)
+
+
+def make_result(task_id, status, counts=None):
+    """Build a task result."""
+    return TaskResult(task_id=task_id, status=status, counts=counts, device=SV1_ARN, shots=100)
+
+
+def test_expand_grid():
+    """Grids expand to every combination, varying the last parameter fastest."""
+    assert expand_grid({'beta': [1, 2], 'gamma': [3, 4]}) == [
+        {'beta': 1, 'gamma': 3},
+        {'beta': 1, 'gamma': 4},
+        {'beta': 2, 'gamma': 3},
+        {'beta': 2, 'gamma': 4},
+    ]
+
+
+def test_z_expectation():
+    """Expectation values of Z strings follow the parity of the selected bits."""
+    counts = {'00': 50, '11': 30, '01': 20}
+    assert z_expectation(counts, 'ZZ') == pytest.approx(0.6)
+    assert z_expectation(counts, 'ZI') == pytest.approx(0.4)
+    assert z_expectation({}, 'Z') is None
+
+
+def test_sweep_table_fills_in():
+    """Rows are filled in as tasks complete and the status follows the points."""
+    sweep = ParameterSweep(SV1_ARN, [{'theta': 0.0}, {'theta': 1.0}], 100, observable='ZZ')
+    assert is_sweep_id(sweep.sweep_id)
+    sweep.set_task(0, 't0')
+
+    sweep.record(0, make_result('t0', TaskStatus.COMPLETED, {'00': 100}))
+    table = sweep.table()
+    assert table['status'] == TaskStatus.RUNNING.value
+    assert table['points'][0]['expectation'] == 1.0
+    assert table['points'][1]['status'] == 'PENDING_SUBMISSION'
+    assert sweep.pending_tasks() == {}
+
+    sweep.set_task(1, 't1')
+    sweep.record(1, make_result('t1', TaskStatus.COMPLETED, {'11': 100}))
+    table = sweep.table()
+    assert table['status'] == TaskStatus.COMPLETED.value
+    assert table['completed'] == 2
+
+
+@pytest.fixture
+def braket_service():
+    """Create a BraketService with a mocked client."""
+    with patch('boto3.client'):
+        return BraketService(region_name='us-west-2')
+
+
+def wait_for_submission(sweep):
+    """Wait until every point of a sweep has been submitted."""
+    deadline = time.monotonic() + 5
+    while sweep.submitted < len(sweep.points) and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+@patch('awslabs.amazon_braket_mcp_server.braket_service.AwsQuantumTask')
+def test_run_parameter_sweep(mock_aws_quantum_task, braket_service):
+    """One program is compiled and submitted per point with its inputs."""
+
+    def create(**request):
+        action = json.loads(request['action'])
+        return {'quantumTaskArn': f'task-{action["inputs"]["theta"]}'}
+
+    braket_service.braket_client.create_quantum_task.side_effect = create
+
+    sweep_id = braket_service.run_parameter_sweep(
+        CIRCUIT,
+        SV1_ARN,
+        [{'theta': 0.0}, {'theta': 3.14}],
+        shots=100,
+        observable='ZZ',
+        s3_bucket='bucket',
+        s3_prefix='results',
+    )
+
+    sweep = braket_service.get_sweep(sweep_id)
+    wait_for_submission(sweep)
+    calls = braket_service.braket_client.create_quantum_task.call_args_list
+    sources = {json.loads(call.kwargs['action'])['source'] for call in calls}
+    assert len(sources) == 1
+    assert 'input float theta;' in sources.pop()
+    assert sweep.task_ids == ['task-0.0', 'task-3.14']
+
+    def make_task(task_id, **kwargs):
+        task = MagicMock()
+        task.metadata.return_value = {'status': 'COMPLETED', 'deviceArn': SV1_ARN, 'shots': 100}
+        task.result.return_value.measurements.tolist.return_value = []
+        task.result.return_value.measurement_counts = (
+            {'00': 100} if task_id == 'task-0.0' else {'11': 100}
+        )
+        return task
+
+    mock_aws_quantum_task.side_effect = make_task
+    table = braket_service.get_sweep_results(sweep_id)
+
+    assert table['status'] == TaskStatus.COMPLETED.value
+    assert [row['counts'] for row in table['points']] == [{'00': 100}, {'11': 100}]
+    assert [row['expectation'] for row in table['points']] == [1.0, 1.0]
+
+
+@patch('awslabs.amazon_braket_mcp_server.braket_service.AwsDevice')
+def test_run_parameter_sweep_with_sdk(mock_aws_device, braket_service):
+    """Without direct submission, one SDK program is shared by every point."""
+    braket_service.direct_submission = False
+    mock_device = mock_aws_device.return_value
+    mock_device.run.side_effect = lambda program, shots, **kwargs: MagicMock(
+        id=f'task-{kwargs["inputs"]["theta"]}'
+    )
+
+    sweep_id = braket_service.run_parameter_sweep(
+        CIRCUIT, SV1_ARN, [{'theta': 0.0}, {'theta': 3.14}], shots=100
+    )
+
+    sweep = braket_service.get_sweep(sweep_id)
+    wait_for_submission(sweep)
+    assert mock_aws_device.call_count == 1
+    programs = {id(call.args[0]) for call in mock_device.run.call_args_list}
+    assert len(programs) == 1
+    assert sweep.task_ids == ['task-0.0', 'task-3.14']
+
+
+def test_run_parameter_sweep_rejects_unbound_points(braket_service):
+    """Every point must bind exactly the circuit's parameters."""
+    with pytest.raises(CircuitValidationError, match='Point 0 binds'):
+        braket_service.run_parameter_sweep(CIRCUIT, SV1_ARN, [{'phi': 0.0}])
+
+
+def test_run_parameter_sweep_tool_expands_grid():
+    """The tool expands the grid and returns the sweep ID."""
+    with patch('awslabs.amazon_braket_mcp_server.server.get_braket_service') as mock_get_service:
+        mock_get_service.return_value.run_parameter_sweep.return_value = 'sweep-1'
+
+        result = run_parameter_sweep(
+            circuit=CIRCUIT.model_dump(), parameter_grid={'theta': [0.0, 1.0, 2.0]}
+        )
+
+    assert result['sweep_id'] == 'sweep-1'
+    assert result['points'] == 3
+    assert mock_get_service.return_value.run_parameter_sweep.call_args.args[2] == [
+        {'theta': 0.0},
+        {'theta': 1.0},
+        {'theta': 2.0},
+    ]
@@ -0,0 +1,207 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Tests for the client-side rate limiter."""
+
+import boto3
+import pytest
+from awslabs.amazon_braket_mcp_server.braket_service import BraketService, make_client_config
+from awslabs.amazon_braket_mcp_server.exceptions import ThrottlingError
+from awslabs.amazon_braket_mcp_server.models import Gate, QuantumCircuit
+from awslabs.amazon_braket_mcp_server.throttling import (
+    RateLimiter,
+    TokenBucket,
+    is_throttling_error,
+)
+from botocore.awsrequest import AWSResponse
+from botocore.exceptions import ClientError
+from unittest.mock import MagicMock, patch
+
+
+def throttling_error(operation='CreateQuantumTask'):
+    """Build a botocore throttling error."""
+    return ClientError(
+        {'Error': {'Code': 'ThrottlingException', 'Message': 'Rate exceeded'}}, operation
+    )
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        """Start the clock at zero."""
+        self.now = 0.0
+
+    def __call__(self):
+        """Return the current time."""
+        return self.now
+
+
+class TestTokenBucket:
+    """Test the adaptive token bucket."""
+
+    def test_burst_then_wait(self):
+        """Tokens are consumed up to capacity, then callers must wait."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2.0, capacity=2.0, clock=clock)
+
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(0.5)
+        assert bucket.reserve() == pytest.approx(1.0)
+
+        clock.now = 10.0
+        assert bucket.reserve() == 0.0
+
+    def test_adaptive_rate(self):
+        """Throttling halves the rate and successes recover it."""
+        bucket = TokenBucket(rate=8.0, clock=FakeClock())
+
+        bucket.on_throttle()
+        bucket.on_throttle()
+        assert bucket.rate == 2.0
+
+        for _ in range(100):
+            bucket.on_success()
+        assert bucket.rate == 8.0
+
+
+class TestRateLimiter:
+    """Test rate-limited calls with backoff."""
+
+    def test_is_throttling_error(self):
+        """Throttling responses are recognized by code and HTTP status."""
+        assert is_throttling_error(throttling_error())
+        assert is_throttling_error(
+            ClientError(
+                {'Error': {'Code': 'X'}, 'ResponseMetadata': {'HTTPStatusCode': 429}}, 'Op'
+            )
+        )
+        assert not is_throttling_error(
+            ClientError({'Error': {'Code': 'ValidationException'}}, 'CreateQuantumTask')
+        )
+        assert not is_throttling_error(Exception('Rate exceeded'))
+
+    def test_retries_throttled_calls(self):
+        """Throttled calls are retried with backoff until they succeed."""
+        sleep = MagicMock()
+        limiter = RateLimiter(sleep=sleep)
+        func = MagicMock(side_effect=[throttling_error(), throttling_error(), 'task-arn'])
+
+        assert limiter.call('CreateQuantumTask', 'us-east-1', func, 1, shots=10) == 'task-arn'
+        assert func.call_count == 3
+        func.assert_called_with(1, shots=10)
+
+        metrics = limiter.get_metrics()['us-east-1/CreateQuantumTask']
+        assert metrics['calls'] == 3
+        assert metrics['throttled'] == 2
+        assert metrics['backoff_seconds'] >= 0
+        assert metrics['current_rate'] < metrics['max_rate']
+
+    def test_raises_after_max_retries(self):
+        """A ThrottlingError with a retry hint is raised once retries are exhausted."""
+        limiter = RateLimiter(max_retries=2, sleep=MagicMock())
+        func = MagicMock(side_effect=throttling_error())
+
+        with pytest.raises(ThrottlingError, match='CreateQuantumTask throttled') as exc_info:
+            limiter.call('CreateQuantumTask', 'us-east-1', func)
+
+        assert func.call_count == 3
+        assert exc_info.value.retry_after > 0
+
+    def test_other_errors_are_not_retried(self):
+        """Non-throttling errors propagate immediately."""
+        limiter = RateLimiter(sleep=MagicMock())
+        func = MagicMock(side_effect=ValueError('bad request'))
+
+        with pytest.raises(ValueError):
+            limiter.call('GetDevice', 'us-west-2', func)
+        assert func.call_count == 1
+
+    def test_buckets_are_keyed_by_operation_and_region(self):
+        """Each operation and region pair gets its own bucket and metrics."""
+        limiter = RateLimiter(sleep=MagicMock())
+        limiter.call('GetQuantumTask', 'us-east-1', lambda: None)
+        limiter.call('GetQuantumTask', 'us-west-2', lambda: None)
+        limiter.call('CreateQuantumTask', 'us-east-1', lambda: None)
+
+        assert set(limiter.get_metrics()) == {
+            'us-east-1/GetQuantumTask',
+            'us-west-2/GetQuantumTask',
+            'us-east-1/CreateQuantumTask',
+        }
+
+    def test_waits_when_bucket_is_empty(self):
+        """Callers sleep for the token wait time when the bucket is drained."""
+        sleep = MagicMock()
+        limiter = RateLimiter(rates={'CancelQuantumTask': 1.0}, sleep=sleep)
+        limiter.call('CancelQuantumTask', 'us-east-1', lambda: None)
+        limiter.call('CancelQuantumTask', 'us-east-1', lambda: None)
+
+        sleep.assert_called_once_with(pytest.approx(1.0, abs=0.05))
+        metrics = limiter.get_metrics()['us-east-1/CancelQuantumTask']
+        assert metrics['wait_seconds'] == pytest.approx(1.0, abs=0.05)
+
+
+class ThrottlingBody:
+    """Raw body of a throttling response."""
+
+    def stream(self, **kwargs):
+        """Stream the body in one chunk."""
+        yield b'{"message": "Rate exceeded"}'
+
+
+def test_botocore_retries_stay_within_the_rate_limiter():
+    """With the default config, each rate-limited call makes at most two requests."""
+    sent = []
+
+    def throttle(request, **kwargs):
+        sent.append(request.url)
+        return AWSResponse(
+            request.url, 429, {'x-amzn-ErrorType': 'ThrottlingException'}, ThrottlingBody()
+        )
+
+    client = boto3.client(
+        'braket',
+        region_name='us-east-1',
+        config=make_client_config(),
+        aws_access_key_id='key',
+        aws_secret_access_key='secret',
+    )
+    client.meta.events.register('before-send.braket', throttle)
+    limiter = RateLimiter(max_retries=2, sleep=MagicMock())
+
+    with patch('botocore.endpoint.time.sleep'), pytest.raises(ThrottlingError):
+        limiter.call('GetQuantumTask', 'us-east-1', client.get_quantum_task, quantumTaskArn='t1')
+
+    assert len(sent) == 3 * 2
+    metrics = limiter.get_metrics()['us-east-1/GetQuantumTask']
+    assert (metrics['calls'], metrics['throttled'], metrics['sdk_retries']) == (3, 3, 3)
+
+
+@patch('boto3.client')
+def test_service_surfaces_throttling_error(mock_client):
+    """The service raises ThrottlingError instead of a generic TaskExecutionError."""
+    create = mock_client.return_value.create_quantum_task
+    create.side_effect = throttling_error()
+
+    service = BraketService(
+        region_name='us-east-1', rate_limiter=RateLimiter(max_retries=1, sleep=MagicMock())
+    )
+
+    with pytest.raises(ThrottlingError):
+        service.run_quantum_task(
+            circuit=QuantumCircuit(num_qubits=1, gates=[Gate(name='h', qubits=[0])]),
+            device_arn='arn:aws:braket:::device/quantum-simulator/amazon/sv1',
+            s3_bucket='bucket',
+            s3_prefix='results',
+        )
+    assert create.call_count == 2
@@ -0,0 +1,149 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Tests for server-side waiting on quantum tasks."""
+
+import asyncio
+import pytest
+from awslabs.amazon_braket_mcp_server.braket_service import BraketService
+from awslabs.amazon_braket_mcp_server.models import TaskResult, TaskStatus
+from awslabs.amazon_braket_mcp_server.server import wait_for_task
+from awslabs.amazon_braket_mcp_server.waiter import TaskPoller
+from collections import Counter
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+class FakeTasks:
+    """Task statuses that advance after a number of lookups."""
+
+    def __init__(self, finish_after):
+        """Map task IDs to the lookup on which they complete."""
+        self.finish_after = finish_after
+        self.lookups = Counter()
+
+    def get_status(self, task_id):
+        """Count a status lookup and report the task's status after it."""
+        self.lookups[task_id] += 1
+        if self.lookups[task_id] >= self.finish_after[task_id]:
+            return TaskStatus.COMPLETED
+        return TaskStatus.RUNNING
+
+
+async def test_concurrent_waiters_share_one_poll_loop():
+    """Each poll round looks up a task once, however many waiters watch it."""
+    tasks = FakeTasks({'t1': 3, 't2': 5})
+    poller = TaskPoller(tasks.get_status, base_interval=0.01, max_interval=0.02)
+
+    results = await asyncio.gather(
+        poller.wait(['t1', 't2']), poller.wait(['t1']), poller.wait(['t1', 't2', 't1'])
+    )
+
+    assert results[0] == {'t1': TaskStatus.COMPLETED, 't2': TaskStatus.COMPLETED}
+    assert results[1] == {'t1': TaskStatus.COMPLETED}
+    assert tasks.lookups == {'t1': 3, 't2': 5}
+    assert poller.rounds == 5
+
+
+async def test_return_when_any():
+    """Waiting for any task returns once the first one finishes."""
+    tasks = FakeTasks({'t1': 2, 't2': 100})
+    poller = TaskPoller(tasks.get_status, base_interval=0.01, max_interval=0.02)
+
+    statuses = await poller.wait(['t1', 't2'], return_when='any')
+
+    assert statuses == {'t1': TaskStatus.COMPLETED, 't2': TaskStatus.RUNNING}
+
+
+async def test_timeout_returns_last_known_statuses():
+    """A wait that times out reports the statuses seen so far."""
+    tasks = FakeTasks({'t1': 1000})
+    poller = TaskPoller(tasks.get_status, base_interval=0.01, max_interval=0.02)
+
+    assert await poller.wait(['t1'], timeout=0.05) == {'t1': TaskStatus.RUNNING}
+    with pytest.raises(ValueError):
+        await poller.wait(['t1'], return_when='some')
+
+
+async def test_polling_backs_off_while_nothing_changes():
+    """Poll intervals double up to the maximum and reset when a status changes."""
+    tasks = FakeTasks({'t1': 6})
+    poller = TaskPoller(tasks.get_status, base_interval=0.001, max_interval=0.004)
+    intervals = []
+
+    def uniform(low, high):
+        intervals.append(high)
+        return high
+
+    with patch('awslabs.amazon_braket_mcp_server.waiter.random.uniform', uniform):
+        await poller.wait(['t1'])
+
+    # The first round records RUNNING (a change); later rounds see no change until COMPLETED
+    assert intervals[:5] == [0.001, 0.002, 0.004, 0.004, 0.004]
+
+
+async def test_progress_is_reported_as_tasks_finish():
+    """Progress callbacks receive the finished and total task counts."""
+    tasks = FakeTasks({'t1': 1, 't2': 3})
+    poller = TaskPoller(tasks.get_status, base_interval=0.01, max_interval=0.02)
+    progress = []
+
+    async def on_progress(finished, total, statuses):
+        progress.append((finished, total))
+
+    await poller.wait(['t1', 't2'], on_progress=on_progress)
+
+    assert progress[0] == (0, 2)
+    assert progress[-1] == (2, 2)
+    assert (1, 2) in progress
+
+
+async def test_failed_lookups_are_retried():
+    """Lookup errors keep the task pending until a later round succeeds."""
+    get_status = MagicMock(side_effect=[Exception('throttled'), TaskStatus.FAILED])
+    poller = TaskPoller(get_status, base_interval=0.01, max_interval=0.02)
+
+    assert await poller.wait(['t1']) == {'t1': TaskStatus.FAILED}
+
+
+def test_get_task_status():
+    """Statuses come from one GetQuantumTask call or the result cache."""
+    with patch('boto3.client'):
+        service = BraketService(region_name='us-west-2')
+    service.braket_client.get_quantum_task.side_effect = [
+        {'status': 'RUNNING'},
+        {'status': 'CANCELLING'},
+    ]
+    service.result_cache.put(
+        TaskResult(task_id='t3', status=TaskStatus.COMPLETED, device='sv1', shots=10)
+    )
+
+    assert service.get_task_status('t1') == TaskStatus.RUNNING
+    assert service.get_task_status('t2') == TaskStatus.RUNNING
+    assert service.get_task_status('t3') == TaskStatus.COMPLETED
+    assert service.braket_client.get_quantum_task.call_count == 2
+
+
+async def test_wait_for_task_tool():
+    """The tool reports finished and pending tasks and sends progress notifications."""
+    ctx = MagicMock()
+    ctx.report_progress = AsyncMock()
+    poller = TaskPoller(
+        FakeTasks({'t1': 1, 't2': 1000}).get_status, base_interval=0.01, max_interval=0.02
+    )
+
+    with patch('awslabs.amazon_braket_mcp_server.server.get_task_poller', return_value=poller):
+        result = await wait_for_task(['t1', 't2'], timeout=0.1, ctx=ctx)
+
+    assert result['finished'] == ['t1']
+    assert result['pending'] == ['t2']
+    assert result['timed_out'] is True
+    assert {'task_id': 't2', 'status': 'RUNNING'} in result['tasks']
+    ctx.report_progress.assert_called_with(1, 2, message='1 of 2 tasks finished')